@@ -1,7 +1,8 @@
-"""Profile a burnin run with yappi (async-aware CPU profiler).
+"""Profile a burnin run with the SDK stage timers.
 
 Usage: uv run python profile_run.py
-Starts burnin, runs for 2m with profiling, dumps top functions.
+Starts burnin with stage timing enabled, runs for 2m, and prints where the
+SDK's send and receive hot paths spend their time (GET /run/stages).
 """
 
 import asyncio
@@ -9,8 +10,6 @@ import json
 import time
 import urllib.request
 
-import yappi
-
 BASE = "http://localhost:8889"
 
 
@@ -66,7 +65,7 @@ def main():
                        "max_downtime_pct": 10, "min_throughput_pct": 50, "max_duration": "168h"},
         "forced_disconnect": {"interval": "0", "duration": "5s"},
         "shutdown": {"drain_timeout_seconds": 10, "cleanup_channels": True},
-        "metrics": {"report_interval": "30s"},
+        "metrics": {"report_interval": "30s", "stage_timer_sample_every": 100},
     }
 
     print("Starting run...")
@@ -82,43 +81,18 @@ def main():
     print("Stabilizing 15s...")
     time.sleep(15)
 
-    # Start profiling
+    # Stage timings restart after warmup; sample a steady-state window
     print("=" * 60)
-    print("PROFILING for 60s (yappi wall-clock mode)...")
+    print("SAMPLING STAGE TIMINGS for 60s...")
     print("=" * 60)
-    yappi.set_clock_type("wall")
-    yappi.start()
-
     time.sleep(60)
 
-    yappi.stop()
-    print("Profiling complete. Results:\n")
-
-    # Get function stats
-    stats = yappi.get_func_stats()
-
-    # Print top 40 by total time
-    print("=" * 100)
-    print("TOP 40 FUNCTIONS BY TOTAL TIME (wall-clock)")
-    print("=" * 100)
-    stats.sort("ttot", "desc")
-    stats.print_all(out=open("/tmp/yappi_full.txt", "w"))
-    for i, s in enumerate(stats):
-        if i >= 40:
-            break
-        print(f"  {s.ttot:>8.3f}s  {s.ncall:>8d} calls  {s.tavg*1000:>8.2f}ms/call  {s.full_name}")
-
-    print()
-    print("=" * 100)
-    print("TOP 30 FUNCTIONS BY CALL COUNT")
-    print("=" * 100)
-    stats.sort("ncall", "desc")
-    for i, s in enumerate(stats):
-        if i >= 30:
-            break
-        print(f"  {s.ncall:>10d} calls  {s.ttot:>8.3f}s total  {s.full_name}")
-
-    print(f"\nFull stats written to /tmp/yappi_full.txt")
+    stages = api_get("/run/stages")
+    print(f"Stage timings (1 in {stages['sample_every']} messages):\n")
+    print(f"  {'stage':40s} {'count':>8s} {'mean_us':>10s} {'p50_us':>10s} {'p99_us':>10s} {'max_us':>10s}")
+    for name, st in stages["stages"].items():
+        print(f"  {name:40s} {st['count']:>8d} {st['mean_us']:>10.1f} {st['p50_us']:>10.1f}"
+              f" {st['p99_us']:>10.1f} {st['max_us']:>10.1f}")
 
     # Stop run
     print("\nStopping run...")
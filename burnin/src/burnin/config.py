@@ -88,6 +88,7 @@ class MessageConfig:
     size_bytes: int = 1024
     size_distribution: str = "256:80,4096:15,65536:5"
     reorder_window: int = 10_000
+    payload_format: str = "json"
 
 
 @dataclass
@@ -99,11 +100,18 @@ class ApiConfig:
 class MetricsConfig:
     port: int = 8888
     report_interval: str = "30s"
+    memory_profile: bool = False
+    memory_profile_interval: str = "60s"
+    stage_timer_sample_every: int = 0
 
     @property
     def report_interval_seconds(self) -> float:
         return _parse_duration(self.report_interval)
 
+    @property
+    def memory_profile_interval_seconds(self) -> float:
+        return _parse_duration(self.memory_profile_interval)
+
 
 @dataclass
 class LoggingConfig:
@@ -255,8 +263,12 @@ class Config:
             errors.append(f"message.size_mode must be 'fixed' or 'distribution', got '{self.message.size_mode}'")
         if self.message.size_bytes < 64:
             errors.append(f"message.size_bytes: must be >= 64, got {self.message.size_bytes}")
+        if self.message.payload_format not in ("json", "binary"):
+            errors.append(f"message.payload_format must be 'json' or 'binary', got '{self.message.payload_format}'")
         if self.metrics.port <= 0 or self.metrics.port > 65535:
             errors.append(f"metrics.port: must be 1-65535, got {self.metrics.port}")
+        if self.metrics.stage_timer_sample_every < 0:
+            errors.append(f"metrics.stage_timer_sample_every: must be >= 0, got {self.metrics.stage_timer_sample_every}")
         if self.shutdown.drain_timeout_seconds <= 0:
             errors.append(f"shutdown.drain_timeout_seconds: must be > 0, got {self.shutdown.drain_timeout_seconds}")
 
@@ -620,7 +632,10 @@ def translate_api_config(
     cfg.logging = startup_cfg.logging
     cfg.api = startup_cfg.api
     cfg.metrics = MetricsConfig(port=startup_cfg.metrics.port,
-                                report_interval=startup_cfg.metrics.report_interval)
+                                report_interval=startup_cfg.metrics.report_interval,
+                                memory_profile=startup_cfg.metrics.memory_profile,
+                                memory_profile_interval=startup_cfg.metrics.memory_profile_interval,
+                                stage_timer_sample_every=startup_cfg.metrics.stage_timer_sample_every)
     cfg.output = startup_cfg.output
     cfg.cors = startup_cfg.cors
 
@@ -742,16 +757,20 @@ def translate_api_config(
     size_mode = m.get("size_mode", "fixed")
     size_bytes = m.get("size_bytes", 1024)
     reorder = m.get("reorder_window", 10_000)
+    payload_format = m.get("payload_format", "json")
     if size_mode not in ("fixed", "distribution"):
         errors.append(f"message.size_mode must be 'fixed' or 'distribution', got '{size_mode}'")
     if size_bytes < 64:
         errors.append(f"message.size_bytes must be >= 64, got {size_bytes}")
     if reorder < 100:
         errors.append(f"message.reorder_window must be >= 100, got {reorder}")
+    if payload_format not in ("json", "binary"):
+        errors.append(f"message.payload_format must be 'json' or 'binary', got '{payload_format}'")
     cfg.message = MessageConfig(
         size_mode=size_mode, size_bytes=size_bytes,
         size_distribution=m.get("size_distribution", "256:80,4096:15,65536:5"),
         reorder_window=reorder,
+        payload_format=payload_format,
     )
 
     # --- Global thresholds ---
@@ -794,6 +813,16 @@ def translate_api_config(
     met = body.get("metrics", {})
     if "report_interval" in met:
         cfg.metrics.report_interval = met["report_interval"]
+    if "memory_profile" in met:
+        cfg.metrics.memory_profile = bool(met["memory_profile"])
+    if "memory_profile_interval" in met:
+        cfg.metrics.memory_profile_interval = met["memory_profile_interval"]
+    if "stage_timer_sample_every" in met:
+        sample_every = met["stage_timer_sample_every"]
+        if not isinstance(sample_every, int) or sample_every < 0:
+            errors.append("metrics.stage_timer_sample_every must be an integer >= 0")
+        else:
+            cfg.metrics.stage_timer_sample_every = sample_every
 
     ctx = RunContext(
         enabled_patterns=enabled,
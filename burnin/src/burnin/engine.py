@@ -49,6 +49,7 @@ from kubemq import (
     QueueMessage,
     QueuesClient,
     RetryPolicy,
+    StageTimer,
 )
 from kubemq.pubsub.events_store_subscription import EventStoreStartPosition
 
@@ -67,7 +68,9 @@ from burnin.config import (
 )
 from burnin.disconnect import AsyncDisconnectManager
 from burnin.http_server import BurninHTTPServer
-from burnin.pattern_group import PatternGroup
+from burnin.memory_profiler import MemoryProfiler, container_counts
+from burnin.pattern_group import CounterColumns, PatternGroup
+from burnin.peak_rate import LatencyAccumulator
 from burnin.report import generate_verdict, print_console_report, write_json_report
 from burnin.run_state import PatternState, RunState, StateMachine
 from burnin.worker import ALL_PATTERNS
@@ -91,6 +94,36 @@ _NOOP_EVENT_CB = lambda _: None
 _NOOP_CMD_CB = lambda _: None
 _NOOP_QUERY_CB = lambda _: None
 
+_REPORT_PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+def _latency_summary(accum: LatencyAccumulator) -> dict[str, float]:
+    p50, p95, p99, p999 = accum.percentiles_ms(_REPORT_PERCENTILES)
+    return {"p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1), "p999_ms": round(p999, 1)}
+
+
+def _timestamp_counts(pg: PatternGroup) -> dict[str, int]:
+    """Send timestamps that left the per-producer rings, summed over channels."""
+    stores = [w.ts_store for w in pg.channel_workers]
+    return {
+        "overflowed": sum(st.overflowed for st in stores),
+        "expired": sum(st.expired for st in stores),
+    }
+
+
+def _stage_summary(timer: StageTimer) -> dict[str, Any]:
+    """Summarise an SDK stage timer in microseconds; stages are mostly sub-ms."""
+    stages: dict[str, dict[str, float]] = {}
+    for name, hist in sorted(timer.snapshot().items()):
+        stages[name] = {
+            "count": hist.count,
+            "mean_us": round(hist.mean_seconds * 1e6, 1),
+            "p50_us": round(hist.percentile(50) * 1e6, 1),
+            "p99_us": round(hist.percentile(99) * 1e6, 1),
+            "max_us": round(hist.max_seconds * 1e6, 1),
+        }
+    return {"sample_every": timer.sample_every, "stages": stages}
+
 
 class Engine:
     """Orchestrates burn-in PatternGroups with API-controlled lifecycle.
@@ -126,6 +159,10 @@ class Engine:
         self._peak_rss: float = 0.0
         self._peak_workers: int = 0
         self._memory_samples: list[float] = []
+        self._memory_profiler: MemoryProfiler | None = None
+        self._memory_profile: dict[str, Any] = {}
+        self._stage_timer: StageTimer | None = None
+        self._stage_profile: dict[str, Any] = {}
         self._test_started: float = 0.0
         self._producers_stopped: float = 0.0
         self._run_task: asyncio.Task | None = None
@@ -264,6 +301,13 @@ class Engine:
         self._peak_rss = 0.0
         self._peak_workers = 0
         self._memory_samples = []
+        self._memory_profile = {}
+        if self._memory_profiler is not None:
+            self._memory_profiler.stop()
+            self._memory_profiler = None
+        sample_every = cfg.metrics.stage_timer_sample_every
+        self._stage_timer = StageTimer(sample_every=sample_every) if sample_every > 0 else None
+        self._stage_profile = {}
         self._test_started = 0.0
         self._producers_stopped = 0.0
         self._warmup_active = False
@@ -413,6 +457,7 @@ class Engine:
                 "size_bytes": cfg.message.size_bytes,
                 "size_distribution": cfg.message.size_distribution,
                 "reorder_window": cfg.message.reorder_window,
+                "payload_format": cfg.message.payload_format,
             },
             "thresholds": {
                 "max_loss_pct": cfg.thresholds.max_loss_pct,
@@ -434,7 +479,12 @@ class Engine:
                 "drain_timeout_seconds": cfg.shutdown.drain_timeout_seconds,
                 "cleanup_channels": cfg.shutdown.cleanup_channels,
             },
-            "metrics": {"report_interval": cfg.metrics.report_interval},
+            "metrics": {
+                "report_interval": cfg.metrics.report_interval,
+                "memory_profile": cfg.metrics.memory_profile,
+                "memory_profile_interval": cfg.metrics.memory_profile_interval,
+                "stage_timer_sample_every": cfg.metrics.stage_timer_sample_every,
+            },
         }
 
         for pname in ALL_PATTERN_NAMES:
@@ -471,6 +521,24 @@ class Engine:
             "config": config_body,
         }
 
+    def get_run_memory(self) -> tuple[int, dict[str, Any]]:
+        if not self._memory_profile:
+            return 404, {"message": "No memory profile sampled yet"}
+        return 200, {
+            "run_id": self._run_ctx.run_id if self._run_ctx else None,
+            "state": self._state.state.value,
+            **self._memory_profile,
+        }
+
+    def get_run_stages(self) -> tuple[int, dict[str, Any]]:
+        if not self._stage_profile:
+            return 404, {"message": "No stage timings sampled yet"}
+        return 200, {
+            "run_id": self._run_ctx.run_id if self._run_ctx else None,
+            "state": self._state.state.value,
+            **self._stage_profile,
+        }
+
     def get_run_report(self) -> tuple[int, dict[str, Any]]:
         if self._last_report:
             return 200, self._last_report
@@ -606,6 +674,8 @@ class Engine:
                 pass
             for pg in self._pattern_groups.values():
                 pg.reset_after_warmup()
+            if self._stage_timer is not None:
+                self._stage_timer.reset()
             self._warmup_active = False
             mc.set_warmup_active(0)
             logger.info("warmup complete, counters reset")
@@ -618,6 +688,9 @@ class Engine:
             self._pattern_states[p] = PatternState.RUNNING.value
 
         self._print_banner(cfg)
+        if cfg.metrics.memory_profile:
+            self._memory_profiler = MemoryProfiler()
+            self._memory_profiler.start()
         self._start_periodic_tasks(cfg)
 
         # Disconnect manager
@@ -691,6 +764,8 @@ class Engine:
             self._pattern_states[p] = "draining"
 
         # Snapshot all counters BEFORE stopping producers
+        for pg in self._pattern_groups.values():
+            await pg.flush_latency()
         self._producer_stop_snapshot = self._capture_pattern_snapshots()
         logger.info("producer-stop snapshot captured")
 
@@ -726,12 +801,22 @@ class Engine:
         for p in ctx.enabled_patterns:
             self._pattern_states[p] = PatternState.STOPPED.value
         logger.info("consumers stopped")
+        mc.flush()
 
         if self._baseline_rss == 0:
             self._baseline_rss = self._get_rss_mb()
 
+        for pg in self._pattern_groups.values():
+            await pg.flush_latency()
+        await self._sample_memory_profile()
+        if self._memory_profiler is not None:
+            self._memory_profiler.stop()
+            self._memory_profiler = None
+        if self._stage_timer is not None:
+            self._stage_profile = _stage_summary(self._stage_timer)
         summary = self._build_summary("stopped")
-        report = self._build_report(summary, ctx)
+        # Workers are stopped; the per-channel verdict checks run off the loop.
+        report = await asyncio.to_thread(self._build_report, summary, ctx)
         self._last_report = report
         self._last_summary = summary
 
@@ -879,6 +964,7 @@ class Engine:
             reconnect_backoff_multiplier=multiplier,
             retry_policy=RetryPolicy(**retry_kwargs),
             connection_pool_size=connection_pool_size,
+            stage_timer=self._stage_timer,
         )
 
     # Max channels per client — keeps bidi stream contention low
@@ -1354,7 +1440,11 @@ class Engine:
             asyncio.create_task(self._peak_rate_advancer(), name="peak-rate-advancer"),
             asyncio.create_task(self._uptime_tracker(), name="uptime-tracker"),
             asyncio.create_task(self._memory_tracker(), name="memory-tracker"),
-            asyncio.create_task(self._timestamp_purger(), name="timestamp-purger"),
+            asyncio.create_task(self._metrics_flusher(), name="metrics-flusher"),
+            asyncio.create_task(
+                self._memory_profile_sampler(cfg.metrics.memory_profile_interval_seconds),
+                name="memory-profile-sampler",
+            ),
         ]
         self._periodic_tasks = tasks
 
@@ -1377,34 +1467,43 @@ class Engine:
                             mc.inc_lost(w.pattern, delta)
                         lag = w.sent_count - w.received_count
                         mc.set_consumer_lag(w.pattern, max(0, lag))
-                    mc.set_actual_rate(pg.pattern, pg.aggregate_sliding_rate())
 
-                uptime_str = self._format_duration(elapsed)
-                header = (f"BURN-IN STATUS | uptime={uptime_str} "
+                counters = {pname: pg.counters() for pname, pg in self._pattern_groups.items()}
+                for pname, c in counters.items():
+                    mc.set_actual_rate(pname, c.aggregate_sliding_rate())
+                if self._stage_timer is not None:
+                    self._stage_profile = _stage_summary(self._stage_timer)
+                header = (f"BURN-IN STATUS | uptime={self._format_duration(elapsed)} "
                           f"mode={cfg.mode} rss={rss:.0f}MB")
-                lines = [header]
-                for pname, pg in self._pattern_groups.items():
-                    rate = pg.aggregate_sliding_rate()
-                    ch_count = pg.pattern_config.channels
-                    ch_label = f"({ch_count}ch)" if ch_count > 1 else ""
-                    if pname in RPC_PATTERNS:
-                        lines.append(
-                            f"  {pname}{ch_label:<14s} sent={pg.total_sent():<8d} "
-                            f"resp={pg.total_rpc_success():<8d} tout={pg.total_rpc_timeout():<4d} "
-                            f"err={pg.total_errors():<4d} p99={pg.pattern_rpc_latency_accum.percentile_ms(99.0):.1f}ms "
-                            f"rate={rate:.0f}/s"
-                        )
-                    else:
-                        lines.append(
-                            f"  {pname}{ch_label:<14s} sent={pg.total_sent():<8d} recv={pg.total_received():<8d} "
-                            f"lost={pg.total_lost():<4d} dup={pg.total_duplicated():<4d} "
-                            f"err={pg.total_errors():<4d} p99={pg.pattern_latency_accum.percentile_ms(99.0):.1f}ms "
-                            f"rate={rate:.0f}/s"
-                        )
-                logger.info("\n".join(lines))
+                # Percentiles and formatting run off the event loop so a large
+                # run's status tick does not stall producers and consumers.
+                await asyncio.to_thread(self._log_status, header, counters)
         except asyncio.CancelledError:
             pass
 
+    def _log_status(self, header: str, counters: dict[str, CounterColumns]) -> None:
+        lines = [header]
+        for pname, c in counters.items():
+            pg = self._pattern_groups[pname]
+            rate = c.aggregate_sliding_rate()
+            ch_count = pg.pattern_config.channels
+            ch_label = f"({ch_count}ch)" if ch_count > 1 else ""
+            if pname in RPC_PATTERNS:
+                lines.append(
+                    f"  {pname}{ch_label:<14s} sent={c.total_sent():<8d} "
+                    f"resp={c.total_rpc_success():<8d} tout={c.total_rpc_timeout():<4d} "
+                    f"err={c.total_errors():<4d} p99={pg.pattern_rpc_latency_accum.percentile_ms(99.0):.1f}ms "
+                    f"rate={rate:.0f}/s"
+                )
+            else:
+                lines.append(
+                    f"  {pname}{ch_label:<14s} sent={c.total_sent():<8d} recv={c.total_received():<8d} "
+                    f"lost={c.total_lost():<4d} dup={c.total_duplicated():<4d} "
+                    f"err={c.total_errors():<4d} p99={pg.pattern_latency_accum.percentile_ms(99.0):.1f}ms "
+                    f"rate={rate:.0f}/s"
+                )
+        logger.info("\n".join(lines))
+
     @staticmethod
     def _format_duration(secs: float) -> str:
         s = int(secs)
@@ -1423,6 +1522,8 @@ class Engine:
                 for w in self._all_workers():
                     w.peak_rate.advance()
                     w.sliding_rate.advance()
+                for pg in self._pattern_groups.values():
+                    await pg.flush_latency()
         except asyncio.CancelledError:
             pass
 
@@ -1440,6 +1541,36 @@ class Engine:
         except asyncio.CancelledError:
             pass
 
+    async def _metrics_flusher(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(1.0)
+                mc.flush()
+                if self._stop_event.is_set():
+                    break
+        except asyncio.CancelledError:
+            pass
+
+    async def _memory_profile_sampler(self, interval: float) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                if self._stop_event.is_set():
+                    break
+                await self._sample_memory_profile()
+        except asyncio.CancelledError:
+            pass
+
+    async def _sample_memory_profile(self) -> None:
+        """Refresh container counts and, if enabled, the tracemalloc diff."""
+        profile: dict[str, Any] = {
+            "containers": container_counts(self._all_clients, self._all_workers()),
+        }
+        if self._memory_profiler is not None:
+            # Snapshot and diff off the loop; they walk every traced block.
+            profile["tracemalloc"] = await asyncio.to_thread(self._memory_profiler.sample)
+        self._memory_profile = profile
+
     async def _memory_tracker(self) -> None:
         try:
             while True:
@@ -1457,17 +1588,6 @@ class Engine:
         except asyncio.CancelledError:
             pass
 
-    async def _timestamp_purger(self) -> None:
-        try:
-            while True:
-                await asyncio.sleep(60.0)
-                if self._stop_event.is_set():
-                    break
-                for w in self._all_workers():
-                    w.ts_store.purge(60.0)
-        except asyncio.CancelledError:
-            pass
-
     # ===================================================================
     # Snapshot capture at producer-stop time (T2)
     # ===================================================================
@@ -1476,31 +1596,34 @@ class Engine:
         """Read all live counters from every PatternGroup and return a snapshot dict."""
         snapshots: dict[str, dict[str, Any]] = {}
         for pname, pg in self._pattern_groups.items():
+            c = pg.counters()
+            lat = pg.pattern_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
+            rpc_lat = pg.pattern_rpc_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
             snap: dict[str, Any] = {
-                "sent": pg.total_sent(),
-                "received": pg.total_received(),
-                "lost": pg.total_lost(),
-                "duplicated": pg.total_duplicated(),
-                "corrupted": pg.total_corrupted(),
-                "out_of_order": pg.total_out_of_order(),
-                "errors": pg.total_errors(),
-                "reconnections": pg.total_reconnections(),
-                "bytes_sent": pg.total_bytes_sent(),
-                "bytes_received": pg.total_bytes_received(),
-                "rpc_success": pg.total_rpc_success(),
-                "rpc_timeout": pg.total_rpc_timeout(),
-                "rpc_error": pg.total_rpc_error(),
-                "unconfirmed": pg.total_unconfirmed(),
-                "peak_rate": pg.max_peak_rate(),
-                "downtime_seconds": pg.max_downtime_seconds(),
-                "latency_p50_ms": pg.pattern_latency_accum.percentile_ms(50.0),
-                "latency_p95_ms": pg.pattern_latency_accum.percentile_ms(95.0),
-                "latency_p99_ms": pg.pattern_latency_accum.percentile_ms(99.0),
-                "latency_p999_ms": pg.pattern_latency_accum.percentile_ms(99.9),
-                "rpc_latency_p50_ms": pg.pattern_rpc_latency_accum.percentile_ms(50.0),
-                "rpc_latency_p95_ms": pg.pattern_rpc_latency_accum.percentile_ms(95.0),
-                "rpc_latency_p99_ms": pg.pattern_rpc_latency_accum.percentile_ms(99.0),
-                "rpc_latency_p999_ms": pg.pattern_rpc_latency_accum.percentile_ms(99.9),
+                "sent": c.total_sent(),
+                "received": c.total_received(),
+                "lost": c.total_lost(),
+                "duplicated": c.total_duplicated(),
+                "corrupted": c.total_corrupted(),
+                "out_of_order": c.total_out_of_order(),
+                "errors": c.total_errors(),
+                "reconnections": c.total_reconnections(),
+                "bytes_sent": c.total_bytes_sent(),
+                "bytes_received": c.total_bytes_received(),
+                "rpc_success": c.total_rpc_success(),
+                "rpc_timeout": c.total_rpc_timeout(),
+                "rpc_error": c.total_rpc_error(),
+                "unconfirmed": c.total_unconfirmed(),
+                "peak_rate": c.max_peak_rate(),
+                "downtime_seconds": c.max_downtime_seconds(),
+                "latency_p50_ms": lat[0],
+                "latency_p95_ms": lat[1],
+                "latency_p99_ms": lat[2],
+                "latency_p999_ms": lat[3],
+                "rpc_latency_p50_ms": rpc_lat[0],
+                "rpc_latency_p95_ms": rpc_lat[1],
+                "rpc_latency_p99_ms": rpc_lat[2],
+                "rpc_latency_p999_ms": rpc_lat[3],
                 "_channel_workers_snapshot": [],
             }
 
@@ -1567,22 +1690,22 @@ class Engine:
                 lat_p99 = psnap["latency_p99_ms"]
                 lat_p999 = psnap["latency_p999_ms"]
             else:
-                sent = pg.total_sent()
-                received = pg.total_received()
-                lost = pg.total_lost()
-                duplicated = pg.total_duplicated()
-                corrupted = pg.total_corrupted()
-                out_of_order = pg.total_out_of_order()
-                errors = pg.total_errors()
-                reconnections = pg.total_reconnections()
-                downtime_seconds = pg.max_downtime_seconds()
-                bytes_sent = pg.total_bytes_sent()
-                bytes_received = pg.total_bytes_received()
-                peak_rate = pg.max_peak_rate()
-                lat_p50 = pg.pattern_latency_accum.percentile_ms(50.0)
-                lat_p95 = pg.pattern_latency_accum.percentile_ms(95.0)
-                lat_p99 = pg.pattern_latency_accum.percentile_ms(99.0)
-                lat_p999 = pg.pattern_latency_accum.percentile_ms(99.9)
+                c = pg.counters()
+                sent = c.total_sent()
+                received = c.total_received()
+                lost = c.total_lost()
+                duplicated = c.total_duplicated()
+                corrupted = c.total_corrupted()
+                out_of_order = c.total_out_of_order()
+                errors = c.total_errors()
+                reconnections = c.total_reconnections()
+                downtime_seconds = c.max_downtime_seconds()
+                bytes_sent = c.total_bytes_sent()
+                bytes_received = c.total_bytes_received()
+                peak_rate = c.max_peak_rate()
+                lat_p50, lat_p95, lat_p99, lat_p999 = (
+                    pg.pattern_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
+                )
 
             loss_pct = (lost / sent * 100) if sent > 0 else 0.0
             avg_throughput = sent / elapsed if elapsed > 0 else 0.0
@@ -1616,6 +1739,7 @@ class Engine:
                 "target_rate": target_rate,
                 "bytes_sent": bytes_sent,
                 "bytes_received": bytes_received,
+                "latency_timestamps": _timestamp_counts(pg),
             }
 
             if pname in RPC_PATTERNS:
@@ -1630,13 +1754,12 @@ class Engine:
                     rpc_p99 = psnap["rpc_latency_p99_ms"]
                     rpc_p999 = psnap["rpc_latency_p999_ms"]
                 else:
-                    ps["responses_success"] = pg.total_rpc_success()
-                    ps["responses_timeout"] = pg.total_rpc_timeout()
-                    ps["responses_error"] = pg.total_rpc_error()
-                    rpc_p50 = pg.pattern_rpc_latency_accum.percentile_ms(50.0)
-                    rpc_p95 = pg.pattern_rpc_latency_accum.percentile_ms(95.0)
-                    rpc_p99 = pg.pattern_rpc_latency_accum.percentile_ms(99.0)
-                    rpc_p999 = pg.pattern_rpc_latency_accum.percentile_ms(99.9)
+                    ps["responses_success"] = c.total_rpc_success()
+                    ps["responses_timeout"] = c.total_rpc_timeout()
+                    ps["responses_error"] = c.total_rpc_error()
+                    rpc_p50, rpc_p95, rpc_p99, rpc_p999 = (
+                        pg.pattern_rpc_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
+                    )
                 ps["rpc_p50_ms"] = rpc_p50
                 ps["rpc_p95_ms"] = rpc_p95
                 ps["rpc_p99_ms"] = rpc_p99
@@ -1656,7 +1779,7 @@ class Engine:
                 ps["num_consumers"] = pc.consumers_per_channel
 
             if pname == "events_store":
-                ps["unconfirmed"] = psnap["unconfirmed"] if psnap else pg.total_unconfirmed()
+                ps["unconfirmed"] = psnap["unconfirmed"] if psnap else c.total_unconfirmed()
 
             ps["_channel_workers"] = pg.channel_workers
 
@@ -1724,10 +1847,11 @@ class Engine:
 
         patterns_resp: dict[str, Any] = {}
         for pname, pg in self._pattern_groups.items():
+            c = pg.counters()
             pc = pg.pattern_config
-            sent = pg.total_sent()
-            received = pg.total_received()
-            lost = pg.total_lost()
+            sent = c.total_sent()
+            received = c.total_received()
+            lost = c.total_lost()
             loss_pct = (lost / sent * 100) if sent > 0 else 0.0
 
             p: dict[str, Any] = {
@@ -1737,44 +1861,34 @@ class Engine:
                 "sent": sent,
                 "received": received,
                 "lost": lost,
-                "duplicated": pg.total_duplicated(),
-                "corrupted": pg.total_corrupted(),
-                "out_of_order": pg.total_out_of_order(),
-                "errors": pg.total_errors(),
-                "reconnections": pg.total_reconnections(),
+                "duplicated": c.total_duplicated(),
+                "corrupted": c.total_corrupted(),
+                "out_of_order": c.total_out_of_order(),
+                "errors": c.total_errors(),
+                "reconnections": c.total_reconnections(),
                 "loss_pct": round(loss_pct, 5),
                 "target_rate": pc.rate * pc.channels,
-                "actual_rate": round(pg.aggregate_sliding_rate(), 1),
-                "peak_rate": round(pg.max_peak_rate(), 1),
-                "bytes_sent": pg.total_bytes_sent(),
-                "bytes_received": pg.total_bytes_received(),
-                "latency": {
-                    "p50_ms": round(pg.pattern_latency_accum.percentile_ms(50.0), 1),
-                    "p95_ms": round(pg.pattern_latency_accum.percentile_ms(95.0), 1),
-                    "p99_ms": round(pg.pattern_latency_accum.percentile_ms(99.0), 1),
-                    "p999_ms": round(pg.pattern_latency_accum.percentile_ms(99.9), 1),
-                },
+                "actual_rate": round(c.aggregate_sliding_rate(), 1),
+                "peak_rate": round(c.max_peak_rate(), 1),
+                "bytes_sent": c.total_bytes_sent(),
+                "bytes_received": c.total_bytes_received(),
+                "latency": _latency_summary(pg.pattern_latency_accum),
             }
 
             if pname in RPC_PATTERNS:
                 p["senders_per_channel"] = pc.senders_per_channel
                 p["responders_per_channel"] = pc.responders_per_channel
-                p["responses_success"] = pg.total_rpc_success()
-                p["responses_timeout"] = pg.total_rpc_timeout()
-                p["responses_error"] = pg.total_rpc_error()
-                p["latency"] = {
-                    "p50_ms": round(pg.pattern_rpc_latency_accum.percentile_ms(50.0), 1),
-                    "p95_ms": round(pg.pattern_rpc_latency_accum.percentile_ms(95.0), 1),
-                    "p99_ms": round(pg.pattern_rpc_latency_accum.percentile_ms(99.0), 1),
-                    "p999_ms": round(pg.pattern_rpc_latency_accum.percentile_ms(99.9), 1),
-                }
+                p["responses_success"] = c.total_rpc_success()
+                p["responses_timeout"] = c.total_rpc_timeout()
+                p["responses_error"] = c.total_rpc_error()
+                p["latency"] = _latency_summary(pg.pattern_rpc_latency_accum)
             else:
                 p["producers_per_channel"] = pc.producers_per_channel
                 p["consumers_per_channel"] = pc.consumers_per_channel
                 if pname in PUBSUB_PATTERNS:
                     p["consumer_group"] = pc.consumer_group
                 if pname == "events_store":
-                    p["unconfirmed"] = pg.total_unconfirmed()
+                    p["unconfirmed"] = c.total_unconfirmed()
 
             patterns_resp[pname] = p
 
@@ -1798,18 +1912,19 @@ class Engine:
     def _compute_totals(self) -> dict[str, int]:
         sent = received = lost = duplicated = corrupted = out_of_order = errors = reconnections = 0
         for pname, pg in self._pattern_groups.items():
-            sent += pg.total_sent()
+            c = pg.counters()
+            sent += c.total_sent()
             if pname in RPC_PATTERNS:
-                received += pg.total_rpc_success()
-                lost += pg.total_rpc_timeout() + pg.total_rpc_error()
+                received += c.total_rpc_success()
+                lost += c.total_rpc_timeout() + c.total_rpc_error()
             else:
-                received += pg.total_received()
-                lost += pg.total_lost()
-            duplicated += pg.total_duplicated()
-            corrupted += pg.total_corrupted()
-            out_of_order += pg.total_out_of_order()
-            errors += pg.total_errors()
-            reconnections += pg.total_reconnections()
+                received += c.total_received()
+                lost += c.total_lost()
+            duplicated += c.total_duplicated()
+            corrupted += c.total_corrupted()
+            out_of_order += c.total_out_of_order()
+            errors += c.total_errors()
+            reconnections += c.total_reconnections()
         return {
             "sent": sent, "received": received, "lost": lost,
             "duplicated": duplicated, "corrupted": corrupted,
@@ -1860,22 +1975,22 @@ class Engine:
                 lat_p99 = psnap["latency_p99_ms"]
                 lat_p999 = psnap["latency_p999_ms"]
             else:
-                sent = pg.total_sent()
-                received = pg.total_received()
-                lost = pg.total_lost()
-                duplicated = pg.total_duplicated()
-                corrupted = pg.total_corrupted()
-                out_of_order = pg.total_out_of_order()
-                errors = pg.total_errors()
-                reconnections = pg.total_reconnections()
-                bytes_sent = pg.total_bytes_sent()
-                bytes_received = pg.total_bytes_received()
-                downtime_seconds = pg.max_downtime_seconds()
-                peak_rate = pg.max_peak_rate()
-                lat_p50 = pg.pattern_latency_accum.percentile_ms(50.0)
-                lat_p95 = pg.pattern_latency_accum.percentile_ms(95.0)
-                lat_p99 = pg.pattern_latency_accum.percentile_ms(99.0)
-                lat_p999 = pg.pattern_latency_accum.percentile_ms(99.9)
+                c = pg.counters()
+                sent = c.total_sent()
+                received = c.total_received()
+                lost = c.total_lost()
+                duplicated = c.total_duplicated()
+                corrupted = c.total_corrupted()
+                out_of_order = c.total_out_of_order()
+                errors = c.total_errors()
+                reconnections = c.total_reconnections()
+                bytes_sent = c.total_bytes_sent()
+                bytes_received = c.total_bytes_received()
+                downtime_seconds = c.max_downtime_seconds()
+                peak_rate = c.max_peak_rate()
+                lat_p50, lat_p95, lat_p99, lat_p999 = (
+                    pg.pattern_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
+                )
 
             loss_pct = (lost / sent * 100) if sent > 0 else 0.0
             avg_rate = sent / elapsed if elapsed > 0 else 0.0
@@ -1906,6 +2021,7 @@ class Engine:
                 "bytes_sent": bytes_sent,
                 "bytes_received": bytes_received,
                 "downtime_seconds": downtime_seconds,
+                "latency_timestamps": _timestamp_counts(pg),
             }
 
             if pname in RPC_PATTERNS:
@@ -1920,13 +2036,12 @@ class Engine:
                     rpc_p99 = psnap["rpc_latency_p99_ms"]
                     rpc_p999 = psnap["rpc_latency_p999_ms"]
                 else:
-                    pr["responses_success"] = pg.total_rpc_success()
-                    pr["responses_timeout"] = pg.total_rpc_timeout()
-                    pr["responses_error"] = pg.total_rpc_error()
-                    rpc_p50 = pg.pattern_rpc_latency_accum.percentile_ms(50.0)
-                    rpc_p95 = pg.pattern_rpc_latency_accum.percentile_ms(95.0)
-                    rpc_p99 = pg.pattern_rpc_latency_accum.percentile_ms(99.0)
-                    rpc_p999 = pg.pattern_rpc_latency_accum.percentile_ms(99.9)
+                    pr["responses_success"] = c.total_rpc_success()
+                    pr["responses_timeout"] = c.total_rpc_timeout()
+                    pr["responses_error"] = c.total_rpc_error()
+                    rpc_p50, rpc_p95, rpc_p99, rpc_p999 = (
+                        pg.pattern_rpc_latency_accum.percentiles_ms(_REPORT_PERCENTILES)
+                    )
                 pr["latency"] = {
                     "p50_ms": round(rpc_p50, 1),
                     "p95_ms": round(rpc_p95, 1),
@@ -1939,7 +2054,7 @@ class Engine:
                 if pname in PUBSUB_PATTERNS:
                     pr["consumer_group"] = pc.consumer_group
                 if pname == "events_store":
-                    pr["unconfirmed"] = pg.total_unconfirmed()
+                    pr["unconfirmed"] = psnap["unconfirmed"] if psnap else c.total_unconfirmed()
 
             patterns_report[pname] = pr
 
@@ -1968,6 +2083,8 @@ class Engine:
                 "memory_growth_factor": round(growth, 2),
                 "peak_workers": self._peak_workers,
             },
+            "memory_profile": self._memory_profile,
+            "stage_timings": self._stage_profile,
             "verdict": verdict,
         }
 
@@ -27,6 +27,8 @@ class EngineAPI(Protocol):
     def get_run_status(self) -> dict[str, Any]: ...
     def get_run_config(self) -> tuple[int, dict[str, Any]]: ...
     def get_run_report(self) -> tuple[int, dict[str, Any]]: ...
+    def get_run_memory(self) -> tuple[int, dict[str, Any]]: ...
+    def get_run_stages(self) -> tuple[int, dict[str, Any]]: ...
     def handle_cleanup(self) -> tuple[int, dict[str, Any]]: ...
     def get_cors_origins(self) -> str: ...
 
@@ -86,6 +88,20 @@ class _Handler(BaseHTTPRequestHandler):
                 code, data = 404, {"message": "No run configuration available"}
             self._json_ok(code, data)
 
+        elif path == "/run/memory":
+            if api:
+                code, data = api.get_run_memory()
+            else:
+                code, data = 404, {"message": "No memory profile sampled yet"}
+            self._json_ok(code, data)
+
+        elif path == "/run/stages":
+            if api:
+                code, data = api.get_run_stages()
+            else:
+                code, data = 404, {"message": "No stage timings sampled yet"}
+            self._json_ok(code, data)
+
         elif path in ("/run/report", "/summary"):
             if path == "/summary":
                 self._log_deprecation("/summary", "/run/report")
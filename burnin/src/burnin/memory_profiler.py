@@ -0,0 +1,157 @@
+"""Soak-test memory profiling: tracemalloc growth by site + SDK container counts.
+
+RSS growth (thresholds.max_memory_growth_factor) says memory grew, not
+where. This module answers the second question two ways:
+
+- container_counts() sizes the structures that can grow without bound in a
+  long run: the async SDK stream workers' pending-response maps, send
+  queues and stage-timing maps, client subscription task sets, and
+  burnin's own sequence trackers, send-timestamp stores and worker tasks.
+  Cheap enough to run on every sample.
+- MemoryProfiler (opt-in via metrics.memory_profile) keeps a tracemalloc
+  baseline and reports the allocation sites that grew the most since it,
+  and since the previous sample.
+
+Both are served by GET /run/memory and included in the final report.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from typing import Any, Iterable
+
+# Allocation sites inside these files are bookkeeping, not growth.
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+# SDK stream workers hung off the async clients, and the attributes to size.
+_STREAM_WORKERS = {
+    "event_sender": ("_event_sender", ("_response_tracking", "_enqueued_at", "_written_at")),
+    "upstream_sender": ("_upstream_sender", ("_response_tracking", "_enqueued_at", "_written_at")),
+    "downstream_receiver": ("_downstream_receiver", ("_response_tracking", "_enqueued_at", "_written_at")),
+}
+
+
+def _size(obj: Any) -> int:
+    if obj is None:
+        return 0
+    qsize = getattr(obj, "qsize", None)
+    if qsize is not None:
+        return qsize()
+    try:
+        return len(obj)
+    except TypeError:
+        return 0
+
+
+def container_counts(clients: Iterable[Any], workers: Iterable[Any]) -> dict[str, dict[str, int]]:
+    """Return element counts of the SDK and burnin containers that can leak.
+
+    Counts are summed across clients (and across workers), keyed by
+    component and attribute name. Call from the event loop that owns them.
+    """
+    sdk: dict[str, int] = {}
+    for client in clients:
+        sdk["subscription_tasks"] = sdk.get("subscription_tasks", 0) + _size(
+            getattr(client, "_subscription_tasks", None)
+        )
+        for name, (attr, fields) in _STREAM_WORKERS.items():
+            stream = getattr(client, attr, None)
+            if stream is None:
+                continue
+            for field in ("_send_queue", *fields):
+                key = f"{name}.{field.lstrip('_')}"
+                sdk[key] = sdk.get(key, 0) + _size(getattr(stream, field, None))
+
+    harness = {
+        "workers": 0, "worker_tasks": 0, "tracker_producers": 0,
+        "tracker_window_slots": 0, "ts_store_entries": 0,
+    }
+    for w in workers:
+        harness["workers"] += 1
+        harness["worker_tasks"] += len(w._tasks)
+        producers = list(w.tracker._producers.values())
+        harness["tracker_producers"] += len(producers)
+        harness["tracker_window_slots"] += sum(len(p.window) for p in producers)
+        harness["ts_store_entries"] += len(w.ts_store)
+    return {"sdk": sdk, "burnin": harness}
+
+
+def _top_growth(stats: list[tracemalloc.StatisticDiff], limit: int) -> list[dict[str, Any]]:
+    top: list[dict[str, Any]] = []
+    for stat in stats:
+        if len(top) == limit:
+            break
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        top.append({
+            "site": f"{frame.filename}:{frame.lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "growth_kb": round(stat.size_diff / 1024, 1),
+            "count": stat.count,
+            "count_growth": stat.count_diff,
+        })
+    return top
+
+
+class MemoryProfiler:
+    """Periodic tracemalloc snapshots diffed by allocation site.
+
+    start() begins tracing and records the baseline; sample() takes a
+    snapshot and stores the sites with the largest growth since the
+    baseline and since the previous sample. tracemalloc slows allocation
+    noticeably, so this is only enabled on request.
+
+    Thread-safe: sample() may run in a worker thread while the HTTP server
+    reads latest().
+    """
+
+    def __init__(self, top_n: int = 20, frames: int = 1) -> None:
+        self._top_n = top_n
+        self._frames = frames
+        self._baseline: tracemalloc.Snapshot | None = None
+        self._previous: tracemalloc.Snapshot | None = None
+        self._latest: dict[str, Any] = {}
+        self._started_here = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started_here = True
+        self._baseline = self._previous = self._snapshot()
+
+    def stop(self) -> None:
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, f) for f in _IGNORED_FILES])
+
+    def sample(self) -> dict[str, Any]:
+        """Take a snapshot, diff it against the baseline and the previous one."""
+        if self._baseline is None or self._previous is None:
+            return {}
+        snapshot = self._snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        since_start = snapshot.compare_to(self._baseline, "lineno")
+        since_last = snapshot.compare_to(self._previous, "lineno")
+        self._previous = snapshot
+        result = {
+            "sampled_at": time.time(),
+            "traced_mb": round(current / 1024 / 1024, 1),
+            "traced_peak_mb": round(peak / 1024 / 1024, 1),
+            "top_growth_since_start": _top_growth(since_start, self._top_n),
+            "top_growth_since_last": _top_growth(since_last, self._top_n),
+        }
+        with self._lock:
+            self._latest = result
+        return result
+
+    def latest(self) -> dict[str, Any]:
+        with self._lock:
+            return self._latest
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from prometheus_client import Counter, Gauge, Histogram
 
 SDK_LABEL = "python"
@@ -182,18 +184,55 @@ active_workers = Gauge(
 )
 
 
+# --- Per-message aggregation ---
+#
+# Per-message counters are not written to the registry directly: each
+# .labels() call is a locked dict lookup inside prometheus_client, which at
+# high rates is the harness measuring itself. Hot-path helpers add to plain
+# deltas keyed by (metric, label values), and flush() -- called from the
+# engine's periodic tick and at shutdown -- applies them through cached,
+# pre-bound label children. Histogram observations go straight to a cached
+# child. Workers call these from the engine's event loop only.
+
+_children: dict[tuple[Any, tuple[str, ...]], Any] = {}
+_pending: dict[tuple[Any, tuple[str, ...]], float] = {}
+
+
+def _child(metric: Any, labels: tuple[str, ...]) -> Any:
+    key = (metric, labels)
+    child = _children.get(key)
+    if child is None:
+        child = _children[key] = metric.labels(*labels)
+    return child
+
+
+def _add(metric: Any, labels: tuple[str, ...], amount: float = 1) -> None:
+    key = (metric, labels)
+    _pending[key] = _pending.get(key, 0) + amount
+
+
+def flush() -> None:
+    """Apply accumulated counter deltas to the Prometheus registry."""
+    if not _pending:
+        return
+    pending = list(_pending.items())
+    _pending.clear()
+    for (metric, labels), amount in pending:
+        _child(metric, labels).inc(amount)
+
+
 # --- Helper functions ---
 
 def inc_sent(pattern: str, producer_id: str, byte_count: int = 0) -> None:
-    messages_sent_total.labels(sdk=SDK_LABEL, pattern=pattern, producer_id=producer_id).inc()
+    _add(messages_sent_total, (SDK_LABEL, pattern, producer_id))
     if byte_count > 0:
-        bytes_sent_total.labels(sdk=SDK_LABEL, pattern=pattern).inc(byte_count)
+        _add(bytes_sent_total, (SDK_LABEL, pattern), byte_count)
 
 
 def inc_received(pattern: str, consumer_id: str, byte_count: int = 0) -> None:
-    messages_received_total.labels(sdk=SDK_LABEL, pattern=pattern, consumer_id=consumer_id).inc()
+    _add(messages_received_total, (SDK_LABEL, pattern, consumer_id))
     if byte_count > 0:
-        bytes_received_total.labels(sdk=SDK_LABEL, pattern=pattern).inc(byte_count)
+        _add(bytes_received_total, (SDK_LABEL, pattern), byte_count)
 
 
 def inc_lost(pattern: str, count: int = 1) -> None:
@@ -201,15 +240,15 @@ def inc_lost(pattern: str, count: int = 1) -> None:
 
 
 def inc_duplicated(pattern: str) -> None:
-    messages_duplicated_total.labels(sdk=SDK_LABEL, pattern=pattern).inc()
+    _add(messages_duplicated_total, (SDK_LABEL, pattern))
 
 
 def inc_corrupted(pattern: str) -> None:
-    messages_corrupted_total.labels(sdk=SDK_LABEL, pattern=pattern).inc()
+    _add(messages_corrupted_total, (SDK_LABEL, pattern))
 
 
 def inc_out_of_order(pattern: str) -> None:
-    messages_out_of_order_total.labels(sdk=SDK_LABEL, pattern=pattern).inc()
+    _add(messages_out_of_order_total, (SDK_LABEL, pattern))
 
 
 def inc_unconfirmed(pattern: str) -> None:
@@ -217,11 +256,11 @@ def inc_unconfirmed(pattern: str) -> None:
 
 
 def inc_reconnection_duplicates(pattern: str) -> None:
-    reconnection_duplicates_total.labels(sdk=SDK_LABEL, pattern=pattern).inc()
+    _add(reconnection_duplicates_total, (SDK_LABEL, pattern))
 
 
 def inc_error(pattern: str, error_type: str) -> None:
-    errors_total.labels(sdk=SDK_LABEL, pattern=pattern, error_type=error_type).inc()
+    _add(errors_total, (SDK_LABEL, pattern, error_type))
 
 
 def inc_reconnections(pattern: str) -> None:
@@ -229,7 +268,7 @@ def inc_reconnections(pattern: str) -> None:
 
 
 def inc_rpc_response(pattern: str, status: str) -> None:
-    rpc_responses_total.labels(sdk=SDK_LABEL, pattern=pattern, status=status).inc()
+    _add(rpc_responses_total, (SDK_LABEL, pattern, status))
 
 
 def add_downtime(pattern: str, seconds: float) -> None:
@@ -241,15 +280,15 @@ def inc_forced_disconnects() -> None:
 
 
 def observe_latency(pattern: str, seconds: float) -> None:
-    message_latency_seconds.labels(sdk=SDK_LABEL, pattern=pattern).observe(seconds)
+    _child(message_latency_seconds, (SDK_LABEL, pattern)).observe(seconds)
 
 
 def observe_send_duration(pattern: str, seconds: float) -> None:
-    send_duration_seconds.labels(sdk=SDK_LABEL, pattern=pattern).observe(seconds)
+    _child(send_duration_seconds, (SDK_LABEL, pattern)).observe(seconds)
 
 
 def observe_rpc_duration(pattern: str, seconds: float) -> None:
-    rpc_duration_seconds.labels(sdk=SDK_LABEL, pattern=pattern).observe(seconds)
+    _child(rpc_duration_seconds, (SDK_LABEL, pattern)).observe(seconds)
 
 
 def set_active_connections(pattern: str, count: float) -> None:
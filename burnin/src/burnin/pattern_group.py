@@ -2,18 +2,19 @@
 
 Each PatternGroup holds all workers for one pattern across all channels.
 Provides lifecycle control (start/stop consumers/producers) and
-aggregate stat methods for report/verdict.
+counter snapshots (CounterColumns) for report/verdict.
 
 Async version: start methods are async, stop methods stay sync (just set flags).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 from burnin.config import PatternConfig, Config, RPC_PATTERNS, PUBSUB_PATTERNS
-from burnin.peak_rate import LatencyAccumulator
+from burnin.peak_rate import LatencyAccumulator, LoopLatencyAccumulator
 from burnin.worker.base import BaseWorker
 from burnin.worker.events import EventsWorker
 from burnin.worker.events_store import EventsStoreWorker
@@ -63,6 +64,115 @@ def _create_worker(
         raise ValueError(f"Unknown pattern: {pattern}")
 
 
+class CounterColumns:
+    """Columnar snapshot of one PatternGroup's worker counters.
+
+    Built in a single pass over the workers; each counter is a list
+    indexed by channel worker, and aggregates are computed over the lists.
+    Report and status code that needs several totals takes one snapshot
+    instead of walking every worker once per total.
+    """
+
+    _INT_COLUMNS = (
+        "sent", "received", "lost", "duplicated", "corrupted", "out_of_order",
+        "errors", "reconnections", "bytes_sent", "bytes_received",
+        "rpc_success", "rpc_timeout", "rpc_error", "unconfirmed",
+    )
+    _FLOAT_COLUMNS = ("downtime_seconds", "peak_rate", "sliding_rate")
+
+    def __init__(self, workers: list[BaseWorker]) -> None:
+        self.columns: dict[str, list[Any]] = {name: [] for name in self._INT_COLUMNS + self._FLOAT_COLUMNS}
+        cols = self.columns
+        for w in workers:
+            tracker = w.tracker
+            cols["sent"].append(w.sent_count)
+            cols["received"].append(w.received_count)
+            cols["lost"].append(tracker.total_lost())
+            cols["duplicated"].append(tracker.total_duplicates())
+            cols["corrupted"].append(w.corrupted_count)
+            cols["out_of_order"].append(tracker.total_out_of_order())
+            cols["errors"].append(w.error_count)
+            cols["reconnections"].append(w.reconnection_count)
+            cols["bytes_sent"].append(w.bytes_sent)
+            cols["bytes_received"].append(w.bytes_received)
+            cols["rpc_success"].append(w.rpc_success_count)
+            cols["rpc_timeout"].append(w.rpc_timeout_count)
+            cols["rpc_error"].append(w.rpc_error_count)
+            cols["unconfirmed"].append(w.unconfirmed_count)
+            cols["downtime_seconds"].append(w.downtime_seconds)
+            cols["peak_rate"].append(w.peak_rate.peak())
+            cols["sliding_rate"].append(w.sliding_rate.rate())
+
+    def _sum(self, name: str) -> Any:
+        return sum(self.columns[name])
+
+    def _max(self, name: str) -> Any:
+        column = self.columns[name]
+        if not column:
+            return 0 if name in self._INT_COLUMNS else 0.0
+        return max(column)
+
+    def total_sent(self) -> int:
+        return self._sum("sent")
+
+    def total_received(self) -> int:
+        return self._sum("received")
+
+    def total_lost(self) -> int:
+        return self._sum("lost")
+
+    def total_duplicated(self) -> int:
+        return self._sum("duplicated")
+
+    def total_corrupted(self) -> int:
+        return self._sum("corrupted")
+
+    def total_errors(self) -> int:
+        return self._sum("errors")
+
+    def total_bytes_sent(self) -> int:
+        return self._sum("bytes_sent")
+
+    def total_bytes_received(self) -> int:
+        return self._sum("bytes_received")
+
+    def total_out_of_order(self) -> int:
+        return self._sum("out_of_order")
+
+    def total_reconnections(self) -> int:
+        """Connection-level: max across channels (shared connection)."""
+        return self._max("reconnections")
+
+    def max_downtime_seconds(self) -> float:
+        """Max downtime across channels (shared connection = same downtime)."""
+        return self._max("downtime_seconds")
+
+    def total_rpc_success(self) -> int:
+        return self._sum("rpc_success")
+
+    def total_rpc_timeout(self) -> int:
+        return self._sum("rpc_timeout")
+
+    def total_rpc_error(self) -> int:
+        return self._sum("rpc_error")
+
+    def total_unconfirmed(self) -> int:
+        return self._sum("unconfirmed")
+
+    def max_peak_rate(self) -> float:
+        """Max peak rate across all channels."""
+        return self._max("peak_rate")
+
+    def aggregate_sliding_rate(self) -> float:
+        """Sum of sliding rates across all channels."""
+        return self._sum("sliding_rate")
+
+
+def _record_batches(batches: list[tuple[LatencyAccumulator, int, list[int]]]) -> None:
+    for accum, generation, samples in batches:
+        accum.record_micros(samples, generation)
+
+
 class PatternGroup:
     """Holds N ChannelWorkers for a single pattern.
 
@@ -85,8 +195,8 @@ class PatternGroup:
         self.run_id = run_id
 
         # Pattern-level shared latency accumulators
-        self.pattern_latency_accum = LatencyAccumulator()
-        self.pattern_rpc_latency_accum = LatencyAccumulator()
+        self.pattern_latency_accum: LatencyAccumulator = LoopLatencyAccumulator()
+        self.pattern_rpc_latency_accum: LatencyAccumulator = LoopLatencyAccumulator()
 
         # Create workers for each channel, distributing across clients round-robin
         self.channel_workers: list[BaseWorker] = []
@@ -115,6 +225,10 @@ class PatternGroup:
             worker.pattern_rpc_latency_accum = self.pattern_rpc_latency_accum
             self.channel_workers.append(worker)
 
+    def counters(self) -> CounterColumns:
+        """Snapshot all worker counters in one pass (see CounterColumns)."""
+        return CounterColumns(self.channel_workers)
+
     # --- Lifecycle ---
 
     async def start_consumers(self) -> None:
@@ -151,6 +265,23 @@ class PatternGroup:
         self.pattern_latency_accum.reset()
         self.pattern_rpc_latency_accum.reset()
 
+    async def flush_latency(self) -> None:
+        """Publish buffered latency samples of the pattern and its workers.
+
+        The buffers are swapped out on the loop; recording them into the
+        histograms runs in a worker thread. Each batch carries the
+        accumulator's generation, so a reset_after_warmup() that lands
+        mid-flush drops the rest of the warmup samples.
+        """
+        accums = [self.pattern_latency_accum, self.pattern_rpc_latency_accum]
+        for w in self.channel_workers:
+            accums.append(w.latency_accum)
+            accums.append(w.rpc_latency_accum)
+        batches = [(accum, accum.generation, accum.take_pending()) for accum in accums]
+        batches = [batch for batch in batches if batch[2]]
+        if batches:
+            await asyncio.to_thread(_record_batches, batches)
+
     def set_reconnection_callback(self, cb: Any) -> None:
         """Set reconnection callback for all channel workers."""
         for w in self.channel_workers:
@@ -160,66 +291,3 @@ class PatternGroup:
         """Update client reference for all channel workers (after reconnect)."""
         for w in self.channel_workers:
             w.set_client(client)
-
-    # --- Aggregation ---
-
-    def total_sent(self) -> int:
-        return sum(w.sent_count for w in self.channel_workers)
-
-    def total_received(self) -> int:
-        return sum(w.received_count for w in self.channel_workers)
-
-    def total_lost(self) -> int:
-        return sum(w.tracker.total_lost() for w in self.channel_workers)
-
-    def total_duplicated(self) -> int:
-        return sum(w.tracker.total_duplicates() for w in self.channel_workers)
-
-    def total_corrupted(self) -> int:
-        return sum(w.corrupted_count for w in self.channel_workers)
-
-    def total_errors(self) -> int:
-        return sum(w.error_count for w in self.channel_workers)
-
-    def total_bytes_sent(self) -> int:
-        return sum(w.bytes_sent for w in self.channel_workers)
-
-    def total_bytes_received(self) -> int:
-        return sum(w.bytes_received for w in self.channel_workers)
-
-    def total_out_of_order(self) -> int:
-        return sum(w.tracker.total_out_of_order() for w in self.channel_workers)
-
-    def total_reconnections(self) -> int:
-        """Connection-level: max across channels (shared connection)."""
-        if not self.channel_workers:
-            return 0
-        return max(w.reconnection_count for w in self.channel_workers)
-
-    def max_downtime_seconds(self) -> float:
-        """Max downtime across channels (shared connection = same downtime)."""
-        if not self.channel_workers:
-            return 0.0
-        return max(w.downtime_seconds for w in self.channel_workers)
-
-    def total_rpc_success(self) -> int:
-        return sum(w.rpc_success_count for w in self.channel_workers)
-
-    def total_rpc_timeout(self) -> int:
-        return sum(w.rpc_timeout_count for w in self.channel_workers)
-
-    def total_rpc_error(self) -> int:
-        return sum(w.rpc_error_count for w in self.channel_workers)
-
-    def total_unconfirmed(self) -> int:
-        return sum(w.unconfirmed_count for w in self.channel_workers)
-
-    def max_peak_rate(self) -> float:
-        """Max peak rate across all channels."""
-        if not self.channel_workers:
-            return 0.0
-        return max(w.peak_rate.peak() for w in self.channel_workers)
-
-    def aggregate_sliding_rate(self) -> float:
-        """Sum of sliding rates across all channels."""
-        return sum(w.sliding_rate.rate() for w in self.channel_workers)
@@ -130,6 +130,7 @@ def _ensure_bench_padding(size: int) -> None:
     global _bench_padding
     if len(_bench_padding) < size:
         _bench_padding = os.urandom(max(size, 4096))
+        _padding_crcs.clear()
 
 
 def encode_fast(sequence: int, target_size: int) -> bytes:
@@ -154,3 +155,74 @@ def decode_fast(body: bytes) -> tuple[int, int]:
     if len(body) >= _BENCH_HEADER_SIZE:
         return _BENCH_HEADER.unpack_from(body, 0)
     return 0, 0
+
+
+# ---------------------------------------------------------------------------
+# Binary framed payload (fixed header + pre-allocated padding, with CRC32)
+# ---------------------------------------------------------------------------
+
+# Header: magic, sdk id, pattern id, producer index (uint32), sequence (uint64),
+# timestamp_ns (uint64), then the CRC32 (uint32) = 28 bytes.
+_FRAME_MAGIC = b"KF"
+_FRAME_PREFIX = struct.Struct("!2sBBIQQ")
+_FRAME_PREFIX_SIZE = _FRAME_PREFIX.size  # 24 bytes
+_FRAME_CRC = struct.Struct("!I")
+_FRAME_HEADER_SIZE = _FRAME_PREFIX_SIZE + _FRAME_CRC.size  # 28 bytes
+
+SDK_IDS = {"python": 1}
+PATTERN_IDS = {
+    name: i
+    for i, name in enumerate(
+        ["events", "events_store", "queue_stream", "queue_simple", "commands", "queries"], 1,
+    )
+}
+
+# CRC32 of the first n bytes of the padding buffer, keyed by n.
+_padding_crcs: dict[int, int] = {}
+
+
+def encode_framed(
+    sdk: str,
+    pattern: str,
+    producer_index: int,
+    sequence: int,
+    target_size: int,
+) -> tuple[bytes, str]:
+    """Encode a binary framed message, returning (body, crc_hex).
+
+    The CRC32 covers the padding followed by the header fields before it,
+    so the padding's share is computed once per size and each message only
+    checksums its 24-byte header prefix.
+    """
+    pad_len = max(0, target_size - _FRAME_HEADER_SIZE)
+    pad_crc = _padding_crcs.get(pad_len)
+    if pad_crc is None:
+        _ensure_bench_padding(pad_len)
+        pad_crc = _padding_crcs[pad_len] = zlib.crc32(_bench_padding[:pad_len])
+    prefix = _FRAME_PREFIX.pack(
+        _FRAME_MAGIC, SDK_IDS.get(sdk, 0), PATTERN_IDS.get(pattern, 0),
+        producer_index, sequence, time.time_ns(),
+    )
+    crc = zlib.crc32(prefix, pad_crc)
+    body = b"".join((prefix, _FRAME_CRC.pack(crc), _bench_padding[:pad_len]))
+    return body, f"{crc:08x}"
+
+
+def decode_framed(body: bytes) -> tuple[int, int, int, bool]:
+    """Decode a binary framed message.
+
+    Returns (producer_index, sequence, timestamp_ns, crc_ok). Raises
+    ValueError if the body is too short or does not start with the frame
+    magic.
+    """
+    if len(body) < _FRAME_HEADER_SIZE:
+        raise ValueError(f"framed payload too short: {len(body)} bytes")
+    magic, _sdk_id, _pattern_id, producer_index, sequence, timestamp_ns = (
+        _FRAME_PREFIX.unpack_from(body, 0)
+    )
+    if magic != _FRAME_MAGIC:
+        raise ValueError("not a framed payload")
+    (expected,) = _FRAME_CRC.unpack_from(body, _FRAME_PREFIX_SIZE)
+    view = memoryview(body)
+    actual = zlib.crc32(view[:_FRAME_PREFIX_SIZE], zlib.crc32(view[_FRAME_HEADER_SIZE:]))
+    return producer_index, sequence, timestamp_ns, actual == expected
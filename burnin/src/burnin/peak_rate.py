@@ -7,6 +7,9 @@ import time
 
 from hdrh.histogram import HdrHistogram
 
+# Samples recorded per lock hold, so percentile readers wait at most ~1ms.
+_RECORD_CHUNK = 1000
+
 
 class PeakRateTracker:
     """Sliding-window peak rate tracker.
@@ -104,6 +107,8 @@ class LatencyAccumulator:
         # 1 µs to 60s, 3 significant digits
         self._hist = HdrHistogram(1, 60_000_000, 3)
         self._lock = threading.Lock()
+        # Bumped by reset(); samples taken before a reset are dropped.
+        self.generation = 0
 
     def record(self, duration_seconds: float) -> None:
         """Record a latency duration in seconds."""
@@ -120,12 +125,103 @@ class LatencyAccumulator:
         with self._lock:
             return self._hist.get_value_at_percentile(p) / 1000.0
 
+    def percentiles_ms(self, ps: tuple[float, ...]) -> tuple[float, ...]:
+        """Get several percentile values in milliseconds in one pass over the histogram."""
+        with self._lock:
+            values = self._hist.get_percentile_to_value_dict(list(ps))
+        return tuple(values[p] / 1000.0 for p in ps)
+
     def count(self) -> int:
         """Get total number of recorded values."""
         with self._lock:
             return self._hist.total_count
 
+    def record_micros(self, samples: list[int], generation: int) -> None:
+        """Record already clamped microsecond samples; safe from any thread.
+
+        Stops recording once a reset() has moved the accumulator past
+        ``generation``, the value read when the samples were taken.
+        """
+        record_value = self._hist.record_value
+        for start in range(0, len(samples), _RECORD_CHUNK):
+            with self._lock:
+                if self.generation != generation:
+                    return
+                for micros in samples[start:start + _RECORD_CHUNK]:
+                    record_value(micros)
+
+    def take_pending(self) -> list[int]:
+        """Return buffered samples. Always empty here; see LoopLatencyAccumulator."""
+        return []
+
     def reset(self) -> None:
         """Reset the histogram."""
         with self._lock:
             self._hist.reset()
+            self.generation += 1
+
+
+# ---------------------------------------------------------------------------
+# Loop-confined variants for the async engine
+# ---------------------------------------------------------------------------
+#
+# The async engine records from a single event loop, so the per-message
+# lock in the classes above only guards against the HTTP server and report
+# threads reading snapshots. These variants record without a lock; the
+# once-a-second advance() tick, which also runs on the loop, takes the lock
+# to publish a consistent view to other threads. Latency samples are handed
+# off on that tick and recorded into the histogram off the loop.
+
+
+class LoopPeakRateTracker(PeakRateTracker):
+    """PeakRateTracker whose record() must be called from one event loop."""
+
+    def record(self) -> None:
+        """Record one event in the current bucket (no lock)."""
+        self._buckets[self._idx] += 1
+
+
+class LoopSlidingRateTracker(SlidingRateTracker):
+    """SlidingRateTracker whose record() must be called from one event loop."""
+
+    def record(self) -> None:
+        self._buckets[self._idx] += 1
+
+
+class LoopLatencyAccumulator(LatencyAccumulator):
+    """LatencyAccumulator whose record() must be called from one event loop.
+
+    Samples are appended to a pending list without a lock. On the engine's
+    one-second tick, take_pending() swaps the list out on the loop and
+    record_micros() records it into the histogram from a worker thread:
+    at ~1.3us per sample, a busy pattern's tick is hundreds of milliseconds
+    of recording that would otherwise stall the loop. Percentile reads
+    therefore lag recording by about one tick. A batch still being recorded
+    when reset() runs is dropped rather than leaking into the fresh
+    histogram. (Swapping whole histograms
+    per tick was not used: resetting a 1us-60s HdrHistogram costs over a
+    millisecond.)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: list[int] = []
+
+    def record(self, duration_seconds: float) -> None:
+        """Buffer a latency duration in seconds until the next flush()."""
+        micros = int(duration_seconds * 1_000_000)
+        if micros < 1:
+            micros = 1
+        if micros > 60_000_000:
+            micros = 60_000_000
+        self._pending.append(micros)
+
+    def take_pending(self) -> list[int]:
+        """Swap out the buffered samples; call on the recording loop."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def reset(self) -> None:
+        """Reset the histogram and drop buffered samples."""
+        self._pending = []
+        super().reset()
@@ -47,13 +47,54 @@ class AsyncRateLimiter:
     """Async token-bucket rate limiter for asyncio tasks.
 
     No lock needed — single-threaded cooperative scheduling.
+
+    At high rates a sleep per token means thousands of timer handles per
+    second, and the loop's timer resolution caps the achievable rate.
+    acquire() hands out tokens in batches instead: it sleeps until a whole
+    batch is due -- at most ``granularity`` seconds' worth -- and grants
+    every token due by the time it wakes. The schedule advances by exactly
+    one interval per token granted, so the long-run rate stays exact. Credit
+    older than two ``granularity`` periods -- enough to absorb timer
+    overshoot -- is dropped, so an idle producer cannot burst.
     """
 
-    def __init__(self, rate: float) -> None:
+    def __init__(self, rate: float, granularity: float = 0.005) -> None:
         self._rate = rate
         self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._granularity = granularity
+        self._batch = max(1, int(rate * granularity)) if rate > 0 else 1
         self._next_time = time.monotonic()
 
+    @property
+    def batch_size(self) -> int:
+        """Tokens one acquire() grants at most per wake-up."""
+        return self._batch
+
+    async def acquire(self, max_tokens: int, stop_event: asyncio.Event) -> int:
+        """Wait until at least one token is due and take up to max_tokens.
+
+        Returns the number of tokens granted, or 0 if stop_event was set
+        (caller should exit).
+        """
+        if self._rate <= 0:
+            return 0 if stop_event.is_set() else max_tokens
+
+        want = min(max_tokens, self._batch)
+        while True:
+            now = time.monotonic()
+            floor = now - 2 * self._granularity
+            if self._next_time < floor:
+                self._next_time = floor
+            due = int((now - self._next_time) / self._interval) + 1 if now >= self._next_time else 0
+            if due > 0:
+                granted = min(max_tokens, due)
+                self._next_time += granted * self._interval
+                return 0 if stop_event.is_set() else granted
+            if stop_event.is_set():
+                return 0
+            # Wake when a full batch is due, not at the first token.
+            await asyncio.sleep(self._next_time + (want - 1) * self._interval - now)
+
     async def wait(self, stop_event: asyncio.Event) -> bool:
         """Wait until the next token is available.
 
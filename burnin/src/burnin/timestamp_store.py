@@ -2,43 +2,107 @@
 
 from __future__ import annotations
 
-import threading
 import time
+from array import array
+
+# Slot marker for "no timestamp stored"; sequence numbers start at 1.
+_EMPTY = -1
+
+
+class _Ring:
+    """Fixed-size ring of (seq, monotonic timestamp) slots for one producer.
+
+    ``overflow`` holds timestamps displaced from a slot while still live,
+    in the order they were displaced.
+    """
+
+    __slots__ = ("overflow", "seqs", "times")
+
+    def __init__(self, capacity: int) -> None:
+        self.seqs = array("q", [_EMPTY]) * capacity
+        self.times = array("d", [0.0]) * capacity
+        self.overflow: dict[int, float] = {}
 
 
 class SendTimestampStore:
-    """Thread-safe mapping of (producer_id, seq) -> monotonic timestamp.
+    """Per-producer ring buffers of send timestamps, indexed by ``seq % capacity``.
+
+    Used to measure end-to-end latency: time from send to receive. Each
+    producer gets its own preallocated ring, so storing and loading a
+    timestamp is two array writes or reads with no key formatting and no
+    lock. A timestamp older than ``max_age`` seconds is treated as gone, as
+    if it had been purged.
 
-    Used to measure end-to-end latency: time from send to receive.
+    When the producer has sent ``capacity`` more messages before a slot's
+    timestamp was loaded, and that timestamp is still within ``max_age``,
+    it moves to a per-producer overflow dict instead of being lost, so slow
+    deliveries still contribute to the latency tail. ``overflowed`` counts
+    those moves; a steadily growing count means the ring is too small for
+    the send rate. ``expired`` counts timestamps dropped after ``max_age``.
+
+    Not thread-safe; each worker's sends and receives run on one event loop.
     """
 
-    def __init__(self) -> None:
-        self._store: dict[str, float] = {}
-        self._lock = threading.Lock()
+    def __init__(self, capacity: int = 10_000, max_age: float = 60.0) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._capacity = capacity
+        self._max_age = max_age
+        self._rings: dict[str, _Ring] = {}
+        self.overflowed = 0
+        self.expired = 0
 
     def store(self, producer_id: str, seq: int, ts: float | None = None) -> None:
         """Store send timestamp for a message."""
-        key = f"{producer_id}:{seq}"
-        with self._lock:
-            self._store[key] = ts if ts is not None else time.monotonic()
+        ring = self._rings.get(producer_id)
+        if ring is None:
+            ring = self._rings[producer_id] = _Ring(self._capacity)
+        now = time.monotonic()
+        i = seq % self._capacity
+        old_seq = ring.seqs[i]
+        if old_seq != _EMPTY:
+            self._displace(ring, old_seq, ring.times[i], now)
+        ring.seqs[i] = seq
+        ring.times[i] = ts if ts is not None else now
 
     def load_and_delete(self, producer_id: str, seq: int) -> float | None:
         """Load and remove timestamp for a message. Returns None if not found."""
-        key = f"{producer_id}:{seq}"
-        with self._lock:
-            return self._store.pop(key, None)
-
-    def purge(self, max_age: float) -> int:
-        """Remove entries older than max_age seconds. Returns count removed."""
-        cutoff = time.monotonic() - max_age
-        removed = 0
-        with self._lock:
-            keys_to_remove = [k for k, v in self._store.items() if v < cutoff]
-            for k in keys_to_remove:
-                del self._store[k]
-                removed += 1
-        return removed
+        ring = self._rings.get(producer_id)
+        if ring is None:
+            return None
+        i = seq % self._capacity
+        if ring.seqs[i] == seq:
+            ring.seqs[i] = _EMPTY
+            ts = ring.times[i]
+        elif ring.overflow:
+            ts = ring.overflow.pop(seq, None)
+            if ts is None:
+                return None
+        else:
+            return None
+        if time.monotonic() - ts > self._max_age:
+            self.expired += 1
+            return None
+        return ts
+
+    def _displace(self, ring: _Ring, seq: int, ts: float, now: float) -> None:
+        """Move a live timestamp out of its slot, dropping expired ones."""
+        overflow = ring.overflow
+        # Oldest first: stop at the first entry still within max_age.
+        while overflow:
+            oldest = next(iter(overflow))
+            if now - overflow[oldest] <= self._max_age:
+                break
+            del overflow[oldest]
+            self.expired += 1
+        if now - ts > self._max_age:
+            self.expired += 1
+            return
+        overflow[seq] = ts
+        self.overflowed += 1
 
     def __len__(self) -> int:
-        with self._lock:
-            return len(self._store)
+        """Number of stored timestamps, including ones past ``max_age``."""
+        return sum(
+            self._capacity - ring.seqs.count(_EMPTY) + len(ring.overflow) for ring in self._rings.values()
+        )
@@ -14,8 +14,15 @@ import time
 from typing import TYPE_CHECKING, Coroutine
 
 from burnin import metrics_collector as mc
-from burnin.payload import SizeDistribution, decode, verify_crc
-from burnin.peak_rate import LatencyAccumulator, PeakRateTracker, SlidingRateTracker
+from burnin.payload import SizeDistribution, decode, decode_framed, encode, encode_framed, verify_crc
+from burnin.peak_rate import (
+    LatencyAccumulator,
+    LoopLatencyAccumulator,
+    LoopPeakRateTracker,
+    LoopSlidingRateTracker,
+    PeakRateTracker,
+    SlidingRateTracker,
+)
 from burnin.rate_limiter import AsyncRateLimiter
 from burnin.timestamp_store import SendTimestampStore
 from burnin.tracker import Tracker
@@ -25,6 +32,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("burnin")
 
+SDK = "python"
+
 
 class BaseWorker:
     """Base class for all 6 pattern workers.
@@ -56,11 +65,17 @@ class BaseWorker:
 
         # Tracking
         self._tracker = Tracker(reorder_window=cfg.message.reorder_window)
-        self._latency_accum = LatencyAccumulator()
-        self._rpc_latency_accum = LatencyAccumulator()
-        self._peak_rate = PeakRateTracker()
-        self._sliding_rate = SlidingRateTracker()
-        self._ts_store = SendTimestampStore()
+        # Loop-confined: recorded without locks, published by the engine's 1s tick
+        self._latency_accum: LatencyAccumulator = LoopLatencyAccumulator()
+        self._rpc_latency_accum: LatencyAccumulator = LoopLatencyAccumulator()
+        self._peak_rate: PeakRateTracker = LoopPeakRateTracker()
+        self._sliding_rate: SlidingRateTracker = LoopSlidingRateTracker()
+        self._ts_store = SendTimestampStore(capacity=cfg.message.reorder_window)
+
+        # Binary framed payloads carry a producer index instead of the id
+        self._framed = cfg.message.payload_format == "binary"
+        self._producer_indexes: dict[str, int] = {}
+        self._producer_ids: list[str] = []
 
         # Pattern-level latency accumulator (set by PatternGroup)
         self.pattern_latency_accum: LatencyAccumulator | None = None
@@ -68,6 +83,7 @@ class BaseWorker:
 
         # Rate limiting (async)
         self._limiter = AsyncRateLimiter(rate)
+        self._rate_tokens = 0  # tokens granted in a batch and not yet used
 
         # Size distribution
         if cfg.message.size_mode == "distribution":
@@ -209,8 +225,19 @@ class BaseWorker:
     # --- Rate limiting ---
 
     async def wait_for_rate(self) -> bool:
-        """Wait for rate limiter. Returns False if producer should stop."""
-        return await self._limiter.wait(self._producer_stop)
+        """Wait for rate limiter. Returns False if producer should stop.
+
+        Tokens are acquired in batches shared by the worker's producers, so
+        high-rate patterns wake the loop once per batch, not per message.
+        """
+        if self._rate_tokens > 0:
+            self._rate_tokens -= 1
+            return not self._producer_stop.is_set()
+        granted = await self._limiter.acquire(self._limiter.batch_size, self._producer_stop)
+        if not granted:
+            return False
+        self._rate_tokens = granted - 1
+        return True
 
     # --- Backpressure ---
 
@@ -236,6 +263,26 @@ class BaseWorker:
         self._sliding_rate.record()
         mc.inc_sent(self.pattern, producer_id, byte_count)
 
+    def encode_payload(self, producer_id: str, seq: int, size: int) -> tuple[bytes, str]:
+        """Encode a non-benchmark payload in the configured format. Returns (body, crc_hex)."""
+        if not self._framed:
+            return encode(SDK, self.pattern, producer_id, seq, size)
+        index = self._producer_indexes.get(producer_id)
+        if index is None:
+            index = self._producer_indexes[producer_id] = len(self._producer_ids)
+            self._producer_ids.append(producer_id)
+        return encode_framed(SDK, self.pattern, index, seq, size)
+
+    def record_receive_payload(self, consumer_id: str, body: bytes, crc_tag: str) -> None:
+        """Decode a non-benchmark payload in the configured format and record it."""
+        if not self._framed:
+            msg = decode(body)
+            self.record_receive(consumer_id, body, crc_tag, msg.producer_id, msg.sequence)
+            return
+        index, seq, _, crc_ok = decode_framed(body)
+        producer_id = self._producer_ids[index] if index < len(self._producer_ids) else f"p-{index}"
+        self.record_receive(consumer_id, body, crc_tag, producer_id, seq, crc_ok=crc_ok)
+
     def record_receive(
         self,
         consumer_id: str,
@@ -243,8 +290,13 @@ class BaseWorker:
         crc_tag: str,
         producer_id: str,
         seq: int,
+        crc_ok: bool | None = None,
     ) -> None:
-        """Record a received message with CRC verification and sequence tracking."""
+        """Record a received message with CRC verification and sequence tracking.
+
+        ``crc_ok`` is the result of a CRC check already done on the body (binary
+        framed payloads); when None, the body is checked against ``crc_tag``.
+        """
         if self._benchmark:
             # Benchmark mode: counters only, no CRC/tracker/latency/metrics
             self._received += 1
@@ -260,7 +312,7 @@ class BaseWorker:
         mc.inc_received(self.pattern, consumer_id, len(body))
 
         # CRC verification
-        if not verify_crc(body, crc_tag):
+        if not (verify_crc(body, crc_tag) if crc_ok is None else crc_ok):
             self._corrupted += 1
             cs["corrupted"] += 1
             mc.inc_corrupted(self.pattern)
@@ -162,7 +162,7 @@ class CommandsWorker(BaseWorker):
                 body = payload.encode_fast(seq, size)
                 crc_hex = ""
             else:
-                body, crc_hex = payload.encode(SDK, PATTERN, sender_id, seq, size)
+                body, crc_hex = self.encode_payload(sender_id, seq, size)
 
             cmd = CommandMessage(
                 channel=self.channel_name,
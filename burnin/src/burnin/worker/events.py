@@ -125,8 +125,7 @@ class EventsWorker(BaseWorker):
                         seq_r, _ = payload.decode_fast(body)
                         self.record_receive(consumer_id, body, "", "", seq_r)
                     else:
-                        msg = payload.decode(body)
-                        self.record_receive(consumer_id, body, crc_tag, msg.producer_id, msg.sequence)
+                        self.record_receive_payload(consumer_id, body, crc_tag)
                 except Exception:
                     self.record_error("decode_failure")
         except Exception as e:
@@ -157,7 +156,7 @@ class EventsWorker(BaseWorker):
                 body = payload.encode_fast(seq, size)
                 crc_hex = ""
             else:
-                body, crc_hex = payload.encode(SDK, PATTERN, producer_id, seq, size)
+                body, crc_hex = self.encode_payload(producer_id, seq, size)
 
             msg = EventMessage(
                 channel=self.channel_name,
@@ -122,8 +122,7 @@ class EventsStoreWorker(BaseWorker):
                         seq_r, _ = payload.decode_fast(body)
                         self.record_receive(consumer_id, body, "", "", seq_r)
                     else:
-                        msg = payload.decode(body)
-                        self.record_receive(consumer_id, body, crc_tag, msg.producer_id, msg.sequence)
+                        self.record_receive_payload(consumer_id, body, crc_tag)
                 except Exception:
                     self.record_error("decode_failure")
         except Exception as e:
@@ -154,7 +153,7 @@ class EventsStoreWorker(BaseWorker):
                 body = payload.encode_fast(seq, size)
                 crc_hex = ""
             else:
-                body, crc_hex = payload.encode(SDK, PATTERN, producer_id, seq, size)
+                body, crc_hex = self.encode_payload(producer_id, seq, size)
 
             msg = EventStoreMessage(
                 channel=self.channel_name,
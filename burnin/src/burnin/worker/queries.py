@@ -170,7 +170,7 @@ class QueriesWorker(BaseWorker):
                 body = payload.encode_fast(seq, size)
                 crc_hex = ""
             else:
-                body, crc_hex = payload.encode(SDK, PATTERN, sender_id, seq, size)
+                body, crc_hex = self.encode_payload(sender_id, seq, size)
 
             query = QueryMessage(
                 channel=self.channel_name,
@@ -106,11 +106,7 @@ class QueueSimpleWorker(BaseWorker):
                             seq_r, _ = payload.decode_fast(body)
                             self.record_receive(consumer_id, body, "", "", seq_r)
                         else:
-                            decoded = payload.decode(body)
-                            self.record_receive(
-                                consumer_id, body, crc_tag,
-                                decoded.producer_id, decoded.sequence,
-                            )
+                            self.record_receive_payload(consumer_id, body, crc_tag)
                     except Exception:
                         self.record_error("decode_failure")
 
@@ -142,7 +138,7 @@ class QueueSimpleWorker(BaseWorker):
                 body = payload.encode_fast(seq, size)
                 crc_hex = ""
             else:
-                body, crc_hex = payload.encode(SDK, PATTERN, producer_id, seq, size)
+                body, crc_hex = self.encode_payload(producer_id, seq, size)
 
             msg = QueueMessage(
                 channel=self.channel_name,
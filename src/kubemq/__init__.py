@@ -55,124 +55,284 @@ Async Example (recommended for async applications):
 
 from __future__ import annotations
 
-from importlib.metadata import version as _metadata_version
+from typing import TYPE_CHECKING, Any
 
-# Logging implementations
-from kubemq._internal.logging import NoOpLogger, StdLibLoggerAdapter
+from kubemq._internal.lazy import lazy_exports
 
-# Async cancellation token
-from kubemq.common.async_cancellation_token import AsyncCancellationToken
+if TYPE_CHECKING:
+    # Logging implementations
+    from kubemq._internal.logging import NoOpLogger, StdLibLoggerAdapter
 
-# Common utilities
-from kubemq.common.cancellation_token import CancellationToken
+    # Async cancellation token
+    from kubemq.common.async_cancellation_token import AsyncCancellationToken
 
-# Channel statistics
-from kubemq.common.channel_stats import (
-    CQChannel,
-    PubSubChannel,
-    QueuesChannel,
-)
+    # Common utilities
+    from kubemq.common.cancellation_token import CancellationToken
 
-# Core configuration
-from kubemq.core.config import (
-    ClientConfig,
-    JitterType,
-    KeepAliveConfig,
-    OperationTimeouts,
-    RetryPolicy,
-    TLSConfig,
-    resolve_timeout,
-)
+    # Channel statistics
+    from kubemq.common.channel_stats import (
+        CQChannel,
+        PubSubChannel,
+        QueuesChannel,
+    )
 
-# Core exceptions
-from kubemq.core.exceptions import (
-    ERROR_CLASSIFICATION,
-    ErrorCategory,
-    ErrorCode,
-    KubeMQAuthenticationError,
-    KubeMQBufferFullError,
-    KubeMQCancellationError,
-    KubeMQChannelError,
-    KubeMQCircuitOpenError,
-    KubeMQClientClosedError,
-    KubeMQConfigurationError,
-    KubeMQConnectionError,
-    KubeMQConnectionNotReadyError,
-    KubeMQError,
-    KubeMQHandlerError,
-    KubeMQMessageError,
-    KubeMQStreamBrokenError,
-    KubeMQTimeoutError,
-    KubeMQTransactionError,
-    KubeMQTransportError,
-    KubeMQValidationError,
-    classify_error,
-    classify_tls_error,
-    from_grpc_error,
-)
+    # Core configuration
+    from kubemq.core.config import (
+        AdaptiveRateConfig,
+        ClientConfig,
+        HedgingPolicy,
+        JitterType,
+        KeepAliveConfig,
+        OperationTimeouts,
+        RetryPolicy,
+        TLSConfig,
+        resolve_timeout,
+    )
 
-# Health checking
-from kubemq.core.health import (
-    AsyncHealthChecker,
-    HealthCheck,
-    HealthChecker,
-    HealthReport,
-    HealthStatus,
-)
+    # Core exceptions
+    from kubemq.core.exceptions import (
+        ERROR_CLASSIFICATION,
+        ErrorCategory,
+        ErrorCode,
+        KubeMQAuthenticationError,
+        KubeMQBufferFullError,
+        KubeMQCancellationError,
+        KubeMQChannelError,
+        KubeMQCircuitOpenError,
+        KubeMQClientClosedError,
+        KubeMQConfigurationError,
+        KubeMQConnectionError,
+        KubeMQConnectionNotReadyError,
+        KubeMQError,
+        KubeMQHandlerError,
+        KubeMQMessageError,
+        KubeMQStreamBrokenError,
+        KubeMQTimeoutError,
+        KubeMQTransactionError,
+        KubeMQTransportError,
+        KubeMQValidationError,
+        classify_error,
+        classify_tls_error,
+        from_grpc_error,
+    )
+
+    # Multi-process consumer groups
+    from kubemq.core.group_runner import (
+        ConsumerGroupRunner,
+        GroupRunReport,
+        WorkerContext,
+        WorkerMetrics,
+        WorkerSnapshot,
+    )
+
+    # Health checking
+    from kubemq.core.health import (
+        AsyncHealthChecker,
+        HealthCheck,
+        HealthChecker,
+        HealthReport,
+        HealthStatus,
+    )
+
+    # Pre-encoded message templates
+    from kubemq.core.message_template import MessageTemplate
+    from kubemq.core.stage_timer import StageProbe, StageTimer
+
+    # Core types
+    from kubemq.core.types import (
+        AsyncCredentialProvider,
+        ConnectionState,
+        CredentialProvider,
+        LatencyHistogram,
+        Logger,
+        PoolHealth,
+        ServerInfo,
+        StartPosition,
+        SubscribeType,
+        TransportProtocol,
+    )
+    from kubemq.cq import Client as CQClient
+    from kubemq.cq.async_client import AsyncClient as AsyncCQClient
 
-# Core types
-from kubemq.core.types import (
-    AsyncCredentialProvider,
-    ConnectionState,
-    CredentialProvider,
-    Logger,
-    ServerInfo,
-    StartPosition,
-    SubscribeType,
-    TransportProtocol,
+    # CQ messages and types
+    from kubemq.cq.command_message import CommandMessage
+    from kubemq.cq.command_message_received import CommandReceived
+    from kubemq.cq.command_response_message import CommandResponse
+    from kubemq.cq.commands_subscription import CommandsSubscription
+    from kubemq.cq.queries_subscription import QueriesSubscription
+    from kubemq.cq.query_cache import QueryCacheStats
+    from kubemq.cq.query_message import QueryMessage
+    from kubemq.cq.query_message_received import QueryReceived
+    from kubemq.cq.query_response_message import QueryResponse
+
+    # Sync domain clients with convenient aliases
+    from kubemq.pubsub import Client as PubSubClient
+
+    # Native async domain clients (Phase 4)
+    from kubemq.pubsub.async_client import AsyncClient as AsyncPubSubClient
+
+    # PubSub events-store checkpointing
+    from kubemq.pubsub.checkpoint import (
+        CheckpointStore,
+        FileCheckpointStore,
+        MemoryCheckpointStore,
+        SQLiteCheckpointStore,
+    )
+
+    # PubSub messages and types
+    from kubemq.pubsub.event_message import EventMessage
+    from kubemq.pubsub.event_message_received import EventReceived
+    from kubemq.pubsub.event_send_result import EventStoreResult
+    from kubemq.pubsub.event_store_message import EventStoreMessage
+    from kubemq.pubsub.event_store_message_received import EventStoreReceived
+    from kubemq.pubsub.events_store_publisher import EventsStorePublisher, PublisherStats
+    from kubemq.pubsub.events_store_subscription import EventsStoreSubscription
+    from kubemq.pubsub.events_subscription import EventsSubscription
+    from kubemq.queues import Client as QueuesClient
+    from kubemq.queues.async_client import AsyncClient as AsyncQueuesClient, AsyncQueuesPollResponse
+
+    # Queues messages and types
+    from kubemq.queues.queues_message import QueueMessage
+    from kubemq.queues.queues_message_received import QueueMessageReceived
+    from kubemq.queues.queues_poll_response import QueuesPollResponse
+    from kubemq.queues.queues_send_result import QueueSendResult
+
+    __version__: str
+
+# The public API is resolved lazily (PEP 562): ``import kubemq`` stays cheap
+# and each name's defining module -- and grpc, for the clients -- is only
+# imported on first use. Keep this table in sync with the imports above.
+_lazy_getattr, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kubemq._internal.logging": (
+            "NoOpLogger",
+            "StdLibLoggerAdapter",
+        ),
+        "kubemq.common.async_cancellation_token": ("AsyncCancellationToken",),
+        "kubemq.common.cancellation_token": ("CancellationToken",),
+        "kubemq.common.channel_stats": (
+            "CQChannel",
+            "PubSubChannel",
+            "QueuesChannel",
+        ),
+        "kubemq.core.config": (
+            "AdaptiveRateConfig",
+            "ClientConfig",
+            "HedgingPolicy",
+            "JitterType",
+            "KeepAliveConfig",
+            "OperationTimeouts",
+            "RetryPolicy",
+            "TLSConfig",
+            "resolve_timeout",
+        ),
+        "kubemq.core.exceptions": (
+            "ERROR_CLASSIFICATION",
+            "ErrorCategory",
+            "ErrorCode",
+            "KubeMQAuthenticationError",
+            "KubeMQBufferFullError",
+            "KubeMQCancellationError",
+            "KubeMQChannelError",
+            "KubeMQCircuitOpenError",
+            "KubeMQClientClosedError",
+            "KubeMQConfigurationError",
+            "KubeMQConnectionError",
+            "KubeMQConnectionNotReadyError",
+            "KubeMQError",
+            "KubeMQHandlerError",
+            "KubeMQMessageError",
+            "KubeMQStreamBrokenError",
+            "KubeMQTimeoutError",
+            "KubeMQTransactionError",
+            "KubeMQTransportError",
+            "KubeMQValidationError",
+            "classify_error",
+            "classify_tls_error",
+            "from_grpc_error",
+        ),
+        "kubemq.core.group_runner": (
+            "ConsumerGroupRunner",
+            "GroupRunReport",
+            "WorkerContext",
+            "WorkerMetrics",
+            "WorkerSnapshot",
+        ),
+        "kubemq.core.health": (
+            "AsyncHealthChecker",
+            "HealthCheck",
+            "HealthChecker",
+            "HealthReport",
+            "HealthStatus",
+        ),
+        "kubemq.core.message_template": ("MessageTemplate",),
+        "kubemq.core.stage_timer": ("StageProbe", "StageTimer"),
+        "kubemq.core.types": (
+            "AsyncCredentialProvider",
+            "ConnectionState",
+            "CredentialProvider",
+            "LatencyHistogram",
+            "Logger",
+            "PoolHealth",
+            "ServerInfo",
+            "StartPosition",
+            "SubscribeType",
+            "TransportProtocol",
+        ),
+        "kubemq.cq": ("Client as CQClient",),
+        "kubemq.cq.async_client": ("AsyncClient as AsyncCQClient",),
+        "kubemq.cq.command_message": ("CommandMessage",),
+        "kubemq.cq.command_message_received": ("CommandReceived",),
+        "kubemq.cq.command_response_message": ("CommandResponse",),
+        "kubemq.cq.commands_subscription": ("CommandsSubscription",),
+        "kubemq.cq.queries_subscription": ("QueriesSubscription",),
+        "kubemq.cq.query_cache": ("QueryCacheStats",),
+        "kubemq.cq.query_message": ("QueryMessage",),
+        "kubemq.cq.query_message_received": ("QueryReceived",),
+        "kubemq.cq.query_response_message": ("QueryResponse",),
+        "kubemq.pubsub": ("Client as PubSubClient",),
+        "kubemq.pubsub.async_client": ("AsyncClient as AsyncPubSubClient",),
+        "kubemq.pubsub.checkpoint": (
+            "CheckpointStore",
+            "FileCheckpointStore",
+            "MemoryCheckpointStore",
+            "SQLiteCheckpointStore",
+        ),
+        "kubemq.pubsub.event_message": ("EventMessage",),
+        "kubemq.pubsub.event_message_received": ("EventReceived",),
+        "kubemq.pubsub.event_send_result": ("EventStoreResult",),
+        "kubemq.pubsub.event_store_message": ("EventStoreMessage",),
+        "kubemq.pubsub.event_store_message_received": ("EventStoreReceived",),
+        "kubemq.pubsub.events_store_publisher": ("EventsStorePublisher", "PublisherStats"),
+        "kubemq.pubsub.events_store_subscription": ("EventsStoreSubscription",),
+        "kubemq.pubsub.events_subscription": ("EventsSubscription",),
+        "kubemq.queues": ("Client as QueuesClient",),
+        "kubemq.queues.async_client": (
+            "AsyncClient as AsyncQueuesClient",
+            "AsyncQueuesPollResponse",
+        ),
+        "kubemq.queues.queues_message": ("QueueMessage",),
+        "kubemq.queues.queues_message_received": ("QueueMessageReceived",),
+        "kubemq.queues.queues_poll_response": ("QueuesPollResponse",),
+        "kubemq.queues.queues_send_result": ("QueueSendResult",),
+    },
 )
-from kubemq.cq import Client as CQClient
-from kubemq.cq.async_client import AsyncClient as AsyncCQClient
-
-# CQ messages and types
-from kubemq.cq.command_message import CommandMessage
-from kubemq.cq.command_message_received import CommandReceived
-from kubemq.cq.command_response_message import CommandResponse
-from kubemq.cq.commands_subscription import CommandsSubscription
-from kubemq.cq.queries_subscription import QueriesSubscription
-from kubemq.cq.query_message import QueryMessage
-from kubemq.cq.query_message_received import QueryReceived
-from kubemq.cq.query_response_message import QueryResponse
-
-# Sync domain clients with convenient aliases
-from kubemq.pubsub import Client as PubSubClient
-
-# Native async domain clients (Phase 4)
-from kubemq.pubsub.async_client import AsyncClient as AsyncPubSubClient
-
-# PubSub messages and types
-from kubemq.pubsub.event_message import EventMessage
-from kubemq.pubsub.event_message_received import EventReceived
-from kubemq.pubsub.event_send_result import EventStoreResult
-from kubemq.pubsub.event_store_message import EventStoreMessage
-from kubemq.pubsub.event_store_message_received import EventStoreReceived
-from kubemq.pubsub.events_store_subscription import EventsStoreSubscription
-from kubemq.pubsub.events_subscription import EventsSubscription
-from kubemq.queues import Client as QueuesClient
-from kubemq.queues.async_client import AsyncClient as AsyncQueuesClient, AsyncQueuesPollResponse
-
-# Queues messages and types
-from kubemq.queues.queues_message import QueueMessage
-from kubemq.queues.queues_message_received import QueueMessageReceived
-from kubemq.queues.queues_poll_response import QueuesPollResponse
-from kubemq.queues.queues_send_result import QueueSendResult
-
-# Version — single source of truth from pyproject.toml via installed metadata
-__version__: str
-try:
-    __version__ = _metadata_version("kubemq")
-except Exception:
-    __version__ = "0.0.0.dev0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # Version — single source of truth from pyproject.toml via installed metadata
+        from importlib.metadata import version as _metadata_version
+
+        global __version__
+        try:
+            __version__ = _metadata_version("kubemq")
+        except Exception:
+            __version__ = "0.0.0.dev0"
+        return __version__
+    return _lazy_getattr(name)
+
 
 __all__ = [
     # Version
@@ -207,6 +367,8 @@ __all__ = [
     "ClientConfig",
     "JitterType",
     "RetryPolicy",
+    "AdaptiveRateConfig",
+    "HedgingPolicy",
     "OperationTimeouts",
     "resolve_timeout",
     # Core types
@@ -214,6 +376,8 @@ __all__ = [
     "SubscribeType",
     "StartPosition",
     "ServerInfo",
+    "PoolHealth",
+    "LatencyHistogram",
     "CredentialProvider",
     "AsyncCredentialProvider",
     "Logger",
@@ -239,6 +403,17 @@ __all__ = [
     "HealthReport",
     "HealthChecker",
     "AsyncHealthChecker",
+    # Multi-process consumer groups
+    "ConsumerGroupRunner",
+    "WorkerContext",
+    "WorkerMetrics",
+    "WorkerSnapshot",
+    "GroupRunReport",
+    # Pre-encoded message templates
+    "MessageTemplate",
+    # Sampled hot-path stage timing
+    "StageProbe",
+    "StageTimer",
     # PubSub messages
     "EventMessage",
     "EventReceived",
@@ -247,6 +422,14 @@ __all__ = [
     "EventStoreReceived",
     "EventsSubscription",
     "EventsStoreSubscription",
+    # PubSub pipelined events-store publishing
+    "EventsStorePublisher",
+    "PublisherStats",
+    # PubSub events-store checkpointing
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "MemoryCheckpointStore",
     # Queues messages
     "QueueMessage",
     "QueueMessageReceived",
@@ -259,6 +442,7 @@ __all__ = [
     "CommandsSubscription",
     "QueryMessage",
     "QueryReceived",
+    "QueryCacheStats",
     "QueryResponse",
     "QueriesSubscription",
     # Channel statistics
@@ -11,8 +11,11 @@ Subpackages:
 
 Modules:
     auth.py          Token holder for auth interceptors
+    batching.py      Size/time batch collectors for batch-callback subscriptions
+    callback_pool.py Fixed worker pool for concurrent subscription callbacks
     compat.py        Server version compatibility check
     deprecation.py   PEP 565-compliant deprecation decorators
+    lazy.py          PEP 562 lazy re-exports for package __init__ modules
     logging.py       Logger implementations (NoOpLogger, StdLibLoggerAdapter)
     telemetry.py     OTel integration with graceful degradation
     retry.py         Retry executor and backoff calculator
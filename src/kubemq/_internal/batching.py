@@ -0,0 +1,251 @@
+"""Size/time batch collectors backing the batch-callback subscription APIs.
+
+A collector accumulates items handed to :meth:`add` and delivers them as a
+list to a handler when either ``max_batch_size`` items are buffered or
+``max_batch_delay_ms`` has elapsed since the first buffered item, whichever
+comes first. Batches are delivered one at a time and in arrival order.
+
+Two flavours are provided: :class:`AsyncBatchCollector` for the native
+async clients (timer runs as an asyncio task) and :class:`BatchCollector`
+for the sync clients (timer runs on a daemon thread).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_logger = logging.getLogger("kubemq.batching")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_DELAY_MS = 100
+MAX_BATCH_SIZE_LIMIT = 10_000
+
+
+def validate_batch_params(max_batch_size: int, max_batch_delay_ms: int) -> None:
+    """Validate batch-callback tuning parameters.
+
+    Raises:
+        ValueError: If ``max_batch_size`` is not between 1 and 10000 or
+            ``max_batch_delay_ms`` is negative.
+    """
+    if max_batch_size < 1 or max_batch_size > MAX_BATCH_SIZE_LIMIT:
+        raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE_LIMIT}")
+    if max_batch_delay_ms < 0:
+        raise ValueError("max_batch_delay_ms must be >= 0")
+
+
+class AsyncBatchCollector(Generic[T]):
+    """Collect items into batches on a single event loop.
+
+    :meth:`add` flushes inline when the batch fills, so a slow handler
+    naturally throttles the producer. A background task flushes partial
+    batches once ``max_batch_delay_ms`` has elapsed.
+
+    Thread Safety:
+        Not thread-safe. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[None]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+    ) -> None:
+        validate_batch_params(max_batch_size, max_batch_delay_ms)
+        self._handler = handler
+        self._max_size = max_batch_size
+        self._max_delay = max_batch_delay_ms / 1000.0
+        self._buffer: list[T] = []
+        self._first_at = 0.0
+        self._generation = 0
+        self._has_items: asyncio.Event | None = None
+        self._deliver_lock: asyncio.Lock | None = None
+        self._timer: asyncio.Task[None] | None = None
+
+    @property
+    def buffered(self) -> int:
+        """Number of items waiting for the next flush."""
+        return len(self._buffer)
+
+    def start(self) -> None:
+        """Start the flush timer (idempotent). Requires a running event loop."""
+        if self._timer is not None:
+            return
+        self._has_items = asyncio.Event()
+        self._deliver_lock = asyncio.Lock()
+        self._timer = asyncio.create_task(self._run_timer(), name="kubemq-batch-timer")
+
+    async def add(self, item: T) -> None:
+        """Buffer an item, delivering the batch inline if it is now full."""
+        if self._timer is None:
+            self.start()
+        assert self._has_items is not None
+        self._buffer.append(item)
+        if len(self._buffer) == 1:
+            self._first_at = time.monotonic()
+            self._has_items.set()
+        if len(self._buffer) >= self._max_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Deliver whatever is buffered now."""
+        if self._deliver_lock is None:
+            return
+        async with self._deliver_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            self._generation += 1
+            assert self._has_items is not None
+            self._has_items.clear()
+            await self._handler(batch)
+
+    async def close(self) -> None:
+        """Stop the timer and deliver any remaining items.
+
+        A batch the timer is already delivering completes first; the timer
+        is only cancelled while it is not inside the handler.
+        """
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            assert self._deliver_lock is not None
+            async with self._deliver_lock:
+                timer.cancel()
+                await asyncio.gather(timer, return_exceptions=True)
+        await self.flush()
+
+    async def _run_timer(self) -> None:
+        assert self._has_items is not None
+        while True:
+            await self._has_items.wait()
+            generation = self._generation
+            remaining = self._first_at + self._max_delay - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            # Skip if the batch that armed this timer was already flushed
+            # because it filled up in the meantime.
+            if generation == self._generation and self._buffer:
+                try:
+                    await self.flush()
+                except Exception:
+                    _logger.exception("Unhandled exception in batch handler")
+
+
+class BatchCollector(Generic[T]):
+    """Collect items into batches for the thread-based sync clients.
+
+    :meth:`add` is called from the subscription thread and flushes inline
+    when the batch fills, so handler exceptions surface through the normal
+    per-message error path. A daemon thread flushes partial batches once
+    ``max_batch_delay_ms`` has elapsed; errors raised there go to
+    ``on_error``. The collector stops -- after a final flush -- on
+    :meth:`close` or when any of ``stop_events`` is set.
+
+    Thread Safety:
+        Thread-safe. Batches are delivered one at a time.
+    """
+
+    _IDLE_POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], None],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+        *,
+        on_error: Callable[[Exception], None] | None = None,
+        stop_events: Iterable[threading.Event] = (),
+    ) -> None:
+        validate_batch_params(max_batch_size, max_batch_delay_ms)
+        self._handler = handler
+        self._max_size = max_batch_size
+        self._max_delay = max_batch_delay_ms / 1000.0
+        self._on_error = on_error
+        self._stop_events = tuple(stop_events)
+        self._buffer: list[T] = []
+        self._deadline: float | None = None
+        self._lock = threading.Lock()
+        self._deliver_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_timer, name="kubemq-batch-timer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def thread(self) -> threading.Thread:
+        """The background flush thread (for shutdown tracking)."""
+        return self._thread
+
+    @property
+    def buffered(self) -> int:
+        """Number of items waiting for the next flush."""
+        with self._lock:
+            return len(self._buffer)
+
+    def add(self, item: T) -> None:
+        """Buffer an item, delivering the batch inline if it is now full."""
+        with self._lock:
+            self._buffer.append(item)
+            size = len(self._buffer)
+            if size == 1:
+                self._deadline = time.monotonic() + self._max_delay
+                self._wakeup.set()
+        if size >= self._max_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver whatever is buffered now."""
+        with self._deliver_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                batch, self._buffer = self._buffer, []
+                self._deadline = None
+            self._handler(batch)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop the timer thread and deliver any remaining items."""
+        self._closed.set()
+        self._wakeup.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=timeout)
+
+    def _stopping(self) -> bool:
+        return self._closed.is_set() or any(e.is_set() for e in self._stop_events)
+
+    def _run_timer(self) -> None:
+        while not self._stopping():
+            with self._lock:
+                deadline = self._deadline
+            if deadline is None:
+                self._wakeup.wait(timeout=self._IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                self._wakeup.wait(timeout=min(remaining, self._IDLE_POLL_SECONDS))
+                self._wakeup.clear()
+                continue
+            self._safe_flush()
+        self._safe_flush()
+
+    def _safe_flush(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            if self._on_error is not None:
+                try:
+                    self._on_error(e)
+                except Exception:
+                    _logger.exception("Error in batch on_error callback itself")
+            else:
+                _logger.exception("Unhandled exception in batch handler")
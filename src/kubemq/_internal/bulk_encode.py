@@ -0,0 +1,90 @@
+"""Columnar bulk encoding for the batch send APIs.
+
+The per-message batch methods pay the full message cost on every row: the
+dataclass and its channel validation, building the protobuf field by field,
+a ``dict(pb.Tags)`` copy and a trace-context injection. When every row goes
+to the same channel with the same metadata, tags and policy, all of that is
+identical across rows. :func:`encode_bulk` does it once: the trace context
+is injected into the shared tags, one sample message is validated and
+encoded as a :class:`~kubemq.core.message_template.MessageTemplate`, and
+the rows are stamped from its prototype with only an ID and a body each.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableSequence, Sequence
+from typing import Any
+
+from kubemq._internal.telemetry import KubeMQTagsCarrier
+from kubemq.core.exceptions import KubeMQValidationError
+from kubemq.core.message_template import MessageTemplate
+
+
+def encode_bulk(
+    message_cls: type,
+    channel: str,
+    bodies: Sequence[bytes],
+    client_id: str,
+    *,
+    ids: Sequence[str] | None = None,
+    metadata: str | None = None,
+    tags: dict[str, str] | None = None,
+    max_body_size: int = 0,
+    into: MutableSequence[Any] | None = None,
+    **fields: Any,
+) -> MutableSequence[Any]:
+    """Validate shared columns once and encode one protobuf per body.
+
+    Args:
+        message_cls: Message dataclass the rows would otherwise be built as,
+            e.g. ``QueueMessage`` or ``EventStoreMessage``.
+        channel: Channel shared by every row.
+        bodies: Message bodies, one per row.
+        client_id: Sender client ID.
+        ids: Message IDs, one per row. Generated if not given.
+        metadata: Metadata shared by every row.
+        tags: Tags shared by every row. Not mutated.
+        max_body_size: Reject bodies larger than this many bytes (0 = no limit).
+        into: Destination passed to :meth:`MessageTemplate.encode_many`.
+        **fields: Other shared ``message_cls`` fields, such as queue policy.
+
+    Returns:
+        The encoded rows, in ``bodies`` order.
+
+    Raises:
+        KubeMQValidationError: If a shared field is invalid, ``ids`` does not
+            match ``bodies``, a body exceeds ``max_body_size``, or a row would
+            be empty.
+    """
+    if ids is not None and len(ids) != len(bodies):
+        raise KubeMQValidationError(
+            f"Got {len(ids)} ids for {len(bodies)} bodies; pass one id per body or none.",
+            is_retryable=False,
+        )
+    if not bodies:
+        return [] if into is None else into
+    if max_body_size > 0:
+        largest = max(map(len, bodies))
+        if largest > max_body_size:
+            raise KubeMQValidationError(
+                f"Message body size ({largest} bytes) exceeds maximum "
+                f"send size ({max_body_size} bytes). "
+                f"Reduce message size or increase max_send_size in ClientConfig.",
+                is_retryable=False,
+            )
+    if not metadata and not tags and not all(bodies):
+        raise KubeMQValidationError(
+            "Every message must have at least one of: metadata, body, or tags. "
+            "Pass shared metadata or tags, or a non-empty body for every row.",
+            is_retryable=False,
+        )
+
+    shared_tags = dict(tags) if tags else {}
+    KubeMQTagsCarrier(shared_tags).inject()
+    try:
+        sample = message_cls(
+            channel=channel, metadata=metadata, tags=shared_tags, body=bodies[0], **fields
+        )
+    except (ValueError, TypeError) as e:
+        raise KubeMQValidationError(str(e), is_retryable=False) from e
+    return MessageTemplate(sample).encode_many(bodies, client_id, ids=ids, into=into)
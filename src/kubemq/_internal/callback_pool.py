@@ -0,0 +1,134 @@
+"""Fixed-size worker pool for concurrent subscription callbacks.
+
+The callback-style subscriptions (``subscribe_with_callback``,
+``subscribe_store_with_callback``, ``subscribe_commands_with_callback`` and
+``subscribe_queries_with_callback``) used to spawn one ``asyncio.Task`` per
+message when ``max_concurrent_callbacks > 1``. Task creation, the done
+callback and the pending-task set bookkeeping dominate the per-message cost
+at high rates, so instead N long-lived worker coroutines pull from a bounded
+``asyncio.Queue``. Concurrency is still capped at N and the bounded queue
+applies backpressure to the stream reader exactly like the old semaphore.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_logger = logging.getLogger("kubemq.callback_pool")
+
+
+class AsyncCallbackPool(Generic[T]):
+    """Run an async handler on a fixed number of long-lived worker coroutines.
+
+    Items are handed over with :meth:`submit`, which blocks once
+    ``queue_size`` items are waiting, so a slow handler throttles the
+    producer instead of growing memory. The handler is expected to do its
+    own error reporting; anything it lets escape is logged and the worker
+    keeps running.
+
+    Thread Safety:
+        Not thread-safe. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], Awaitable[None]],
+        workers: int,
+        *,
+        queue_size: int | None = None,
+        name: str = "kubemq-callback",
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._handler = handler
+        self._size = workers
+        self._queue_size = queue_size if queue_size is not None else workers
+        self._name = name
+        self._queue: asyncio.Queue[T] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def size(self) -> int:
+        """Number of worker coroutines."""
+        return self._size
+
+    @property
+    def pending(self) -> int:
+        """Number of items queued but not yet picked up by a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        """True while worker coroutines are alive."""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Create the queue and spawn the worker coroutines (idempotent).
+
+        Must be called from within a running event loop.
+        """
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"{self._name}-{i}") for i in range(self._size)
+        ]
+
+    async def submit(self, item: T) -> None:
+        """Queue an item for processing, waiting while the queue is full."""
+        if self._queue is None:
+            self.start()
+        assert self._queue is not None
+        await self._queue.put(item)
+
+    async def join(self) -> None:
+        """Wait until every submitted item has been processed."""
+        if self._queue is not None and self._workers:
+            await self._queue.join()
+
+    async def close(self, *, drain: bool = True) -> None:
+        """Stop the workers.
+
+        Args:
+            drain: If True (default), wait for queued and in-flight items to
+                finish before stopping. If False, in-flight handlers are
+                cancelled and queued items are discarded.
+        """
+        if not self._workers:
+            return
+        if drain:
+            try:
+                await self.join()
+            finally:
+                await self._stop_workers()
+        else:
+            await self._stop_workers()
+
+    async def _stop_workers(self) -> None:
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        handler = self._handler
+        while True:
+            item = await queue.get()
+            try:
+                await handler(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                with contextlib.suppress(Exception):
+                    _logger.exception("Unhandled exception in %s worker", self._name)
+            finally:
+                queue.task_done()
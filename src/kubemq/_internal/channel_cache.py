@@ -0,0 +1,181 @@
+"""Client-side cache for channel listings.
+
+Every ``list_*_channels`` call sends a ``list-channels`` request to
+``kubemq.cluster.internal.requests`` and decodes the full JSON reply, so a
+dashboard polling thousands of channels every few seconds keeps the broker
+busy answering the same question. With
+``ClientConfig(channel_list_cache_ttl=...)`` set, the sync clients (and
+their ``*_async`` wrappers) answer from a :class:`ChannelListCache`:
+
+- results are kept per ``(channel_type, channel_search)`` for the TTL
+- a trailing-wildcard search such as ``"orders.*"`` is answered from a
+  fresh unfiltered listing of the same type, when one is cached, by a
+  binary search over the sorted channel names
+- concurrent callers missing the same key share one broker request; once
+  an entry has expired, the first caller refreshes it while the others
+  keep getting the previous result until the refresh lands
+- creating or deleting a channel through the same client drops the cached
+  listings of that channel type
+
+Cached lists are shared between callers; treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+_WILDCARDS = frozenset("*?[]")
+
+
+def _literal_prefix(channel_search: str) -> str | None:
+    """Return the prefix of a ``"<literal>*"`` search, else None."""
+    if not channel_search.endswith("*"):
+        return None
+    prefix = channel_search[:-1]
+    if not prefix or _WILDCARDS.intersection(prefix):
+        return None
+    return prefix
+
+
+class _Entry:
+    __slots__ = ("channels", "expires_at", "names")
+
+    def __init__(self, channels: list[Any], expires_at: float, *, indexed: bool) -> None:
+        self.channels = channels
+        self.expires_at = expires_at
+        # Unfiltered listings keep their channels sorted by name, with the
+        # names alongside for bisect.
+        self.names = [channel.name for channel in channels] if indexed else None
+
+    def with_prefix(self, prefix: str) -> list[Any]:
+        names = self.names
+        assert names is not None
+        start = bisect.bisect_left(names, prefix)
+        end = start
+        while end < len(names) and names[end].startswith(prefix):
+            end += 1
+        return self.channels[start:end]
+
+
+class _Flight:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: list[Any] | None = None
+        self.error: BaseException | None = None
+
+
+class ChannelListCache:
+    """TTL cache of channel listings with single-flight refresh.
+
+    Args:
+        ttl_seconds: How long a fetched listing is served before it is
+            refreshed.
+        clock: Monotonic time source; injectable for tests.
+
+    Raises:
+        ValueError: If ``ttl_seconds`` is not positive.
+
+    Thread Safety:
+        Thread-safe. The broker request runs outside the cache lock.
+    """
+
+    def __init__(self, ttl_seconds: float, *, clock: Callable[[], float] = time.monotonic) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._flights: dict[tuple[str, str], _Flight] = {}
+        # Bumped by invalidate() so a fetch that started earlier does not
+        # store a listing from before the change.
+        self._generation = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Seconds a listing is served before it is refreshed."""
+        return self._ttl
+
+    def get(
+        self,
+        channel_type: str,
+        channel_search: str,
+        fetch: Callable[[str], list[Any]],
+    ) -> list[Any]:
+        """Return the listing for ``channel_search``, fetching it if needed.
+
+        Args:
+            channel_type: Channel type the listing belongs to.
+            channel_search: Search filter as passed to the broker.
+            fetch: Called with ``channel_search`` to query the broker.
+
+        Returns:
+            The cached or freshly fetched channels.
+
+        Raises:
+            Whatever ``fetch`` raises, for the caller that ran it and for
+            callers that were waiting on it without a previous result.
+        """
+        key = (channel_type, channel_search)
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.expires_at:
+                return entry.channels
+            prefix = _literal_prefix(channel_search)
+            if prefix is not None:
+                full = self._entries.get((channel_type, ""))
+                if full is not None and now < full.expires_at:
+                    return full.with_prefix(prefix)
+            flight = self._flights.get(key)
+            if flight is not None:
+                if entry is not None:
+                    return entry.channels
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                leader = True
+            generation = self._generation
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.result is not None
+            return flight.result
+
+        try:
+            channels = fetch(channel_search)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+            raise
+
+        indexed = channel_search == ""
+        if indexed:
+            channels = sorted(channels, key=lambda channel: channel.name)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = _Entry(channels, self._clock() + self._ttl, indexed=indexed)
+            self._flights.pop(key, None)
+        flight.result = channels
+        flight.done.set()
+        return channels
+
+    def invalidate(self, channel_type: str | None = None) -> None:
+        """Drop cached listings of ``channel_type``, or of every type."""
+        with self._lock:
+            self._generation += 1
+            if channel_type is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == channel_type]:
+                    del self._entries[key]
@@ -0,0 +1,87 @@
+"""Opt-in publish-to-receive latency probe for the receive paths.
+
+Enabled per process by any client created with
+``ClientConfig(delivery_latency_probe=True)``. Once enabled, the ``decode``
+classmethods of the received message types record
+``time.time_ns() - <publish timestamp>`` into a :class:`LogHistogram` per
+message kind. The publish timestamp is the raw integer nanosecond field
+already on the wire, so nothing is converted to ``datetime``:
+
+- events and events store: ``EventReceive.Timestamp`` (events without a
+  server timestamp are skipped)
+- queues: ``QueueMessage.Attributes.Timestamp``
+- commands and queries: the ``Request`` message has no timestamp, so the
+  probe reads the :data:`PUBLISH_TIME_TAG` tag. The CQ clients stamp it on
+  sent commands and queries when ``delivery_latency_probe`` is enabled on
+  the sending client; publishers in other SDKs may set it themselves.
+
+The delay is measured against the local wall clock, so it includes any
+clock offset between the broker (or publisher) and this host.
+
+When disabled, the receive paths pay one module attribute lookup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections.abc import Mapping
+
+from kubemq._internal.histogram import LogHistogram
+from kubemq.core.types import LatencyHistogram
+
+PUBLISH_TIME_TAG = "x-kubemq-publish-time-ns"
+"""Tag carrying a command or query's publish time in Unix nanoseconds."""
+
+
+class DeliveryLatencyProbe:
+    """Per-kind publish-to-receive latency histograms."""
+
+    __slots__ = ("_histograms", "_lock")
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, LogHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, published_ns: int) -> None:
+        """Record the delay since ``published_ns``; ignored if it is 0."""
+        if not published_ns:
+            return
+        histogram = self._histograms.get(kind)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(kind, LogHistogram())
+        histogram.record_ns(time.time_ns() - published_ns)
+
+    def record_tag(self, kind: str, tags: Mapping[str, str]) -> None:
+        """Record from :data:`PUBLISH_TIME_TAG` in a protobuf tag map, if set."""
+        value = tags.get(PUBLISH_TIME_TAG)
+        if value:
+            with contextlib.suppress(ValueError):
+                self.record(kind, int(value))
+
+    def snapshot(self) -> dict[str, LatencyHistogram]:
+        """Return the distribution recorded so far for each message kind."""
+        return {kind: h.snapshot() for kind, h in list(self._histograms.items())}
+
+
+active: DeliveryLatencyProbe | None = None
+"""The process-wide probe, or None while no client has enabled it."""
+
+_enable_lock = threading.Lock()
+
+
+def enable() -> DeliveryLatencyProbe:
+    """Install the process-wide probe (idempotent) and return it."""
+    global active
+    with _enable_lock:
+        if active is None:
+            active = DeliveryLatencyProbe()
+        return active
+
+
+def disable() -> None:
+    """Remove the process-wide probe. Intended for tests."""
+    global active
+    active = None
@@ -0,0 +1,168 @@
+"""Hedged requests for ``AsyncCQClient.send_query``.
+
+A query waits on one responder over one pooled connection, so a single
+slow responder or connection sets the client's tail latency. With
+``ClientConfig(hedging=HedgingPolicy(...))`` and a connection pool of two
+or more, :class:`Hedger` sends a second copy of a query that has not been
+answered after the policy's latency percentile, on another pooled
+connection. The first successful response wins and the other request is
+cancelled:
+
+- the hedge delay is the configured percentile of recent end-to-end query
+  latencies, clamped to ``[min_delay_seconds, max_delay_seconds]``, and
+  recomputed every :data:`_REFRESH_EVERY` samples
+- hedges draw from a token budget refilled by ``max_hedge_ratio`` per
+  query, so they add at most that fraction of load beyond a short burst
+- a hedge gets only the time left before the query's own timeout, and is
+  skipped when less than ``min_remaining_seconds`` is left
+- hedges and hedge wins are counted in ``kubemq.client.hedge.requests``
+
+Confined to the client's event loop; no locking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from kubemq._internal.histogram import LogHistogram
+
+if TYPE_CHECKING:
+    from kubemq.core.config import HedgingPolicy
+
+T = TypeVar("T")
+
+# Recompute the hedge delay after this many new latency samples.
+_REFRESH_EVERY = 64
+# Start a fresh latency window once this many samples have accumulated,
+# so the delay tracks recent latencies.
+_WINDOW = 4096
+
+
+class Hedger:
+    """Decides when to hedge a query and races the two attempts.
+
+    Args:
+        policy: Hedging policy from ``ClientConfig.hedging``.
+        metrics: Optional ``KubeMQMetrics`` that counts hedges and wins.
+    """
+
+    __slots__ = (
+        "_budget",
+        "_delay",
+        "_histogram",
+        "_metrics",
+        "_policy",
+        "_samples",
+        "_since_refresh",
+        "hedged",
+        "requests",
+        "wins",
+    )
+
+    def __init__(self, policy: HedgingPolicy, metrics: Any = None) -> None:
+        self._policy = policy
+        self._metrics = metrics
+        self._histogram = LogHistogram()
+        self._samples = 0
+        self._since_refresh = 0
+        self._delay = policy.initial_delay_seconds
+        self._budget = float(policy.burst)
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+
+    @property
+    def delay(self) -> float:
+        """Current hedge delay in seconds."""
+        return self._delay
+
+    def record_latency(self, seconds: float) -> None:
+        """Add one end-to-end query latency to the hedge-delay window."""
+        self._histogram.record_ns(int(seconds * 1e9))
+        self._samples += 1
+        self._since_refresh += 1
+        policy = self._policy
+        if self._samples < policy.min_samples:
+            return
+        if self._since_refresh < _REFRESH_EVERY and self._samples != policy.min_samples:
+            return
+        self._since_refresh = 0
+        percentile = self._histogram.snapshot().percentile(policy.percentile)
+        self._delay = min(policy.max_delay_seconds, max(policy.min_delay_seconds, percentile))
+        if self._samples >= _WINDOW:
+            self._histogram = LogHistogram()
+            self._samples = 0
+
+    def _take_budget(self) -> bool:
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        return True
+
+    def _record(self, outcome: str, channel: str) -> None:
+        if self._metrics is not None:
+            self._metrics.record_hedge(outcome, channel)
+
+    async def run(
+        self,
+        attempt: Callable[[bool, float], Awaitable[T]],
+        timeout_seconds: float,
+        channel: str,
+    ) -> T:
+        """Run ``attempt(False, timeout)`` and hedge it with ``attempt(True, remaining)``.
+
+        Args:
+            attempt: Starts one request. Called with ``hedge=False`` for the
+                primary and ``hedge=True`` for the hedge, plus the timeout
+                the request may use.
+            timeout_seconds: The query's overall timeout.
+            channel: Query channel, for metrics.
+
+        Returns:
+            The first successful result.
+
+        Raises:
+            The primary's error if both attempts fail, or if the query was
+            not hedged.
+        """
+        policy = self._policy
+        self.requests += 1
+        self._budget = min(float(policy.burst), self._budget + policy.max_hedge_ratio)
+        start = time.perf_counter()
+        primary: asyncio.Future[T] = asyncio.ensure_future(attempt(False, timeout_seconds))
+        backup: asyncio.Future[T] | None = None
+        try:
+            await asyncio.wait((primary,), timeout=self._delay)
+            remaining = timeout_seconds - (time.perf_counter() - start)
+            if (
+                primary.done()
+                or remaining < policy.min_remaining_seconds
+                or not self._take_budget()
+            ):
+                result = await primary
+                self.record_latency(time.perf_counter() - start)
+                return result
+
+            self.hedged += 1
+            self._record("hedged", channel)
+            backup = asyncio.ensure_future(attempt(True, remaining))
+            pending: set[asyncio.Future[T]] = {primary, backup}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    if task is backup:
+                        self.wins += 1
+                        self._record("won", channel)
+                    self.record_latency(time.perf_counter() - start)
+                    return task.result()
+            # Both failed: surface the primary's error.
+            return primary.result()
+        finally:
+            for attempt_future in (primary, backup):
+                if attempt_future is not None and not attempt_future.done():
+                    attempt_future.cancel()
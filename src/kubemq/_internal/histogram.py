@@ -0,0 +1,114 @@
+"""Latency recorders.
+
+Both back the latency snapshots exposed as
+:class:`~kubemq.core.types.LatencyHistogram` and are cheap enough to run
+for every message. :class:`BucketHistogram` bisects a fixed set of bounds
+and is not thread-safe: confine it to one event loop. :class:`LogHistogram`
+covers nanoseconds to an hour at constant relative precision and takes a
+lock, so receive threads can share it.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from kubemq._internal.semconv import DURATION_HISTOGRAM_BUCKETS
+from kubemq.core.types import LatencyHistogram
+
+
+class BucketHistogram:
+    """Accumulates latency samples (seconds) into fixed buckets."""
+
+    __slots__ = ("_bounds", "_count", "_counts", "_max", "_sum")
+
+    def __init__(self, bounds: Sequence[float] = DURATION_HISTOGRAM_BUCKETS) -> None:
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one sample."""
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self._count += 1
+        self._sum += seconds
+        self._max = max(self._max, seconds)
+
+    def snapshot(self) -> LatencyHistogram:
+        """Return the current distribution."""
+        return LatencyHistogram(
+            bounds=self._bounds,
+            counts=tuple(self._counts),
+            count=self._count,
+            sum_seconds=self._sum,
+            max_seconds=self._max,
+        )
+
+
+class LogHistogram:
+    """HDR-style recorder for integer nanosecond samples.
+
+    Buckets are log-linear: each power of two is split into
+    ``2 ** (significant_bits - 1)`` equal sub-buckets, so every bucket is
+    within ``2 ** -(significant_bits - 1)`` of its value (about 1.6% at the
+    default of 7 bits) from 1 ns up to ``highest_ns``. Indexing is integer
+    arithmetic on ``int.bit_length()``. Larger samples go to an overflow
+    bucket and still count towards ``max_seconds``.
+
+    Thread-safe: ``record_ns`` takes a lock, so one recorder can be fed from
+    several receive threads.
+    """
+
+    __slots__ = ("_count", "_counts", "_half_bits", "_lock", "_max", "_sub_bits", "_sum")
+
+    def __init__(self, significant_bits: int = 7, highest_ns: int = 1 << 42) -> None:
+        if significant_bits < 2:
+            raise ValueError("significant_bits must be >= 2")
+        self._sub_bits = significant_bits
+        self._half_bits = significant_bits - 1
+        max_shift = max(0, highest_ns.bit_length() - significant_bits)
+        # Last slot is the overflow bucket.
+        self._counts = [0] * (((max_shift + 2) << self._half_bits) + 1)
+        self._count = 0
+        self._sum = 0
+        self._max = 0
+        self._lock = threading.Lock()
+
+    def record_ns(self, nanoseconds: int) -> None:
+        """Add one sample. Negative values (clock skew) are recorded as 0."""
+        nanoseconds = max(nanoseconds, 0)
+        shift = max(nanoseconds.bit_length() - self._sub_bits, 0)
+        index = (shift << self._half_bits) + (nanoseconds >> shift)
+        counts = self._counts
+        with self._lock:
+            counts[index if index < len(counts) else -1] += 1
+            self._count += 1
+            self._sum += nanoseconds
+            self._max = max(self._max, nanoseconds)
+
+    def _upper_bound_ns(self, index: int) -> int:
+        shift = max(0, (index >> self._half_bits) - 1)
+        return ((index - (shift << self._half_bits) + 1) << shift) - 1
+
+    def snapshot(self) -> LatencyHistogram:
+        """Return the current distribution, keeping only non-empty buckets."""
+        with self._lock:
+            counts = list(self._counts)
+            count, total, peak = self._count, self._sum, self._max
+        bounds: list[float] = []
+        kept: list[int] = []
+        for index, bucket in enumerate(counts[:-1]):
+            if bucket:
+                bounds.append(self._upper_bound_ns(index) / 1e9)
+                kept.append(bucket)
+        kept.append(counts[-1])
+        return LatencyHistogram(
+            bounds=tuple(bounds),
+            counts=tuple(kept),
+            count=count,
+            sum_seconds=total / 1e9,
+            max_seconds=peak / 1e9,
+        )
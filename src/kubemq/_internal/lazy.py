@@ -0,0 +1,90 @@
+"""PEP 562 lazy re-exports for package ``__init__`` modules.
+
+``import kubemq`` used to import every client, the transports and the
+generated gRPC stubs up front, so a process that only needed
+``QueueMessage`` still paid for ``grpc``. Packages now declare their
+re-exports as a table and install the module-level ``__getattr__`` /
+``__dir__`` built here; each name's defining module is imported on first
+attribute access and the value is cached in the package namespace so later
+lookups are plain dict hits.
+
+The tables use import-statement syntax so they read like the eager imports
+they replace::
+
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "kubemq.core.config": ("ClientConfig", "TLSConfig"),
+            "kubemq.pubsub": ("Client as PubSubClient",),
+        },
+    )
+
+Type checkers do not see ``__getattr__`` results, so packages keep the
+equivalent imports under ``if TYPE_CHECKING:``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def _parse_exports(
+    exports: Mapping[str, Iterable[str]],
+) -> dict[str, tuple[str, str]]:
+    table: dict[str, tuple[str, str]] = {}
+    for module_name, names in exports.items():
+        for spec in names:
+            attr, _, alias = spec.partition(" as ")
+            attr = attr.strip()
+            table[(alias or attr).strip()] = (module_name, attr)
+    return table
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, Iterable[str]],
+    *,
+    fallback: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package's lazy re-exports.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Maps a module (absolute, or relative with a leading dot) to
+            the names it provides, each ``"name"`` or ``"name as alias"``.
+        fallback: Modules searched for public names not listed in
+            ``exports``, preserving what a run of ``from .mod import *``
+            statements used to expose. As with successive star imports,
+            later modules take precedence.
+
+    Returns:
+        A ``(__getattr__, __dir__)`` pair to assign at module level.
+    """
+    table = _parse_exports(exports)
+    fallback_modules = tuple(reversed(tuple(fallback)))
+
+    def __getattr__(name: str) -> Any:
+        target = table.get(name)
+        if target is not None:
+            module_name, attr = target
+            value = getattr(importlib.import_module(module_name, package), attr)
+        else:
+            if name.startswith("_"):
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+            for module_name in fallback_modules:
+                module = importlib.import_module(module_name, package)
+                if name in vars(module):
+                    value = vars(module)[name]
+                    break
+            else:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(table))
+
+    return __getattr__, __dir__
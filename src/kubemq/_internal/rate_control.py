@@ -0,0 +1,126 @@
+"""AIMD send-rate controller for the async stream senders.
+
+Without pacing, a producer faster than the broker fills the send queue and
+then gets ``KubeMQBufferFullError`` until it backs off by hand. With
+``ClientConfig.adaptive_rate`` set, :class:`AsyncEventSender` and
+:class:`AsyncUpstreamSender` call :meth:`AimdRateController.acquire` before
+each enqueue and report every confirmation back, and the controller steers
+the rate toward the highest one the stream sustains:
+
+- pacing is a token bucket holding at most one adjust interval of tokens;
+  a caller that finds it empty reserves a token and sleeps until it is due,
+  so concurrent callers queue up in order without a lock
+- once per interval, the rate is multiplied by ``decrease_factor`` if any
+  congestion signal fired (send queue past ``high_queue_utilization``,
+  smoothed confirmation latency above ``target_latency_seconds``, or a
+  failed send), and otherwise grows by ``additive_increase`` when callers
+  were actually held back
+
+Confined to the sender's event loop; no locking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kubemq.core.config import AdaptiveRateConfig
+
+_logger = logging.getLogger("kubemq._internal.rate_control")
+
+# Weight of the newest sample in the confirmation-latency EWMA.
+_LATENCY_ALPHA = 0.2
+
+
+class AimdRateController:
+    """Paces sends and adjusts the rate with additive-increase/multiplicative-decrease."""
+
+    __slots__ = (
+        "_clock",
+        "_config",
+        "_congested",
+        "_last_adjust",
+        "_last_refill",
+        "_latency",
+        "_rate",
+        "_throttled",
+        "_tokens",
+    )
+
+    def __init__(
+        self, config: AdaptiveRateConfig, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._config = config
+        self._clock = clock
+        self._rate = config.initial_rate
+        now = clock()
+        self._tokens = self._burst()
+        self._last_refill = now
+        self._last_adjust = now
+        self._latency = 0.0
+        self._congested = False
+        self._throttled = False
+
+    @property
+    def rate(self) -> float:
+        """Current target rate in messages per second."""
+        return self._rate
+
+    @property
+    def latency(self) -> float:
+        """Smoothed confirmation latency in seconds."""
+        return self._latency
+
+    def _burst(self) -> float:
+        return max(1.0, self._rate * self._config.adjust_interval_seconds)
+
+    def reserve(self, queue_depth: int, queue_capacity: int) -> float:
+        """Take one token and return how long to wait before sending (seconds)."""
+        now = self._clock()
+        config = self._config
+        if queue_capacity and queue_depth >= queue_capacity * config.high_queue_utilization:
+            self._congested = True
+        if now - self._last_adjust >= config.adjust_interval_seconds:
+            self._adjust(now)
+        self._tokens = min(self._burst(), self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        self._throttled = True
+        return -self._tokens / self._rate
+
+    async def acquire(self, queue_depth: int, queue_capacity: int) -> None:
+        """Wait until the next send is allowed."""
+        delay = self.reserve(queue_depth, queue_capacity)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_result(self, latency_seconds: float, ok: bool) -> None:
+        """Feed back one confirmation: its latency and whether it succeeded."""
+        if self._latency:
+            self._latency += _LATENCY_ALPHA * (latency_seconds - self._latency)
+        else:
+            self._latency = latency_seconds
+        if not ok or self._latency > self._config.target_latency_seconds:
+            self._congested = True
+
+    def on_error(self) -> None:
+        """Feed back a stream-level failure such as a disconnect."""
+        self._congested = True
+
+    def _adjust(self, now: float) -> None:
+        config = self._config
+        previous = self._rate
+        if self._congested:
+            self._rate = max(config.min_rate, previous * config.decrease_factor)
+            _logger.debug("send rate %.0f -> %.0f msg/s (congested)", previous, self._rate)
+        elif self._throttled:
+            self._rate = min(config.max_rate, previous + config.additive_increase)
+        self._congested = False
+        self._throttled = False
+        self._last_adjust = now
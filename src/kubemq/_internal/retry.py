@@ -36,9 +36,24 @@ class BackoffCalculator:
         self._max_ms = policy.max_backoff_ms
         self._multiplier = policy.backoff_multiplier
         self._jitter = policy.jitter
+        self._previous_ms = float(self._initial_ms)
 
     def delay_ms(self, attempt: int) -> float:
-        """Return the backoff delay in milliseconds for the given attempt (0-based)."""
+        """Return the backoff delay in milliseconds for the given attempt (0-based).
+
+        ``JitterType.DECORRELATED`` draws each delay from
+        ``[initial, 3 * previous delay]`` (capped at the maximum), so it
+        depends on the previous call; attempt 0 resets the sequence.
+        """
+        if self._jitter == JitterType.DECORRELATED:
+            if attempt == 0:
+                self._previous_ms = float(self._initial_ms)
+            self._previous_ms = min(
+                float(self._max_ms),
+                random.uniform(self._initial_ms, self._previous_ms * 3),
+            )
+            return self._previous_ms
+
         base = min(
             self._max_ms,
             self._initial_ms * (self._multiplier**attempt),
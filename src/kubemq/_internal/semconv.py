@@ -50,6 +50,19 @@ METRIC_RECONNECTIONS = "messaging.client.reconnections"
 METRIC_RETRY_ATTEMPTS = "kubemq.client.retry.attempts"
 METRIC_RETRY_EXHAUSTED = "kubemq.client.retry.exhausted"
 METRIC_SEND_QUEUE_UTILIZATION = "kubemq.send_queue.utilization"
+METRIC_STAGE_DURATION = "kubemq.client.stage.duration"
+METRIC_QUERY_CACHE_LOOKUPS = "kubemq.client.query_cache.lookups"
+METRIC_HEDGE_REQUESTS = "kubemq.client.hedge.requests"
+
+# Stage timer attributes
+KUBEMQ_STAGE_COMPONENT = "kubemq.stage.component"
+KUBEMQ_STAGE_NAME = "kubemq.stage.name"
+
+# Query cache attributes ("hit", "miss" or "coalesced")
+KUBEMQ_CACHE_RESULT = "kubemq.cache.result"
+
+# Hedged query attributes ("hedged" or "won")
+KUBEMQ_HEDGE_OUTCOME = "kubemq.hedge.outcome"
 
 # Histogram bucket boundaries (seconds)
 DURATION_HISTOGRAM_BUCKETS = (
@@ -43,6 +43,9 @@ if TYPE_CHECKING:
         TracerProvider,
     )
 
+    from kubemq._internal.delivery_latency import DeliveryLatencyProbe
+    from kubemq.core.types import LatencyHistogram
+
 
 # ── No-op stubs (used when HAS_OTEL is False) ─────────────────────
 # These implement the same call interface as OTel classes so that
@@ -581,6 +584,8 @@ class KubeMQMetrics:
         channel_allowlist: Explicit set of channel names always included
             regardless of cardinality threshold.
         logger: Logger Protocol instance for cardinality warnings.
+        delivery_latency: Enable the process-wide publish-to-receive latency
+            probe (see :mod:`kubemq._internal.delivery_latency`).
     """
 
     __slots__ = (
@@ -598,6 +603,10 @@ class KubeMQMetrics:
         "_reconnections",
         "_retry_attempts",
         "_retry_exhausted",
+        "_stage_duration",
+        "_query_cache_lookups",
+        "_hedge_requests",
+        "_delivery_latency",
     )
 
     def __init__(
@@ -606,6 +615,7 @@ class KubeMQMetrics:
         max_channel_cardinality: int = 100,
         channel_allowlist: set[str] | None = None,
         logger: Any = None,
+        delivery_latency: bool = False,
     ) -> None:
         self._meter = meter
         self._max_cardinality = max_channel_cardinality
@@ -618,11 +628,14 @@ class KubeMQMetrics:
         from kubemq._internal.semconv import (
             METRIC_CONNECTION_COUNT,
             METRIC_CONSUMED_MESSAGES,
+            METRIC_HEDGE_REQUESTS,
             METRIC_OPERATION_DURATION,
+            METRIC_QUERY_CACHE_LOOKUPS,
             METRIC_RECONNECTIONS,
             METRIC_RETRY_ATTEMPTS,
             METRIC_RETRY_EXHAUSTED,
             METRIC_SENT_MESSAGES,
+            METRIC_STAGE_DURATION,
         )
 
         self._operation_duration = meter.create_histogram(
@@ -660,6 +673,26 @@ class KubeMQMetrics:
             unit="{attempt}",
             description="Retries exhausted",
         )
+        self._stage_duration = meter.create_histogram(
+            name=METRIC_STAGE_DURATION,
+            unit="s",
+            description="Sampled duration of send/receive pipeline stages",
+        )
+        self._query_cache_lookups = meter.create_counter(
+            name=METRIC_QUERY_CACHE_LOOKUPS,
+            unit="{lookup}",
+            description="Client-side query cache lookups by result",
+        )
+        self._hedge_requests = meter.create_counter(
+            name=METRIC_HEDGE_REQUESTS,
+            unit="{request}",
+            description="Hedged query requests sent and won",
+        )
+        self._delivery_latency: DeliveryLatencyProbe | None = None
+        if delivery_latency:
+            from kubemq._internal import delivery_latency as _delivery_latency
+
+            self._delivery_latency = _delivery_latency.enable()
 
     def record_operation_duration(
         self,
@@ -759,6 +792,51 @@ class KubeMQMetrics:
             },
         )
 
+    def record_stage_duration(self, duration_seconds: float, component: str, stage: str) -> None:
+        """Record one sampled pipeline stage duration (see ``StageTimer``)."""
+        from kubemq._internal.semconv import (
+            KUBEMQ_STAGE_COMPONENT,
+            KUBEMQ_STAGE_NAME,
+            MESSAGING_SYSTEM,
+            MESSAGING_SYSTEM_VALUE,
+        )
+
+        self._stage_duration.record(
+            duration_seconds,
+            attributes={
+                MESSAGING_SYSTEM: MESSAGING_SYSTEM_VALUE,
+                KUBEMQ_STAGE_COMPONENT: component,
+                KUBEMQ_STAGE_NAME: stage,
+            },
+        )
+
+    def record_query_cache_lookup(self, result: str, channel: str) -> None:
+        """Count one query cache lookup (``"hit"``, ``"miss"`` or ``"coalesced"``)."""
+        from kubemq._internal.semconv import KUBEMQ_CACHE_RESULT
+
+        attrs = self._base_attributes("send", channel)
+        attrs[KUBEMQ_CACHE_RESULT] = result
+        self._query_cache_lookups.add(1, attributes=attrs)
+
+    def record_hedge(self, outcome: str, channel: str) -> None:
+        """Count a hedged query (``"hedged"``) or a hedge that answered first (``"won"``)."""
+        from kubemq._internal.semconv import KUBEMQ_HEDGE_OUTCOME
+
+        attrs = self._base_attributes("send", channel)
+        attrs[KUBEMQ_HEDGE_OUTCOME] = outcome
+        self._hedge_requests.add(1, attributes=attrs)
+
+    def delivery_latency(self) -> dict[str, LatencyHistogram]:
+        """Return publish-to-receive latency per message kind.
+
+        Keys are ``"events"``, ``"events_store"``, ``"queues"``,
+        ``"commands"`` and ``"queries"``, present once a message of that kind
+        has been recorded. Empty unless the probe was enabled.
+        """
+        if self._delivery_latency is None:
+            return {}
+        return self._delivery_latency.snapshot()
+
     def _base_attributes(self, operation: str, channel: str) -> dict[str, Any]:
         """Build base metric attributes with cardinality management."""
         from kubemq._internal.semconv import (
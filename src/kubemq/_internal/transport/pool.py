@@ -0,0 +1,141 @@
+"""Coordinated reconnection for pooled async transports.
+
+An async client keeps a primary transport plus ``connection_pool_size``
+send transports, each with its own ReconnectionManager. When the broker
+restarts they all lose their connection at once and, left alone, every
+channel of every client redials on its own schedule. A fleet of clients
+then hits the recovering broker with ``pool_size x fleet`` dials per
+backoff step. PoolReconnectCoordinator gates those redials:
+
+1. The first transport to redial after an outage becomes the probe. It is
+   the only member dialing until the broker answers its verification ping.
+2. The other members wait for the probe. Once it is back they are admitted
+   one stagger step apart, with random jitter inside each step.
+3. Pooled transports back off with decorrelated jitter, so clients that
+   failed together drift apart on later attempts instead of retrying in
+   lockstep.
+
+The probe's successful ping is the health result shared across the pool;
+if the probe's own reconnection gives up, the next member to redial takes
+over probing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from kubemq.core.exceptions import KubeMQConnectionError
+from kubemq.core.types import PoolHealth
+
+if TYPE_CHECKING:
+    from kubemq.transport.async_transport import AsyncTransport
+
+
+class PoolReconnectCoordinator:
+    """Serializes pool redials behind a single probe connection.
+
+    Internal — created by ``NativeAsyncBaseClient.connect`` and handed to
+    each pooled ``AsyncTransport``, whose ReconnectionManager dials through
+    :meth:`redial`.
+    """
+
+    def __init__(
+        self,
+        *,
+        stagger_ms: int = 100,
+        probe_wait_seconds: float = 30.0,
+        logger: Any = None,
+    ) -> None:
+        self._stagger_ms = stagger_ms
+        self._probe_wait_seconds = probe_wait_seconds
+        self._logger = logger or logging.getLogger("kubemq.pool")
+        self._transports: list[AsyncTransport] = []
+        self._healthy = asyncio.Event()
+        self._healthy.set()
+        self._probe: AsyncTransport | None = None
+        self._admitted = 0
+        self._outage_started: float | None = None
+        self._probe_attempts = 0
+        self._reconnects = 0
+        self._recoveries = 0
+        self._last_recovery_seconds: float | None = None
+
+    def register(self, transport: AsyncTransport) -> None:
+        """Add a transport to the coordinated pool."""
+        self._transports.append(transport)
+
+    def connection_lost(self, transport: AsyncTransport) -> None:
+        """Record that a member lost its connection.
+
+        The first loss after a healthy period starts a new outage: later
+        redials wait for a fresh probe before dialing.
+        """
+        if self._healthy.is_set():
+            self._healthy.clear()
+            self._admitted = 0
+            self._outage_started = time.monotonic()
+            self._logger.info("Pool connection lost; probing before redialing the pool")
+
+    async def redial(self, transport: AsyncTransport, dial: Callable[[], Awaitable[None]]) -> None:
+        """Dial ``transport`` once, gated by the pool's probe.
+
+        Used as the ReconnectionManager ``connect_fn``. Raising counts as a
+        failed attempt, so the caller's backoff applies between tries.
+
+        Raises:
+            KubeMQConnectionError: If the probe did not recover within
+                ``probe_wait_seconds``.
+        """
+        if not self._healthy.is_set():
+            probe = self._probe
+            if probe is not None and probe is not transport and probe.is_reconnecting:
+                try:
+                    await asyncio.wait_for(self._healthy.wait(), timeout=self._probe_wait_seconds)
+                except TimeoutError as e:
+                    raise KubeMQConnectionError(
+                        "Timed out waiting for the pool probe connection to recover"
+                    ) from e
+            else:
+                self._probe = transport
+                self._probe_attempts += 1
+                await dial()
+                self._probe = None
+                self._healthy.set()
+                self._logger.info("Pool probe reconnected; redialing remaining transports")
+                self._record_reconnect()
+                return
+
+        await self._stage()
+        await dial()
+        self._record_reconnect()
+
+    async def _stage(self) -> None:
+        slot = self._admitted
+        self._admitted += 1
+        delay_ms = slot * self._stagger_ms + random.uniform(0, self._stagger_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+
+    def _record_reconnect(self) -> None:
+        self._reconnects += 1
+        if self._outage_started is not None and all(t.is_connected for t in self._transports):
+            self._recoveries += 1
+            self._last_recovery_seconds = time.monotonic() - self._outage_started
+            self._outage_started = None
+
+    def health(self) -> PoolHealth:
+        """Return a snapshot of the pool's connection state and counters."""
+        return PoolHealth(
+            size=len(self._transports),
+            ready=sum(1 for t in self._transports if t.is_connected),
+            reconnecting=sum(1 for t in self._transports if t.is_reconnecting),
+            probe_attempts=self._probe_attempts,
+            reconnects=self._reconnects,
+            recoveries=self._recoveries,
+            last_recovery_seconds=self._last_recovery_seconds,
+        )
@@ -17,11 +17,13 @@ import threading
 from collections.abc import Awaitable, Callable
 from typing import Any, Union
 
-from kubemq.core.exceptions import KubeMQBufferFullError
+from kubemq.core.exceptions import KubeMQBufferFullError, KubeMQConnectionError
 
 BufferDrainCallback = Callable[[int], None]
 AsyncBufferDrainCallback = Callable[[int], Awaitable[None]]
 AnyBufferDrainCallback = Union[BufferDrainCallback, AsyncBufferDrainCallback]
+BufferedItem = tuple[bytes, dict[str, Any]]
+BufferFlushCallback = Callable[[list[BufferedItem]], Awaitable[None]]
 
 
 class ReconnectConfig:
@@ -32,12 +34,13 @@ class ReconnectConfig:
     """
 
     __slots__ = (
-        "max_reconnect_attempts",
+        "auto_reconnect",
+        "buffer_overflow_mode",
         "initial_reconnect_delay_ms",
+        "max_reconnect_attempts",
         "max_reconnect_delay_ms",
         "reconnect_backoff_multiplier",
         "reconnect_buffer_size",
-        "auto_reconnect",
     )
 
     def __init__(
@@ -48,6 +51,7 @@ class ReconnectConfig:
         max_reconnect_delay_ms: int = 30_000,
         reconnect_backoff_multiplier: float = 2.0,
         reconnect_buffer_size: int = 8 * 1024 * 1024,
+        buffer_overflow_mode: str = "error",
         auto_reconnect: bool = True,
     ) -> None:
         self.max_reconnect_attempts = max_reconnect_attempts
@@ -55,6 +59,7 @@ class ReconnectConfig:
         self.max_reconnect_delay_ms = max_reconnect_delay_ms
         self.reconnect_backoff_multiplier = reconnect_backoff_multiplier
         self.reconnect_buffer_size = reconnect_buffer_size
+        self.buffer_overflow_mode = buffer_overflow_mode
         self.auto_reconnect = auto_reconnect
 
 
@@ -172,6 +177,20 @@ class _AsyncBoundedByteBuffer:
             self._space_available.set()
             return items
 
+    async def remove(self, metadata: dict[str, Any]) -> bool:
+        """Drop the item buffered with ``metadata``.
+
+        Returns False if the item was already drained.
+        """
+        async with self._lock:
+            for index, (data, meta) in enumerate(self._buffer):
+                if meta is metadata:
+                    del self._buffer[index]
+                    self._current_bytes -= len(data)
+                    self._space_available.set()
+                    return True
+            return False
+
     async def discard_all(self) -> int:
         """Discard all items. Returns count of discarded items."""
         async with self._lock:
@@ -192,6 +211,12 @@ class ReconnectionManager:
     4. Subscription recovery after reconnection
     5. DNS re-resolution (new channel per attempt)
     6. State machine transitions (READY -> RECONNECTING -> READY or CLOSED)
+
+    Buffered items are ``(payload, metadata)`` pairs. After a successful
+    reconnect they are handed to ``flush_fn`` in FIFO order for re-sending;
+    when the buffer is discarded instead, any ``asyncio.Future`` stored under
+    ``metadata["future"]`` is failed with ``KubeMQConnectionError`` so callers
+    awaiting a buffered send are released.
     """
 
     def __init__(
@@ -200,14 +225,19 @@ class ReconnectionManager:
         backoff: Any,
         on_buffer_drain: AnyBufferDrainCallback | None = None,
         logger: Any = None,
+        flush_fn: BufferFlushCallback | None = None,
     ) -> None:
         self._config = config
         self._backoff = backoff
-        self._buffer = _AsyncBoundedByteBuffer(config.reconnect_buffer_size)
+        self._buffer = _AsyncBoundedByteBuffer(
+            config.reconnect_buffer_size, overflow_mode=config.buffer_overflow_mode
+        )
         self._on_buffer_drain = on_buffer_drain
+        self._flush_fn = flush_fn
         self._logger = logger or logging.getLogger("kubemq.reconnect")
         self._reconnect_task: asyncio.Task[None] | None = None
         self._cancelled = False
+        self._reconnected = False
 
     @property
     def buffer(self) -> _AsyncBoundedByteBuffer:
@@ -234,6 +264,7 @@ class ReconnectionManager:
             return
 
         self._cancelled = False
+        self._reconnected = False
         self._reconnect_task = asyncio.create_task(
             self._reconnect_loop(connect_fn, subscription_recovery_fn)
         )
@@ -279,32 +310,20 @@ class ReconnectionManager:
                     attempt + 1,
                 )
 
-                # Drain buffered messages after successful reconnection
-                buffered = await self._buffer.drain_all()
-                if buffered:
-                    self._logger.info(
-                        "Flushing buffered messages count=%d",
-                        len(buffered),
-                    )
-                    if self._on_buffer_drain:
-                        try:
-                            if asyncio.iscoroutinefunction(self._on_buffer_drain):
-                                await self._on_buffer_drain(len(buffered))
-                            else:
-                                self._on_buffer_drain(len(buffered))
-                        except Exception:
-                            self._logger.error(
-                                "OnBufferDrain callback raised an exception",
-                                exc_info=True,
-                            )
+                self._reconnected = True
+                await self._flush_buffer()
 
                 # Recover subscriptions
                 if subscription_recovery_fn:
                     await subscription_recovery_fn()
 
+                # Sends that were blocked on a full buffer may have landed
+                # while subscriptions were being recovered.
+                await self._flush_buffer()
                 return
 
             except Exception as exc:
+                self._reconnected = False
                 self._logger.warning(
                     "Reconnection attempt failed attempt=%d error=%s",
                     attempt + 1,
@@ -312,13 +331,38 @@ class ReconnectionManager:
                 )
                 attempt += 1
 
+    async def _flush_buffer(self) -> None:
+        """Hand buffered messages to ``flush_fn`` until the buffer stays empty."""
+        while buffered := await self._buffer.drain_all():
+            self._logger.info(
+                "Flushing buffered messages count=%d",
+                len(buffered),
+            )
+            if self._flush_fn:
+                try:
+                    await self._flush_fn(buffered)
+                except Exception:
+                    self._logger.exception("Buffer flush raised an exception")
+                    _fail_pending(buffered, "Failed to flush buffered message after reconnect")
+            await self._notify_drain(len(buffered))
+
     async def buffer_message(self, data: bytes, metadata: dict[str, Any] | None = None) -> None:
         """Buffer a message during reconnection.
 
+        In ``"block"`` overflow mode this waits for space. If the
+        reconnection finished while the caller was waiting, the message is
+        flushed (or discarded, if reconnection gave up) immediately rather
+        than left stranded until the next reconnect.
+
         Raises:
-            KubeMQBufferFullError: When the buffer is full.
+            KubeMQBufferFullError: When the buffer is full in ``"error"`` mode.
         """
         await self._buffer.put(data, metadata)
+        if self._reconnect_task is not None and self._reconnect_task.done():
+            if self._reconnected:
+                await self._flush_buffer()
+            else:
+                await self._discard_buffer_and_notify()
 
     async def cancel(self) -> None:
         """Cancel reconnection, discard buffer, and notify via callback."""
@@ -331,12 +375,26 @@ class ReconnectionManager:
 
     async def _discard_buffer_and_notify(self) -> None:
         """Discard buffered messages and fire OnBufferDrain callback."""
-        count = await self._buffer.discard_all()
-        if count > 0 and self._on_buffer_drain:
-            try:
-                if asyncio.iscoroutinefunction(self._on_buffer_drain):
-                    await self._on_buffer_drain(count)
-                else:
-                    self._on_buffer_drain(count)
-            except Exception:
-                self._logger.error("OnBufferDrain callback raised an exception")
+        discarded = await self._buffer.drain_all()
+        _fail_pending(discarded, "Reconnection abandoned; buffered message was discarded")
+        if discarded:
+            await self._notify_drain(len(discarded))
+
+    async def _notify_drain(self, count: int) -> None:
+        if not self._on_buffer_drain:
+            return
+        try:
+            if asyncio.iscoroutinefunction(self._on_buffer_drain):
+                await self._on_buffer_drain(count)
+            else:
+                self._on_buffer_drain(count)
+        except Exception:
+            self._logger.exception("OnBufferDrain callback raised an exception")
+
+
+def _fail_pending(items: list[BufferedItem], message: str) -> None:
+    """Fail the unresolved futures attached to buffered items."""
+    for _, metadata in items:
+        future = metadata.get("future")
+        if future is not None and not future.done():
+            future.set_exception(KubeMQConnectionError(message))
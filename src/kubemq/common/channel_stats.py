@@ -1,6 +1,15 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 class QueuesStats:
@@ -158,28 +167,17 @@ def decode_pub_sub_channel_list(data_bytes: bytes) -> list[PubSubChannel]:
     - List[PubSubChannel]: A list of PubSubChannel objects.
 
     """
-    # Decode bytes to string and parse JSON
-    data_str = data_bytes.decode("utf-8")
-    channels_data = json.loads(data_str)
-
-    channels = []
-    for item in channels_data:
-        # Extracting incoming and outgoing as Stats objects
-        incoming = PubSubStats(**item["incoming"])
-        outgoing = PubSubStats(**item["outgoing"])
-
-        # Creating a Channel instance with the Stats objects
-        channel = PubSubChannel(
-            name=item["name"],
-            type=item["type"],
-            last_activity=item["lastActivity"],
-            is_active=item["isActive"],
-            incoming=incoming,
-            outgoing=outgoing,
+    return [
+        PubSubChannel(
+            item["name"],
+            item["type"],
+            item["lastActivity"],
+            item["isActive"],
+            PubSubStats(**item["incoming"]),
+            PubSubStats(**item["outgoing"]),
         )
-        channels.append(channel)
-
-    return channels
+        for item in _loads(data_bytes)
+    ]
 
 
 def decode_queues_channel_list(data_bytes: bytes) -> list[QueuesChannel]:
@@ -197,28 +195,17 @@ def decode_queues_channel_list(data_bytes: bytes) -> list[QueuesChannel]:
         - The JSON object should contain the necessary fields ('name', 'type', 'lastActivity', 'isActive', 'incoming', 'outgoing') for creating QueuesChannel objects.
         - The 'incoming' and 'outgoing' fields should contain valid JSON objects that can be parsed into QueuesStats objects.
     """
-    # Decode bytes to string and parse JSON
-    data_str = data_bytes.decode("utf-8")
-    channels_data = json.loads(data_str)
-
-    channels = []
-    for item in channels_data:
-        # Extracting incoming and outgoing as Stats objects
-        incoming = QueuesStats(**item["incoming"])
-        outgoing = QueuesStats(**item["outgoing"])
-
-        # Creating a Channel instance with the Stats objects
-        channel = QueuesChannel(
-            name=item["name"],
-            type=item["type"],
-            last_activity=item["lastActivity"],
-            is_active=item["isActive"],
-            incoming=incoming,
-            outgoing=outgoing,
+    return [
+        QueuesChannel(
+            item["name"],
+            item["type"],
+            item["lastActivity"],
+            item["isActive"],
+            QueuesStats(**item["incoming"]),
+            QueuesStats(**item["outgoing"]),
         )
-        channels.append(channel)
-
-    return channels
+        for item in _loads(data_bytes)
+    ]
 
 
 def decode_cq_channel_list(data_bytes: bytes) -> list[CQChannel]:
@@ -230,25 +217,14 @@ def decode_cq_channel_list(data_bytes: bytes) -> list[CQChannel]:
     Returns:
     - List[CQChannel]: The list of CQChannel objects decoded from the byte array.
     """
-    # Decode bytes to string and parse JSON
-    data_str = data_bytes.decode("utf-8")
-    channels_data = json.loads(data_str)
-
-    channels = []
-    for item in channels_data:
-        # Extracting incoming and outgoing as Stats objects
-        incoming = CQStats(**item["incoming"])
-        outgoing = CQStats(**item["outgoing"])
-
-        # Creating a Channel instance with the Stats objects
-        channel = CQChannel(
-            name=item["name"],
-            type=item["type"],
-            last_activity=item["lastActivity"],
-            is_active=item["isActive"],
-            incoming=incoming,
-            outgoing=outgoing,
+    return [
+        CQChannel(
+            item["name"],
+            item["type"],
+            item["lastActivity"],
+            item["isActive"],
+            CQStats(**item["incoming"]),
+            CQStats(**item["outgoing"]),
         )
-        channels.append(channel)
-
-    return channels
+        for item in _loads(data_bytes)
+    ]
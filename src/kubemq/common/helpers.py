@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
-import grpc
+if TYPE_CHECKING:
+    import grpc
 
 
 def fast_id() -> str:
@@ -14,6 +16,16 @@ def fast_id() -> str:
     return os.urandom(16).hex()
 
 
+def fast_ids(count: int) -> list[str]:
+    """Generate ``count`` message IDs in the format of :func:`fast_id`.
+
+    Draws the randomness for all IDs in a single ``os.urandom`` call, which is
+    several times cheaper per ID than calling :func:`fast_id` in a loop.
+    """
+    hexed = os.urandom(16 * count).hex()
+    return [hexed[i : i + 32] for i in range(0, 32 * count, 32)]
+
+
 def decode_grpc_error(error: grpc.RpcError | Exception) -> str:
     """Decodes the error message from a gRPC error or general exception.
 
@@ -23,6 +35,8 @@ def decode_grpc_error(error: grpc.RpcError | Exception) -> str:
     Returns:
         str: The decoded error message.
     """
+    import grpc  # deferred: keeps ``import kubemq`` free of grpc for message-only users
+
     if hasattr(error, "code") and error.code() == grpc.StatusCode.UNAVAILABLE:
         return "Connection Error: Server is unavailable"
     elif hasattr(error, "code") and error.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
@@ -53,6 +67,8 @@ def is_channel_error(exception: Exception) -> bool:
     Returns:
         bool: True if the exception is a channel error, False otherwise
     """
+    import grpc
+
     # Check for common gRPC connectivity errors
     if isinstance(exception, grpc.RpcError):
         if hasattr(exception, "code") and exception.code() in [
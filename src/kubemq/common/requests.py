@@ -8,6 +8,7 @@ from typing import Any
 
 import grpc
 
+from kubemq._internal.channel_cache import ChannelListCache
 from kubemq.common.channel_stats import (
     CQChannel,
     PubSubChannel,
@@ -23,7 +24,11 @@ requests_channel = "kubemq.cluster.internal.requests"
 
 
 def create_channel_request(
-    transport: Any, client_id: str | None, channel_name: str, channel_type: str
+    transport: Any,
+    client_id: str | None,
+    channel_name: str,
+    channel_type: str,
+    cache: ChannelListCache | None = None,
 ) -> bool:
     """This method creates a request to create a channel in the Kubemq server.
 
@@ -65,10 +70,17 @@ def create_channel_request(
         return False
     except grpc.RpcError as e:
         raise from_grpc_error(e) from e
+    finally:
+        if cache is not None:
+            cache.invalidate(channel_type)
 
 
 def delete_channel_request(
-    transport: Any, client_id: str | None, channel_name: str, channel_type: str
+    transport: Any,
+    client_id: str | None,
+    channel_name: str,
+    channel_type: str,
+    cache: ChannelListCache | None = None,
 ) -> bool:
     """This method is used to send a delete channel request to the Kubemq server. It deletes a channel with the specified name and type.
 
@@ -109,6 +121,9 @@ def delete_channel_request(
         return False
     except grpc.RpcError as e:
         raise from_grpc_error(e) from e
+    finally:
+        if cache is not None:
+            cache.invalidate(channel_type)
 
 
 _LIST_MAX_RETRIES = 3
@@ -182,28 +197,60 @@ def _list_channels_with_retry(
     return []
 
 
+def _list_channels(
+    transport: Any,
+    client_id: str | None,
+    channel_type: str,
+    channel_search: str,
+    decode_fn: Callable[[bytes], list[Any]],
+    cache: ChannelListCache | None,
+) -> list[Any]:
+    if cache is None:
+        return _list_channels_with_retry(
+            transport, client_id, channel_type, channel_search, decode_fn
+        )
+    return cache.get(
+        channel_type,
+        channel_search,
+        lambda search: _list_channels_with_retry(
+            transport, client_id, channel_type, search, decode_fn
+        ),
+    )
+
+
 def list_queues_channels(
-    transport: Any, client_id: str | None, channel_search: str
+    transport: Any,
+    client_id: str | None,
+    channel_search: str,
+    cache: ChannelListCache | None = None,
 ) -> list[QueuesChannel]:
-    """List queues channels with retry on transient errors."""
-    return _list_channels_with_retry(
-        transport, client_id, "queues", channel_search, decode_queues_channel_list
+    """List queues channels with retry on transient errors, via ``cache`` if given."""
+    return _list_channels(
+        transport, client_id, "queues", channel_search, decode_queues_channel_list, cache
     )
 
 
 def list_pubsub_channels(
-    transport: Any, client_id: str | None, channel_type: str, channel_search: str
+    transport: Any,
+    client_id: str | None,
+    channel_type: str,
+    channel_search: str,
+    cache: ChannelListCache | None = None,
 ) -> list[PubSubChannel]:
-    """List pub/sub channels with retry on transient errors."""
-    return _list_channels_with_retry(
-        transport, client_id, channel_type, channel_search, decode_pub_sub_channel_list
+    """List pub/sub channels with retry on transient errors, via ``cache`` if given."""
+    return _list_channels(
+        transport, client_id, channel_type, channel_search, decode_pub_sub_channel_list, cache
     )
 
 
 def list_cq_channels(
-    transport: Any, client_id: str | None, channel_type: str, channel_search: str
+    transport: Any,
+    client_id: str | None,
+    channel_type: str,
+    channel_search: str,
+    cache: ChannelListCache | None = None,
 ) -> list[CQChannel]:
-    """List CQ channels with retry on transient errors."""
-    return _list_channels_with_retry(
-        transport, client_id, channel_type, channel_search, decode_cq_channel_list
+    """List CQ channels with retry on transient errors, via ``cache`` if given."""
+    return _list_channels(
+        transport, client_id, channel_type, channel_search, decode_cq_channel_list, cache
     )
@@ -2,75 +2,182 @@
 
 from __future__ import annotations
 
-from kubemq.core.client import (
-    AsyncBaseClient,
-    BaseClient,
-    NativeAsyncBaseClient,
-)
-from kubemq.core.config import (
-    ClientConfig,
-    JitterType,
-    KeepAliveConfig,
-    OperationTimeouts,
-    RetryPolicy,
-    TLSConfig,
-    resolve_timeout,
-)
-from kubemq.core.exceptions import (
-    ERROR_CLASSIFICATION,
-    ErrorCategory,
-    ErrorCode,
-    KubeMQAuthenticationError,
-    KubeMQBufferFullError,
-    KubeMQCancellationError,
-    KubeMQChannelError,
-    KubeMQCircuitOpenError,
-    KubeMQClientClosedError,
-    KubeMQConfigurationError,
-    KubeMQConnectionError,
-    KubeMQConnectionNotReadyError,
-    KubeMQError,
-    KubeMQHandlerError,
-    KubeMQMessageError,
-    KubeMQStreamBrokenError,
-    KubeMQTimeoutError,
-    KubeMQTransactionError,
-    KubeMQTransportError,
-    KubeMQValidationError,
-    classify_error,
-    classify_tls_error,
-    from_grpc_error,
-)
-from kubemq.core.health import (
-    AsyncHealthChecker,
-    HealthCheck,
-    HealthChecker,
-    HealthReport,
-    HealthStatus,
-)
-from kubemq.core.messages import (
-    BaseMessage,
-    BaseReceivedMessage,
-    BaseResponse,
-)
-from kubemq.core.types import (
-    AnyErrorCallback,
-    AsyncCallback,
-    AsyncCloseable,
-    AsyncCredentialProvider,
-    AsyncErrorCallback,
-    AsyncPingable,
-    Callback,
-    Closeable,
-    ConnectionState,
-    CredentialProvider,
-    ErrorCallback,
-    Pingable,
-    ServerInfo,
-    StartPosition,
-    SubscribeType,
-    SyncCallback,
-    SyncErrorCallback,
+from typing import TYPE_CHECKING
+
+from kubemq._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kubemq.core.client import (
+        AsyncBaseClient,
+        BaseClient,
+        NativeAsyncBaseClient,
+    )
+    from kubemq.core.config import (
+        AdaptiveRateConfig,
+        ClientConfig,
+        HedgingPolicy,
+        JitterType,
+        KeepAliveConfig,
+        OperationTimeouts,
+        RetryPolicy,
+        TLSConfig,
+        resolve_timeout,
+    )
+    from kubemq.core.exceptions import (
+        ERROR_CLASSIFICATION,
+        ErrorCategory,
+        ErrorCode,
+        KubeMQAuthenticationError,
+        KubeMQBufferFullError,
+        KubeMQCancellationError,
+        KubeMQChannelError,
+        KubeMQCircuitOpenError,
+        KubeMQClientClosedError,
+        KubeMQConfigurationError,
+        KubeMQConnectionError,
+        KubeMQConnectionNotReadyError,
+        KubeMQError,
+        KubeMQHandlerError,
+        KubeMQMessageError,
+        KubeMQStreamBrokenError,
+        KubeMQTimeoutError,
+        KubeMQTransactionError,
+        KubeMQTransportError,
+        KubeMQValidationError,
+        classify_error,
+        classify_tls_error,
+        from_grpc_error,
+    )
+    from kubemq.core.group_runner import (
+        ConsumerGroupRunner,
+        GroupRunReport,
+        WorkerContext,
+        WorkerMetrics,
+        WorkerSnapshot,
+    )
+    from kubemq.core.health import (
+        AsyncHealthChecker,
+        HealthCheck,
+        HealthChecker,
+        HealthReport,
+        HealthStatus,
+    )
+    from kubemq.core.message_template import MessageTemplate
+    from kubemq.core.messages import (
+        BaseMessage,
+        BaseReceivedMessage,
+        BaseResponse,
+    )
+    from kubemq.core.stage_timer import StageProbe, StageTimer
+    from kubemq.core.types import (
+        AnyErrorCallback,
+        AsyncCallback,
+        AsyncCloseable,
+        AsyncCredentialProvider,
+        AsyncErrorCallback,
+        AsyncPingable,
+        Callback,
+        Closeable,
+        ConnectionState,
+        CredentialProvider,
+        ErrorCallback,
+        LatencyHistogram,
+        Pingable,
+        PoolHealth,
+        ServerInfo,
+        StartPosition,
+        SubscribeType,
+        SyncCallback,
+        SyncErrorCallback,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kubemq.core.client": (
+            "AsyncBaseClient",
+            "BaseClient",
+            "NativeAsyncBaseClient",
+        ),
+        "kubemq.core.config": (
+            "AdaptiveRateConfig",
+            "ClientConfig",
+            "HedgingPolicy",
+            "JitterType",
+            "KeepAliveConfig",
+            "OperationTimeouts",
+            "RetryPolicy",
+            "TLSConfig",
+            "resolve_timeout",
+        ),
+        "kubemq.core.exceptions": (
+            "ERROR_CLASSIFICATION",
+            "ErrorCategory",
+            "ErrorCode",
+            "KubeMQAuthenticationError",
+            "KubeMQBufferFullError",
+            "KubeMQCancellationError",
+            "KubeMQChannelError",
+            "KubeMQCircuitOpenError",
+            "KubeMQClientClosedError",
+            "KubeMQConfigurationError",
+            "KubeMQConnectionError",
+            "KubeMQConnectionNotReadyError",
+            "KubeMQError",
+            "KubeMQHandlerError",
+            "KubeMQMessageError",
+            "KubeMQStreamBrokenError",
+            "KubeMQTimeoutError",
+            "KubeMQTransactionError",
+            "KubeMQTransportError",
+            "KubeMQValidationError",
+            "classify_error",
+            "classify_tls_error",
+            "from_grpc_error",
+        ),
+        "kubemq.core.group_runner": (
+            "ConsumerGroupRunner",
+            "GroupRunReport",
+            "WorkerContext",
+            "WorkerMetrics",
+            "WorkerSnapshot",
+        ),
+        "kubemq.core.health": (
+            "AsyncHealthChecker",
+            "HealthCheck",
+            "HealthChecker",
+            "HealthReport",
+            "HealthStatus",
+        ),
+        "kubemq.core.message_template": ("MessageTemplate",),
+        "kubemq.core.messages": (
+            "BaseMessage",
+            "BaseReceivedMessage",
+            "BaseResponse",
+        ),
+        "kubemq.core.stage_timer": ("StageProbe", "StageTimer"),
+        "kubemq.core.types": (
+            "AnyErrorCallback",
+            "AsyncCallback",
+            "AsyncCloseable",
+            "AsyncCredentialProvider",
+            "AsyncErrorCallback",
+            "AsyncPingable",
+            "Callback",
+            "Closeable",
+            "ConnectionState",
+            "CredentialProvider",
+            "ErrorCallback",
+            "LatencyHistogram",
+            "Pingable",
+            "PoolHealth",
+            "ServerInfo",
+            "StartPosition",
+            "SubscribeType",
+            "SyncCallback",
+            "SyncErrorCallback",
+        ),
+    },
 )
 
 __all__ = [
@@ -103,6 +210,8 @@ __all__ = [
     "SubscribeType",
     "StartPosition",
     "ServerInfo",
+    "PoolHealth",
+    "LatencyHistogram",
     "CredentialProvider",
     "AsyncCredentialProvider",
     "SyncCallback",
@@ -122,6 +231,8 @@ __all__ = [
     "ClientConfig",
     "JitterType",
     "RetryPolicy",
+    "AdaptiveRateConfig",
+    "HedgingPolicy",
     "OperationTimeouts",
     "resolve_timeout",
     # Client
@@ -138,4 +249,15 @@ __all__ = [
     "HealthReport",
     "HealthChecker",
     "AsyncHealthChecker",
+    # Multi-process consumer groups
+    "ConsumerGroupRunner",
+    "WorkerContext",
+    "WorkerMetrics",
+    "WorkerSnapshot",
+    "GroupRunReport",
+    # Pre-encoded message templates
+    "MessageTemplate",
+    # Sampled hot-path stage timing
+    "StageProbe",
+    "StageTimer",
 ]
@@ -10,6 +10,7 @@ from abc import ABC
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from kubemq._internal.channel_cache import ChannelListCache
 from kubemq._internal.logging import NOOP_LOGGER, StdLibLoggerAdapter
 from kubemq._internal.telemetry import KubeMQInstrumentor, KubeMQMetrics
 from kubemq.core.compat import run_in_thread
@@ -23,9 +24,11 @@ from kubemq.core.exceptions import (
 from kubemq.core.types import ServerInfo
 
 if TYPE_CHECKING:
+    from kubemq._internal.transport.pool import PoolReconnectCoordinator
     from kubemq._internal.transport.state import AnyStateCallback
     from kubemq.common.async_cancellation_token import AsyncCancellationToken
-    from kubemq.core.types import ConnectionState
+    from kubemq.core.stage_timer import StageProbe
+    from kubemq.core.types import ConnectionState, LatencyHistogram, PoolHealth
     from kubemq.transport.async_transport import AsyncTransport
     from kubemq.transport.transport import SyncTransport
 
@@ -66,7 +69,10 @@ def _create_instrumentor(config: ClientConfig, logger: Any) -> KubeMQInstrumento
         max_channel_cardinality=config.max_channel_cardinality,
         channel_allowlist=set(config.channel_allowlist),
         logger=logger,
+        delivery_latency=config.delivery_latency_probe,
     )
+    if config.stage_timer is not None:
+        config.stage_timer._attach_metrics(instrumentor._metrics)
     return instrumentor
 
 
@@ -130,6 +136,11 @@ class BaseClient(ABC):  # noqa: B024
         self._shutdown_event = threading.Event()
         self._subscription_threads: list[threading.Thread] = []
         self._subscription_threads_lock = threading.Lock()
+        self._channel_cache = (
+            ChannelListCache(self._config.channel_list_cache_ttl)
+            if self._config.channel_list_cache_ttl > 0
+            else None
+        )
 
         # Initialize transport
         self._initialize()
@@ -155,6 +166,25 @@ class BaseClient(ABC):  # noqa: B024
         """Get the client configuration."""
         return self._config
 
+    def delivery_latency(self) -> dict[str, LatencyHistogram]:
+        """Return publish-to-receive latency per message kind.
+
+        Populated only when ``ClientConfig.delivery_latency_probe`` is set.
+        The probe is process-wide, so every client that enables it sees the
+        same distributions.
+        """
+        return self._instrumentor._metrics.delivery_latency()  # type: ignore[no-any-return]
+
+    def invalidate_channel_cache(self) -> None:
+        """Drop every listing cached under ``ClientConfig.channel_list_cache_ttl``.
+
+        Creating or deleting a channel through this client already drops
+        the listings of that channel type; call this after changes made by
+        other clients. A no-op when the cache is disabled.
+        """
+        if self._channel_cache is not None:
+            self._channel_cache.invalidate()
+
     def ping(self) -> ServerInfo:
         """Ping the server and return server information.
 
@@ -376,6 +406,15 @@ class AsyncBaseClient(ABC):  # noqa: B024
         """Get the client configuration."""
         return self._config
 
+    def delivery_latency(self) -> dict[str, LatencyHistogram]:
+        """Return publish-to-receive latency per message kind.
+
+        Populated only when ``ClientConfig.delivery_latency_probe`` is set.
+        The probe is process-wide, so every client that enables it sees the
+        same distributions.
+        """
+        return self._instrumentor._metrics.delivery_latency()  # type: ignore[no-any-return]
+
     async def ping(self) -> ServerInfo:
         """Ping the server and return server information.
 
@@ -477,6 +516,9 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
                 await asyncio.gather(*tasks)
     """
 
+    # StageTimer component for this client's encode/instrument stages.
+    _stage_component: str = ""
+
     def __init__(
         self,
         address: str = "",
@@ -529,6 +571,15 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
         # gRPC connection pool — round-robin for send operations
         self._pool: list[AsyncTransport] = []
         self._pool_counter: int = 0
+        self._pool_coordinator: PoolReconnectCoordinator | None = None
+
+        # Sampled stage timing (ClientConfig.stage_timer)
+        stage_timer = self._config.stage_timer
+        self._stages: StageProbe | None = (
+            stage_timer.probe(self._stage_component)
+            if stage_timer is not None and self._stage_component
+            else None
+        )
 
     async def connect(self) -> None:
         """Connect to the KubeMQ server using native async transport.
@@ -549,16 +600,30 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
                 raise KubeMQClientClosedError("Client is closed and cannot be reconnected")
 
             try:
-                self._transport = AsyncTransport(self._config)
+                pool_size = self._config.connection_pool_size
+                coordinator = None
+                if pool_size > 1 and self._config.auto_reconnect:
+                    from kubemq._internal.transport.pool import PoolReconnectCoordinator
+
+                    coordinator = PoolReconnectCoordinator(
+                        stagger_ms=self._config.reconnect_stagger_ms,
+                        probe_wait_seconds=self._config.reconnect_max_delay_ms / 1000.0,
+                        logger=self._logger,
+                    )
+
+                self._transport = AsyncTransport(self._config, pool_coordinator=coordinator)
                 await self._transport.connect()
 
                 # Create connection pool for send operations
-                pool_size = self._config.connection_pool_size
                 if pool_size > 1:
                     for _ in range(pool_size):
-                        t = AsyncTransport(self._config)
+                        t = AsyncTransport(self._config, pool_coordinator=coordinator)
                         await t.connect()
                         self._pool.append(t)
+                if coordinator is not None:
+                    for t in (self._transport, *self._pool):
+                        coordinator.register(t)
+                self._pool_coordinator = coordinator
 
                 self._logger.debug(
                     "Connected to %s (pool_size=%d)",
@@ -571,6 +636,7 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
                     with contextlib.suppress(Exception):
                         await t.close()
                 self._pool.clear()
+                self._pool_coordinator = None
                 self._transport = None
                 self._logger.error(f"Failed to connect: {e}")
                 raise from_grpc_error(e) from e
@@ -586,6 +652,12 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
         else:
             self._pipeline_sem = None
 
+    def _record_encode_stages(self, encode_start: float, encoded: float) -> None:
+        """Record a sampled message's encode and trace-injection time."""
+        assert self._stages is not None
+        self._stages.record("encode", encoded - encode_start)
+        self._stages.record("instrument", time.perf_counter() - encoded)
+
     def _pick_pool_transport(self) -> AsyncTransport:
         """Pick next transport from pool (round-robin). Falls back to primary."""
         if self._pool:
@@ -600,11 +672,38 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
         """Check if the client is connected to the server."""
         return self._transport is not None and self._transport.is_connected and not self._closing
 
+    def pool_health(self) -> PoolHealth:
+        """Return a snapshot of the connection pool's reconnection state.
+
+        Covers the primary transport plus the pooled send transports.
+        Reconnect counters are only tracked when ``connection_pool_size > 1``
+        and ``auto_reconnect`` is enabled.
+        """
+        from kubemq.core.types import PoolHealth
+
+        if self._pool_coordinator is not None:
+            return self._pool_coordinator.health()
+        transports = [t for t in (self._transport, *self._pool) if t is not None]
+        return PoolHealth(
+            size=len(transports),
+            ready=sum(1 for t in transports if t.is_connected),
+            reconnecting=sum(1 for t in transports if t.is_reconnecting),
+        )
+
     @property
     def config(self) -> ClientConfig:
         """Get the client configuration."""
         return self._config
 
+    def delivery_latency(self) -> dict[str, LatencyHistogram]:
+        """Return publish-to-receive latency per message kind.
+
+        Populated only when ``ClientConfig.delivery_latency_probe`` is set.
+        The probe is process-wide, so every client that enables it sees the
+        same distributions.
+        """
+        return self._instrumentor._metrics.delivery_latency()  # type: ignore[no-any-return]
+
     async def ping(self) -> ServerInfo:
         """Ping the server using native async.
 
@@ -755,6 +854,21 @@ class NativeAsyncBaseClient(ABC):  # noqa: B024
         if not self.is_connected:
             raise KubeMQConnectionError("Client is not connected to server")
 
+    def _buffering_transport(self) -> AsyncTransport | None:
+        """Return the primary transport while it buffers publishes for a reconnect.
+
+        Publish paths check this before ``_ensure_connected()``: during
+        RECONNECTING they hand the encoded message to
+        ``AsyncTransport.buffer_publish`` instead of failing.
+
+        Only the primary transport is checked. With ``connection_pool_size >
+        1``, a pooled transport that drops while the primary stays connected
+        is not buffered for, and a publish picked onto it fails as before.
+        """
+        if self._closed or self._closing or self._transport is None or self.is_connected:
+            return None
+        return self._transport if self._transport.is_buffering else None
+
     async def _register_subscription(
         self,
         token: AsyncCancellationToken,
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from kubemq.core.stage_timer import StageTimer
     from kubemq.core.types import AsyncCredentialProvider, CredentialProvider
 
 
@@ -161,6 +162,7 @@ class JitterType(Enum):
     FULL = "FULL"
     EQUAL = "EQUAL"
     NONE = "NONE"
+    DECORRELATED = "DECORRELATED"
 
 
 @dataclass(frozen=True)
@@ -241,6 +243,120 @@ class OperationTimeouts:
         )
 
 
+@dataclass(frozen=True)
+class AdaptiveRateConfig:
+    """AIMD send-rate control for the async events and queue upstream streams.
+
+    When set as ``ClientConfig.adaptive_rate``, awaitable sends are paced to
+    a target rate instead of filling the send queue until
+    ``KubeMQBufferFullError``. Every ``adjust_interval_seconds`` the rate is
+    multiplied by ``decrease_factor`` if the send queue was at least
+    ``high_queue_utilization`` full, the smoothed confirmation latency
+    exceeded ``target_latency_seconds``, or the server reported an error;
+    otherwise, if senders were held back, it grows by ``additive_increase``.
+
+    Attributes:
+        initial_rate: Starting rate in messages per second.
+        min_rate: Rate floor in messages per second.
+        max_rate: Rate ceiling in messages per second.
+        additive_increase: Messages per second added per uncongested interval.
+        decrease_factor: Multiplier applied per congested interval.
+        target_latency_seconds: Confirmation latency treated as congestion.
+        high_queue_utilization: Send-queue fill ratio treated as congestion.
+        adjust_interval_seconds: How often the rate is re-evaluated; also
+            the burst window for pacing.
+    """
+
+    initial_rate: float = 1_000.0
+    min_rate: float = 10.0
+    max_rate: float = 100_000.0
+    additive_increase: float = 100.0
+    decrease_factor: float = 0.7
+    target_latency_seconds: float = 0.05
+    high_queue_utilization: float = 0.5
+    adjust_interval_seconds: float = 0.1
+
+    def __post_init__(self) -> None:
+        if not (0 < self.min_rate <= self.initial_rate <= self.max_rate):
+            raise ValueError(
+                "rates must satisfy 0 < min_rate <= initial_rate <= max_rate, got "
+                f"{self.min_rate}, {self.initial_rate}, {self.max_rate}"
+            )
+        if self.additive_increase <= 0:
+            raise ValueError(f"additive_increase must be positive, got {self.additive_increase}")
+        if not (0 < self.decrease_factor < 1):
+            raise ValueError(f"decrease_factor must be in (0, 1), got {self.decrease_factor}")
+        if self.target_latency_seconds <= 0:
+            raise ValueError(
+                f"target_latency_seconds must be positive, got {self.target_latency_seconds}"
+            )
+        if not (0 < self.high_queue_utilization <= 1):
+            raise ValueError(
+                f"high_queue_utilization must be in (0, 1], got {self.high_queue_utilization}"
+            )
+        if self.adjust_interval_seconds <= 0:
+            raise ValueError(
+                f"adjust_interval_seconds must be positive, got {self.adjust_interval_seconds}"
+            )
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """Hedged requests for ``AsyncCQClient.send_query``.
+
+    When set as ``ClientConfig.hedging``, a query that has not been answered
+    after the ``percentile``-th percentile of recent query latencies is sent
+    a second time on another pooled connection. The first successful
+    response wins and the other request is cancelled. The responder may see
+    both copies, so only enable this for idempotent queries.
+
+    Attributes:
+        percentile: Latency percentile (0-100) used as the hedge delay.
+        initial_delay_seconds: Hedge delay until ``min_samples`` latencies
+            have been observed.
+        min_delay_seconds: Lower clamp for the hedge delay.
+        max_delay_seconds: Upper clamp for the hedge delay.
+        min_samples: Latencies to observe before the percentile is used.
+        max_hedge_ratio: Budget: at most this fraction of queries (plus a
+            burst of ``burst``) are hedged.
+        burst: Hedges allowed back to back before the ratio applies.
+        min_remaining_seconds: Skip the hedge if less than this much of the
+            query's timeout would be left for it.
+    """
+
+    percentile: float = 95.0
+    initial_delay_seconds: float = 0.1
+    min_delay_seconds: float = 0.005
+    max_delay_seconds: float = 1.0
+    min_samples: int = 20
+    max_hedge_ratio: float = 0.1
+    burst: int = 10
+    min_remaining_seconds: float = 0.05
+
+    def __post_init__(self) -> None:
+        if not (0 < self.percentile < 100):
+            raise ValueError(f"percentile must be in (0, 100), got {self.percentile}")
+        if not (0 < self.min_delay_seconds <= self.max_delay_seconds):
+            raise ValueError(
+                "delays must satisfy 0 < min_delay_seconds <= max_delay_seconds, got "
+                f"{self.min_delay_seconds}, {self.max_delay_seconds}"
+            )
+        if self.initial_delay_seconds <= 0:
+            raise ValueError(
+                f"initial_delay_seconds must be positive, got {self.initial_delay_seconds}"
+            )
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be >= 1, got {self.min_samples}")
+        if not (0 < self.max_hedge_ratio <= 1):
+            raise ValueError(f"max_hedge_ratio must be in (0, 1], got {self.max_hedge_ratio}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be >= 1, got {self.burst}")
+        if self.min_remaining_seconds < 0:
+            raise ValueError(
+                f"min_remaining_seconds must be non-negative, got {self.min_remaining_seconds}"
+            )
+
+
 def resolve_timeout(
     explicit: float | None,
     per_operation_default: float,
@@ -348,6 +464,9 @@ class ClientConfig:
     reconnect_backoff_multiplier: float = 2.0
     reconnect_buffer_size: int = DEFAULT_RECONNECT_BUFFER_SIZE
     buffer_overflow_mode: str = "error"
+    # Pooled channels redial one stagger step apart once the pool's probe
+    # connection has confirmed the server is back.
+    reconnect_stagger_ms: int = 100
 
     # Shutdown settings
     drain_timeout: float = DEFAULT_DRAIN_TIMEOUT
@@ -382,6 +501,30 @@ class ClientConfig:
     max_channel_cardinality: int = 100
     channel_allowlist: list[str] = field(default_factory=list)
 
+    # Record publish-to-receive latency on every received message (process-
+    # wide once any client enables it; read via client.delivery_latency()).
+    # Also stamps a publish-time tag on sent commands and queries, which the
+    # receiving side needs to measure them.
+    delivery_latency_probe: bool = False
+
+    # Serve list_*_channels from a client-side cache for this many seconds
+    # (0 = always ask the broker)
+    channel_list_cache_ttl: float = 0.0
+
+    # Byte budget of the client-side cache for queries that carry a
+    # cache_key (0 = disabled)
+    query_cache_max_bytes: int = 0
+
+    # Hedged send_query on the async CQ client (None = no hedging)
+    hedging: HedgingPolicy | None = None
+
+    # AIMD pacing of async event and queue sends (None = unpaced)
+    adaptive_rate: AdaptiveRateConfig | None = None
+
+    # Sampled per-stage timing of the async send/receive hot paths
+    # (not serializable — set programmatically only)
+    stage_timer: StageTimer | None = field(default=None, repr=False)
+
     # Credential provider (AUTH-4)
     credential_provider: CredentialProvider | AsyncCredentialProvider | None = field(
         default=None, repr=False
@@ -439,8 +582,14 @@ class ClientConfig:
             raise ValueError("reconnect_buffer_size must be non-negative")
         if self.buffer_overflow_mode not in ("error", "block"):
             raise ValueError("buffer_overflow_mode must be 'error' or 'block'")
+        if self.reconnect_stagger_ms < 0:
+            raise ValueError("reconnect_stagger_ms must be non-negative")
         if self.credential_timeout <= 0:
             raise ValueError("credential_timeout must be positive")
+        if self.channel_list_cache_ttl < 0:
+            raise ValueError("channel_list_cache_ttl must be non-negative")
+        if self.query_cache_max_bytes < 0:
+            raise ValueError("query_cache_max_bytes must be non-negative")
 
         if self.legacy_timeout_mode:
             self.operation_timeouts = OperationTimeouts.legacy()
@@ -7,6 +7,7 @@ Python built-in exceptions (e.g., ConnectionError, TimeoutError).
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
 import re
 from enum import Enum, unique
@@ -549,55 +550,13 @@ def classify_tls_error(error: Exception) -> KubeMQError:
 # REQ-ERR-6: gRPC error mapping (all 17 status codes)
 # ---------------------------------------------------------------------------
 
-try:
-    import grpc
-    import grpc.aio
+# grpc is imported on first conversion rather than here, so importing the
+# exception types does not load grpc. Status codes are looked up by name in
+# the table below, which serves real and duck-typed gRPC errors alike.
+_HAS_GRPC = importlib.util.find_spec("grpc") is not None
+
 
-    _GRPC_MAPPING: dict[
-        grpc.StatusCode,
-        tuple[type[KubeMQError], ErrorCode, bool],
-    ] = {
-        grpc.StatusCode.OK: (KubeMQError, ErrorCode.UNKNOWN, False),
-        grpc.StatusCode.CANCELLED: (KubeMQCancellationError, ErrorCode.CANCELLED, False),
-        grpc.StatusCode.UNKNOWN: (KubeMQError, ErrorCode.UNKNOWN, True),
-        grpc.StatusCode.INVALID_ARGUMENT: (
-            KubeMQValidationError,
-            ErrorCode.VALIDATION_ERROR,
-            False,
-        ),
-        grpc.StatusCode.DEADLINE_EXCEEDED: (KubeMQTimeoutError, ErrorCode.CONNECTION_TIMEOUT, True),
-        grpc.StatusCode.NOT_FOUND: (KubeMQChannelError, ErrorCode.NOT_FOUND, False),
-        grpc.StatusCode.ALREADY_EXISTS: (KubeMQValidationError, ErrorCode.ALREADY_EXISTS, False),
-        grpc.StatusCode.PERMISSION_DENIED: (
-            KubeMQAuthenticationError,
-            ErrorCode.PERMISSION_DENIED,
-            False,
-        ),
-        grpc.StatusCode.RESOURCE_EXHAUSTED: (
-            KubeMQMessageError,
-            ErrorCode.RESOURCE_EXHAUSTED,
-            True,
-        ),
-        grpc.StatusCode.FAILED_PRECONDITION: (
-            KubeMQValidationError,
-            ErrorCode.VALIDATION_ERROR,
-            False,
-        ),
-        grpc.StatusCode.ABORTED: (KubeMQTransactionError, ErrorCode.ABORTED, True),
-        grpc.StatusCode.OUT_OF_RANGE: (KubeMQValidationError, ErrorCode.OUT_OF_RANGE, False),
-        grpc.StatusCode.UNIMPLEMENTED: (KubeMQError, ErrorCode.UNIMPLEMENTED, False),
-        grpc.StatusCode.INTERNAL: (KubeMQError, ErrorCode.INTERNAL, False),
-        grpc.StatusCode.UNAVAILABLE: (KubeMQConnectionError, ErrorCode.UNAVAILABLE, True),
-        grpc.StatusCode.DATA_LOSS: (KubeMQError, ErrorCode.DATA_LOSS, False),
-        grpc.StatusCode.UNAUTHENTICATED: (KubeMQAuthenticationError, ErrorCode.AUTH_FAILED, False),
-    }
-    _HAS_GRPC = True
-except ImportError:
-    _HAS_GRPC = False
-    _GRPC_MAPPING = {}
-
-
-# String-based mapping for duck-typed gRPC-like errors
+# Status-code-name mapping for gRPC and duck-typed gRPC-like errors
 _STRING_GRPC_MAPPING: dict[str, tuple[type[KubeMQError], ErrorCode, bool]] = {
     "OK": (KubeMQError, ErrorCode.UNKNOWN, False),
     "CANCELLED": (KubeMQCancellationError, ErrorCode.CANCELLED, False),
@@ -696,7 +655,7 @@ def from_grpc_error(
             cause=error,
         )
 
-    mapping_entry = _GRPC_MAPPING.get(grpc_code)
+    mapping_entry = _STRING_GRPC_MAPPING.get(getattr(grpc_code, "name", ""))
     if mapping_entry is None:
         return KubeMQError(
             details or "Unknown gRPC error",
@@ -0,0 +1,416 @@
+"""Shared-nothing multi-process runner for consumer-group workers.
+
+CPU-bound consumers do not scale past one core inside a single Python
+process. :class:`ConsumerGroupRunner` starts N worker processes, each
+running its own event loop and its own async clients, all joined to the
+same consumer group so the server spreads messages across them. The parent
+process forwards SIGINT/SIGTERM to the workers for a graceful drain and
+aggregates the counters each worker publishes.
+
+Example:
+    from kubemq import ConsumerGroupRunner, EventsSubscription, WorkerContext
+
+    async def worker(ctx: WorkerContext) -> None:
+        client = await ctx.pubsub_client()
+
+        async def on_event(event):
+            crunch(event.body)
+            ctx.metrics.inc("processed")
+
+        await client.subscribe_with_callback(
+            EventsSubscription(channel="jobs", group=ctx.group,
+                               on_receive_event_callback=lambda e: None),
+            on_event,
+            cancellation_token=ctx.cancellation_token,
+        )
+
+    if __name__ == "__main__":
+        report = ConsumerGroupRunner(
+            worker, group="crunchers", processes=8,
+            config=ClientConfig(address="localhost:50000", client_id="cruncher"),
+        ).run()
+        print(report.totals)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from kubemq.common.async_cancellation_token import AsyncCancellationToken
+from kubemq.core.config import ClientConfig
+
+if TYPE_CHECKING:
+    from kubemq.core.client import NativeAsyncBaseClient
+    from kubemq.cq.async_client import AsyncClient as AsyncCQClient
+    from kubemq.pubsub.async_client import AsyncClient as AsyncPubSubClient
+    from kubemq.queues.async_client import AsyncClient as AsyncQueuesClient
+
+_logger = logging.getLogger("kubemq.group_runner")
+
+GroupWorker = Callable[["WorkerContext"], Awaitable[None]]
+
+
+class WorkerMetrics:
+    """Per-worker counters published to the runner's parent process.
+
+    Counters are plain floats keyed by name. They are only touched from the
+    worker's event loop, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, float] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to counter ``name``."""
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def set(self, name: str, value: float) -> None:
+        """Set counter ``name`` to ``value`` (gauge semantics)."""
+        self._counters[name] = value
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a copy of the current counters."""
+        return dict(self._counters)
+
+
+@dataclass
+class WorkerSnapshot:
+    """Latest metrics reported by one worker process."""
+
+    worker_index: int
+    pid: int
+    counters: dict[str, float] = field(default_factory=dict)
+    uptime_seconds: float = 0.0
+    exit_code: int | None = None
+    error: str = ""
+
+
+@dataclass
+class GroupRunReport:
+    """Outcome of a :meth:`ConsumerGroupRunner.run` call."""
+
+    workers: dict[int, WorkerSnapshot] = field(default_factory=dict)
+
+    @property
+    def totals(self) -> dict[str, float]:
+        """Counters summed across all workers."""
+        totals: dict[str, float] = {}
+        for snap in self.workers.values():
+            for name, value in snap.counters.items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    @property
+    def exit_codes(self) -> dict[int, int | None]:
+        """Process exit code per worker index."""
+        return {idx: snap.exit_code for idx, snap in self.workers.items()}
+
+    @property
+    def succeeded(self) -> bool:
+        """True if every worker exited with code 0."""
+        return all(code == 0 for code in self.exit_codes.values())
+
+
+class WorkerContext:
+    """Per-process context handed to the worker coroutine.
+
+    Clients obtained through :meth:`pubsub_client`, :meth:`queues_client`
+    and :meth:`cq_client` are connected on first use, cached for the life of
+    the worker, and closed when the worker returns. Each worker uses the
+    runner's :class:`ClientConfig` with ``-w<index>`` appended to the client
+    ID so the server sees distinct group members.
+    """
+
+    def __init__(
+        self,
+        worker_index: int,
+        worker_count: int,
+        group: str,
+        config: ClientConfig,
+        cancellation_token: AsyncCancellationToken,
+    ) -> None:
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        self.group = group
+        self.config = config
+        self.cancellation_token = cancellation_token
+        self.metrics = WorkerMetrics()
+        self._clients: dict[str, NativeAsyncBaseClient] = {}
+
+    async def pubsub_client(self) -> AsyncPubSubClient:
+        """Return this worker's connected :class:`AsyncPubSubClient`."""
+        from kubemq.pubsub.async_client import AsyncClient
+
+        return await self._client("pubsub", AsyncClient)  # type: ignore[return-value]
+
+    async def queues_client(self) -> AsyncQueuesClient:
+        """Return this worker's connected :class:`AsyncQueuesClient`."""
+        from kubemq.queues.async_client import AsyncClient
+
+        return await self._client("queues", AsyncClient)  # type: ignore[return-value]
+
+    async def cq_client(self) -> AsyncCQClient:
+        """Return this worker's connected :class:`AsyncCQClient`."""
+        from kubemq.cq.async_client import AsyncClient
+
+        return await self._client("cq", AsyncClient)  # type: ignore[return-value]
+
+    async def _client(self, kind: str, cls: type[Any]) -> NativeAsyncBaseClient:
+        client = self._clients.get(kind)
+        if client is None:
+            client = cls(config=self.config)
+            await client.connect()
+            self._clients[kind] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client opened through this context."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                _logger.warning("Error closing worker client: %s", e)
+
+
+class ConsumerGroupRunner:
+    """Run a worker coroutine in N processes joined to one consumer group.
+
+    Each process is shared-nothing: it has its own event loop, its own
+    clients and its own :class:`WorkerMetrics`. Work distribution is left
+    to the server's group semantics -- every worker subscribes with
+    ``group=ctx.group`` and the server delivers each message to one member.
+
+    Shutdown: SIGINT/SIGTERM received by the parent (or a call to
+    :meth:`stop`) is forwarded to every worker as SIGTERM, which cancels the
+    worker's ``cancellation_token``. Workers still running after
+    ``drain_timeout_seconds`` are killed.
+
+    The worker function and the config must be picklable, i.e. the worker
+    must be a module-level ``async def``.
+
+    Thread Safety:
+        :meth:`stop` and :meth:`metrics` may be called from any thread.
+        :meth:`run` must be called once, from the main thread if signal
+        forwarding is wanted.
+    """
+
+    def __init__(
+        self,
+        worker: GroupWorker,
+        *,
+        group: str,
+        processes: int | None = None,
+        config: ClientConfig | None = None,
+        drain_timeout_seconds: float = 30.0,
+        metrics_interval_seconds: float = 1.0,
+        start_method: str = "spawn",
+    ) -> None:
+        if not group:
+            raise ValueError("group is required")
+        count = processes if processes is not None else (os.cpu_count() or 1)
+        if count < 1:
+            raise ValueError("processes must be >= 1")
+        if drain_timeout_seconds < 0:
+            raise ValueError("drain_timeout_seconds must be >= 0")
+        if metrics_interval_seconds <= 0:
+            raise ValueError("metrics_interval_seconds must be > 0")
+        self._worker = worker
+        self._group = group
+        self._count = count
+        self._config = config or ClientConfig()
+        self._drain_timeout = drain_timeout_seconds
+        self._metrics_interval = metrics_interval_seconds
+        self._ctx = multiprocessing.get_context(start_method)
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._snapshots: dict[int, WorkerSnapshot] = {}
+        self._processes: dict[int, Any] = {}
+
+    @property
+    def processes(self) -> int:
+        """Number of worker processes."""
+        return self._count
+
+    def stop(self) -> None:
+        """Request a graceful drain of all workers."""
+        self._stop_event.set()
+
+    def metrics(self) -> GroupRunReport:
+        """Return the latest metrics reported by each worker."""
+        with self._lock:
+            return GroupRunReport(
+                workers={i: dataclasses.replace(s) for i, s in self._snapshots.items()}
+            )
+
+    def run(self) -> GroupRunReport:
+        """Start the workers and block until all of them have exited.
+
+        Returns:
+            GroupRunReport: Final per-worker counters and exit codes.
+        """
+        metrics_queue = self._ctx.Queue()
+        base_id = self._config.client_id or "kubemq-worker"
+        for index in range(self._count):
+            cfg = dataclasses.replace(self._config, client_id=f"{base_id}-w{index}")
+            proc = self._ctx.Process(  # type: ignore[attr-defined]
+                target=_worker_main,
+                args=(
+                    self._worker,
+                    index,
+                    self._count,
+                    self._group,
+                    cfg,
+                    metrics_queue,
+                    self._metrics_interval,
+                ),
+                name=f"kubemq-group-worker-{index}",
+                daemon=False,
+            )
+            proc.start()
+            self._processes[index] = proc
+            with self._lock:
+                self._snapshots[index] = WorkerSnapshot(worker_index=index, pid=proc.pid or 0)
+
+        restore = self._install_signal_forwarding()
+        try:
+            self._supervise(metrics_queue)
+        finally:
+            restore()
+            self._drain_metrics(metrics_queue, timeout=0)
+            metrics_queue.close()
+
+        with self._lock:
+            for index, proc in self._processes.items():
+                self._snapshots[index].exit_code = proc.exitcode
+        return self.metrics()
+
+    def _supervise(self, metrics_queue: Any) -> None:
+        stop_deadline: float | None = None
+        while any(p.is_alive() for p in self._processes.values()):
+            self._drain_metrics(metrics_queue, timeout=0.2)
+            if self._stop_event.is_set() and stop_deadline is None:
+                stop_deadline = time.monotonic() + self._drain_timeout
+                for proc in self._processes.values():
+                    if proc.is_alive():
+                        proc.terminate()
+            if stop_deadline is not None and time.monotonic() >= stop_deadline:
+                for proc in self._processes.values():
+                    if proc.is_alive():
+                        _logger.warning("Worker %s did not drain in time, killing", proc.name)
+                        proc.kill()
+                break
+        for proc in self._processes.values():
+            proc.join()
+
+    def _drain_metrics(self, metrics_queue: Any, timeout: float) -> None:
+        block = timeout > 0
+        while True:
+            try:
+                report = metrics_queue.get(block=block, timeout=timeout if block else None)
+            except (queue.Empty, OSError, EOFError, ValueError):
+                return
+            block = False
+            with self._lock:
+                self._snapshots[report.worker_index] = report
+
+    def _install_signal_forwarding(self) -> Callable[[], None]:
+        if threading.current_thread() is not threading.main_thread():
+            return lambda: None
+        previous: dict[int, Any] = {}
+
+        def _handler(signum: int, frame: Any) -> None:
+            _logger.info("Received signal %d, draining workers", signum)
+            self._stop_event.set()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(ValueError, OSError):
+                previous[sig] = signal.signal(sig, _handler)
+
+        def _restore() -> None:
+            for sig, handler in previous.items():
+                with contextlib.suppress(ValueError, OSError):
+                    signal.signal(sig, handler)
+
+        return _restore
+
+
+def _worker_main(
+    worker: GroupWorker,
+    index: int,
+    count: int,
+    group: str,
+    config: ClientConfig,
+    metrics_queue: Any,
+    metrics_interval: float,
+) -> None:
+    """Process entry point: run the worker coroutine on a fresh event loop."""
+    try:
+        asyncio.run(
+            _run_worker(worker, index, count, group, config, metrics_queue, metrics_interval)
+        )
+    except Exception:
+        _logger.exception("Group worker %d failed", index)
+        raise SystemExit(1) from None
+
+
+async def _run_worker(
+    worker: GroupWorker,
+    index: int,
+    count: int,
+    group: str,
+    config: ClientConfig,
+    metrics_queue: Any,
+    metrics_interval: float,
+) -> None:
+    token = AsyncCancellationToken()
+    ctx = WorkerContext(index, count, group, config, token)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError, RuntimeError, ValueError):
+            loop.add_signal_handler(sig, token.cancel)
+
+    started = time.monotonic()
+
+    def _publish(error: str = "") -> None:
+        snap = WorkerSnapshot(
+            worker_index=index,
+            pid=os.getpid(),
+            counters=ctx.metrics.snapshot(),
+            uptime_seconds=time.monotonic() - started,
+            error=error,
+        )
+        with contextlib.suppress(Exception):
+            metrics_queue.put_nowait(snap)
+
+    async def _reporter() -> None:
+        while True:
+            await asyncio.sleep(metrics_interval)
+            _publish()
+
+    reporter = asyncio.create_task(_reporter())
+    error = ""
+    try:
+        await worker(ctx)
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        reporter.cancel()
+        await asyncio.gather(reporter, return_exceptions=True)
+        await ctx.aclose()
+        _publish(error)
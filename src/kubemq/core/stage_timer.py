@@ -0,0 +1,141 @@
+"""Sampling per-stage timers for the async send and receive hot paths.
+
+When throughput drops, the time can go into encoding, trace injection,
+waiting in a stream's send queue, the gRPC write, or matching responses to
+callers. A :class:`StageTimer` passed as ``ClientConfig(stage_timer=...)``
+makes the async clients and their stream workers time those stages for a
+sample of messages:
+
+============================  ==============================================
+Component                     Stages
+============================  ==============================================
+``events``                    ``encode``, ``instrument`` (publish_event,
+                              send_event_unary, send_event_store);
+                              ``queue_wait``, ``write``,
+                              ``response``, ``demux`` (the events stream)
+``queues_upstream``           ``encode``, ``instrument`` (send_queue_message);
+                              ``queue_wait``, ``write``, ``response``,
+                              ``demux`` (the upstream stream)
+``queues_downstream``         ``queue_wait``, ``write``, ``response``,
+                              ``demux`` (the downstream stream)
+============================  ==============================================
+
+``queue_wait`` runs from enqueue to the stream's request generator taking
+the message; ``write`` until gRPC asks for the next one; ``response`` from
+then until the broker's reply is read; ``demux`` is resolving the caller's
+future. Fire-and-forget events and acks have no ``response`` or ``demux``.
+
+Samples go to an in-process histogram per ``(component, stage)``, to each
+client's metrics as ``kubemq.client.stage.duration``, and to an optional
+callback. Without a timer, the hot paths pay one ``is None`` check or an
+empty-dict check per message.
+
+Example:
+    timer = StageTimer(sample_every=100)
+    client = AsyncPubSubClient(config=ClientConfig(stage_timer=timer))
+    ...
+    for name, latency in timer.snapshot().items():
+        print(name, latency.mean_seconds, latency.percentile(99))
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from kubemq._internal.histogram import LogHistogram
+
+if TYPE_CHECKING:
+    from kubemq.core.types import LatencyHistogram
+
+StageCallback = Callable[[str, str, float], None]
+"""``callback(component, stage, seconds)`` invoked for every sample."""
+
+
+class StageTimer:
+    """Collects sampled stage durations from one or more clients.
+
+    Args:
+        sample_every: Time one message in this many, per component and
+            worker. 1 times every message.
+        callback: Called with ``(component, stage, seconds)`` for every
+            sample. Runs on the event loop; keep it cheap.
+
+    Raises:
+        ValueError: If ``sample_every`` is less than 1.
+
+    Thread Safety:
+        Not thread-safe. Share one timer only among clients on the same
+        event loop.
+    """
+
+    __slots__ = ("_callback", "_histograms", "_metrics", "_sample_every")
+
+    def __init__(self, *, sample_every: int = 1, callback: StageCallback | None = None) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        self._sample_every = sample_every
+        self._callback = callback
+        self._histograms: dict[str, LogHistogram] = {}
+        self._metrics: list[Any] = []
+
+    @property
+    def sample_every(self) -> int:
+        """One message in this many is timed."""
+        return self._sample_every
+
+    def probe(self, component: str) -> StageProbe:
+        """Return a sampler for one component, with its own sample counter."""
+        return StageProbe(self, component)
+
+    def record(self, component: str, stage: str, seconds: float) -> None:
+        """Record one stage duration."""
+        key = f"{component}.{stage}"
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LogHistogram()
+        histogram.record_ns(int(seconds * 1e9))
+        for metrics in self._metrics:
+            metrics.record_stage_duration(seconds, component, stage)
+        if self._callback is not None:
+            self._callback(component, stage, seconds)
+
+    def snapshot(self) -> dict[str, LatencyHistogram]:
+        """Return the distribution per ``"<component>.<stage>"``."""
+        return {key: histogram.snapshot() for key, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        self._histograms.clear()
+
+    def _attach_metrics(self, metrics: Any) -> None:
+        """Also export samples to a client's ``KubeMQMetrics``."""
+        if metrics not in self._metrics:
+            self._metrics.append(metrics)
+
+
+class StageProbe:
+    """A :class:`StageTimer` bound to one component, with sampling state.
+
+    Each stream worker and client holds its own probe, so the sampling
+    counters of different call sites do not interfere.
+    """
+
+    __slots__ = ("_countdown", "_timer", "component")
+
+    def __init__(self, timer: StageTimer, component: str) -> None:
+        self._timer = timer
+        self.component = component
+        self._countdown = 1
+
+    def sample(self) -> bool:
+        """Return True if the current message should be timed."""
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = self._timer._sample_every
+        return True
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one duration for this component."""
+        self._timer.record(self.component, stage, seconds)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum, auto
 from typing import (
@@ -50,6 +52,75 @@ class ConnectionState(Enum):
     CLOSED = "CLOSED"
 
 
+@dataclass(frozen=True)
+class PoolHealth:
+    """Snapshot of an async client's connection pool.
+
+    Returned by ``pool_health()`` on the async clients. Counts cover the
+    primary transport plus the pooled send transports.
+
+    Attributes:
+        size: Number of transports in the pool.
+        ready: Transports currently connected.
+        reconnecting: Transports with a reconnection in progress.
+        probe_attempts: Dials made by probe connections since connect.
+        reconnects: Successful transport redials since connect.
+        recoveries: Times the whole pool came back after an outage.
+        last_recovery_seconds: Time from the first lost connection to the
+            last transport reconnecting, for the most recent recovery.
+    """
+
+    size: int
+    ready: int
+    reconnecting: int
+    probe_attempts: int = 0
+    reconnects: int = 0
+    recoveries: int = 0
+    last_recovery_seconds: float | None = None
+
+
+@dataclass(frozen=True)
+class LatencyHistogram:
+    """Snapshot of a latency distribution in fixed buckets.
+
+    Attributes:
+        bounds: Bucket upper bounds in seconds, ascending.
+        counts: Samples per bucket. Has one more entry than ``bounds``; the
+            last entry counts samples above the largest bound.
+        count: Total number of samples.
+        sum_seconds: Sum of all samples.
+        max_seconds: Largest sample.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int = 0
+    sum_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean sample, or 0.0 when empty."""
+        return self.sum_seconds / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q``-th percentile (0-100) in seconds.
+
+        Returns the upper bound of the bucket holding the percentile, or
+        ``max_seconds`` when it falls in the overflow bucket. Returns 0.0 for
+        an empty histogram.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+
 class SubscribeType(Enum):
     """Subscription types for KubeMQ channels.
 
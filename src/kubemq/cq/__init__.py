@@ -1,12 +1,39 @@
-from kubemq.common import CancellationToken
-
-from .async_client import AsyncClient, AsyncCQClient
-from .client import Client as Client
-from .command_message import CommandMessage
-from .command_message_received import CommandReceived
-from .command_response_message import CommandResponse
-from .commands_subscription import CommandsSubscription
-from .queries_subscription import QueriesSubscription
-from .query_message import QueryMessage
-from .query_message_received import QueryReceived
-from .query_response_message import QueryResponse
+from typing import TYPE_CHECKING
+
+from kubemq._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kubemq.common import CancellationToken
+
+    from .async_client import AsyncClient, AsyncCQClient
+    from .client import Client as Client
+    from .command_message import CommandMessage
+    from .command_message_received import CommandReceived
+    from .command_response_message import CommandResponse
+    from .commands_subscription import CommandsSubscription
+    from .queries_subscription import QueriesSubscription
+    from .query_cache import QueryCacheStats
+    from .query_message import QueryMessage
+    from .query_message_received import QueryReceived
+    from .query_response_message import QueryResponse
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kubemq.common": ("CancellationToken",),
+        ".async_client": (
+            "AsyncClient",
+            "AsyncCQClient",
+        ),
+        ".client": ("Client",),
+        ".command_message": ("CommandMessage",),
+        ".command_message_received": ("CommandReceived",),
+        ".command_response_message": ("CommandResponse",),
+        ".commands_subscription": ("CommandsSubscription",),
+        ".queries_subscription": ("QueriesSubscription",),
+        ".query_cache": ("QueryCacheStats",),
+        ".query_message": ("QueryMessage",),
+        ".query_message_received": ("QueryReceived",),
+        ".query_response_message": ("QueryResponse",),
+    },
+)
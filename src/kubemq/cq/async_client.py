@@ -12,6 +12,8 @@ from typing import (
     Any,
 )
 
+from kubemq._internal.callback_pool import AsyncCallbackPool
+from kubemq._internal.hedging import Hedger
 from kubemq._internal.retry import BackoffCalculator
 from kubemq._internal.telemetry import (
     KubeMQTagsCarrier,
@@ -20,6 +22,7 @@ from kubemq._internal.telemetry import (
     serialize_span_to_bytes,
 )
 from kubemq.common.async_cancellation_token import AsyncCancellationToken
+from kubemq.common.helpers import fast_id
 from kubemq.core.client import NativeAsyncBaseClient
 from kubemq.core.config import ClientConfig
 from kubemq.core.exceptions import (
@@ -33,9 +36,11 @@ from kubemq.cq.command_message_received import CommandReceived
 from kubemq.cq.command_response_message import CommandResponse
 from kubemq.cq.commands_subscription import CommandsSubscription
 from kubemq.cq.queries_subscription import QueriesSubscription
+from kubemq.cq.query_cache import QueryCacheStats, QueryResultCache
 from kubemq.cq.query_message import QueryMessage
 from kubemq.cq.query_message_received import QueryReceived
 from kubemq.cq.query_response_message import QueryResponse
+from kubemq.grpc import Request as pbRequest, Response as pbResponse
 
 if TYPE_CHECKING:
     pass
@@ -118,6 +123,18 @@ class AsyncClient(NativeAsyncBaseClient):
             config=config,
             **kwargs,
         )
+        self._query_cache = (
+            QueryResultCache(
+                self._config.query_cache_max_bytes, metrics=self._instrumentor._metrics
+            )
+            if self._config.query_cache_max_bytes > 0
+            else None
+        )
+        self._hedger = (
+            Hedger(self._config.hedging, metrics=self._instrumentor._metrics)
+            if self._config.hedging is not None
+            else None
+        )
 
     # =========================================================================
     # Command Operations
@@ -167,10 +184,16 @@ class AsyncClient(NativeAsyncBaseClient):
         error_type_val = None
         with self._instrumentor.start_span("send", message.channel) as span:
             try:
-                self._ensure_connected()
+                buffering = self._buffering_transport()
+                if buffering is None:
+                    self._ensure_connected()
                 assert self._transport is not None
                 span_bytes = serialize_span_to_bytes()
-                pb_request = message.encode(self._config.client_id or "", span=span_bytes)
+                pb_request = message.encode(
+                    self._config.client_id or "",
+                    span=span_bytes,
+                    stamp_publish_time=self._config.delivery_latency_probe,
+                )
                 tags_dict = dict(pb_request.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_request.Tags.update(tags_dict)
@@ -182,13 +205,18 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                response = await self._retry_executor.execute(
-                    "SendCommand",
-                    self._pick_pool_transport().send_request,
-                    pb_request,
-                    timeout_seconds=message.timeout_in_seconds,
-                    channel=message.channel,
-                )
+                if buffering is not None:
+                    response = await buffering.buffer_publish(
+                        "command", pb_request, timeout_seconds=message.timeout_in_seconds
+                    )
+                else:
+                    response = await self._retry_executor.execute(
+                        "SendCommand",
+                        self._pick_pool_transport().send_request,
+                        pb_request,
+                        timeout_seconds=message.timeout_in_seconds,
+                        channel=message.channel,
+                    )
                 self._instrumentor._metrics.record_sent_message("send", message.channel)
                 return CommandResponse.decode(response)
             except (ValueError, TypeError) as e:
@@ -271,7 +299,11 @@ class AsyncClient(NativeAsyncBaseClient):
 
         Sends a query to a subscriber and awaits until a response
         containing data is received or the query's
-        ``timeout_in_seconds`` expires.
+        ``timeout_in_seconds`` expires. With
+        ``ClientConfig.query_cache_max_bytes`` set, a query carrying a
+        ``cache_key`` may be answered from the client-side cache, and
+        concurrent identical queries share one request (see
+        :mod:`kubemq.cq.query_cache`).
 
         Args:
             message: The query message to send.
@@ -303,6 +335,13 @@ class AsyncClient(NativeAsyncBaseClient):
                 success/failure.
             :meth:`subscribe_to_queries`: Subscribe to receive queries.
         """
+        cache = self._query_cache
+        if cache is not None and message.cache_key:
+            return await cache.get_or_fetch_async(message, lambda: self._send_query(message))
+        return await self._send_query(message)
+
+    async def _send_query(self, message: QueryMessage) -> QueryResponse:
+        """Send a query to the responder."""
         self._validate_message_size(message.body)
         start = time.perf_counter()
         error_type_val = None
@@ -311,7 +350,11 @@ class AsyncClient(NativeAsyncBaseClient):
                 self._ensure_connected()
                 assert self._transport is not None
                 span_bytes = serialize_span_to_bytes()
-                pb_request = message.encode(self._config.client_id or "", span=span_bytes)
+                pb_request = message.encode(
+                    self._config.client_id or "",
+                    span=span_bytes,
+                    stamp_publish_time=self._config.delivery_latency_probe,
+                )
                 tags_dict = dict(pb_request.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_request.Tags.update(tags_dict)
@@ -323,13 +366,7 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                response = await self._retry_executor.execute(
-                    "SendQuery",
-                    self._pick_pool_transport().send_request,
-                    pb_request,
-                    timeout_seconds=message.timeout_in_seconds,
-                    channel=message.channel,
-                )
+                response = await self._request_query(pb_request, message)
                 self._instrumentor._metrics.record_sent_message("send", message.channel)
                 return QueryResponse.decode(response)
             except (ValueError, TypeError) as e:
@@ -400,6 +437,20 @@ class AsyncClient(NativeAsyncBaseClient):
         sorted_results = sorted(indexed_results, key=lambda x: x[0])
         return [result for _, result in sorted_results]
 
+    def query_cache_stats(self) -> QueryCacheStats | None:
+        """Return the client-side query cache counters.
+
+        Returns:
+            QueryCacheStats, or None when ``ClientConfig.query_cache_max_bytes``
+            is 0.
+        """
+        return self._query_cache.stats() if self._query_cache is not None else None
+
+    def clear_query_cache(self) -> None:
+        """Drop every response held by the client-side query cache."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
     # =========================================================================
     # Response Operations
     # =========================================================================
@@ -467,7 +518,9 @@ class AsyncClient(NativeAsyncBaseClient):
         higher concurrent throughput.
         """
         self._ensure_connected()
-        pb_request = message.encode(self._config.client_id or "")
+        pb_request = message.encode(
+            self._config.client_id or "", stamp_publish_time=self._config.delivery_latency_probe
+        )
         transport = self._pick_pool_transport()
 
         if self._pipeline_sem is not None:
@@ -493,30 +546,62 @@ class AsyncClient(NativeAsyncBaseClient):
         """Send query — fast path, no instrumentation.
 
         Uses pipeline semaphore and connection pool when enabled for
-        higher concurrent throughput.
+        higher concurrent throughput. Uses the client-side query cache
+        like :meth:`send_query`.
         """
+        cache = self._query_cache
+        if cache is not None and message.cache_key:
+            return await cache.get_or_fetch_async(message, lambda: self._send_query_fast(message))
+        return await self._send_query_fast(message)
+
+    async def _send_query_fast(self, message: QueryMessage) -> QueryResponse:
+        """Send a query to the responder without instrumentation."""
         self._ensure_connected()
-        pb_request = message.encode(self._config.client_id or "")
-        transport = self._pick_pool_transport()
+        pb_request = message.encode(
+            self._config.client_id or "", stamp_publish_time=self._config.delivery_latency_probe
+        )
 
         if self._pipeline_sem is not None:
             async with self._pipeline_sem:
-                response = await self._retry_executor.execute(
-                    "SendQuery",
-                    transport.send_request,
-                    pb_request,
-                    timeout_seconds=message.timeout_in_seconds,
-                    channel=message.channel,
-                )
+                response = await self._request_query(pb_request, message)
         else:
-            response = await self._retry_executor.execute(
+            response = await self._request_query(pb_request, message)
+        return QueryResponse.decode(response)
+
+    async def _request_query(self, pb_request: pbRequest, message: QueryMessage) -> pbResponse:
+        """Send an encoded query on a pooled transport, hedged if configured."""
+        hedger = self._hedger
+        if hedger is None or len(self._pool) < 2:
+            return await self._retry_executor.execute(
                 "SendQuery",
-                transport.send_request,
+                self._pick_pool_transport().send_request,
                 pb_request,
                 timeout_seconds=message.timeout_in_seconds,
                 channel=message.channel,
             )
-        return QueryResponse.decode(response)
+
+        primary = self._pick_pool_transport()
+
+        async def attempt(hedge: bool, timeout: float) -> pbResponse:
+            transport, request = primary, pb_request
+            if hedge:
+                transport = self._pick_pool_transport()
+                if transport is primary:
+                    transport = self._pick_pool_transport()
+                # A distinct RequestID keeps the two responses apart.
+                request = pbRequest()
+                request.CopyFrom(pb_request)
+                request.RequestID = fast_id()
+                request.Timeout = max(1, int(timeout * 1000))
+            return await self._retry_executor.execute(
+                "SendQuery",
+                transport.send_request,
+                request,
+                timeout_seconds=timeout,
+                channel=message.channel,
+            )
+
+        return await hedger.run(attempt, message.timeout_in_seconds, message.channel)
 
     async def send_response_fast(self, response: CommandResponse | QueryResponse) -> None:
         """Send response — fast path, no instrumentation."""
@@ -924,7 +1009,7 @@ class AsyncClient(NativeAsyncBaseClient):
         if current_task is not None:
             self._register_subscription_task(current_task)
 
-        pending_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
+        pool: AsyncCallbackPool[CommandReceived] | None = None
 
         try:
             request = subscription.encode(self._config.client_id or "")
@@ -961,7 +1046,6 @@ class AsyncClient(NativeAsyncBaseClient):
                                 duration, "process", subscription.channel, error_type_val
                             )
             else:
-                sem = asyncio.Semaphore(max_concurrent_callbacks)
 
                 async def _run_cmd_callback(cmd: CommandReceived) -> None:
                     try:
@@ -976,18 +1060,18 @@ class AsyncClient(NativeAsyncBaseClient):
                                 cb_err,
                                 type(cb_err).__name__,
                             )
-                    finally:
-                        sem.release()
 
+                pool = AsyncCallbackPool(
+                    _run_cmd_callback, max_concurrent_callbacks, name="kubemq-commands-callback"
+                )
+                pool.start()
+                submit = pool.submit
                 async for pb_request in self._transport.subscribe_to_requests(request, token):
                     command = CommandReceived.decode(pb_request)
                     self._instrumentor._metrics.record_consumed_message(
                         "process", subscription.channel
                     )
-                    await sem.acquire()
-                    task = asyncio.create_task(_run_cmd_callback(command))
-                    pending_tasks.add(task)
-                    task.add_done_callback(pending_tasks.discard)
+                    await submit(command)
 
         except Exception as e:
             if error_callback:
@@ -995,8 +1079,8 @@ class AsyncClient(NativeAsyncBaseClient):
             else:
                 raise
         finally:
-            if pending_tasks:
-                await asyncio.gather(*pending_tasks, return_exceptions=True)
+            if pool is not None:
+                await pool.close()
             await self._unregister_subscription(token)
 
     async def subscribe_queries_with_callback(  # noqa: C901
@@ -1060,7 +1144,7 @@ class AsyncClient(NativeAsyncBaseClient):
         if current_task is not None:
             self._register_subscription_task(current_task)
 
-        pending_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
+        pool: AsyncCallbackPool[QueryReceived] | None = None
 
         try:
             request = subscription.encode(self._config.client_id or "")
@@ -1097,7 +1181,6 @@ class AsyncClient(NativeAsyncBaseClient):
                                 duration, "process", subscription.channel, error_type_val
                             )
             else:
-                sem = asyncio.Semaphore(max_concurrent_callbacks)
 
                 async def _run_query_callback(qry: QueryReceived) -> None:
                     try:
@@ -1112,18 +1195,18 @@ class AsyncClient(NativeAsyncBaseClient):
                                 cb_err,
                                 type(cb_err).__name__,
                             )
-                    finally:
-                        sem.release()
 
+                pool = AsyncCallbackPool(
+                    _run_query_callback, max_concurrent_callbacks, name="kubemq-queries-callback"
+                )
+                pool.start()
+                submit = pool.submit
                 async for pb_request in self._transport.subscribe_to_requests(request, token):
                     query = QueryReceived.decode(pb_request)
                     self._instrumentor._metrics.record_consumed_message(
                         "process", subscription.channel
                     )
-                    await sem.acquire()
-                    task = asyncio.create_task(_run_query_callback(query))
-                    pending_tasks.add(task)
-                    task.add_done_callback(pending_tasks.discard)
+                    await submit(query)
 
         except Exception as e:
             if error_callback:
@@ -1131,8 +1214,8 @@ class AsyncClient(NativeAsyncBaseClient):
             else:
                 raise
         finally:
-            if pending_tasks:
-                await asyncio.gather(*pending_tasks, return_exceptions=True)
+            if pool is not None:
+                await pool.close()
             await self._unregister_subscription(token)
 
 
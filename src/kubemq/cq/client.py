@@ -35,6 +35,7 @@ from kubemq.cq.command_message_received import CommandReceived
 from kubemq.cq.command_response_message import CommandResponse
 from kubemq.cq.commands_subscription import CommandsSubscription
 from kubemq.cq.queries_subscription import QueriesSubscription
+from kubemq.cq.query_cache import QueryCacheStats, QueryResultCache
 from kubemq.cq.query_message import QueryMessage
 from kubemq.cq.query_message_received import QueryReceived
 from kubemq.cq.query_response_message import QueryResponse
@@ -156,6 +157,13 @@ class Client(BaseClient):
             )
 
         super().__init__(config=config)
+        self._query_cache = (
+            QueryResultCache(
+                self._config.query_cache_max_bytes, metrics=self._instrumentor._metrics
+            )
+            if self._config.query_cache_max_bytes > 0
+            else None
+        )
 
     async def __aenter__(self) -> Client:
         """Async context manager entry."""
@@ -205,7 +213,11 @@ class Client(BaseClient):
                 self._ensure_connected()
                 assert self._transport is not None
                 span_bytes = serialize_span_to_bytes()
-                pb_req = message.encode(self._config.client_id or "", span=span_bytes)
+                pb_req = message.encode(
+                    self._config.client_id or "",
+                    span=span_bytes,
+                    stamp_publish_time=self._config.delivery_latency_probe,
+                )
                 tags_dict = dict(pb_req.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_req.Tags.update(tags_dict)
@@ -332,8 +344,29 @@ class Client(BaseClient):
 
     # Query methods — GS-aligned verbs
 
+    def query_cache_stats(self) -> QueryCacheStats | None:
+        """Return the client-side query cache counters.
+
+        Returns:
+            QueryCacheStats, or None when ``ClientConfig.query_cache_max_bytes``
+            is 0.
+        """
+        return self._query_cache.stats() if self._query_cache is not None else None
+
+    def clear_query_cache(self) -> None:
+        """Drop every response held by the client-side query cache."""
+        if self._query_cache is not None:
+            self._query_cache.clear()
+
     def _send_query_impl(self, message: QueryMessage) -> QueryResponse:
-        """Internal implementation for sending a query."""
+        """Internal implementation for sending a query, via the query cache if enabled."""
+        cache = self._query_cache
+        if cache is not None and message.cache_key:
+            return cache.get_or_fetch(message, lambda: self._send_query_remote(message))
+        return self._send_query_remote(message)
+
+    def _send_query_remote(self, message: QueryMessage) -> QueryResponse:
+        """Send a query to the responder."""
         self._validate_message_size(message.body)
         start = time.perf_counter()
         error_type_val = None
@@ -342,7 +375,11 @@ class Client(BaseClient):
                 self._ensure_connected()
                 assert self._transport is not None
                 span_bytes = serialize_span_to_bytes()
-                pb_req = message.encode(self._config.client_id or "", span=span_bytes)
+                pb_req = message.encode(
+                    self._config.client_id or "",
+                    span=span_bytes,
+                    stamp_publish_time=self._config.delivery_latency_probe,
+                )
                 tags_dict = dict(pb_req.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_req.Tags.update(tags_dict)
@@ -376,7 +413,10 @@ class Client(BaseClient):
 
         Sends a query to a subscriber and blocks until a response
         containing data is received or the query's
-        ``timeout_in_seconds`` expires.
+        ``timeout_in_seconds`` expires. With
+        ``ClientConfig.query_cache_max_bytes`` set, a query carrying a
+        ``cache_key`` may be answered from the client-side cache (see
+        :mod:`kubemq.cq.query_cache`).
 
         Args:
             message: The query message to send.
@@ -552,7 +592,9 @@ class Client(BaseClient):
             KubeMQError: If the server rejects the request (e.g., channel
                 already exists or invalid name).
         """
-        return create_channel_request(self._transport, self._config.client_id, channel, "commands")
+        return create_channel_request(
+            self._transport, self._config.client_id, channel, "commands", cache=self._channel_cache
+        )
 
     async def create_commands_channel_async(self, channel: str) -> bool | None:
         """Create a commands channel asynchronously.
@@ -589,7 +631,9 @@ class Client(BaseClient):
             KubeMQError: If the server rejects the request (e.g., channel
                 already exists or invalid name).
         """
-        return create_channel_request(self._transport, self._config.client_id, channel, "queries")
+        return create_channel_request(
+            self._transport, self._config.client_id, channel, "queries", cache=self._channel_cache
+        )
 
     async def create_queries_channel_async(self, channel: str) -> bool | None:
         """Create a queries channel asynchronously.
@@ -625,7 +669,9 @@ class Client(BaseClient):
             KubeMQChannelError: If the channel does not exist.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return delete_channel_request(self._transport, self._config.client_id, channel, "commands")
+        return delete_channel_request(
+            self._transport, self._config.client_id, channel, "commands", cache=self._channel_cache
+        )
 
     async def delete_commands_channel_async(self, channel: str) -> bool | None:
         """Delete a commands channel asynchronously.
@@ -661,7 +707,9 @@ class Client(BaseClient):
             KubeMQChannelError: If the channel does not exist.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return delete_channel_request(self._transport, self._config.client_id, channel, "queries")
+        return delete_channel_request(
+            self._transport, self._config.client_id, channel, "queries", cache=self._channel_cache
+        )
 
     async def delete_queries_channel_async(self, channel: str) -> bool | None:
         """Delete a queries channel asynchronously.
@@ -698,7 +746,13 @@ class Client(BaseClient):
                 client lacks permission.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return list_cq_channels(self._transport, self._config.client_id, "commands", channel_search)
+        return list_cq_channels(
+            self._transport,
+            self._config.client_id,
+            "commands",
+            channel_search,
+            cache=self._channel_cache,
+        )
 
     async def list_commands_channels_async(self, channel_search: str = "") -> list[CQChannel]:
         """List commands channels asynchronously.
@@ -736,7 +790,13 @@ class Client(BaseClient):
                 client lacks permission.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return list_cq_channels(self._transport, self._config.client_id, "queries", channel_search)
+        return list_cq_channels(
+            self._transport,
+            self._config.client_id,
+            "queries",
+            channel_search,
+            cache=self._channel_cache,
+        )
 
     async def list_queries_channels_async(self, channel_search: str = "") -> list[CQChannel]:
         """List queries channels asynchronously.
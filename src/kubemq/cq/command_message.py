@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import sys
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,6 +11,7 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+from kubemq._internal.delivery_latency import PUBLISH_TIME_TAG
 from kubemq.common.channel_validators import validate_channel_name
 from kubemq.common.helpers import fast_id
 from kubemq.grpc import Request as pbCommand
@@ -56,9 +58,17 @@ class CommandMessage:
                 "Command message must have at least one of the following: metadata, body, or tags."
             )
 
-    def encode(self, client_id: str, *, span: bytes = b"") -> pbCommand:
+    def encode(
+        self, client_id: str, *, span: bytes = b"", stamp_publish_time: bool = False
+    ) -> pbCommand:
         """Encode the command message to a protobuf Request.
 
+        Args:
+            client_id: Sender client ID.
+            span: Serialized trace context, if any.
+            stamp_publish_time: Set the publish-time tag read by the
+                receiver's delivery latency probe.
+
         Returns:
             The protobuf Request ready for transmission.
         """
@@ -74,6 +84,8 @@ class CommandMessage:
             pb_command.Tags[key] = value
         if span:
             pb_command.Span = span
+        if stamp_publish_time:
+            pb_command.Tags[PUBLISH_TIME_TAG] = str(time.time_ns())
         return pb_command
 
     def with_updates(self, **kwargs: Any) -> Self:
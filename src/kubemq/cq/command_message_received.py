@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from kubemq._internal import delivery_latency
 from kubemq.grpc import Request as pbRequest
 
 
@@ -45,6 +46,9 @@ class CommandReceived:
         Returns:
             A new CommandReceived instance populated from the protobuf message.
         """
+        probe = delivery_latency.active
+        if probe is not None:
+            probe.record_tag("commands", command_receive.Tags)
         return cls(
             id=command_receive.RequestID,
             from_client_id=command_receive.ClientID,
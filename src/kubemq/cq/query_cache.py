@@ -0,0 +1,275 @@
+"""Client-side cache of query responses.
+
+``QueryMessage.cache_key`` and ``cache_ttl_in_seconds`` ask the broker to
+cache a responder's reply, but each ``send_query`` still makes a network
+round-trip. With ``ClientConfig(query_cache_max_bytes=...)`` set,
+:class:`AsyncCQClient` and :class:`CQClient` also keep successful replies
+to queries that carry a ``cache_key`` in a local :class:`QueryResultCache`:
+
+- entries are keyed by ``(channel, cache_key)`` and live for the query's
+  ``cache_ttl_in_seconds``
+- least recently used entries are evicted once the cached bodies,
+  metadata and tags exceed the byte budget
+- concurrent misses for the same key share one request to the responder
+- hits, misses and coalesced lookups are counted in :meth:`stats` and in
+  the ``kubemq.client.query_cache.lookups`` metric
+
+Responses served from the cache are copies with ``cache_hit=True``.
+Failed or unexecuted responses are never cached.
+
+Example:
+    config = ClientConfig(query_cache_max_bytes=64 * 1024 * 1024)
+    async with AsyncCQClient(config=config) as client:
+        query = QueryMessage(
+            channel="inventory", body=b"sku-1", timeout_in_seconds=5,
+            cache_key="sku-1", cache_ttl_in_seconds=30,
+        )
+        await client.send_query(query)  # goes to the responder
+        await client.send_query(query)  # served from memory
+        print(client.query_cache_stats())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kubemq.cq.query_message import QueryMessage
+    from kubemq.cq.query_response_message import QueryResponse
+
+# Rough per-entry bookkeeping cost charged against the byte budget.
+_ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True)
+class QueryCacheStats:
+    """Snapshot of a :class:`QueryResultCache`.
+
+    Attributes:
+        entries: Responses currently cached.
+        size_bytes: Estimated size of the cached responses.
+        max_bytes: Configured byte budget.
+        hits: Lookups served from the cache.
+        misses: Lookups that sent the query to the responder.
+        coalesced: Lookups that waited on another caller's in-flight query.
+        evictions: Entries dropped to stay within the byte budget.
+    """
+
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+
+
+class _Entry:
+    __slots__ = ("expires_at", "response", "size")
+
+    def __init__(self, response: QueryResponse, size: int, expires_at: float) -> None:
+        self.response = response
+        self.size = size
+        self.expires_at = expires_at
+
+
+class _Flight:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: QueryResponse | None = None
+        self.error: BaseException | None = None
+
+
+def _response_size(response: QueryResponse) -> int:
+    size = _ENTRY_OVERHEAD + len(response.body) + len(response.metadata or "")
+    for key, value in response.tags.items():
+        size += len(key) + len(value)
+    return size
+
+
+def _copy(response: QueryResponse, *, cache_hit: bool) -> QueryResponse:
+    return dataclasses.replace(response, cache_hit=cache_hit, tags=dict(response.tags))
+
+
+class QueryResultCache:
+    """TTL + LRU cache of query responses with single-flight misses.
+
+    Args:
+        max_bytes: Byte budget for cached responses.
+        metrics: Optional ``KubeMQMetrics`` that receives one lookup
+            count per query.
+        clock: Monotonic time source; injectable for tests.
+
+    Raises:
+        ValueError: If ``max_bytes`` is not positive.
+
+    Thread Safety:
+        Thread-safe. :meth:`get_or_fetch_async` coalesces callers on one
+        event loop; :meth:`get_or_fetch` coalesces callers across threads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        *,
+        metrics: Any = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._max_bytes = max_bytes
+        self._metrics = metrics
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._size = 0
+        self._async_flights: dict[tuple[str, str], asyncio.Future[QueryResponse]] = {}
+        self._sync_flights: dict[tuple[str, str], _Flight] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    async def get_or_fetch_async(
+        self, message: QueryMessage, fetch: Callable[[], Awaitable[QueryResponse]]
+    ) -> QueryResponse:
+        """Return the cached response for ``message`` or await ``fetch()``."""
+        key = (message.channel, message.cache_key)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            self._record("coalesced", message.channel)
+            await asyncio.wait((flight,))
+            if flight.cancelled():
+                # The leader was cancelled; try again on our own.
+                return await self.get_or_fetch_async(message, fetch)
+            return _copy(flight.result(), cache_hit=False)
+
+        self._record("miss", message.channel)
+        flight = self._async_flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Retrieved here so an unawaited flight does not log a warning.
+            flight.exception()
+            raise
+        else:
+            self._store(key, message.cache_ttl_in_seconds, response)
+            flight.set_result(response)
+            return response
+        finally:
+            self._async_flights.pop(key, None)
+
+    def get_or_fetch(
+        self, message: QueryMessage, fetch: Callable[[], QueryResponse]
+    ) -> QueryResponse:
+        """Return the cached response for ``message`` or call ``fetch()``."""
+        key = (message.channel, message.cache_key)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            flight = self._sync_flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._sync_flights[key] = _Flight()
+
+        if not leader:
+            self._record("coalesced", message.channel)
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.result is not None
+            return _copy(flight.result, cache_hit=False)
+
+        self._record("miss", message.channel)
+        try:
+            response = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            self._store(key, message.cache_ttl_in_seconds, response)
+            flight.result = response
+            return response
+        finally:
+            with self._lock:
+                self._sync_flights.pop(key, None)
+            flight.done.set()
+
+    def stats(self) -> QueryCacheStats:
+        """Return current size and lookup counters."""
+        with self._lock:
+            return QueryCacheStats(
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached response. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _lookup(self, key: tuple[str, str]) -> QueryResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() >= entry.expires_at:
+                del self._entries[key]
+                self._size -= entry.size
+                return None
+            self._entries.move_to_end(key)
+            response = entry.response
+        self._record("hit", key[0])
+        return _copy(response, cache_hit=True)
+
+    def _store(self, key: tuple[str, str], ttl_seconds: int, response: QueryResponse) -> None:
+        if not response.is_executed or response.error or ttl_seconds <= 0:
+            return
+        size = _response_size(response)
+        if size > self._max_bytes:
+            return
+        entry = _Entry(_copy(response, cache_hit=False), size, self._clock() + ttl_seconds)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._evictions += 1
+
+    def _record(self, result: str, channel: str) -> None:
+        with self._lock:
+            if result == "hit":
+                self._hits += 1
+            elif result == "miss":
+                self._misses += 1
+            else:
+                self._coalesced += 1
+        if self._metrics is not None:
+            self._metrics.record_query_cache_lookup(result, channel)
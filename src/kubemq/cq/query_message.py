@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import sys
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,6 +11,7 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+from kubemq._internal.delivery_latency import PUBLISH_TIME_TAG
 from kubemq.common.channel_validators import validate_channel_name
 from kubemq.common.helpers import fast_id
 from kubemq.grpc import Request as pbQuery
@@ -71,9 +73,17 @@ class QueryMessage:
         if self.cache_key and self.cache_ttl_in_seconds <= 0:
             raise ValueError("cache_ttl_in_seconds must be > 0 when cache_key is set.")
 
-    def encode(self, client_id: str, *, span: bytes = b"") -> pbQuery:
+    def encode(
+        self, client_id: str, *, span: bytes = b"", stamp_publish_time: bool = False
+    ) -> pbQuery:
         """Encode the query message to a protobuf Request.
 
+        Args:
+            client_id: Sender client ID.
+            span: Serialized trace context, if any.
+            stamp_publish_time: Set the publish-time tag read by the
+                receiver's delivery latency probe.
+
         Returns:
             The protobuf Request ready for transmission.
         """
@@ -91,6 +101,8 @@ class QueryMessage:
         pb_query.CacheTTL = self.cache_ttl_in_seconds
         if span:
             pb_query.Span = span
+        if stamp_publish_time:
+            pb_query.Tags[PUBLISH_TIME_TAG] = str(time.time_ns())
         return pb_query
 
     def with_updates(self, **kwargs: Any) -> Self:
@@ -1,2 +1,11 @@
+from typing import TYPE_CHECKING
+
+from kubemq._internal.lazy import lazy_exports
+
 from .kubemq_pb2 import *  # noqa: F403
-from .kubemq_pb2_grpc import *  # noqa: F403
+
+if TYPE_CHECKING:
+    from .kubemq_pb2_grpc import *  # noqa: F403
+
+# The service stubs pull in ``grpc`` itself; message types only need protobuf.
+__getattr__, __dir__ = lazy_exports(__name__, {}, fallback=(".kubemq_pb2_grpc",))
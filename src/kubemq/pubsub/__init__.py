@@ -1,12 +1,54 @@
-from kubemq.common import CancellationToken
-
-from .async_client import AsyncClient, AsyncPubSubClient
-from .client import Client as Client
-from .event_message import EventMessage
-from .event_message_received import EventReceived
-from .event_send_result import EventStoreResult
-from .event_sender import EventSender
-from .event_store_message import EventStoreMessage
-from .event_store_message_received import EventStoreReceived
-from .events_store_subscription import EventsStoreSubscription, EventStoreStartPosition
-from .events_subscription import EventsSubscription
+from typing import TYPE_CHECKING
+
+from kubemq._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kubemq.common import CancellationToken
+
+    from .async_client import AsyncClient, AsyncPubSubClient
+    from .checkpoint import (
+        CheckpointStore,
+        FileCheckpointStore,
+        MemoryCheckpointStore,
+        SQLiteCheckpointStore,
+    )
+    from .client import Client as Client
+    from .event_message import EventMessage
+    from .event_message_received import EventReceived
+    from .event_send_result import EventStoreResult
+    from .event_sender import EventSender
+    from .event_store_message import EventStoreMessage
+    from .event_store_message_received import EventStoreReceived
+    from .events_store_publisher import EventsStorePublisher, PublisherStats
+    from .events_store_subscription import EventsStoreSubscription, EventStoreStartPosition
+    from .events_subscription import EventsSubscription
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kubemq.common": ("CancellationToken",),
+        ".async_client": (
+            "AsyncClient",
+            "AsyncPubSubClient",
+        ),
+        ".checkpoint": (
+            "CheckpointStore",
+            "FileCheckpointStore",
+            "MemoryCheckpointStore",
+            "SQLiteCheckpointStore",
+        ),
+        ".client": ("Client",),
+        ".event_message": ("EventMessage",),
+        ".event_message_received": ("EventReceived",),
+        ".event_send_result": ("EventStoreResult",),
+        ".event_sender": ("EventSender",),
+        ".event_store_message": ("EventStoreMessage",),
+        ".event_store_message_received": ("EventStoreReceived",),
+        ".events_store_publisher": ("EventsStorePublisher", "PublisherStats"),
+        ".events_store_subscription": (
+            "EventsStoreSubscription",
+            "EventStoreStartPosition",
+        ),
+        ".events_subscription": ("EventsSubscription",),
+    },
+)
@@ -7,12 +7,20 @@ import contextlib
 import dataclasses
 import logging
 import time
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
 )
 
+from kubemq._internal.batching import (
+    DEFAULT_MAX_BATCH_DELAY_MS,
+    DEFAULT_MAX_BATCH_SIZE,
+    AsyncBatchCollector,
+    validate_batch_params,
+)
+from kubemq._internal.bulk_encode import encode_bulk
+from kubemq._internal.callback_pool import AsyncCallbackPool
 from kubemq._internal.deprecation import deprecated_async
 from kubemq._internal.retry import BackoffCalculator
 from kubemq._internal.telemetry import (
@@ -32,11 +40,19 @@ from kubemq.core.exceptions import (
     KubeMQValidationError,
 )
 from kubemq.pubsub.async_event_sender import AsyncEventSender
+from kubemq.pubsub.checkpoint import (
+    DEFAULT_COMMIT_EVERY,
+    DEFAULT_COMMIT_INTERVAL_SECONDS,
+    AsyncCheckpointer,
+    CheckpointStore,
+    default_checkpoint_key,
+)
 from kubemq.pubsub.event_message import EventMessage
 from kubemq.pubsub.event_message_received import EventReceived
 from kubemq.pubsub.event_send_result import EventStoreResult
 from kubemq.pubsub.event_store_message import EventStoreMessage
 from kubemq.pubsub.event_store_message_received import EventStoreReceived
+from kubemq.pubsub.events_store_publisher import DEFAULT_PUBLISH_WINDOW, EventsStorePublisher
 from kubemq.pubsub.events_store_subscription import EventsStoreSubscription, EventStoreStartPosition
 from kubemq.pubsub.events_subscription import EventsSubscription
 
@@ -49,6 +65,8 @@ _logger = logging.getLogger("kubemq.pubsub.async_client")
 AsyncEventCallback = Callable[[EventReceived], Awaitable[None]]
 AsyncEventStoreCallback = Callable[[EventStoreReceived], Awaitable[None]]
 AsyncErrorCallback = Callable[[Exception], Awaitable[None]]
+AsyncEventBatchCallback = Callable[[list[EventReceived]], Awaitable[None]]
+AsyncEventStoreBatchCallback = Callable[[list[EventStoreReceived]], Awaitable[None]]
 
 
 class AsyncClient(NativeAsyncBaseClient):
@@ -82,6 +100,8 @@ class AsyncClient(NativeAsyncBaseClient):
         Safe to share across asyncio tasks within a single event loop.
     """
 
+    _stage_component = "events"
+
     def __init__(
         self,
         address: str = "",
@@ -115,7 +135,11 @@ class AsyncClient(NativeAsyncBaseClient):
         """Lazily initialize the bidirectional event stream sender."""
         if self._event_sender is None:
             self._ensure_connected()
-            self._event_sender = AsyncEventSender(self._pick_pool_transport())
+            self._event_sender = AsyncEventSender(
+                self._pick_pool_transport(),
+                stage_timer=self._config.stage_timer,
+                adaptive_rate=self._config.adaptive_rate,
+            )
             await self._event_sender.start()
         return self._event_sender
 
@@ -168,7 +192,10 @@ class AsyncClient(NativeAsyncBaseClient):
         error_type_val = None
         with self._instrumentor.start_span("publish", message.channel) as span:
             try:
+                timed = self._stages is not None and self._stages.sample()
+                encode_start = time.perf_counter() if timed else 0.0
                 pb_event = message.encode(self._config.client_id or "")
+                encoded = time.perf_counter() if timed else 0.0
                 tags_dict = dict(pb_event.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_event.Tags.update(tags_dict)
@@ -180,8 +207,14 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                sender = await self._get_event_sender()
-                await sender.send(pb_event)
+                if timed:
+                    self._record_encode_stages(encode_start, encoded)
+                buffering = self._buffering_transport()
+                if buffering is not None:
+                    await buffering.buffer_publish("event", pb_event, wait=False)
+                else:
+                    sender = await self._get_event_sender()
+                    await sender.send(pb_event)
                 self._instrumentor._metrics.record_sent_message("publish", message.channel)
             except (ValueError, TypeError) as e:
                 error_type_val = "validation"
@@ -240,13 +273,18 @@ class AsyncClient(NativeAsyncBaseClient):
                 streaming sender.
         """
         self._validate_message_size(message.body)
-        self._ensure_connected()
+        buffering = self._buffering_transport()
+        if buffering is None:
+            self._ensure_connected()
         assert self._transport is not None
         start = time.perf_counter()
         error_type_val = None
         with self._instrumentor.start_span("publish", message.channel) as span:
             try:
+                timed = self._stages is not None and self._stages.sample()
+                encode_start = time.perf_counter() if timed else 0.0
                 pb_event = message.encode(self._config.client_id or "")
+                encoded = time.perf_counter() if timed else 0.0
                 tags_dict = dict(pb_event.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_event.Tags.update(tags_dict)
@@ -258,7 +296,12 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                result = await self._transport.send_event(pb_event)
+                if timed:
+                    self._record_encode_stages(encode_start, encoded)
+                if buffering is not None:
+                    result = await buffering.buffer_publish("event", pb_event, wait=False)
+                else:
+                    result = await self._transport.send_event(pb_event)
                 self._instrumentor._metrics.record_sent_message("publish", message.channel)
                 if result and not result.Sent and result.Error:
                     raise KubeMQError(result.Error)
@@ -333,7 +376,10 @@ class AsyncClient(NativeAsyncBaseClient):
         error_type_val = None
         with self._instrumentor.start_span("publish", message.channel) as span:
             try:
+                timed = self._stages is not None and self._stages.sample()
+                encode_start = time.perf_counter() if timed else 0.0
                 pb_event = message.encode(self._config.client_id or "")
+                encoded = time.perf_counter() if timed else 0.0
                 tags_dict = dict(pb_event.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_event.Tags.update(tags_dict)
@@ -345,8 +391,14 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                sender = await self._get_event_sender()
-                result = await sender.send(pb_event)
+                if timed:
+                    self._record_encode_stages(encode_start, encoded)
+                buffering = self._buffering_transport()
+                if buffering is not None:
+                    result = await buffering.buffer_publish("event_store", pb_event)
+                else:
+                    sender = await self._get_event_sender()
+                    result = await sender.send(pb_event)
                 self._instrumentor._metrics.record_sent_message("publish", message.channel)
                 return EventStoreResult.decode(result) if result else EventStoreResult()
             except (ValueError, TypeError) as e:
@@ -505,6 +557,155 @@ class AsyncClient(NativeAsyncBaseClient):
         sorted_results = sorted(indexed_results, key=lambda x: x[0])
         return [result for _, result in sorted_results]
 
+    def events_store_publisher(
+        self,
+        *,
+        window: int = DEFAULT_PUBLISH_WINDOW,
+        ordered_confirmations: bool = True,
+    ) -> EventsStorePublisher:
+        """Create a pipelined events-store publisher on this client's stream.
+
+        Args:
+            window: Maximum events published and not yet confirmed by the
+                broker (credits).
+            ordered_confirmations: Also deliver results in publish order
+                through ``confirmations()``. If False, results are only
+                available from the futures ``publish()`` returns.
+
+        Returns:
+            EventsStorePublisher: Use ``publish()``, ``confirmations()``,
+            ``flush()`` and ``stats()``.
+
+        Raises:
+            KubeMQConnectionError: If the client is not connected.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`send_events_store_batch`: Fan-out batch without flow control.
+        """
+        self._ensure_connected()
+        return EventsStorePublisher(
+            self, window=window, ordered_confirmations=ordered_confirmations
+        )
+
+    async def send_events_bulk(
+        self,
+        channel: str,
+        bodies: Sequence[bytes],
+        *,
+        ids: Sequence[str] | None = None,
+        metadata: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> list[EventStoreResult]:
+        """Publish many bodies to one events channel over a single stream.
+
+        Columnar counterpart of :meth:`send_events_batch` for events that
+        share a channel, metadata and tags. The shared fields are validated
+        and encoded once, each row only adds an ID and a body, and all rows
+        are written over one ``SendEventsStream``.
+
+        Args:
+            channel: Events channel for every event.
+            bodies: Event bodies, one per event.
+            ids: Event IDs, one per body. Generated if not given.
+            metadata: Metadata for every event.
+            tags: Tags for every event.
+
+        Returns:
+            list[EventStoreResult]: One ``sent=True`` result per body, in
+            input order, once every event has been written.
+
+        Raises:
+            KubeMQValidationError: If a shared field is invalid, ``ids`` does
+                not have one entry per body, a body exceeds
+                ``max_send_size``, or an event would be empty.
+            KubeMQConnectionError: If the server is unreachable.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`send_events_store_bulk`: Persistent counterpart.
+        """
+        return await self._send_events_bulk(
+            EventMessage, channel, bodies, ids=ids, metadata=metadata, tags=tags
+        )
+
+    async def send_events_store_bulk(
+        self,
+        channel: str,
+        bodies: Sequence[bytes],
+        *,
+        ids: Sequence[str] | None = None,
+        metadata: str | None = None,
+        tags: dict[str, str] | None = None,
+    ) -> list[EventStoreResult]:
+        """Persist many bodies to one events-store channel over a single stream.
+
+        Columnar counterpart of :meth:`send_events_store_batch`. All rows are
+        written over one ``SendEventsStream`` and the call returns when the
+        server has confirmed every one of them.
+
+        Args:
+            channel: Events-store channel for every event.
+            bodies: Event bodies, one per event.
+            ids: Event IDs, one per body. Generated if not given.
+            metadata: Metadata for every event.
+            tags: Tags for every event.
+
+        Returns:
+            list[EventStoreResult]: The server's result for each body, in
+            input order.
+
+        Raises:
+            KubeMQValidationError: If a shared field is invalid, ``ids`` does
+                not have one entry per body, a body exceeds
+                ``max_send_size``, or an event would be empty.
+            KubeMQConnectionError: If the server is unreachable.
+            KubeMQTimeoutError: If confirmations do not arrive within
+                ``default_timeout_seconds``.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`send_events_bulk`: Fire-and-forget counterpart.
+        """
+        return await self._send_events_bulk(
+            EventStoreMessage, channel, bodies, ids=ids, metadata=metadata, tags=tags
+        )
+
+    async def _send_events_bulk(
+        self,
+        message_cls: type,
+        channel: str,
+        bodies: Sequence[bytes],
+        *,
+        ids: Sequence[str] | None,
+        metadata: str | None,
+        tags: dict[str, str] | None,
+    ) -> list[EventStoreResult]:
+        self._ensure_connected()
+        assert self._transport is not None
+
+        events = encode_bulk(
+            message_cls,
+            channel,
+            bodies,
+            self._config.client_id or "",
+            ids=ids,
+            metadata=metadata,
+            tags=tags,
+            max_body_size=self._config.max_send_size,
+        )
+        if not events:
+            return []
+        results = await self._transport.send_events_bulk(events)
+        if message_cls is EventMessage:
+            return [EventStoreResult(id=event.EventID, sent=True, error="") for event in events]
+        return [
+            EventStoreResult.decode(result)
+            if (result := results.get(event.EventID)) is not None
+            else EventStoreResult(id=event.EventID, sent=False, error="No result from server")
+            for event in events
+        ]
+
     # =========================================================================
     # Subscription Operations
     # =========================================================================
@@ -779,75 +980,138 @@ class AsyncClient(NativeAsyncBaseClient):
         self,
         subscription: EventsStoreSubscription,
         cancellation_token: AsyncCancellationToken | None = None,
+        *,
+        checkpoint_store: CheckpointStore | None = None,
+        checkpoint_key: str | None = None,
+        checkpoint_interval_seconds: float = DEFAULT_COMMIT_INTERVAL_SECONDS,
+        checkpoint_every: int = DEFAULT_COMMIT_EVERY,
     ) -> AsyncIterator[EventStoreReceived]:
         """Subscribe to events store -- fast path with automatic reconnection.
 
         No per-message instrumentation overhead, but includes a retry loop
         so the subscription recovers after broker outages.  On reconnect,
         resumes from the last received sequence to avoid re-processing.
+
+        With a ``checkpoint_store``, the resume position also survives
+        process restarts: an event's sequence is recorded once the consumer
+        asks for the next one, committed in batches off the event loop, and
+        a stored position makes the first subscribe use ``StartAtSequence``.
+
+        Args:
+            subscription: Subscription configuration
+            cancellation_token: Optional token to cancel subscription
+            checkpoint_store: Optional durable store for the resume position.
+            checkpoint_key: Key in ``checkpoint_store``. Defaults to the
+                channel, suffixed with ``#group`` when a group is set.
+            checkpoint_interval_seconds: Commit the position at least this
+                often. Default 1.0.
+            checkpoint_every: Also commit once this many events have been
+                processed since the last commit. Default 1000.
         """
         token = cancellation_token or AsyncCancellationToken()
         backoff = BackoffCalculator(self._config.retry_policy)
         attempt = 0
         last_sequence = 0
+        checkpointer = await self._start_checkpointer(
+            subscription,
+            checkpoint_store,
+            checkpoint_key,
+            checkpoint_interval_seconds,
+            checkpoint_every,
+        )
+        if checkpointer is not None:
+            last_sequence = checkpointer.committed
 
-        while not token.is_cancelled:
-            try:
-                self._ensure_connected()
-                assert self._transport is not None
-                # Resume from last received sequence on reconnect
-                if last_sequence > 0:
-                    resume_sub = dataclasses.replace(
-                        subscription,
-                        events_store_type=EventStoreStartPosition.StartAtSequence,
-                        events_store_sequence_value=last_sequence + 1,
+        try:
+            while not token.is_cancelled:
+                try:
+                    self._ensure_connected()
+                    assert self._transport is not None
+                    # Resume from last received sequence on reconnect
+                    if last_sequence > 0:
+                        resume_sub = dataclasses.replace(
+                            subscription,
+                            events_store_type=EventStoreStartPosition.StartAtSequence,
+                            events_store_sequence_value=last_sequence + 1,
+                        )
+                        request = resume_sub.encode(self._config.client_id or "")
+                    else:
+                        request = subscription.encode(self._config.client_id or "")
+                    async for pb_event in self._transport.subscribe_to_events(request, token):
+                        attempt = 0
+                        received = EventStoreReceived.decode(pb_event)
+                        if received.sequence > 0:
+                            last_sequence = received.sequence
+                        yield received
+                        if checkpointer is not None:
+                            checkpointer.mark(received.sequence)
+                    # Stream ended -- loop back and re-subscribe unless cancelled.
+                    if token.is_cancelled:
+                        return
+                    _logger.warning(
+                        "EventStore fast-subscribe stream ended, reconnecting (attempt %d)",
+                        attempt + 1,
                     )
-                    request = resume_sub.encode(self._config.client_id or "")
-                else:
-                    request = subscription.encode(self._config.client_id or "")
-                async for pb_event in self._transport.subscribe_to_events(request, token):
-                    attempt = 0
-                    received = EventStoreReceived.decode(pb_event)
-                    if received.sequence > 0:
-                        last_sequence = received.sequence
-                    yield received
-                # Stream ended -- loop back and re-subscribe unless cancelled.
-                if token.is_cancelled:
-                    return
-                _logger.warning(
-                    "EventStore fast-subscribe stream ended, reconnecting (attempt %d)",
-                    attempt + 1,
-                )
-                delay = backoff.delay_seconds(attempt)
-                attempt += 1
-                await asyncio.sleep(delay)
-                continue
-            except KubeMQClientClosedError:
-                raise
-            except KubeMQError as e:
-                if token.is_cancelled:
-                    return
-                if not e.is_retryable and not isinstance(e, KubeMQConnectionError):
+                    delay = backoff.delay_seconds(attempt)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                except KubeMQClientClosedError:
                     raise
-                _logger.warning(
-                    "EventStore fast-subscribe stream broken (attempt %d): %s",
-                    attempt + 1,
-                    e.message,
-                )
-                delay = backoff.delay_seconds(attempt)
-                attempt += 1
-                await asyncio.sleep(delay)
-            except Exception as e:
-                if token.is_cancelled:
-                    return
-                _logger.warning(
-                    "EventStore fast-subscribe error (attempt %d): %s",
-                    attempt + 1,
-                    e,
-                )
-                delay = backoff.delay_seconds(attempt)
-                attempt += 1
-                await asyncio.sleep(delay)
+                except KubeMQError as e:
+                    if token.is_cancelled:
+                        return
+                    if not e.is_retryable and not isinstance(e, KubeMQConnectionError):
+                        raise
+                    _logger.warning(
+                        "EventStore fast-subscribe stream broken (attempt %d): %s",
+                        attempt + 1,
+                        e.message,
+                    )
+                    delay = backoff.delay_seconds(attempt)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                except Exception as e:
+                    if token.is_cancelled:
+                        return
+                    _logger.warning(
+                        "EventStore fast-subscribe error (attempt %d): %s",
+                        attempt + 1,
+                        e,
+                    )
+                    delay = backoff.delay_seconds(attempt)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+        finally:
+            if checkpointer is not None:
+                await checkpointer.close()
+
+    async def _start_checkpointer(
+        self,
+        subscription: EventsStoreSubscription,
+        store: CheckpointStore | None,
+        key: str | None,
+        interval_seconds: float,
+        every: int,
+    ) -> AsyncCheckpointer | None:
+        """Load the stored resume position and start periodic commits."""
+        if store is None:
+            return None
+        checkpointer = AsyncCheckpointer(
+            store,
+            key or default_checkpoint_key(subscription.channel, subscription.group),
+            commit_interval_seconds=interval_seconds,
+            commit_every=every,
+        )
+        sequence = await checkpointer.load()
+        if sequence is not None:
+            _logger.info(
+                "Resuming events store subscription %s from checkpoint sequence %d",
+                checkpointer.key,
+                sequence,
+            )
+        checkpointer.start()
+        return checkpointer
 
     async def subscribe_to_events_store(  # noqa: C901
         self,
@@ -1123,11 +1387,32 @@ class AsyncClient(NativeAsyncBaseClient):
         if current_task is not None:
             self._register_subscription_task(current_task)
 
-        pending_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
+        pool: AsyncCallbackPool[EventReceived] | None = None
         backoff = BackoffCalculator(self._config.retry_policy)
         attempt = 0
 
         try:
+            if max_concurrent_callbacks > 1:
+
+                async def _run_callback(evt: EventReceived) -> None:
+                    try:
+                        await callback(evt)
+                    except Exception as cb_err:
+                        if error_callback:
+                            with contextlib.suppress(Exception):
+                                await error_callback(cb_err)
+                        elif self._logger:
+                            self._logger.error(
+                                "Unhandled callback exception: %s (%s)",
+                                cb_err,
+                                type(cb_err).__name__,
+                            )
+
+                pool = AsyncCallbackPool(
+                    _run_callback, max_concurrent_callbacks, name="kubemq-events-callback"
+                )
+                pool.start()
+
             while not token.is_cancelled:
                 try:
                     self._ensure_connected()
@@ -1184,37 +1469,16 @@ class AsyncClient(NativeAsyncBaseClient):
                                         duration, "process", subscription.channel, error_type_val
                                     )
                     else:
-                        # Concurrent path: semaphore-limited task spawning
-                        sem = asyncio.Semaphore(max_concurrent_callbacks)
-
-                        async def _run_callback(
-                            evt: EventReceived, _sem: asyncio.Semaphore = sem
-                        ) -> None:
-                            try:
-                                await callback(evt)
-                            except Exception as cb_err:
-                                if error_callback:
-                                    with contextlib.suppress(Exception):
-                                        await error_callback(cb_err)
-                                elif self._logger:
-                                    self._logger.error(
-                                        "Unhandled callback exception: %s (%s)",
-                                        cb_err,
-                                        type(cb_err).__name__,
-                                    )
-                            finally:
-                                _sem.release()
-
+                        # Concurrent path: hand off to the fixed worker pool
+                        assert pool is not None
+                        submit = pool.submit
                         async for pb_event in self._transport.subscribe_to_events(request, token):
                             attempt = 0
                             event = EventReceived.decode(pb_event)
                             self._instrumentor._metrics.record_consumed_message(
                                 "process", subscription.channel
                             )
-                            await sem.acquire()
-                            task = asyncio.create_task(_run_callback(event))
-                            pending_tasks.add(task)
-                            task.add_done_callback(pending_tasks.discard)
+                            await submit(event)
 
                     # Stream ended -- loop back and re-subscribe unless cancelled.
                     if token.is_cancelled:
@@ -1266,8 +1530,8 @@ class AsyncClient(NativeAsyncBaseClient):
                         raise
                     return
         finally:
-            if pending_tasks:
-                await asyncio.gather(*pending_tasks, return_exceptions=True)
+            if pool is not None:
+                await pool.close()
             await self._unregister_subscription(token)
 
     async def subscribe_store_with_callback(  # noqa: C901
@@ -1278,6 +1542,10 @@ class AsyncClient(NativeAsyncBaseClient):
         cancellation_token: AsyncCancellationToken | None = None,
         *,
         max_concurrent_callbacks: int = 1,
+        checkpoint_store: CheckpointStore | None = None,
+        checkpoint_key: str | None = None,
+        checkpoint_interval_seconds: float = DEFAULT_COMMIT_INTERVAL_SECONDS,
+        checkpoint_every: int = DEFAULT_COMMIT_EVERY,
     ) -> None:
         """Subscribe to events store with an async callback and stream reconnection.
 
@@ -1296,6 +1564,18 @@ class AsyncClient(NativeAsyncBaseClient):
             max_concurrent_callbacks: Maximum number of callbacks that may
                 execute concurrently. Default ``1`` (sequential). Must be
                 >= 1 and <= 1000.
+            checkpoint_store: Optional durable store for the resume position.
+                An event's sequence is recorded once its callback returns
+                (with concurrent callbacks, once every earlier event's
+                callback has also returned) and committed in batches. A
+                stored position makes the first subscribe use
+                ``StartAtSequence``, so restarts resume where they left off.
+            checkpoint_key: Key in ``checkpoint_store``. Defaults to the
+                channel, suffixed with ``#group`` when a group is set.
+            checkpoint_interval_seconds: Commit the position at least this
+                often. Default 1.0.
+            checkpoint_every: Also commit once this many events have been
+                processed since the last commit. Default 1000.
 
         Raises:
             ValueError: If ``max_concurrent_callbacks`` < 1 or > 1000.
@@ -1335,12 +1615,49 @@ class AsyncClient(NativeAsyncBaseClient):
         if current_task is not None:
             self._register_subscription_task(current_task)
 
-        pending_tasks: set[asyncio.Task] = set()  # type: ignore[type-arg]
+        pool: AsyncCallbackPool[EventStoreReceived] | None = None
+        checkpointer: AsyncCheckpointer | None = None
         backoff = BackoffCalculator(self._config.retry_policy)
         attempt = 0
         last_sequence = 0
 
         try:
+            checkpointer = await self._start_checkpointer(
+                subscription,
+                checkpoint_store,
+                checkpoint_key,
+                checkpoint_interval_seconds,
+                checkpoint_every,
+            )
+            if checkpointer is not None:
+                last_sequence = checkpointer.committed
+
+            if max_concurrent_callbacks > 1:
+
+                async def _run_store_callback(evt: EventStoreReceived) -> None:
+                    try:
+                        await callback(evt)
+                    except Exception as cb_err:
+                        if error_callback:
+                            with contextlib.suppress(Exception):
+                                await error_callback(cb_err)
+                        elif self._logger:
+                            self._logger.error(
+                                "Unhandled callback exception: %s (%s)",
+                                cb_err,
+                                type(cb_err).__name__,
+                            )
+                    finally:
+                        if checkpointer is not None:
+                            checkpointer.mark(evt.sequence)
+
+                pool = AsyncCallbackPool(
+                    _run_store_callback,
+                    max_concurrent_callbacks,
+                    name="kubemq-events-store-callback",
+                )
+                pool.start()
+
             while not token.is_cancelled:
                 try:
                     self._ensure_connected()
@@ -1391,6 +1708,8 @@ class AsyncClient(NativeAsyncBaseClient):
                                             _logger.error(
                                                 "Unhandled handler error: %s", handler_error
                                             )
+                                    if checkpointer is not None:
+                                        checkpointer.mark(event.sequence)
                                     self._instrumentor._metrics.record_consumed_message(
                                         "process", subscription.channel
                                     )
@@ -1406,38 +1725,19 @@ class AsyncClient(NativeAsyncBaseClient):
                                         duration, "process", subscription.channel, error_type_val
                                     )
                     else:
-                        sem = asyncio.Semaphore(max_concurrent_callbacks)
-
-                        async def _run_store_callback(
-                            evt: EventStoreReceived, _sem: asyncio.Semaphore = sem
-                        ) -> None:
-                            try:
-                                await callback(evt)
-                            except Exception as cb_err:
-                                if error_callback:
-                                    with contextlib.suppress(Exception):
-                                        await error_callback(cb_err)
-                                elif self._logger:
-                                    self._logger.error(
-                                        "Unhandled callback exception: %s (%s)",
-                                        cb_err,
-                                        type(cb_err).__name__,
-                                    )
-                            finally:
-                                _sem.release()
-
+                        assert pool is not None
+                        submit = pool.submit
                         async for pb_event in self._transport.subscribe_to_events(request, token):
                             attempt = 0
                             event = EventStoreReceived.decode(pb_event)
                             if event.sequence > 0:
                                 last_sequence = event.sequence
+                            if checkpointer is not None:
+                                checkpointer.track(event.sequence)
                             self._instrumentor._metrics.record_consumed_message(
                                 "process", subscription.channel
                             )
-                            await sem.acquire()
-                            task = asyncio.create_task(_run_store_callback(event))
-                            pending_tasks.add(task)
-                            task.add_done_callback(pending_tasks.discard)
+                            await submit(event)
 
                     # Stream ended -- loop back and re-subscribe unless cancelled.
                     if token.is_cancelled:
@@ -1489,10 +1789,159 @@ class AsyncClient(NativeAsyncBaseClient):
                         raise
                     return
         finally:
-            if pending_tasks:
-                await asyncio.gather(*pending_tasks, return_exceptions=True)
+            if pool is not None:
+                await pool.close()
+            if checkpointer is not None:
+                await checkpointer.close()
             await self._unregister_subscription(token)
 
+    async def subscribe_with_batch_callback(
+        self,
+        subscription: EventsSubscription,
+        callback: AsyncEventBatchCallback,
+        error_callback: AsyncErrorCallback | None = None,
+        cancellation_token: AsyncCancellationToken | None = None,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+    ) -> None:
+        """Subscribe to events and deliver them to the callback in batches.
+
+        Events are collected until ``max_batch_size`` are buffered or
+        ``max_batch_delay_ms`` has passed since the first buffered event,
+        then delivered as a list. Batches are delivered in order, one at a
+        time, which lets sinks such as databases do one bulk write per
+        batch. Reconnection and error isolation behave as in
+        :meth:`subscribe_with_callback`; a failing batch is reported via
+        ``error_callback`` and does not terminate the stream.
+
+        Args:
+            subscription: Subscription configuration
+            callback: Async callback receiving a list of events
+            error_callback: Optional async callback for errors
+            cancellation_token: Optional token to cancel subscription
+            max_batch_size: Maximum events per batch (1–10000).
+            max_batch_delay_ms: Maximum time in milliseconds a received
+                event waits before its batch is delivered.
+
+        Raises:
+            ValueError: If ``max_batch_size`` or ``max_batch_delay_ms`` is
+                out of range.
+            KubeMQValidationError: If the subscription configuration is
+                invalid.
+            KubeMQConnectionError: If the server is unreachable or the
+                initial connection fails.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        Cancellation:
+            Pass an ``AsyncCancellationToken`` to cancel the subscription.
+            When cancelled, the partially filled batch is delivered before
+            return.
+
+        See Also:
+            :meth:`subscribe_with_callback`: Per-event callback variant.
+            :meth:`kubemq.pubsub.client.Client.subscribe_to_events_batch`:
+                Sync counterpart.
+        """
+        validate_batch_params(max_batch_size, max_batch_delay_ms)
+        collector: AsyncBatchCollector[EventReceived] = AsyncBatchCollector(
+            self._batch_handler(callback, error_callback, subscription.channel),
+            max_batch_size,
+            max_batch_delay_ms,
+        )
+        collector.start()
+        try:
+            await self.subscribe_with_callback(
+                subscription, collector.add, error_callback, cancellation_token
+            )
+        finally:
+            await collector.close()
+
+    async def subscribe_store_with_batch_callback(
+        self,
+        subscription: EventsStoreSubscription,
+        callback: AsyncEventStoreBatchCallback,
+        error_callback: AsyncErrorCallback | None = None,
+        cancellation_token: AsyncCancellationToken | None = None,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+    ) -> None:
+        """Subscribe to events store and deliver events to the callback in batches.
+
+        Batching semantics are the same as :meth:`subscribe_with_batch_callback`.
+        Sequence tracking and resume-on-reconnect behave as in
+        :meth:`subscribe_store_with_callback`. Events within a batch are in
+        sequence order.
+
+        Args:
+            subscription: Subscription configuration
+            callback: Async callback receiving a list of stored events
+            error_callback: Optional async callback for errors
+            cancellation_token: Optional token to cancel subscription
+            max_batch_size: Maximum events per batch (1–10000).
+            max_batch_delay_ms: Maximum time in milliseconds a received
+                event waits before its batch is delivered.
+
+        Raises:
+            ValueError: If ``max_batch_size`` or ``max_batch_delay_ms`` is
+                out of range.
+            KubeMQValidationError: If the subscription configuration is
+                invalid.
+            KubeMQConnectionError: If the server is unreachable or the
+                initial connection fails.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        Cancellation:
+            Pass an ``AsyncCancellationToken`` to cancel the subscription.
+            When cancelled, the partially filled batch is delivered before
+            return.
+
+        See Also:
+            :meth:`subscribe_store_with_callback`: Per-event callback variant.
+        """
+        validate_batch_params(max_batch_size, max_batch_delay_ms)
+        collector: AsyncBatchCollector[EventStoreReceived] = AsyncBatchCollector(
+            self._batch_handler(callback, error_callback, subscription.channel),
+            max_batch_size,
+            max_batch_delay_ms,
+        )
+        collector.start()
+        try:
+            await self.subscribe_store_with_callback(
+                subscription, collector.add, error_callback, cancellation_token
+            )
+        finally:
+            await collector.close()
+
+    @staticmethod
+    def _batch_handler(
+        callback: Callable[[list[Any]], Awaitable[None]],
+        error_callback: AsyncErrorCallback | None,
+        channel: str,
+    ) -> Callable[[list[Any]], Awaitable[None]]:
+        """Wrap a batch callback so handler errors are isolated and reported."""
+
+        async def _deliver(batch: list[Any]) -> None:
+            try:
+                await callback(batch)
+            except Exception as handler_err:
+                handler_error = KubeMQHandlerError(
+                    f"Batch handler raised {type(handler_err).__name__}: {handler_err}",
+                    cause=handler_err,
+                    operation="BatchMessageHandler",
+                    channel=channel,
+                )
+                if error_callback:
+                    try:
+                        await error_callback(handler_error)
+                    except Exception:
+                        _logger.exception("Error in error_callback itself")
+                else:
+                    _logger.error("Unhandled batch handler error: %s", handler_error)
+
+        return _deliver
+
 
 # Alias for backward compatibility and clearer naming
 AsyncPubSubClient = AsyncClient
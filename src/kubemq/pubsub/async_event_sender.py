@@ -10,14 +10,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING
 
 import grpc
 
+from kubemq._internal.rate_control import AimdRateController
 from kubemq.grpc import Event, Result
 
 if TYPE_CHECKING:
+    from kubemq.core.config import AdaptiveRateConfig
+    from kubemq.core.stage_timer import StageTimer
     from kubemq.transport.async_transport import AsyncTransport
 
 DEFAULT_SEND_QUEUE_SIZE = 50_000
@@ -43,6 +47,8 @@ class AsyncEventSender:
         *,
         max_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
         reconnect_interval: float = 1.0,
+        stage_timer: StageTimer | None = None,
+        adaptive_rate: AdaptiveRateConfig | None = None,
     ) -> None:
         self._transport = transport
         self._send_queue: asyncio.Queue[Event | object] = asyncio.Queue(maxsize=max_queue_size)
@@ -51,6 +57,12 @@ class AsyncEventSender:
         self._allow_new_messages = True
         self._reconnect_interval = reconnect_interval
         self._loop_task: asyncio.Task[None] | None = None
+        # Sampled stage timing: EventID -> enqueue time, then write time.
+        self._stages = stage_timer.probe("events") if stage_timer is not None else None
+        self._enqueued_at: dict[str, float] = {}
+        self._written_at: dict[str, float] = {}
+        # Optional AIMD pacing of send()/submit().
+        self._rate = AimdRateController(adaptive_rate) if adaptive_rate is not None else None
 
     async def start(self) -> None:
         """Start the background stream loop."""
@@ -62,12 +74,21 @@ class AsyncEventSender:
 
         Fire-and-forget (Store=False): enqueue and return immediately.
         Store (Store=True): enqueue, await server confirmation via Future.
+        With adaptive rate control, first waits for the controller to admit
+        the event.
         """
         if self._closed:
             raise ConnectionError("AsyncEventSender is closed.")
         if not self._allow_new_messages:
             raise ConnectionError("Sender is not ready to accept new messages.")
 
+        rate = self._rate
+        if rate is not None:
+            await rate.acquire(self._send_queue.qsize(), self._send_queue.maxsize)
+
+        if self._stages is not None and self._stages.sample():
+            self._enqueued_at[event.EventID] = time.perf_counter()
+
         if not event.Store:
             # Fire-and-forget: non-blocking enqueue.
             # MUST NOT use await put() — that blocks the event loop when the
@@ -81,6 +102,9 @@ class AsyncEventSender:
                 try:
                     self._send_queue.put_nowait(event)
                 except asyncio.QueueFull:
+                    self._enqueued_at.pop(event.EventID, None)
+                    if rate is not None:
+                        rate.on_error()
                     from kubemq.core.exceptions import KubeMQBufferFullError
 
                     raise KubeMQBufferFullError(
@@ -95,10 +119,46 @@ class AsyncEventSender:
         self._response_tracking[event.EventID] = future
 
         await self._send_queue.put(event)
+        if rate is not None:
+            future.add_done_callback(self._confirmation_callback(rate))
         try:
             return await future
         finally:
             self._response_tracking.pop(event.EventID, None)
+            self._enqueued_at.pop(event.EventID, None)
+            self._written_at.pop(event.EventID, None)
+
+    async def submit(self, event: Event) -> asyncio.Future[Result]:
+        """Enqueue a Store event and return its confirmation Future.
+
+        Unlike :meth:`send`, does not wait for the confirmation; the caller
+        bounds how many submissions are outstanding. The tracking entry is
+        dropped when the Future completes.
+        """
+        if self._closed:
+            raise ConnectionError("AsyncEventSender is closed.")
+        if not self._allow_new_messages:
+            raise ConnectionError("Sender is not ready to accept new messages.")
+
+        rate = self._rate
+        if rate is not None:
+            await rate.acquire(self._send_queue.qsize(), self._send_queue.maxsize)
+
+        event_id = event.EventID
+        if self._stages is not None and self._stages.sample():
+            self._enqueued_at[event_id] = time.perf_counter()
+        future: asyncio.Future[Result] = asyncio.get_running_loop().create_future()
+        self._response_tracking[event_id] = future
+        future.add_done_callback(lambda _: self._forget(event_id))
+        if rate is not None:
+            future.add_done_callback(self._confirmation_callback(rate))
+        try:
+            await self._send_queue.put(event)
+        except BaseException:
+            self._enqueued_at.pop(event_id, None)
+            future.cancel()
+            raise
+        return future
 
     async def _stream_loop(self) -> None:
         """Outer reconnection loop."""
@@ -147,6 +207,14 @@ class AsyncEventSender:
             msg = await self._send_queue.get()
             if msg is _SENTINEL:
                 break
+            if self._enqueued_at:
+                event: Event = msg  # type: ignore[assignment]
+                enqueued = self._enqueued_at.pop(event.EventID, None)
+                if enqueued is not None:
+                    dequeued = time.perf_counter()
+                    yield event
+                    self._record_write(event, enqueued, dequeued)
+                    continue
             yield msg  # type: ignore[misc]
 
     async def _receive_responses(self, call: grpc.aio.StreamStreamCall) -> None:
@@ -159,6 +227,9 @@ class AsyncEventSender:
             async for response in call:
                 if self._closed:
                     break
+                if self._written_at:
+                    self._resolve_timed(response)
+                    continue
                 future = self._response_tracking.get(response.EventID)
                 if future and not future.done():
                     future.set_result(response)
@@ -168,9 +239,52 @@ class AsyncEventSender:
 
                 raise from_grpc_error(e) from e
 
+    @staticmethod
+    def _confirmation_callback(
+        rate: AimdRateController,
+    ) -> Callable[[asyncio.Future[Result]], None]:
+        """Return a done-callback that reports a confirmation to ``rate``."""
+        started = time.monotonic()
+
+        def report(future: asyncio.Future[Result]) -> None:
+            ok = not future.cancelled() and future.exception() is None and future.result().Sent
+            rate.on_result(time.monotonic() - started, ok)
+
+        return report
+
+    def _record_write(self, event: Event, enqueued: float, dequeued: float) -> None:
+        """Record queue wait and write time for a sampled event."""
+        assert self._stages is not None
+        written = time.perf_counter()
+        self._stages.record("queue_wait", dequeued - enqueued)
+        self._stages.record("write", written - dequeued)
+        if event.Store and event.EventID in self._response_tracking:
+            self._written_at[event.EventID] = written
+
+    def _resolve_timed(self, response: Result) -> None:
+        """Resolve a Future, timing the response wait and demux if sampled."""
+        received = time.perf_counter()
+        written = self._written_at.pop(response.EventID, None)
+        future = self._response_tracking.get(response.EventID)
+        if future and not future.done():
+            future.set_result(response)
+        if written is not None and self._stages is not None:
+            self._stages.record("response", received - written)
+            self._stages.record("demux", time.perf_counter() - received)
+
+    def _forget(self, event_id: str) -> None:
+        """Drop the tracking and stage-timing entries for ``event_id``."""
+        self._response_tracking.pop(event_id, None)
+        self._enqueued_at.pop(event_id, None)
+        self._written_at.pop(event_id, None)
+
     def _handle_disconnection(self) -> None:
         """Signal error to all pending Futures and drain the queue."""
         self._allow_new_messages = False
+        self._enqueued_at.clear()
+        self._written_at.clear()
+        if self._rate is not None:
+            self._rate.on_error()
         for event_id, future in self._response_tracking.items():
             if not future.done():
                 error_result = Result(
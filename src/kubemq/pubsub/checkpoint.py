@@ -0,0 +1,341 @@
+"""Durable resume offsets for events-store subscriptions.
+
+The events-store subscriptions already resume from the last received
+sequence after a reconnect, but that position lives in memory and is lost
+when the process restarts. A :class:`CheckpointStore` persists the last
+processed sequence under a key so a restarted consumer resumes with
+``StartAtSequence`` instead of replaying from the first event.
+
+Commits are batched: the subscription only records the sequence in memory
+per message, and an :class:`AsyncCheckpointer` writes it to the store every
+``commit_interval_seconds`` or every ``commit_every`` messages (whichever
+comes first) on a worker thread, so store I/O never runs on the per-message
+path or blocks the event loop. After a crash at most one commit interval of
+events is redelivered -- delivery is at-least-once.
+
+Example:
+    store = SQLiteCheckpointStore("offsets.db")
+    async for event in client.subscribe_to_events_store_fast(
+        subscription, token, checkpoint_store=store
+    ):
+        handle(event)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Protocol, runtime_checkable
+
+_logger = logging.getLogger("kubemq.pubsub.checkpoint")
+
+DEFAULT_COMMIT_INTERVAL_SECONDS = 1.0
+DEFAULT_COMMIT_EVERY = 1000
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    """Pluggable persistence for events-store subscription offsets.
+
+    Implementations are called from a worker thread, never from the event
+    loop, and may block. Calls for one key are serialized by the SDK, but a
+    store shared by several subscriptions must be thread-safe.
+    """
+
+    def load(self, key: str) -> int | None:
+        """Return the last committed sequence for ``key``, or None."""
+        ...
+
+    def save(self, key: str, sequence: int) -> None:
+        """Durably record ``sequence`` as the last processed one for ``key``."""
+        ...
+
+
+def default_checkpoint_key(channel: str, group: str | None = None) -> str:
+    """Build the default checkpoint key for a subscription."""
+    return f"{channel}#{group}" if group else channel
+
+
+class MemoryCheckpointStore:
+    """In-process checkpoint store, mainly useful for tests.
+
+    Thread Safety:
+        Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._offsets: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> int | None:
+        """Return the last committed sequence for ``key``, or None."""
+        with self._lock:
+            return self._offsets.get(key)
+
+    def save(self, key: str, sequence: int) -> None:
+        """Record ``sequence`` as the last processed one for ``key``."""
+        with self._lock:
+            self._offsets[key] = sequence
+
+
+class FileCheckpointStore:
+    """Checkpoint store backed by a single JSON file.
+
+    The whole key -> sequence map is rewritten on each save via a temporary
+    file and ``os.replace``, so a crash mid-write never leaves a torn file.
+    Suitable for a handful of subscriptions per process; use
+    :class:`SQLiteCheckpointStore` for many keys or several processes.
+
+    Args:
+        path: Location of the JSON file. Parent directories are created.
+        fsync: If True (default), fsync the file before replacing it.
+
+    Thread Safety:
+        Thread-safe within one process.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, fsync: bool = True) -> None:
+        self._path = os.fspath(path)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._offsets: dict[str, int] | None = None
+
+    @property
+    def path(self) -> str:
+        """Location of the backing JSON file."""
+        return self._path
+
+    def load(self, key: str) -> int | None:
+        """Return the last committed sequence for ``key``, or None."""
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, sequence: int) -> None:
+        """Record ``sequence`` as the last processed one for ``key``."""
+        with self._lock:
+            offsets = self._read()
+            offsets[key] = sequence
+            self._write(offsets)
+
+    def _read(self) -> dict[str, int]:
+        if self._offsets is None:
+            try:
+                with open(self._path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._offsets = {str(k): int(v) for k, v in data.items()}
+            except FileNotFoundError:
+                self._offsets = {}
+        return self._offsets
+
+    def _write(self, offsets: dict[str, int]) -> None:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".kubemq-checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(offsets, f, sort_keys=True)
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+class SQLiteCheckpointStore:
+    """Checkpoint store backed by a SQLite database (stdlib ``sqlite3``).
+
+    Uses WAL journaling so several consumer processes can share one
+    database file. Each save is a single-row upsert.
+
+    Args:
+        path: Database file, or ``":memory:"``.
+        table: Table name for the offsets (created if missing).
+
+    Thread Safety:
+        Thread-safe. The connection is shared and guarded by a lock.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, table: str = "kubemq_checkpoints") -> None:
+        if not table.replace("_", "").isalnum():
+            raise ValueError(f"invalid table name: {table!r}")
+        self._table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.fspath(path), check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if os.fspath(path) != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, sequence INTEGER NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> int | None:
+        """Return the last committed sequence for ``key``, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT sequence FROM {self._table} WHERE key = ?", (key,)
+            ).fetchone()
+        return int(row[0]) if row is not None else None
+
+    def save(self, key: str, sequence: int) -> None:
+        """Record ``sequence`` as the last processed one for ``key``."""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO {self._table} (key, sequence, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET sequence = excluded.sequence, "
+                "updated_at = excluded.updated_at",
+                (key, sequence, time.time()),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class AsyncCheckpointer:
+    """Batch sequence commits for one subscription onto a worker thread.
+
+    :meth:`mark` is cheap and synchronous; it only updates in-memory state.
+    A background task commits the highest contiguous processed sequence
+    every ``commit_interval_seconds``, or sooner once ``commit_every``
+    messages have been marked since the last commit.
+
+    When callbacks run concurrently, messages can finish out of order.
+    Sequences registered with :meth:`track` are only committed once every
+    earlier tracked sequence has also been marked, so a crash never skips
+    an unprocessed event.
+
+    Thread Safety:
+        Not thread-safe. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        key: str,
+        *,
+        commit_interval_seconds: float = DEFAULT_COMMIT_INTERVAL_SECONDS,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+    ) -> None:
+        if commit_interval_seconds <= 0:
+            raise ValueError("commit_interval_seconds must be > 0")
+        if commit_every < 1:
+            raise ValueError("commit_every must be >= 1")
+        self._store = store
+        self._key = key
+        self._interval = commit_interval_seconds
+        self._commit_every = commit_every
+        self._pending = 0
+        self._committed = 0
+        self._since_commit = 0
+        self._inflight: OrderedDict[int, bool] = OrderedDict()
+        self._kick: asyncio.Event | None = None
+        self._commit_lock: asyncio.Lock | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def key(self) -> str:
+        """Checkpoint key in the store."""
+        return self._key
+
+    @property
+    def pending(self) -> int:
+        """Highest processed sequence, committed or not."""
+        return self._pending
+
+    @property
+    def committed(self) -> int:
+        """Last sequence written to the store by this checkpointer."""
+        return self._committed
+
+    async def load(self) -> int | None:
+        """Read the stored sequence for this key (off the event loop)."""
+        sequence = await asyncio.to_thread(self._store.load, self._key)
+        if sequence is not None and sequence > self._committed:
+            self._committed = self._pending = sequence
+        return sequence
+
+    def start(self) -> None:
+        """Start the periodic commit task (idempotent). Requires a running loop."""
+        if self._task is not None:
+            return
+        self._kick = asyncio.Event()
+        self._commit_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="kubemq-checkpoint")
+
+    def track(self, sequence: int) -> None:
+        """Register an in-flight sequence whose completion may be out of order."""
+        if sequence > 0:
+            self._inflight[sequence] = False
+
+    def mark(self, sequence: int) -> None:
+        """Record ``sequence`` as processed."""
+        if sequence <= 0:
+            return
+        inflight = self._inflight
+        if sequence in inflight:
+            inflight[sequence] = True
+            # Advance over the contiguous run of finished sequences.
+            while inflight:
+                first, done = next(iter(inflight.items()))
+                if not done:
+                    break
+                inflight.popitem(last=False)
+                self._pending = max(self._pending, first)
+        elif not inflight and sequence > self._pending:
+            self._pending = sequence
+        self._count()
+
+    def _count(self) -> None:
+        self._since_commit += 1
+        if self._since_commit >= self._commit_every and self._kick is not None:
+            self._kick.set()
+
+    async def commit(self) -> None:
+        """Write the pending sequence to the store now, if it advanced."""
+        if self._commit_lock is None:
+            self._commit_lock = asyncio.Lock()
+        async with self._commit_lock:
+            sequence = self._pending
+            if sequence <= self._committed:
+                return
+            self._since_commit = 0
+            await asyncio.to_thread(self._store.save, self._key, sequence)
+            self._committed = sequence
+
+    async def close(self) -> None:
+        """Stop the commit task and flush the final position."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        try:
+            await self.commit()
+        except Exception:
+            _logger.exception("Final checkpoint commit failed for %s", self._key)
+
+    async def _run(self) -> None:
+        assert self._kick is not None
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._kick.wait(), timeout=self._interval)
+            self._kick.clear()
+            try:
+                await self.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep the in-memory position; the next tick retries.
+                _logger.warning("Checkpoint commit failed for %s: %s", self._key, e)
@@ -7,11 +7,17 @@ import contextlib
 import dataclasses
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import grpc
 
+from kubemq._internal.batching import (
+    DEFAULT_MAX_BATCH_DELAY_MS,
+    DEFAULT_MAX_BATCH_SIZE,
+    BatchCollector,
+)
 from kubemq._internal.deprecation import deprecated, deprecated_async
 from kubemq._internal.retry import BackoffCalculator
 from kubemq._internal.telemetry import (
@@ -546,7 +552,9 @@ class Client(BaseClient):
             KubeMQError: If the server rejects the request (e.g., channel
                 already exists or invalid name).
         """
-        return create_channel_request(self._transport, self._config.client_id, channel, "events")
+        return create_channel_request(
+            self._transport, self._config.client_id, channel, "events", cache=self._channel_cache
+        )
 
     async def create_events_channel_async(self, channel: str) -> bool | None:
         """Create an events channel asynchronously.
@@ -584,7 +592,11 @@ class Client(BaseClient):
                 already exists or invalid name).
         """
         return create_channel_request(
-            self._transport, self._config.client_id, channel, "events_store"
+            self._transport,
+            self._config.client_id,
+            channel,
+            "events_store",
+            cache=self._channel_cache,
         )
 
     async def create_events_store_channel_async(self, channel: str) -> bool | None:
@@ -621,7 +633,9 @@ class Client(BaseClient):
             KubeMQChannelError: If the channel does not exist.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return delete_channel_request(self._transport, self._config.client_id, channel, "events")
+        return delete_channel_request(
+            self._transport, self._config.client_id, channel, "events", cache=self._channel_cache
+        )
 
     async def delete_events_channel_async(self, channel: str) -> bool | None:
         """Delete an events channel asynchronously.
@@ -658,7 +672,11 @@ class Client(BaseClient):
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
         return delete_channel_request(
-            self._transport, self._config.client_id, channel, "events_store"
+            self._transport,
+            self._config.client_id,
+            channel,
+            "events_store",
+            cache=self._channel_cache,
         )
 
     async def delete_events_store_channel_async(self, channel: str) -> bool | None:
@@ -698,7 +716,11 @@ class Client(BaseClient):
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
         return list_pubsub_channels(
-            self._transport, self._config.client_id, "events", channel_search
+            self._transport,
+            self._config.client_id,
+            "events",
+            channel_search,
+            cache=self._channel_cache,
         )
 
     async def list_events_channels_async(self, channel_search: str = "") -> list[PubSubChannel]:
@@ -740,7 +762,11 @@ class Client(BaseClient):
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
         return list_pubsub_channels(
-            self._transport, self._config.client_id, "events_store", channel_search
+            self._transport,
+            self._config.client_id,
+            "events_store",
+            channel_search,
+            cache=self._channel_cache,
         )
 
     async def list_events_store_channels_async(
@@ -873,6 +899,124 @@ class Client(BaseClient):
         """
         self._subscribe(subscription, cancel)
 
+    def subscribe_to_events_batch(
+        self,
+        subscription: EventsSubscription,
+        batch_callback: Callable[[list[EventReceived]], None],
+        cancel: CancellationToken | None = None,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+    ) -> None:
+        """Subscribe to events and deliver them to a callback in batches.
+
+        Behaves like :meth:`subscribe_to_events`, but events are collected
+        until ``max_batch_size`` are buffered or ``max_batch_delay_ms`` has
+        passed since the first buffered event, then delivered as a list.
+        The subscription's ``on_receive_event_callback`` is not called.
+        Batch handler errors are reported to ``on_error_callback`` and do
+        not terminate the stream.
+
+        Args:
+            subscription: The subscription configuration (channel, group,
+                error callback).
+            batch_callback: Called with each batch of events.
+            cancel: Optional cancellation token to stop the subscription.
+                The partially filled batch is delivered on cancellation.
+            max_batch_size: Maximum events per batch (1–10000).
+            max_batch_delay_ms: Maximum time in milliseconds a received
+                event waits before its batch is delivered.
+
+        Raises:
+            ValueError: If ``max_batch_size`` or ``max_batch_delay_ms`` is
+                out of range.
+            KubeMQConnectionError: If the server is unreachable or the
+                initial connection fails.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        Callback Concurrency:
+            Batches are delivered one at a time, in order, from either the
+            subscription thread (full batch) or a timer thread (partial
+            batch after the delay).
+
+        See Also:
+            :meth:`subscribe_to_events`: Per-event callback variant.
+            :meth:`kubemq.pubsub.async_client.AsyncClient.subscribe_with_batch_callback`:
+                Async counterpart.
+        """
+        self._subscribe_batch(
+            subscription, batch_callback, cancel, max_batch_size, max_batch_delay_ms
+        )
+
+    def subscribe_to_events_store_batch(
+        self,
+        subscription: EventsStoreSubscription,
+        batch_callback: Callable[[list[EventStoreReceived]], None],
+        cancel: CancellationToken | None = None,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_delay_ms: int = DEFAULT_MAX_BATCH_DELAY_MS,
+    ) -> None:
+        """Subscribe to events store and deliver events to a callback in batches.
+
+        Batching semantics are the same as :meth:`subscribe_to_events_batch`;
+        replay and resume-on-reconnect behave as in
+        :meth:`subscribe_to_events_store`.
+
+        Args:
+            subscription: The subscription configuration (channel, store
+                type, error callback).
+            batch_callback: Called with each batch of stored events.
+            cancel: Optional cancellation token to stop the subscription.
+            max_batch_size: Maximum events per batch (1–10000).
+            max_batch_delay_ms: Maximum time in milliseconds a received
+                event waits before its batch is delivered.
+
+        Raises:
+            ValueError: If ``max_batch_size`` or ``max_batch_delay_ms`` is
+                out of range.
+            KubeMQConnectionError: If the server is unreachable or the
+                initial connection fails.
+            KubeMQClientClosedError: If the client has already been closed.
+        """
+        self._subscribe_batch(
+            subscription, batch_callback, cancel, max_batch_size, max_batch_delay_ms
+        )
+
+    def _subscribe_batch(
+        self,
+        subscription: EventsSubscription | EventsStoreSubscription,
+        batch_callback: Callable[[list[Any]], None],
+        cancel: CancellationToken | None,
+        max_batch_size: int,
+        max_batch_delay_ms: int,
+    ) -> None:
+        """Route a subscription's per-event callback through a batch collector."""
+        self._ensure_connected()
+        if cancel is None:
+            cancel = CancellationToken()
+
+        def _on_batch_error(err: Exception) -> None:
+            handler_error = KubeMQHandlerError(
+                f"Batch handler raised {type(err).__name__}: {err}",
+                cause=err,
+                operation="BatchMessageHandler",
+            )
+            subscription.raise_on_error(str(handler_error))
+
+        collector: BatchCollector[Any] = BatchCollector(
+            batch_callback,
+            max_batch_size,
+            max_batch_delay_ms,
+            on_error=_on_batch_error,
+            stop_events=(cancel.event, self._shutdown_event),
+        )
+        self._register_subscription_thread(collector.thread)
+        self._subscribe(
+            dataclasses.replace(subscription, on_receive_event_callback=collector.add),
+            cancel,
+        )
+
     def _subscribe(
         self,
         subscription: EventsSubscription | EventsStoreSubscription,
@@ -95,7 +95,7 @@ class EventSender:
         response_raw = response_container.get("response")
         response: Result | None = response_raw if isinstance(response_raw, Result) else None
         with self.lock:
-            del self.response_tracking[event.EventID]
+            self.response_tracking.pop(event.EventID, None)
         return response
 
     def handle_disconnection(self) -> None:
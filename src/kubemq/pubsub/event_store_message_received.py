@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from kubemq._internal import delivery_latency
 from kubemq.grpc import EventReceive as pbEventReceive
 
 
@@ -50,6 +51,9 @@ class EventStoreReceived:
             event_receive.Tags.get("x-kubemq-client-id", "") if event_receive.Tags else ""
         )
         tags = dict(event_receive.Tags) if event_receive.Tags else {}
+        probe = delivery_latency.active
+        if probe is not None:
+            probe.record("events_store", event_receive.Timestamp)
 
         return cls(
             id=event_receive.EventID,
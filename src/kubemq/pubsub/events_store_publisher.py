@@ -0,0 +1,272 @@
+"""Pipelined events-store publishing with a bounded in-flight window.
+
+``send_event_store`` waits for each confirmation before returning, and
+``send_events_store_batch`` gets concurrency by fanning out one coroutine
+per message, with nothing tying the send rate to how fast the broker
+confirms. :class:`EventsStorePublisher` pipelines instead: ``publish()``
+writes the event onto the client's shared events stream and returns as soon
+as it is on the wire, while confirmations come back in publish order
+through ``confirmations()``.
+
+Flow control is credit-based. The publisher starts with ``window`` credits;
+each publish takes one and blocks when none are left, and a credit is
+returned as soon as the broker confirms, so a slow broker throttles the
+producer. With ordered confirmations (the default) results also queue up
+for ``confirmations()`` until they are read; a producer that never reads
+them should pass ``ordered_confirmations=False``.
+
+Example:
+    async with client.events_store_publisher(window=512) as publisher:
+
+        async def produce():
+            for payload in payloads:
+                await publisher.publish(EventStoreMessage(channel="orders", body=payload))
+            await publisher.close()
+
+        producer = asyncio.create_task(produce())
+        async for result in publisher.confirmations():
+            if not result.sent:
+                log.error("event %s failed: %s", result.id, result.error)
+        await producer
+        print(publisher.stats().confirm_latency.percentile(99))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from kubemq._internal.histogram import BucketHistogram
+from kubemq._internal.telemetry import KubeMQTagsCarrier
+from kubemq.core.exceptions import (
+    KubeMQClientClosedError,
+    KubeMQTimeoutError,
+    KubeMQValidationError,
+)
+from kubemq.core.types import LatencyHistogram
+from kubemq.pubsub.event_send_result import EventStoreResult
+
+if TYPE_CHECKING:
+    from kubemq.grpc import Result
+    from kubemq.pubsub.async_client import AsyncClient
+    from kubemq.pubsub.event_store_message import EventStoreMessage
+
+DEFAULT_PUBLISH_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class PublisherStats:
+    """Snapshot of an :class:`EventsStorePublisher`.
+
+    Attributes:
+        window: Configured number of credits.
+        in_flight: Events published and not yet confirmed by the broker.
+        published: Events written to the stream.
+        confirmed: Events the broker stored.
+        failed: Events the broker rejected or that were lost on disconnect.
+        confirm_latency: Time from publish to broker confirmation.
+    """
+
+    window: int
+    in_flight: int
+    published: int
+    confirmed: int
+    failed: int
+    confirm_latency: LatencyHistogram
+
+
+class EventsStorePublisher:
+    """Publishes events-store messages with a fixed window of credits.
+
+    Create with :meth:`AsyncPubSubClient.events_store_publisher`.
+
+    Args:
+        client: Connected async PubSub client whose events stream is used.
+        window: Maximum events published and not yet confirmed by the
+            broker.
+        ordered_confirmations: If True, results are queued in publish order
+            for :meth:`confirmations`. If False, results are only available
+            from the futures returned by :meth:`publish`.
+
+    Thread Safety:
+        Not thread-safe. Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        window: int = DEFAULT_PUBLISH_WINDOW,
+        ordered_confirmations: bool = True,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self._client = client
+        self._window = window
+        self._ordered = ordered_confirmations
+        self._credits = asyncio.Semaphore(window)
+        self._pending: deque[asyncio.Future[EventStoreResult]] = deque()
+        self._pending_added = asyncio.Event()
+        self._outstanding: set[asyncio.Future[EventStoreResult]] = set()
+        self._latency = BucketHistogram()
+        self._published = 0
+        self._confirmed = 0
+        self._failed = 0
+        self._closed = False
+
+    @property
+    def window(self) -> int:
+        """Configured number of credits."""
+        return self._window
+
+    @property
+    def in_flight(self) -> int:
+        """Events published and not yet confirmed by the broker."""
+        return len(self._outstanding)
+
+    async def publish(self, message: EventStoreMessage) -> asyncio.Future[EventStoreResult]:
+        """Write one event to the stream once a credit is available.
+
+        Args:
+            message: The event to store.
+
+        Returns:
+            A future resolved with the broker's result. Awaiting it is
+            optional; the same result is also delivered by
+            :meth:`confirmations`.
+
+        Raises:
+            KubeMQClientClosedError: If the publisher has been closed.
+            KubeMQValidationError: If the message fails validation.
+            KubeMQConnectionError: If the client is not connected.
+        """
+        if self._closed:
+            raise KubeMQClientClosedError("EventsStorePublisher is closed")
+        client = self._client
+        client._validate_message_size(message.body)
+        await self._credits.acquire()
+        try:
+            try:
+                pb_event = message.encode(client._config.client_id or "")
+            except (ValueError, TypeError) as e:
+                raise KubeMQValidationError(str(e), is_retryable=False) from e
+            tags_dict = dict(pb_event.Tags)
+            KubeMQTagsCarrier(tags_dict).inject()
+            pb_event.Tags.update(tags_dict)
+            sender = await client._get_event_sender()
+            started = time.perf_counter()
+            confirmation = await sender.submit(pb_event)
+        except BaseException:
+            self._credits.release()
+            raise
+
+        result: asyncio.Future[EventStoreResult] = asyncio.get_running_loop().create_future()
+        self._published += 1
+        self._outstanding.add(result)
+        if self._ordered:
+            self._pending.append(result)
+            self._pending_added.set()
+        event_id = pb_event.EventID
+        confirmation.add_done_callback(
+            lambda done: self._on_confirmation(done, result, started, event_id, message.channel)
+        )
+        return result
+
+    def _on_confirmation(
+        self,
+        confirmation: asyncio.Future[Result],
+        result: asyncio.Future[EventStoreResult],
+        started: float,
+        event_id: str,
+        channel: str,
+    ) -> None:
+        self._latency.record(time.perf_counter() - started)
+        self._outstanding.discard(result)
+        if confirmation.cancelled() or confirmation.exception() is not None:
+            error = "cancelled" if confirmation.cancelled() else str(confirmation.exception())
+            outcome = EventStoreResult(id=event_id, sent=False, error=error)
+        else:
+            outcome = EventStoreResult.decode(confirmation.result())
+        if outcome.sent:
+            self._confirmed += 1
+            self._client._instrumentor._metrics.record_sent_message("publish", channel)
+        else:
+            self._failed += 1
+        if not result.done():
+            result.set_result(outcome)
+        self._credits.release()
+
+    async def confirmations(self) -> AsyncIterator[EventStoreResult]:
+        """Yield broker results in publish order.
+
+        Ends once the publisher is closed and every published event has been
+        delivered. Requires ``ordered_confirmations=True``.
+
+        Yields:
+            EventStoreResult: One per published event. Failures are yielded
+            with ``sent=False``, not raised.
+        """
+        if not self._ordered:
+            raise RuntimeError("confirmations() requires ordered_confirmations=True")
+        while True:
+            while not self._pending:
+                if self._closed:
+                    return
+                self._pending_added.clear()
+                await self._pending_added.wait()
+            outcome = await self._pending[0]
+            self._pending.popleft()
+            yield outcome
+
+    async def flush(self, timeout_seconds: float | None = None) -> None:
+        """Wait until every published event has been confirmed.
+
+        Args:
+            timeout_seconds: How long to wait. Defaults to the client's
+                ``default_timeout_seconds``.
+
+        Raises:
+            KubeMQTimeoutError: If events are still unconfirmed when the
+                timeout expires.
+        """
+        if not self._outstanding:
+            return
+        if timeout_seconds is None:
+            timeout_seconds = self._client._config.default_timeout_seconds
+        _, unconfirmed = await asyncio.wait(set(self._outstanding), timeout=timeout_seconds)
+        if unconfirmed:
+            raise KubeMQTimeoutError(
+                f"{len(unconfirmed)} events still unconfirmed after {timeout_seconds}s"
+            )
+
+    async def close(self) -> None:
+        """Stop accepting publishes and let :meth:`confirmations` finish.
+
+        Already-published events are still confirmed and delivered.
+        """
+        self._closed = True
+        self._pending_added.set()
+
+    def stats(self) -> PublisherStats:
+        """Return counters and the confirmation latency distribution."""
+        return PublisherStats(
+            window=self._window,
+            in_flight=len(self._outstanding),
+            published=self._published,
+            confirmed=self._confirmed,
+            failed=self._failed,
+            confirm_latency=self._latency.snapshot(),
+        )
+
+    async def __aenter__(self) -> EventsStorePublisher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        try:
+            await self.flush()
+        finally:
+            await self.close()
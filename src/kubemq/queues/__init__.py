@@ -1,11 +1,74 @@
-from .async_client import AsyncClient, AsyncQueuesClient, AsyncQueuesPollResponse
-from .client import *  # noqa: F403
-from .downstream_receiver import *  # noqa: F403
-from .queues_message import *  # noqa: F403
-from .queues_message_received import *  # noqa: F403
-from .queues_messages_waiting_pulled import *  # noqa: F403
-from .queues_poll_request import *  # noqa: F403
-from .queues_poll_response import *  # noqa: F403
-from .queues_send_result import *  # noqa: F403
-from .queues_send_result import QueueBatchSendResult
-from .upstream_sender import *  # noqa: F403
+from typing import TYPE_CHECKING
+
+from kubemq._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    # Redundant aliases mark these as re-exports, as the star imports did.
+    from .async_client import (
+        AsyncClient as AsyncClient,
+        AsyncQueuesClient as AsyncQueuesClient,
+        AsyncQueuesPollResponse as AsyncQueuesPollResponse,
+    )
+    from .client import Client as Client
+    from .downstream_receiver import DownstreamReceiver as DownstreamReceiver
+    from .queues_message import QueueMessage as QueueMessage
+    from .queues_message_received import QueueMessageReceived as QueueMessageReceived
+    from .queues_messages_waiting_pulled import (
+        QueueMessagesBase as QueueMessagesBase,
+        QueueMessagesPulled as QueueMessagesPulled,
+        QueueMessagesWaiting as QueueMessagesWaiting,
+        QueueMessageWaitingPulled as QueueMessageWaitingPulled,
+    )
+    from .queues_poll_request import QueuesPollRequest as QueuesPollRequest
+    from .queues_poll_response import (
+        QueuesPollResponse as QueuesPollResponse,
+        ResponseHandlerProtocol as ResponseHandlerProtocol,
+    )
+    from .queues_send_result import (
+        QueueBatchSendResult as QueueBatchSendResult,
+        QueueSendResult as QueueSendResult,
+    )
+    from .upstream_sender import UpstreamSender as UpstreamSender
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".async_client": (
+            "AsyncClient",
+            "AsyncQueuesClient",
+            "AsyncQueuesPollResponse",
+        ),
+        ".client": ("Client",),
+        ".downstream_receiver": ("DownstreamReceiver",),
+        ".queues_message": ("QueueMessage",),
+        ".queues_message_received": ("QueueMessageReceived",),
+        ".queues_messages_waiting_pulled": (
+            "QueueMessagesBase",
+            "QueueMessagesPulled",
+            "QueueMessagesWaiting",
+            "QueueMessageWaitingPulled",
+        ),
+        ".queues_poll_request": ("QueuesPollRequest",),
+        ".queues_poll_response": (
+            "QueuesPollResponse",
+            "ResponseHandlerProtocol",
+        ),
+        ".queues_send_result": (
+            "QueueBatchSendResult",
+            "QueueSendResult",
+        ),
+        ".upstream_sender": ("UpstreamSender",),
+    },
+    # Names the former ``from .module import *`` lines also re-exported.
+    fallback=(
+        ".client",
+        ".downstream_receiver",
+        ".queues_message",
+        ".queues_message_received",
+        ".queues_messages_waiting_pulled",
+        ".queues_poll_request",
+        ".queues_poll_response",
+        ".queues_send_result",
+        ".upstream_sender",
+    ),
+)
@@ -6,12 +6,13 @@ import asyncio
 import logging
 import time
 import uuid
-from collections.abc import AsyncIterator, Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import (
     TYPE_CHECKING,
     Any,
 )
 
+from kubemq._internal.bulk_encode import encode_bulk
 from kubemq._internal.retry import BackoffCalculator
 from kubemq._internal.telemetry import KubeMQTagsCarrier, error_code_to_error_type
 from kubemq.common.async_cancellation_token import AsyncCancellationToken
@@ -33,6 +34,7 @@ _logger = logging.getLogger("kubemq.queues.async_client")
 # Type aliases for callbacks
 AsyncMessageCallback = Callable[[QueueMessageReceived], Awaitable[None]]
 AsyncErrorCallback = Callable[[Exception], Awaitable[None]]
+AsyncMessageBatchCallback = Callable[[list[QueueMessageReceived]], Awaitable[None]]
 
 
 class AsyncQueuesPollResponse:
@@ -120,6 +122,66 @@ class AsyncQueuesPollResponse:
 
         self.is_transaction_completed = True
 
+    async def ack_range(self, messages: list[QueueMessageReceived] | None = None) -> None:
+        """Acknowledge a set of messages with a single AckRange request.
+
+        Args:
+            messages: Messages to acknowledge. Defaults to all messages in
+                the response.
+        """
+        await self._do_range_operation(pb.QueuesDownstreamRequestType.AckRange, messages)
+
+    async def reject_range(self, messages: list[QueueMessageReceived] | None = None) -> None:
+        """Reject a set of messages with a single NAckRange request.
+
+        Args:
+            messages: Messages to reject. Defaults to all messages in the
+                response.
+        """
+        await self._do_range_operation(pb.QueuesDownstreamRequestType.NAckRange, messages)
+
+    async def _do_range_operation(
+        self,
+        request_type: int,
+        messages: list[QueueMessageReceived] | None,
+    ) -> None:
+        """Settle several messages of this transaction in one request."""
+        if self.is_auto_acked:
+            raise ValueError("Messages are auto-acknowledged")
+        if self.is_transaction_completed:
+            raise ValueError("Transaction is already completed")
+        targets = self.messages if messages is None else messages
+        if not targets:
+            return
+        for msg in targets:
+            if msg.is_completed:
+                raise ValueError(f"message {msg.sequence} is already completed")
+
+        request = pb.QueuesDownstreamRequest()
+        request.RequestID = str(uuid.uuid4())
+        request.ClientID = self.receiver_client_id
+        request.Channel = targets[0].channel
+        request.RequestTypeData = request_type  # type: ignore[assignment]
+        request.RefTransactionId = self.transaction_id
+        request.SequenceRange.extend(msg.sequence for msg in targets)
+
+        handler = targets[0].async_response_handler
+        if handler is not None:
+            # Same persistent downstream stream the messages were received on
+            await handler(request)
+        else:
+
+            async def single_request() -> AsyncIterator[pb.QueuesDownstreamRequest]:
+                yield request
+
+            async for _ in self._transport.queues_downstream(single_request()):
+                break
+
+        for msg in targets:
+            msg._mark_transaction_completed()
+        if len(targets) == len(self.messages):
+            self.is_transaction_completed = True
+
     def count(self) -> int:
         """Get the number of messages in the response."""
         return len(self.messages)
@@ -201,6 +263,8 @@ class AsyncClient(NativeAsyncBaseClient):
         Safe to share across asyncio tasks within a single event loop.
     """
 
+    _stage_component = "queues_upstream"
+
     def __init__(
         self,
         address: str = "",
@@ -235,7 +299,11 @@ class AsyncClient(NativeAsyncBaseClient):
         """Lazily initialize the bidirectional upstream stream sender."""
         if self._upstream_sender is None:
             self._ensure_connected()
-            self._upstream_sender = AsyncUpstreamSender(self._pick_pool_transport())
+            self._upstream_sender = AsyncUpstreamSender(
+                self._pick_pool_transport(),
+                stage_timer=self._config.stage_timer,
+                adaptive_rate=self._config.adaptive_rate,
+            )
             await self._upstream_sender.start()
         return self._upstream_sender
 
@@ -243,7 +311,9 @@ class AsyncClient(NativeAsyncBaseClient):
         """Lazily initialize the persistent downstream bidi stream."""
         if self._downstream_receiver is None:
             self._ensure_connected()
-            self._downstream_receiver = AsyncDownstreamReceiver(self._pick_pool_transport())
+            self._downstream_receiver = AsyncDownstreamReceiver(
+                self._pick_pool_transport(), stage_timer=self._config.stage_timer
+            )
             await self._downstream_receiver.start()
         return self._downstream_receiver
 
@@ -304,7 +374,9 @@ class AsyncClient(NativeAsyncBaseClient):
         error_type_val = None
         with self._instrumentor.start_span("send", message.channel) as span:
             try:
-                self._ensure_connected()
+                buffering = self._buffering_transport()
+                if buffering is None:
+                    self._ensure_connected()
                 assert self._transport is not None
                 pb_message = message.encode_message(self._config.client_id or "")
                 tags_dict = dict(pb_message.Tags)
@@ -318,7 +390,10 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                result = await self._transport.send_queue_message(pb_message)
+                if buffering is not None:
+                    result = await buffering.buffer_publish("queue", pb_message)
+                else:
+                    result = await self._transport.send_queue_message(pb_message)
                 self._instrumentor._metrics.record_sent_message("send", message.channel)
                 return QueueSendResult.decode(result)
             except (ValueError, TypeError) as e:
@@ -374,7 +449,10 @@ class AsyncClient(NativeAsyncBaseClient):
         error_type_val = None
         with self._instrumentor.start_span("send", message.channel) as span:
             try:
+                timed = self._stages is not None and self._stages.sample()
+                encode_start = time.perf_counter() if timed else 0.0
                 pb_message = message.encode_message(self._config.client_id or "")
+                encoded = time.perf_counter() if timed else 0.0
                 tags_dict = dict(pb_message.Tags)
                 KubeMQTagsCarrier(tags_dict).inject()
                 pb_message.Tags.update(tags_dict)
@@ -386,8 +464,16 @@ class AsyncClient(NativeAsyncBaseClient):
 
                     span.set_attribute(MESSAGING_MESSAGE_ID, message.id)
                     span.set_attribute(MESSAGING_MESSAGE_BODY_SIZE, len(message.body))
-                sender = await self._get_upstream_sender()
-                result = await sender.send(pb_message)
+                if timed:
+                    self._record_encode_stages(encode_start, encoded)
+                buffering = self._buffering_transport()
+                if buffering is not None:
+                    result = QueueSendResult.decode(
+                        await buffering.buffer_publish("queue", pb_message)
+                    )
+                else:
+                    sender = await self._get_upstream_sender()
+                    result = await sender.send(pb_message)
                 self._instrumentor._metrics.record_sent_message("send", message.channel)
                 return result
             except (ValueError, TypeError) as e:
@@ -516,12 +602,14 @@ class AsyncClient(NativeAsyncBaseClient):
 
         batch_request = pb.QueueMessagesBatchRequest()
         batch_request.BatchID = batch_id
+        # The trace context is the same for every message in the batch.
+        trace_tags: dict[str, str] = {}
+        KubeMQTagsCarrier(trace_tags).inject()
         for msg in messages:
             self._validate_message_size(msg.body)
             pb_msg = msg.encode_message(client_id)
-            tags_dict = dict(pb_msg.Tags)
-            KubeMQTagsCarrier(tags_dict).inject()
-            pb_msg.Tags.update(tags_dict)
+            if trace_tags:
+                pb_msg.Tags.update(trace_tags)
             batch_request.Messages.append(pb_msg)
 
         batch_response = await self._transport.send_queue_messages_batch(batch_request)
@@ -536,6 +624,85 @@ class AsyncClient(NativeAsyncBaseClient):
             have_errors=batch_response.HaveErrors,
         )
 
+    async def send_queue_messages_bulk(
+        self,
+        channel: str,
+        bodies: Sequence[bytes],
+        *,
+        ids: Sequence[str] | None = None,
+        metadata: str | None = None,
+        tags: dict[str, str] | None = None,
+        delay_in_seconds: int = 0,
+        expiration_in_seconds: int = 0,
+        max_receive_count: int = 0,
+        max_receive_queue: str = "",
+    ) -> QueueBatchSendResult:
+        """Send many bodies to one queue as a server-side batch.
+
+        Columnar counterpart of :meth:`send_queue_messages_batch` for the
+        common case where every message shares a channel, metadata, tags and
+        policy. The shared fields are validated and encoded once and each
+        row only adds an ID and a body, which makes encoding large batches
+        of small messages several times cheaper.
+
+        Args:
+            channel: Queue channel for every message.
+            bodies: Message bodies, one per message.
+            ids: Message IDs, one per body. Generated if not given.
+            metadata: Metadata for every message.
+            tags: Tags for every message.
+            delay_in_seconds: Delivery delay for every message.
+            expiration_in_seconds: Expiration for every message.
+            max_receive_count: Receive attempts before dead-lettering.
+            max_receive_queue: Dead-letter queue; required with
+                ``max_receive_count``.
+
+        Returns:
+            QueueBatchSendResult: Same as :meth:`send_queue_messages_batch`,
+            with one result per body in input order.
+
+        Raises:
+            KubeMQValidationError: If a shared field is invalid, ``ids`` does
+                not have one entry per body, a body exceeds
+                ``max_send_size``, or a message would be empty.
+            KubeMQConnectionError: If the server is unreachable or the
+                connection is lost.
+            KubeMQTimeoutError: If the operation exceeds the server deadline.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`QueuesClient.send_queue_messages_bulk`: Sync counterpart.
+            :class:`~kubemq.core.message_template.MessageTemplate`: Reusable
+                prototype for repeated single sends.
+        """
+        self._ensure_connected()
+        assert self._transport is not None
+
+        batch_request = pb.QueueMessagesBatchRequest(BatchID=str(uuid.uuid4()))
+        encode_bulk(
+            QueueMessage,
+            channel,
+            bodies,
+            self._config.client_id or "",
+            ids=ids,
+            metadata=metadata,
+            tags=tags,
+            max_body_size=self._config.max_send_size,
+            into=batch_request.Messages,
+            delay_in_seconds=delay_in_seconds,
+            expiration_in_seconds=expiration_in_seconds,
+            max_receive_count=max_receive_count,
+            max_receive_queue=max_receive_queue,
+        )
+
+        batch_response = await self._transport.send_queue_messages_batch(batch_request)
+
+        return QueueBatchSendResult(
+            batch_id=batch_response.BatchID,
+            results=[QueueSendResult.decode(r) for r in batch_response.Results],
+            have_errors=batch_response.HaveErrors,
+        )
+
     # =========================================================================
     # Receive Operations
     # =========================================================================
@@ -926,6 +1093,102 @@ class AsyncClient(NativeAsyncBaseClient):
                     if error_callback:
                         await error_callback(e)
 
+    async def process_queue_messages_batch(
+        self,
+        channel: str,
+        callback: AsyncMessageBatchCallback,
+        error_callback: AsyncErrorCallback | None = None,
+        max_messages: int = 100,
+        wait_timeout_seconds: int = 60,
+        auto_ack: bool = False,
+        cancellation_token: AsyncCancellationToken | None = None,
+    ) -> None:
+        """Process queue messages with an async callback that receives batches.
+
+        Each poll collects up to ``max_messages`` messages, waiting at most
+        ``wait_timeout_seconds`` for them, and delivers the whole poll
+        result as one list. When ``auto_ack`` is False the batch is settled
+        with a single AckRange request if the callback returns normally, or
+        a single NAckRange request (so the messages are redelivered) if it
+        raises. Messages the callback settles itself are left alone.
+
+        Args:
+            channel: Queue channel to process from.
+            callback: Async callback receiving a list of messages.
+            error_callback: Optional async callback for errors.
+            max_messages: Maximum messages per batch (1–1024).
+            wait_timeout_seconds: Wait timeout per poll (0–3600).
+            auto_ack: If True, messages are auto-acknowledged on receive.
+            cancellation_token: Optional token to cancel processing.
+
+        Returns:
+            None. Runs until cancelled via ``cancellation_token``.
+
+        Raises:
+            KubeMQConnectionError: If the server is unreachable or the
+                connection is lost.
+            KubeMQAuthenticationError: If the auth token is invalid or the
+                client lacks permission for the channel.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`process_queue_messages`: Per-message callback variant.
+            :meth:`AsyncQueuesPollResponse.ack_range`: Range settlement.
+        """
+        token = cancellation_token or AsyncCancellationToken()
+
+        current_task = asyncio.current_task()
+        if current_task is not None:
+            self._register_subscription_task(current_task)
+
+        async for response in self.subscribe_to_queue(
+            channel=channel,
+            max_messages=max_messages,
+            wait_timeout_seconds=wait_timeout_seconds,
+            auto_ack=auto_ack,
+            cancellation_token=token,
+        ):
+            if response.is_error:
+                if error_callback:
+                    try:
+                        await error_callback(Exception(response.error))
+                    except Exception:
+                        _logger.exception("Error in error_callback itself")
+                continue
+
+            succeeded = True
+            try:
+                await callback(response.messages)
+            except Exception as handler_err:
+                succeeded = False
+                handler_error = KubeMQHandlerError(
+                    f"Batch handler raised {type(handler_err).__name__}: {handler_err}",
+                    cause=handler_err,
+                    operation="BatchMessageHandler",
+                    channel=channel,
+                )
+                if error_callback:
+                    try:
+                        await error_callback(handler_error)
+                    except Exception:
+                        _logger.exception("Error in error_callback itself")
+                else:
+                    _logger.error("Unhandled batch handler error: %s", handler_error)
+
+            if auto_ack or response.is_transaction_completed:
+                continue
+            pending = [m for m in response.messages if not m.is_completed]
+            if not pending:
+                continue
+            try:
+                if succeeded:
+                    await response.ack_range(pending)
+                else:
+                    await response.reject_range(pending)
+            except Exception as e:
+                if error_callback:
+                    await error_callback(e)
+
     # =========================================================================
     # Queue Management
     # =========================================================================
@@ -12,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
@@ -24,6 +25,7 @@ from kubemq.grpc import (
 )
 
 if TYPE_CHECKING:
+    from kubemq.core.stage_timer import StageTimer
     from kubemq.transport.async_transport import AsyncTransport
 
 _SENTINEL = object()
@@ -50,6 +52,7 @@ class AsyncDownstreamReceiver:
         *,
         reconnect_interval: float = 1.0,
         response_timeout: float = _DEFAULT_RESPONSE_TIMEOUT,
+        stage_timer: StageTimer | None = None,
     ) -> None:
         self._transport = transport
         self._send_queue: asyncio.Queue[QueuesDownstreamRequest | object] = asyncio.Queue(
@@ -67,6 +70,10 @@ class AsyncDownstreamReceiver:
         self._generator_stop: asyncio.Event = asyncio.Event()
         # Readiness signal: set once the bidi stream is established.
         self._stream_ready: asyncio.Event = asyncio.Event()
+        # Sampled stage timing: RequestID -> enqueue time, then write time.
+        self._stages = stage_timer.probe("queues_downstream") if stage_timer is not None else None
+        self._enqueued_at: dict[str, float] = {}
+        self._written_at: dict[str, float] = {}
 
     async def start(self) -> None:
         """Start the background stream loop and wait for the stream to be ready."""
@@ -92,6 +99,8 @@ class AsyncDownstreamReceiver:
         loop = asyncio.get_running_loop()
         future: asyncio.Future[QueuesDownstreamResponse] = loop.create_future()
         self._response_tracking[request.RequestID] = future
+        if self._stages is not None and self._stages.sample():
+            self._enqueued_at[request.RequestID] = time.perf_counter()
 
         await self._send_queue.put(request)
         try:
@@ -105,6 +114,8 @@ class AsyncDownstreamReceiver:
             return None
         finally:
             self._response_tracking.pop(request.RequestID, None)
+            self._enqueued_at.pop(request.RequestID, None)
+            self._written_at.pop(request.RequestID, None)
 
     async def send_without_response(self, request: QueuesDownstreamRequest) -> None:
         """Send a request without waiting for a response.
@@ -116,6 +127,8 @@ class AsyncDownstreamReceiver:
         if not self._allow_new_requests:
             raise ConnectionError("Receiver is not ready to accept new requests.")
 
+        if self._stages is not None and self._stages.sample():
+            self._enqueued_at[request.RequestID] = time.perf_counter()
         await self._send_queue.put(request)
 
     async def _stream_loop(self) -> None:
@@ -218,6 +231,14 @@ class AsyncDownstreamReceiver:
             msg = get_task.result()
             if msg is _SENTINEL:
                 break
+            if self._enqueued_at:
+                request: QueuesDownstreamRequest = msg  # type: ignore[assignment]
+                enqueued = self._enqueued_at.pop(request.RequestID, None)
+                if enqueued is not None:
+                    dequeued = time.perf_counter()
+                    yield request
+                    self._record_write(request.RequestID, enqueued, dequeued)
+                    continue
             yield msg  # type: ignore[misc]
 
     async def _receive_responses(self, call: grpc.aio.StreamStreamCall) -> None:
@@ -231,6 +252,9 @@ class AsyncDownstreamReceiver:
                     self._handle_disconnection()
                     break
                 self._allow_new_requests = True
+                if self._written_at:
+                    self._resolve_timed(response)
+                    continue
                 request_id = response.RefRequestId
                 future = self._response_tracking.get(request_id)
                 if future and not future.done():
@@ -245,9 +269,31 @@ class AsyncDownstreamReceiver:
 
                 raise from_grpc_error(e) from e
 
+    def _record_write(self, request_id: str, enqueued: float, dequeued: float) -> None:
+        """Record queue wait and write time for a sampled request."""
+        assert self._stages is not None
+        written = time.perf_counter()
+        self._stages.record("queue_wait", dequeued - enqueued)
+        self._stages.record("write", written - dequeued)
+        if request_id in self._response_tracking:
+            self._written_at[request_id] = written
+
+    def _resolve_timed(self, response: QueuesDownstreamResponse) -> None:
+        """Resolve a future, timing the response wait and demux if sampled."""
+        received = time.perf_counter()
+        written = self._written_at.pop(response.RefRequestId, None)
+        future = self._response_tracking.get(response.RefRequestId)
+        if future and not future.done():
+            future.set_result(response)
+        if written is not None and self._stages is not None:
+            self._stages.record("response", received - written)
+            self._stages.record("demux", time.perf_counter() - received)
+
     def _handle_disconnection(self) -> None:
         """Signal error to all pending futures."""
         self._allow_new_requests = False
+        self._enqueued_at.clear()
+        self._written_at.clear()
         for request_id, future in self._response_tracking.items():
             if not future.done():
                 error_resp = QueuesDownstreamResponse(
@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
+from kubemq._internal.rate_control import AimdRateController
 from kubemq.common.helpers import fast_id
 from kubemq.grpc import (
     QueueMessage as pbQueueMessage,
@@ -18,6 +20,8 @@ from kubemq.grpc import (
 from kubemq.queues.queues_send_result import QueueSendResult
 
 if TYPE_CHECKING:
+    from kubemq.core.config import AdaptiveRateConfig
+    from kubemq.core.stage_timer import StageTimer
     from kubemq.transport.async_transport import AsyncTransport
 
 DEFAULT_SEND_QUEUE_SIZE = 10_000
@@ -41,6 +45,8 @@ class AsyncUpstreamSender:
         max_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
         send_timeout: float = 2.0,
         reconnect_interval: float = 1.0,
+        stage_timer: StageTimer | None = None,
+        adaptive_rate: AdaptiveRateConfig | None = None,
     ) -> None:
         self._transport = transport
         self._send_queue: asyncio.Queue[QueuesUpstreamRequest | object] = asyncio.Queue(
@@ -61,6 +67,12 @@ class AsyncUpstreamSender:
         # request generator is active.  Prevents send() from timing out
         # because the stream hasn't been created yet.
         self._stream_ready: asyncio.Event = asyncio.Event()
+        # Sampled stage timing: RequestID -> enqueue time, then write time.
+        self._stages = stage_timer.probe("queues_upstream") if stage_timer is not None else None
+        self._enqueued_at: dict[str, float] = {}
+        self._written_at: dict[str, float] = {}
+        # Optional AIMD pacing of send().
+        self._rate = AimdRateController(adaptive_rate) if adaptive_rate is not None else None
 
     async def start(self) -> None:
         """Start the background stream loop and wait for the stream to be ready."""
@@ -77,7 +89,9 @@ class AsyncUpstreamSender:
     async def send(self, message: pbQueueMessage) -> QueueSendResult:
         """Enqueue a queue message for sending via the bidi stream.
 
-        Blocks until a response is received or send_timeout expires.
+        Blocks until a response is received or send_timeout expires. With
+        adaptive rate control, first waits for the controller to admit the
+        message.
 
         Returns:
             QueueSendResult with send confirmation or error.
@@ -90,6 +104,10 @@ class AsyncUpstreamSender:
         if not self._allow_new_messages:
             raise ConnectionError("Sender is not ready to accept new messages.")
 
+        rate = self._rate
+        if rate is not None:
+            await rate.acquire(self._send_queue.qsize(), self._send_queue.maxsize)
+
         message_id = message.MessageID
         request = QueuesUpstreamRequest()
         request.RequestID = fast_id()
@@ -99,11 +117,16 @@ class AsyncUpstreamSender:
         future: asyncio.Future[QueuesUpstreamResponse] = loop.create_future()
 
         self._response_tracking[request.RequestID] = (future, message_id)
+        if self._stages is not None and self._stages.sample():
+            self._enqueued_at[request.RequestID] = time.perf_counter()
 
         try:
             self._send_queue.put_nowait(request)
         except asyncio.QueueFull:
             self._response_tracking.pop(request.RequestID, None)
+            self._enqueued_at.pop(request.RequestID, None)
+            if rate is not None:
+                rate.on_error()
             from kubemq.core.exceptions import KubeMQBufferFullError
 
             raise KubeMQBufferFullError(
@@ -112,10 +135,13 @@ class AsyncUpstreamSender:
                 buffer_size=self._send_queue.maxsize,
             ) from None
 
+        started = time.monotonic()
         try:
             response = await asyncio.wait_for(future, timeout=self._send_timeout)
         except TimeoutError:
             self._response_tracking.pop(request.RequestID, None)
+            if rate is not None:
+                rate.on_result(self._send_timeout, False)
             return QueueSendResult(
                 id=message_id,
                 is_error=True,
@@ -123,10 +149,18 @@ class AsyncUpstreamSender:
             )
         finally:
             self._response_tracking.pop(request.RequestID, None)
+            self._enqueued_at.pop(request.RequestID, None)
+            self._written_at.pop(request.RequestID, None)
 
         if response.Results:
-            return QueueSendResult.decode(response.Results[0])
-        return QueueSendResult(id=message_id, is_error=True, error="Empty response from server")
+            result = QueueSendResult.decode(response.Results[0])
+        else:
+            result = QueueSendResult(
+                id=message_id, is_error=True, error="Empty response from server"
+            )
+        if rate is not None:
+            rate.on_result(time.monotonic() - started, not result.is_error)
+        return result
 
     async def _stream_loop(self) -> None:
         """Outer reconnection loop wrapping the bidi stream."""
@@ -196,6 +230,9 @@ class AsyncUpstreamSender:
             async for response in call:
                 if self._closed:
                     break
+                if self._written_at:
+                    self._resolve_timed(response)
+                    continue
                 self._process_response(response)
         except asyncio.CancelledError:
             _logger.debug("Upstream response reader cancelled")
@@ -242,6 +279,14 @@ class AsyncUpstreamSender:
             msg = get_task.result()
             if msg is _SENTINEL:
                 break
+            if self._enqueued_at:
+                request: QueuesUpstreamRequest = msg  # type: ignore[assignment]
+                enqueued = self._enqueued_at.pop(request.RequestID, None)
+                if enqueued is not None:
+                    dequeued = time.perf_counter()
+                    yield request
+                    self._record_write(request.RequestID, enqueued, dequeued)
+                    continue
             yield msg  # type: ignore[misc]
 
     def _process_response(self, response: QueuesUpstreamResponse) -> None:
@@ -252,9 +297,31 @@ class AsyncUpstreamSender:
             if not future.done():
                 future.set_result(response)
 
+    def _record_write(self, request_id: str, enqueued: float, dequeued: float) -> None:
+        """Record queue wait and write time for a sampled request."""
+        assert self._stages is not None
+        written = time.perf_counter()
+        self._stages.record("queue_wait", dequeued - enqueued)
+        self._stages.record("write", written - dequeued)
+        if request_id in self._response_tracking:
+            self._written_at[request_id] = written
+
+    def _resolve_timed(self, response: QueuesUpstreamResponse) -> None:
+        """Resolve a Future, timing the response wait and demux if sampled."""
+        received = time.perf_counter()
+        written = self._written_at.pop(response.RefRequestID, None)
+        self._process_response(response)
+        if written is not None and self._stages is not None:
+            self._stages.record("response", received - written)
+            self._stages.record("demux", time.perf_counter() - received)
+
     def _handle_disconnection(self) -> None:
         """Signal error to all pending Futures and drain the queue."""
         self._allow_new_messages = False
+        self._enqueued_at.clear()
+        self._written_at.clear()
+        if self._rate is not None:
+            self._rate.on_error()
         for request_id, (future, message_id) in self._response_tracking.items():
             if not future.done():
                 error_response = QueuesUpstreamResponse(
@@ -5,8 +5,10 @@ from __future__ import annotations
 import threading
 import time
 import uuid
+from collections.abc import Sequence
 from pathlib import Path
 
+from kubemq._internal.bulk_encode import encode_bulk
 from kubemq._internal.deprecation import deprecated, deprecated_async
 from kubemq._internal.telemetry import (
     KubeMQTagsCarrier,
@@ -494,12 +496,14 @@ class Client(BaseClient):
 
         batch_request = QueueMessagesBatchRequest()
         batch_request.BatchID = batch_id
+        # The trace context is the same for every message in the batch.
+        trace_tags: dict[str, str] = {}
+        KubeMQTagsCarrier(trace_tags).inject()
         for msg in messages:
             self._validate_message_size(msg.body)
             pb_msg = msg.encode_message(client_id)
-            tags_dict = dict(pb_msg.Tags)
-            KubeMQTagsCarrier(tags_dict).inject()
-            pb_msg.Tags.update(tags_dict)
+            if trace_tags:
+                pb_msg.Tags.update(trace_tags)
             batch_request.Messages.append(pb_msg)
 
         batch_response = self._transport.kubemq_client().SendQueueMessagesBatch(batch_request)
@@ -514,6 +518,82 @@ class Client(BaseClient):
             have_errors=batch_response.HaveErrors,
         )
 
+    def send_queue_messages_bulk(
+        self,
+        channel: str,
+        bodies: Sequence[bytes],
+        *,
+        ids: Sequence[str] | None = None,
+        metadata: str | None = None,
+        tags: dict[str, str] | None = None,
+        delay_in_seconds: int = 0,
+        expiration_in_seconds: int = 0,
+        max_receive_count: int = 0,
+        max_receive_queue: str = "",
+    ) -> QueueBatchSendResult:
+        """Send many bodies to one queue as a server-side batch.
+
+        Columnar counterpart of :meth:`send_queue_messages_batch`: the shared
+        channel, metadata, tags and policy are validated and encoded once and
+        each row only adds an ID and a body.
+
+        Args:
+            channel: Queue channel for every message.
+            bodies: Message bodies, one per message.
+            ids: Message IDs, one per body. Generated if not given.
+            metadata: Metadata for every message.
+            tags: Tags for every message.
+            delay_in_seconds: Delivery delay for every message.
+            expiration_in_seconds: Expiration for every message.
+            max_receive_count: Receive attempts before dead-lettering.
+            max_receive_queue: Dead-letter queue; required with
+                ``max_receive_count``.
+
+        Returns:
+            QueueBatchSendResult: One result per body, in input order.
+
+        Raises:
+            KubeMQValidationError: If a shared field is invalid, ``ids`` does
+                not have one entry per body, a body exceeds
+                ``max_send_size``, or a message would be empty.
+            KubeMQConnectionError: If the server is unreachable or the
+                connection is lost.
+            KubeMQTimeoutError: If the operation exceeds the server deadline.
+            KubeMQClientClosedError: If the client has already been closed.
+
+        See Also:
+            :meth:`AsyncQueuesClient.send_queue_messages_bulk`: Async counterpart.
+        """
+        self._ensure_connected()
+        assert self._transport is not None
+
+        from kubemq.grpc import QueueMessagesBatchRequest
+
+        batch_request = QueueMessagesBatchRequest(BatchID=str(uuid.uuid4()))
+        encode_bulk(
+            QueueMessage,
+            channel,
+            bodies,
+            self._config.client_id or "",
+            ids=ids,
+            metadata=metadata,
+            tags=tags,
+            max_body_size=self._config.max_send_size,
+            into=batch_request.Messages,
+            delay_in_seconds=delay_in_seconds,
+            expiration_in_seconds=expiration_in_seconds,
+            max_receive_count=max_receive_count,
+            max_receive_queue=max_receive_queue,
+        )
+
+        batch_response = self._transport.kubemq_client().SendQueueMessagesBatch(batch_request)
+
+        return QueueBatchSendResult(
+            batch_id=batch_response.BatchID,
+            results=[QueueSendResult.decode(r) for r in batch_response.Results],
+            have_errors=batch_response.HaveErrors,
+        )
+
     def create_queues_channel(self, channel: str) -> bool | None:
         """Create a queues channel.
 
@@ -531,7 +611,9 @@ class Client(BaseClient):
             KubeMQError: If the server rejects the request (e.g., channel
                 already exists or invalid name).
         """
-        return create_channel_request(self._transport, self._config.client_id, channel, "queues")
+        return create_channel_request(
+            self._transport, self._config.client_id, channel, "queues", cache=self._channel_cache
+        )
 
     async def create_queues_channel_async(self, channel: str) -> bool | None:
         """Create a queues channel asynchronously.
@@ -567,7 +649,9 @@ class Client(BaseClient):
             KubeMQChannelError: If the channel does not exist.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return delete_channel_request(self._transport, self._config.client_id, channel, "queues")
+        return delete_channel_request(
+            self._transport, self._config.client_id, channel, "queues", cache=self._channel_cache
+        )
 
     async def delete_queues_channel_async(self, channel: str) -> bool | None:
         """Delete a queues channel asynchronously.
@@ -605,7 +689,9 @@ class Client(BaseClient):
                 client lacks permission.
             KubeMQTimeoutError: If the operation exceeds the server deadline.
         """
-        return list_queues_channels(self._transport, self._config.client_id, channel_search)
+        return list_queues_channels(
+            self._transport, self._config.client_id, channel_search, cache=self._channel_cache
+        )
 
     async def list_queues_channels_async(self, channel_search: str = "") -> list[QueuesChannel]:
         """List queues channels asynchronously.
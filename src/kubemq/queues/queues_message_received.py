@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from kubemq._internal import delivery_latency
 from kubemq.grpc import (
     QueueMessage as pbQueueMessage,
     QueuesDownstreamRequest,
@@ -182,6 +183,9 @@ class QueueMessageReceived:
         Returns:
             QueueMessageReceived: The decoded message.
         """
+        probe = delivery_latency.active
+        if probe is not None and message.Attributes:
+            probe.record("queues", message.Attributes.Timestamp)
         return cls(
             id=message.MessageID,
             channel=message.Channel,
@@ -1,7 +1,22 @@
-from kubemq.common.cancellation_token import CancellationToken
+from typing import TYPE_CHECKING
 
-from .async_transport import AsyncTransport
-from .server_info import ServerInfo
-from .transport import SyncTransport
+from kubemq._internal.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from kubemq.common.cancellation_token import CancellationToken
+
+    from .async_transport import AsyncTransport
+    from .server_info import ServerInfo
+    from .transport import SyncTransport
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "kubemq.common.cancellation_token": ("CancellationToken",),
+        ".async_transport": ("AsyncTransport",),
+        ".server_info": ("ServerInfo",),
+        ".transport": ("SyncTransport",),
+    },
+)
 
 __all__ = ["AsyncTransport", "CancellationToken", "ServerInfo", "SyncTransport"]
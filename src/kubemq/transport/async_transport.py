@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import dataclasses
+import itertools
 import logging
-from collections.abc import AsyncIterator
+import uuid
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -36,7 +39,22 @@ from .interceptors import (
 )
 from .server_info import ServerInfo
 
+# Publish kinds accepted by AsyncTransport.buffer_publish, mapped to the
+# protobuf type used to decode them on flush. Kinds in the same flush group
+# are replayed together in one bulk call.
+_BUFFERED_TYPES: dict[str, type[Message]] = {
+    "event": pb.Event,
+    "event_store": pb.Event,
+    "queue": pb.QueueMessage,
+    "command": pb.Request,
+}
+_FLUSH_GROUPS = {"event": "events", "event_store": "events", "queue": "queue", "command": "command"}
+
 if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
+    from kubemq._internal.transport.pool import PoolReconnectCoordinator
+    from kubemq._internal.transport.reconnect import BufferedItem
     from kubemq._internal.transport.state import AnyStateCallback
     from kubemq.core.types import ConnectionState
 
@@ -64,11 +82,19 @@ class AsyncTransport:
         is_connected: Whether the transport is connected.
     """
 
-    def __init__(self, config: ClientConfig) -> None:
+    def __init__(
+        self,
+        config: ClientConfig,
+        *,
+        pool_coordinator: PoolReconnectCoordinator | None = None,
+    ) -> None:
         """Initialize the async transport.
 
         Args:
             config: Client configuration containing address, auth, TLS settings, etc.
+            pool_coordinator: Coordinator shared by a client's pooled
+                transports. When set, reconnects are gated behind the pool's
+                probe connection and back off with decorrelated jitter.
         """
         self._config = config
         self._channel: grpc.aio.Channel | None = None
@@ -84,22 +110,30 @@ class AsyncTransport:
         from kubemq._internal.transport.state import ConnectionStateManager
 
         self._state_manager = ConnectionStateManager(logger=self._logger)
+        self._pool_coordinator = pool_coordinator
         self._reconnection_manager = None
         if config.auto_reconnect:
             from kubemq._internal.retry import BackoffCalculator
             from kubemq._internal.transport.reconnect import ReconnectConfig, ReconnectionManager
+            from kubemq.core.config import JitterType
 
             rc = ReconnectConfig(
                 max_reconnect_attempts=config.max_reconnect_attempts,
                 initial_reconnect_delay_ms=config.reconnect_initial_delay_ms,
                 max_reconnect_delay_ms=config.reconnect_max_delay_ms,
                 reconnect_buffer_size=config.reconnect_buffer_size,
+                buffer_overflow_mode=config.buffer_overflow_mode,
             )
-            backoff = BackoffCalculator(config.retry_policy)
+            policy = config.retry_policy
+            if pool_coordinator is not None:
+                policy = dataclasses.replace(policy, jitter=JitterType.DECORRELATED)
+            backoff = BackoffCalculator(policy)
             self._reconnection_manager = ReconnectionManager(
                 config=rc,
                 backoff=backoff,
+                on_buffer_drain=config.on_buffer_drain,
                 logger=self._logger,
+                flush_fn=self._flush_reconnect_buffer,
             )
 
         # Track active streams for graceful shutdown
@@ -376,11 +410,18 @@ class AsyncTransport:
 
         self._state_manager.transition_to(ConnectionState.RECONNECTING)
         self._connected = False
+        if self._pool_coordinator is not None:
+            self._pool_coordinator.connection_lost(self)
         if self._reconnection_manager and not self._reconnection_manager.is_reconnecting:
             await self._reconnection_manager.start_reconnection(
-                connect_fn=self._reconnect,
+                connect_fn=self._pool_redial if self._pool_coordinator else self._reconnect,
             )
 
+    async def _pool_redial(self) -> None:
+        """Reconnect through the pool coordinator's probe gate."""
+        assert self._pool_coordinator is not None
+        await self._pool_coordinator.redial(self, self._reconnect)
+
     async def _reconnect(self) -> None:
         """Create a fresh channel and verify it with a ping.
 
@@ -397,6 +438,202 @@ class AsyncTransport:
         self._connected = True
         self._state_manager.transition_to(ConnectionState.READY)
 
+    # =========================================================================
+    # Reconnect Buffering
+    # =========================================================================
+
+    @property
+    def is_reconnecting(self) -> bool:
+        """True while the reconnection loop is running."""
+        return self._reconnection_manager is not None and self._reconnection_manager.is_reconnecting
+
+    @property
+    def is_buffering(self) -> bool:
+        """True while a reconnect is in progress and publishes are buffered."""
+        return self.is_reconnecting and not self._connected and not self._closing
+
+    async def buffer_publish(
+        self,
+        kind: str,
+        message: Message,
+        *,
+        wait: bool = True,
+        timeout_seconds: int | None = None,
+    ) -> Any:
+        """Hold a publish in the reconnect buffer until the connection is back.
+
+        The message is serialized once; its encoded size counts against
+        ``reconnect_buffer_size`` and ``buffer_overflow_mode`` decides whether
+        a full buffer raises or waits.
+
+        Args:
+            kind: One of ``"event"``, ``"event_store"``, ``"queue"`` or
+                ``"command"``.
+            message: The encoded protobuf to send.
+            wait: If True, wait for the message to be flushed and return the
+                server's reply. If False, return as soon as it is buffered.
+            timeout_seconds: Operation timeout. Bounds both the wait for
+                buffer space and the wait for the flush, and is applied to
+                the request when a command is flushed. Defaults to
+                ``default_timeout_seconds``.
+
+        Returns:
+            The flushed reply (``pb.Result``, ``pb.SendQueueMessageResult`` or
+            ``pb.Response``), or None when ``wait`` is False or for a
+            non-persistent event.
+
+        Raises:
+            KubeMQBufferFullError: If the buffer is full in ``"error"`` mode.
+            KubeMQTimeoutError: If the message is not flushed within the
+                timeout. A message still in the buffer is dropped from it.
+            KubeMQConnectionError: If reconnection is abandoned before the
+                message is flushed, reconnection is not enabled, or the
+                server's reply to the flush has no result for the message.
+        """
+        if kind not in _BUFFERED_TYPES:
+            raise ValueError(f"Unsupported buffered publish kind: {kind!r}")
+        if self._reconnection_manager is None:
+            raise KubeMQConnectionError("Transport is not connected")
+        future: asyncio.Future[Any] | None = (
+            asyncio.get_running_loop().create_future() if wait else None
+        )
+        metadata: dict[str, Any] = {"kind": kind, "future": future}
+        if timeout_seconds:
+            metadata["timeout"] = timeout_seconds
+        timeout = timeout_seconds or self._config.default_timeout_seconds
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            await asyncio.wait_for(
+                self._reconnection_manager.buffer_message(message.SerializeToString(), metadata),
+                timeout=timeout,
+            )
+            if future is None:
+                return None
+            return await asyncio.wait_for(future, timeout=max(deadline - loop.time(), 0))
+        except TimeoutError as e:
+            await self._reconnection_manager.buffer.remove(metadata)
+            raise KubeMQTimeoutError(f"Buffered {kind} was not flushed within {timeout}s") from e
+
+    async def _flush_reconnect_buffer(self, items: list[BufferedItem]) -> None:
+        """Re-send buffered publishes after reconnect, in FIFO order.
+
+        Consecutive items of the same flush group go out in one bulk call:
+        events over a single ``SendEventsStream``, queue messages as one
+        ``SendQueueMessagesBatch``, commands as concurrent requests.
+        """
+        stub = self._get_stub()
+        for group, run_items in itertools.groupby(
+            items, key=lambda item: _FLUSH_GROUPS[item[1]["kind"]]
+        ):
+            run = [
+                (_BUFFERED_TYPES[meta["kind"]].FromString(data), meta) for data, meta in run_items
+            ]
+            error: Exception
+            try:
+                if group == "events":
+                    await self._flush_events(stub, run)
+                elif group == "queue":
+                    await self._flush_queue_messages(stub, run)
+                else:
+                    await self._flush_commands(stub, run)
+            except Exception as e:
+                if isinstance(e, grpc.aio.AioRpcError):
+                    error = from_grpc_error(e)
+                elif isinstance(e, TimeoutError):
+                    error = KubeMQTimeoutError("Flushing buffered messages timed out")
+                else:
+                    error = e
+            else:
+                # The server answered with fewer results than messages sent.
+                error = KubeMQConnectionError("No result for buffered message")
+            for _, meta in run:
+                future = meta.get("future")
+                if future is not None and not future.done():
+                    future.set_exception(error)
+
+    async def _flush_events(
+        self, stub: kubemq_pb2_grpc.kubemqStub, run: list[tuple[Any, dict[str, Any]]]
+    ) -> None:
+        results = await self._write_events(stub, [event for event, _ in run])
+        for event, meta in run:
+            future = meta.get("future")
+            if future is None or future.done():
+                continue
+            if not event.Store:
+                future.set_result(None)
+            elif event.EventID in results:
+                future.set_result(results[event.EventID])
+
+    async def _write_events(
+        self, stub: kubemq_pb2_grpc.kubemqStub, events: Sequence[pb.Event]
+    ) -> dict[str, pb.Result]:
+        """Write ``events`` over one ``SendEventsStream`` and collect store results.
+
+        After the half-close the call is read until the server ends it, so
+        the server has consumed every event before the stream is released.
+        The call is only cancelled on error or when that drain times out.
+        """
+        pending = {event.EventID for event in events if event.Store}
+        results: dict[str, pb.Result] = {}
+        call = stub.SendEventsStream()
+        try:
+            for event in events:
+                await call.write(event)
+            await call.done_writing()
+            await asyncio.wait_for(
+                self._collect_event_results(call, pending, results),
+                timeout=self._config.default_timeout_seconds,
+            )
+        except BaseException:
+            call.cancel()
+            raise
+        return results
+
+    @staticmethod
+    async def _collect_event_results(
+        call: grpc.aio.StreamStreamCall, pending: set[str], results: dict[str, pb.Result]
+    ) -> None:
+        async for result in call:
+            if result.EventID in pending:
+                pending.discard(result.EventID)
+                results[result.EventID] = result
+
+    async def _flush_queue_messages(
+        self, stub: kubemq_pb2_grpc.kubemqStub, run: list[tuple[Any, dict[str, Any]]]
+    ) -> None:
+        request = pb.QueueMessagesBatchRequest(
+            BatchID=str(uuid.uuid4()), Messages=[message for message, _ in run]
+        )
+        response = await asyncio.wait_for(
+            stub.SendQueueMessagesBatch(request),
+            timeout=self._config.default_timeout_seconds,
+        )
+        for (_, meta), result in zip(run, response.Results):
+            future = meta.get("future")
+            if future is not None and not future.done():
+                future.set_result(result)
+
+    async def _flush_commands(
+        self, stub: kubemq_pb2_grpc.kubemqStub, run: list[tuple[Any, dict[str, Any]]]
+    ) -> None:
+        async def _send(request: pb.Request, meta: dict[str, Any]) -> None:
+            timeout = meta.get("timeout") or self._config.default_timeout_seconds
+            try:
+                response = await asyncio.wait_for(stub.SendRequest(request), timeout=timeout)
+            except TimeoutError:
+                error: Exception = KubeMQTimeoutError(f"Request timed out after {timeout}s")
+            except grpc.aio.AioRpcError as e:
+                error = from_grpc_error(e)
+            else:
+                if meta.get("future") is not None and not meta["future"].done():
+                    meta["future"].set_result(response)
+                return
+            if meta.get("future") is not None and not meta["future"].done():
+                meta["future"].set_exception(error)
+
+        await asyncio.gather(*(_send(request, meta) for request, meta in run))
+
     # =========================================================================
     # Basic Operations
     # =========================================================================
@@ -858,6 +1095,33 @@ class AsyncTransport:
                 await self._on_connection_lost()
             raise from_grpc_error(e) from e
 
+    async def send_events_bulk(self, events: Sequence[pb.Event]) -> dict[str, pb.Result]:
+        """Send events over a dedicated ``SendEventsStream`` in one pass.
+
+        Args:
+            events: Encoded events, persistent or not.
+
+        Returns:
+            The server's result for each persistent event, keyed by EventID.
+            Non-persistent events have no result.
+
+        Raises:
+            KubeMQConnectionError: If not connected.
+            KubeMQTimeoutError: If the server does not finish reading the
+                stream in time.
+        """
+        stub = self._get_stub()
+        try:
+            return await self._write_events(stub, events)
+        except TimeoutError as e:
+            raise KubeMQTimeoutError(
+                f"Events bulk send timed out after {self._config.default_timeout_seconds}s"
+            ) from e
+        except grpc.aio.AioRpcError as e:
+            if self._is_connection_error(e):
+                await self._on_connection_lost()
+            raise from_grpc_error(e) from e
+
     async def receive_queue_messages(
         self,
         request: pb.ReceiveQueueMessagesRequest,
@@ -0,0 +1,669 @@
+"""Publish/consume benchmark matrix with setup kept out of the measurement.
+
+The pytest-benchmark cases in this package time one operation each. This
+harness sweeps a matrix instead, one scenario per combination of
+pattern x payload size x concurrency x connection pool size, and writes
+machine-readable JSON that can be diffed across commits:
+
+- setup (connecting clients, starting subscribers and responders, warmup
+  sends) and teardown (draining queues, closing clients) run outside the
+  timed window; only the sends themselves are measured
+- every scenario sends a fixed number of messages from ``concurrency``
+  tasks sharing one client, for ``rounds`` rounds; the reported figures
+  come from the median round by throughput
+- channels are fresh per scenario and round, payloads are deterministic,
+  and scenarios always run in the same order, so two runs differ only in
+  the code under test and the machine
+- patterns are pluggable: subclass :class:`Workload` and decorate it with
+  :func:`register_pattern`
+
+Usage:
+    # Default matrix against a local broker
+    KUBEMQ_BENCHMARK_ADDRESS=localhost:50000 \\
+        uv run python -m tests.benchmarks.harness --output bench.json
+
+    # Narrow sweep, compared against a saved baseline
+    uv run python -m tests.benchmarks.harness \\
+        --patterns events,queries --sizes 1024 --concurrency 1,32 \\
+        --pool-sizes 1,4 --output bench.json --compare baseline.json
+
+See BENCHMARK_BASELINE.md for the CI baseline command and the result
+format.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, ClassVar
+
+SCHEMA_VERSION = 1
+
+DEFAULT_PATTERNS = (
+    "events",
+    "events_store",
+    "queues_stream",
+    "queues_simple",
+    "commands",
+    "queries",
+)
+DEFAULT_SIZES = (64, 1024, 65536)
+DEFAULT_CONCURRENCY = (1, 16, 64)
+DEFAULT_POOL_SIZES = (1, 4)
+
+# How long to wait for subscribers to catch up before counting deliveries.
+_SETTLE_SECONDS = 5.0
+_RPC_TIMEOUT_SECONDS = 10
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One cell of the benchmark matrix."""
+
+    pattern: str
+    payload_size: int
+    concurrency: int
+    pool_size: int
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match scenarios across result files."""
+        return (
+            f"{self.pattern}/size={self.payload_size}"
+            f"/concurrency={self.concurrency}/pool={self.pool_size}"
+        )
+
+
+@dataclass(frozen=True)
+class HarnessSettings:
+    """Run-wide settings; recorded in the results so runs can be reproduced.
+
+    Attributes:
+        address: Broker address.
+        messages: Timed sends per round.
+        warmup: Untimed sends per round, before the timed ones.
+        rounds: Rounds per scenario; the median round is reported.
+    """
+
+    address: str
+    messages: int = 2000
+    warmup: int = 200
+    rounds: int = 3
+
+
+@dataclass
+class RoundResult:
+    """Measurements from one round of one scenario."""
+
+    sent: int
+    errors: int
+    elapsed_seconds: float
+    latencies: list[float] = field(repr=False)
+    received: int | None = None
+
+    @property
+    def throughput(self) -> float:
+        """Successful sends per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.sent / self.elapsed_seconds
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Nearest-rank percentile of already sorted values (0 for no values)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(scenario: Scenario, rounds: list[RoundResult]) -> dict[str, Any]:
+    """Reduce a scenario's rounds to one JSON-ready result record."""
+    ordered = sorted(rounds, key=lambda r: r.throughput)
+    median = ordered[(len(ordered) - 1) // 2]
+    latencies = sorted(median.latencies)
+    return {
+        "key": scenario.key,
+        **asdict(scenario),
+        "sent": median.sent,
+        "errors": median.errors,
+        "received": median.received,
+        "elapsed_seconds": round(median.elapsed_seconds, 6),
+        "throughput_msgs_per_sec": round(median.throughput, 1),
+        "throughput_mb_per_sec": round(median.throughput * scenario.payload_size / 1024 / 1024, 3),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 4) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 4),
+            "p95": round(percentile(latencies, 95) * 1000, 4),
+            "p99": round(percentile(latencies, 99) * 1000, 4),
+            "max": round(latencies[-1] * 1000, 4) if latencies else 0.0,
+        },
+        "round_throughputs": [round(r.throughput, 1) for r in rounds],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+
+
+class Workload(ABC):
+    """One messaging pattern: connects in :meth:`setup`, sends in :meth:`send`.
+
+    A workload instance serves one round of one scenario. :meth:`setup`
+    and :meth:`teardown` are not timed. :meth:`send` is called
+    ``warmup + messages`` times from ``scenario.concurrency`` tasks and
+    must be safe to run concurrently. Patterns with a consumer side report
+    deliveries from :meth:`received`.
+    """
+
+    name: ClassVar[str] = ""
+
+    def __init__(self, scenario: Scenario, address: str, channel: str) -> None:
+        self.scenario = scenario
+        self.address = address
+        self.channel = channel
+        self.payload = b"x" * scenario.payload_size
+        self._stack = contextlib.AsyncExitStack()
+
+    def client_config(self, pool_size: int | None = None) -> Any:
+        """Return a ``ClientConfig`` for this scenario's pool size."""
+        from kubemq import ClientConfig
+
+        return ClientConfig(
+            address=self.address,
+            client_id=f"bench-{uuid.uuid4().hex[:8]}",
+            connection_pool_size=pool_size or self.scenario.pool_size,
+        )
+
+    async def connect(self, client: Any) -> Any:
+        """Enter ``client`` and close it at teardown."""
+        return await self._stack.enter_async_context(client)
+
+    def background(self, coro: Any) -> None:
+        """Run ``coro`` until teardown, e.g. a subscriber or responder."""
+        task = asyncio.ensure_future(coro)
+
+        async def _stop() -> None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+        self._stack.push_async_callback(_stop)
+
+    async def setup(self) -> None:  # noqa: B027
+        """Connect clients and start consumers."""
+
+    @abstractmethod
+    async def send(self) -> None:
+        """Perform one timed operation."""
+
+    async def received(self, expected: int) -> int | None:
+        """Return deliveries seen by the consumer side, or None if not tracked."""
+        return None
+
+    async def teardown(self) -> None:
+        """Stop consumers and close clients."""
+        await self._stack.aclose()
+
+
+PATTERNS: dict[str, type[Workload]] = {}
+
+
+def register_pattern(name: str) -> Callable[[type[Workload]], type[Workload]]:
+    """Class decorator that adds a :class:`Workload` to :data:`PATTERNS`."""
+
+    def decorator(cls: type[Workload]) -> type[Workload]:
+        cls.name = name
+        PATTERNS[name] = cls
+        return cls
+
+    return decorator
+
+
+class _SubscribedWorkload(Workload):
+    """Counts deliveries on a separate, unpooled subscriber client."""
+
+    def __init__(self, scenario: Scenario, address: str, channel: str) -> None:
+        super().__init__(scenario, address, channel)
+        self._delivered = 0
+
+    async def _consume(self, events: Any) -> None:
+        async for _ in events:
+            self._delivered += 1
+
+    async def received(self, expected: int) -> int | None:
+        deadline = time.monotonic() + _SETTLE_SECONDS
+        while self._delivered < expected and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        return self._delivered
+
+
+@register_pattern("events")
+class EventsWorkload(_SubscribedWorkload):
+    """Fire-and-forget ``publish_event`` on the events stream."""
+
+    async def setup(self) -> None:
+        from kubemq import AsyncCancellationToken, AsyncPubSubClient, EventMessage
+        from kubemq.pubsub import EventsSubscription
+
+        subscriber = await self.connect(AsyncPubSubClient(config=self.client_config(1)))
+        token = AsyncCancellationToken()
+        self._stack.callback(token.cancel)
+        subscription = EventsSubscription(
+            channel=self.channel, on_receive_event_callback=lambda _: None
+        )
+        self.background(self._consume(subscriber.subscribe_to_events(subscription, token)))
+        self.client = await self.connect(AsyncPubSubClient(config=self.client_config()))
+        self.message = EventMessage(channel=self.channel, body=self.payload)
+        # Let the subscription register before the first publish.
+        await asyncio.sleep(0.5)
+
+    async def send(self) -> None:
+        await self.client.publish_event(self.message)
+
+
+@register_pattern("events_store")
+class EventsStoreWorkload(_SubscribedWorkload):
+    """``send_event_store``, waiting for the broker's confirmation."""
+
+    async def setup(self) -> None:
+        from kubemq import AsyncCancellationToken, AsyncPubSubClient, EventStoreMessage
+        from kubemq.pubsub import EventsStoreSubscription, EventStoreStartPosition
+
+        subscriber = await self.connect(AsyncPubSubClient(config=self.client_config(1)))
+        token = AsyncCancellationToken()
+        self._stack.callback(token.cancel)
+        subscription = EventsStoreSubscription(
+            channel=self.channel,
+            events_store_type=EventStoreStartPosition.StartFromNew,
+            on_receive_event_callback=lambda _: None,
+        )
+        self.background(self._consume(subscriber.subscribe_to_events_store(subscription, token)))
+        self.client = await self.connect(AsyncPubSubClient(config=self.client_config()))
+        self.message = EventStoreMessage(channel=self.channel, body=self.payload)
+        await asyncio.sleep(0.5)
+
+    async def send(self) -> None:
+        result = await self.client.send_event_store(self.message)
+        if not result.sent:
+            raise RuntimeError(result.error or "event store send not confirmed")
+
+
+class _QueueWorkload(Workload):
+    """Queue sends; the channel is drained at teardown."""
+
+    async def setup(self) -> None:
+        from kubemq import AsyncQueuesClient, QueueMessage
+
+        self.client = await self.connect(AsyncQueuesClient(config=self.client_config()))
+        self.message = QueueMessage(channel=self.channel, body=self.payload)
+
+    async def teardown(self) -> None:
+        with contextlib.suppress(Exception):
+            await self.client.ack_all_queue_messages(self.channel, wait_time_seconds=1)
+        await super().teardown()
+
+    @staticmethod
+    def _check(result: Any) -> None:
+        if result.is_error:
+            raise RuntimeError(result.error or "queue send failed")
+
+
+@register_pattern("queues_stream")
+class QueuesStreamWorkload(_QueueWorkload):
+    """``send_queue_message`` over the upstream stream."""
+
+    async def send(self) -> None:
+        self._check(await self.client.send_queue_message(self.message))
+
+
+@register_pattern("queues_simple")
+class QueuesSimpleWorkload(_QueueWorkload):
+    """``send_queue_message_simple`` over the unary RPC."""
+
+    async def send(self) -> None:
+        self._check(await self.client.send_queue_message_simple(self.message))
+
+
+@register_pattern("commands")
+class CommandsWorkload(Workload):
+    """``send_command`` round trips against an in-process responder."""
+
+    async def setup(self) -> None:
+        from kubemq import (
+            AsyncCancellationToken,
+            AsyncCQClient,
+            CommandMessage,
+            CommandResponse,
+        )
+        from kubemq.cq import CommandsSubscription
+
+        responder = await self.connect(AsyncCQClient(config=self.client_config(1)))
+        token = AsyncCancellationToken()
+        self._stack.callback(token.cancel)
+        subscription = CommandsSubscription(
+            channel=self.channel, on_receive_command_callback=lambda _: None
+        )
+
+        async def _respond() -> None:
+            async for command in responder.subscribe_to_commands(subscription, token):
+                await responder.send_response(
+                    CommandResponse(command_received=command, is_executed=True)
+                )
+
+        self.background(_respond())
+        self.client = await self.connect(AsyncCQClient(config=self.client_config()))
+        self.message = CommandMessage(
+            channel=self.channel, body=self.payload, timeout_in_seconds=_RPC_TIMEOUT_SECONDS
+        )
+        await asyncio.sleep(0.5)
+
+    async def send(self) -> None:
+        response = await self.client.send_command(self.message)
+        if not response.is_executed:
+            raise RuntimeError(response.error or "command not executed")
+
+
+@register_pattern("queries")
+class QueriesWorkload(Workload):
+    """``send_query`` round trips against an in-process responder echoing the body."""
+
+    async def setup(self) -> None:
+        from kubemq import AsyncCancellationToken, AsyncCQClient, QueryMessage, QueryResponse
+        from kubemq.cq import QueriesSubscription
+
+        responder = await self.connect(AsyncCQClient(config=self.client_config(1)))
+        token = AsyncCancellationToken()
+        self._stack.callback(token.cancel)
+        subscription = QueriesSubscription(
+            channel=self.channel, on_receive_query_callback=lambda _: None
+        )
+
+        async def _respond() -> None:
+            async for query in responder.subscribe_to_queries(subscription, token):
+                await responder.send_response(
+                    QueryResponse(query_received=query, is_executed=True, body=query.body)
+                )
+
+        self.background(_respond())
+        self.client = await self.connect(AsyncCQClient(config=self.client_config()))
+        self.message = QueryMessage(
+            channel=self.channel, body=self.payload, timeout_in_seconds=_RPC_TIMEOUT_SECONDS
+        )
+        await asyncio.sleep(0.5)
+
+    async def send(self) -> None:
+        response = await self.client.send_query(self.message)
+        if not response.is_executed:
+            raise RuntimeError(response.error or "query not executed")
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+
+def build_matrix(
+    patterns: Iterable[str],
+    sizes: Iterable[int],
+    concurrency: Iterable[int],
+    pool_sizes: Iterable[int],
+) -> list[Scenario]:
+    """Return the scenarios of a sweep, in a fixed order."""
+    patterns = list(patterns)
+    unknown = [p for p in patterns if p not in PATTERNS]
+    if unknown:
+        raise ValueError(f"unknown pattern(s) {unknown}; known: {sorted(PATTERNS)}")
+    return [
+        Scenario(pattern, size, conc, pool)
+        for pattern, size, conc, pool in itertools.product(
+            patterns, sorted(sizes), sorted(concurrency), sorted(pool_sizes)
+        )
+    ]
+
+
+async def _drive(workload: Workload, count: int, concurrency: int) -> RoundResult:
+    """Call ``workload.send`` ``count`` times from ``concurrency`` tasks."""
+    tickets: Iterator[int] = iter(range(count))
+    latencies: list[float] = []
+    errors = 0
+    clock = time.perf_counter
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in tickets:
+            start = clock()
+            try:
+                await workload.send()
+            except Exception:  # noqa: BLE001 - counted as a failed send
+                errors += 1
+                continue
+            latencies.append(clock() - start)
+
+    start = clock()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, count) or 1)))
+    elapsed = clock() - start
+    return RoundResult(
+        sent=len(latencies), errors=errors, elapsed_seconds=elapsed, latencies=latencies
+    )
+
+
+async def run_round(
+    scenario: Scenario,
+    settings: HarnessSettings,
+    workload_cls: type[Workload] | None = None,
+    channel: str | None = None,
+) -> RoundResult:
+    """Set up, warm up, measure and tear down one round of ``scenario``."""
+    cls = workload_cls or PATTERNS[scenario.pattern]
+    channel = channel or f"bench-{scenario.pattern}-{uuid.uuid4().hex[:12]}"
+    workload = cls(scenario, settings.address, channel)
+    try:
+        await workload.setup()
+        if settings.warmup:
+            await _drive(workload, settings.warmup, scenario.concurrency)
+        result = await _drive(workload, settings.messages, scenario.concurrency)
+        received = await workload.received(settings.warmup + settings.messages)
+        if received is not None:
+            result.received = max(0, received - settings.warmup)
+        return result
+    finally:
+        await workload.teardown()
+
+
+async def run_matrix(
+    scenarios: Sequence[Scenario],
+    settings: HarnessSettings,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run every scenario and return the results document."""
+    records = []
+    for scenario in scenarios:
+        rounds = [await run_round(scenario, settings) for _ in range(settings.rounds)]
+        record = summarize(scenario, rounds)
+        records.append(record)
+        if progress is not None:
+            progress(record)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment(),
+        "settings": asdict(settings),
+        "results": records,
+    }
+
+
+def _git(*args: str) -> str | None:
+    try:
+        out = subprocess.run(["git", *args], capture_output=True, text=True, check=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment() -> dict[str, Any]:
+    """Describe the code and machine a run was made on."""
+    import grpc
+
+    import kubemq
+
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(status) if status is not None else None,
+        "kubemq_version": kubemq.__version__,
+        "grpc_version": grpc.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Match scenarios by key and report throughput and p99 changes in percent.
+
+    Raises:
+        ValueError: If the documents have different schema versions.
+    """
+    if baseline.get("schema_version") != current.get("schema_version"):
+        raise ValueError(
+            f"schema version mismatch: baseline {baseline.get('schema_version')}, "
+            f"current {current.get('schema_version')}"
+        )
+    before = {r["key"]: r for r in baseline["results"]}
+    rows = []
+    for record in current["results"]:
+        old = before.get(record["key"])
+        if old is None:
+            continue
+        rows.append(
+            {
+                "key": record["key"],
+                "throughput_before": old["throughput_msgs_per_sec"],
+                "throughput_after": record["throughput_msgs_per_sec"],
+                "throughput_change_pct": _change(
+                    old["throughput_msgs_per_sec"], record["throughput_msgs_per_sec"]
+                ),
+                "p99_before_ms": old["latency_ms"]["p99"],
+                "p99_after_ms": record["latency_ms"]["p99"],
+                "p99_change_pct": _change(old["latency_ms"]["p99"], record["latency_ms"]["p99"]),
+            }
+        )
+    return rows
+
+
+def _change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return round((after - before) / before * 100, 1)
+
+
+def regressions(rows: Iterable[dict[str, Any]], threshold_pct: float) -> list[dict[str, Any]]:
+    """Rows whose throughput dropped by more than ``threshold_pct`` percent."""
+    return [r for r in rows if r["throughput_change_pct"] < -threshold_pct]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _csv(kind: Callable[[str], Any]) -> Callable[[str], list[Any]]:
+    return lambda text: [kind(part) for part in text.split(",") if part]
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.harness",
+        description="Run the KubeMQ publish/consume benchmark matrix.",
+    )
+    parser.add_argument(
+        "--address",
+        default=os.environ.get("KUBEMQ_BENCHMARK_ADDRESS", "localhost:50000"),
+        help="broker address (default: $KUBEMQ_BENCHMARK_ADDRESS or localhost:50000)",
+    )
+    parser.add_argument("--patterns", type=_csv(str), default=list(DEFAULT_PATTERNS))
+    parser.add_argument("--sizes", type=_csv(int), default=list(DEFAULT_SIZES))
+    parser.add_argument("--concurrency", type=_csv(int), default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--pool-sizes", type=_csv(int), default=list(DEFAULT_POOL_SIZES))
+    parser.add_argument("--messages", type=int, default=HarnessSettings.messages)
+    parser.add_argument("--warmup", type=int, default=HarnessSettings.warmup)
+    parser.add_argument("--rounds", type=int, default=HarnessSettings.rounds)
+    parser.add_argument("--output", type=Path, help="write the results JSON here")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to compare with")
+    parser.add_argument(
+        "--fail-threshold",
+        type=float,
+        help="with --compare, exit 1 if any throughput drops by more than this percent",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    if args.messages < 1 or args.rounds < 1 or args.warmup < 0:
+        print("--messages and --rounds must be >= 1, --warmup >= 0", file=sys.stderr)
+        return 2
+    settings = HarnessSettings(
+        address=args.address, messages=args.messages, warmup=args.warmup, rounds=args.rounds
+    )
+    try:
+        scenarios = build_matrix(args.patterns, args.sizes, args.concurrency, args.pool_sizes)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    def progress(record: dict[str, Any]) -> None:
+        print(
+            f"{record['key']:<55} {record['throughput_msgs_per_sec']:>10.1f} msg/s"
+            f"  p50 {record['latency_ms']['p50']:>8.3f} ms"
+            f"  p99 {record['latency_ms']['p99']:>8.3f} ms"
+            f"  errors {record['errors']}",
+            flush=True,
+        )
+
+    document = asyncio.run(run_matrix(scenarios, settings, progress))
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text())
+    rows = compare(baseline, document)
+    print()
+    for row in rows:
+        print(
+            f"{row['key']:<55} throughput {row['throughput_change_pct']:+7.1f}%"
+            f"  p99 {row['p99_change_pct']:+7.1f}%"
+        )
+    if args.fail_threshold is not None and regressions(rows, args.fail_threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
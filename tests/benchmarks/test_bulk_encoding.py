@@ -0,0 +1,90 @@
+"""Batch encoding cost: per-message loop vs. columnar bulk encoder.
+
+Encodes 100k 64-byte messages to one channel the way
+``send_queue_messages_batch`` / ``send_events_store_batch`` do (one
+dataclass, one ``encode`` and one trace-tag injection per row) and the way
+the ``*_bulk`` methods do (shared fields once, then an ID and a body per
+row). No server is required.
+
+Usage:
+    uv run pytest tests/benchmarks/test_bulk_encoding.py --benchmark-only \\
+        --benchmark-group-by=param:kind
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from kubemq._internal.bulk_encode import encode_bulk
+from kubemq._internal.telemetry import KubeMQTagsCarrier
+from kubemq.grpc import kubemq_pb2 as pb
+from kubemq.pubsub.event_store_message import EventStoreMessage
+from kubemq.queues.queues_message import QueueMessage
+
+from .conftest import BENCHMARK_PAYLOAD_64B
+
+pytestmark = [pytest.mark.benchmark]
+
+ROWS = 100_000
+CLIENT_ID = "bench-client"
+TAGS = {"source": "benchmark"}
+BODIES = [BENCHMARK_PAYLOAD_64B] * ROWS
+KINDS = ["queue", "event_store"]
+
+
+def _per_message_queue() -> pb.QueueMessagesBatchRequest:
+    request = pb.QueueMessagesBatchRequest(BatchID="bench")
+    for body in BODIES:
+        pb_msg = QueueMessage(
+            channel="bench.queue", tags=TAGS, expiration_in_seconds=3600, body=body
+        ).encode_message(CLIENT_ID)
+        tags_dict = dict(pb_msg.Tags)
+        KubeMQTagsCarrier(tags_dict).inject()
+        pb_msg.Tags.update(tags_dict)
+        request.Messages.append(pb_msg)
+    return request
+
+
+def _per_message_event_store() -> list[pb.Event]:
+    events = []
+    for body in BODIES:
+        pb_event = EventStoreMessage(channel="bench.store", tags=TAGS, body=body).encode(CLIENT_ID)
+        tags_dict = dict(pb_event.Tags)
+        KubeMQTagsCarrier(tags_dict).inject()
+        pb_event.Tags.update(tags_dict)
+        events.append(pb_event)
+    return events
+
+
+def _bulk_queue() -> pb.QueueMessagesBatchRequest:
+    request = pb.QueueMessagesBatchRequest(BatchID="bench")
+    encode_bulk(
+        QueueMessage,
+        "bench.queue",
+        BODIES,
+        CLIENT_ID,
+        tags=TAGS,
+        into=request.Messages,
+        expiration_in_seconds=3600,
+    )
+    return request
+
+
+def _bulk_event_store() -> list[pb.Event]:
+    return list(encode_bulk(EventStoreMessage, "bench.store", BODIES, CLIENT_ID, tags=TAGS))
+
+
+PER_MESSAGE = {"queue": _per_message_queue, "event_store": _per_message_event_store}
+BULK = {"queue": _bulk_queue, "event_store": _bulk_event_store}
+
+
+class TestBulkEncoding:
+    """Encode 100k 64-byte messages for one batch."""
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_per_message(self, benchmark, kind):
+        benchmark.pedantic(PER_MESSAGE[kind], rounds=3, warmup_rounds=1)
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_bulk(self, benchmark, kind):
+        benchmark.pedantic(BULK[kind], rounds=3, warmup_rounds=1)
@@ -0,0 +1,65 @@
+"""Callback dispatch overhead: worker pool vs. task-per-message.
+
+Measures the SDK-side cost of handing a decoded message to a user callback
+in the ``max_concurrent_callbacks > 1`` subscription paths. No server is
+required -- the callback is a no-op so the numbers isolate dispatch cost.
+
+Usage:
+    uv run pytest tests/benchmarks/test_callback_dispatch.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kubemq._internal.callback_pool import AsyncCallbackPool
+
+pytestmark = [pytest.mark.benchmark]
+
+MESSAGES = 10_000
+CONCURRENCY = 32
+
+
+async def _noop(item: int) -> None:
+    return None
+
+
+async def _task_per_message() -> None:
+    """The dispatch pattern used before the worker pool was introduced."""
+    sem = asyncio.Semaphore(CONCURRENCY)
+    pending: set[asyncio.Task[None]] = set()
+
+    async def _run(item: int) -> None:
+        try:
+            await _noop(item)
+        finally:
+            sem.release()
+
+    for i in range(MESSAGES):
+        await sem.acquire()
+        task = asyncio.create_task(_run(i))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _worker_pool() -> None:
+    pool = AsyncCallbackPool(_noop, CONCURRENCY)
+    pool.start()
+    submit = pool.submit
+    for i in range(MESSAGES):
+        await submit(i)
+    await pool.close()
+
+
+class TestCallbackDispatch:
+    """Per-message dispatch overhead for concurrent callback subscriptions."""
+
+    def test_task_per_message(self, benchmark):
+        benchmark.pedantic(lambda: asyncio.run(_task_per_message()), rounds=5, warmup_rounds=1)
+
+    def test_worker_pool(self, benchmark):
+        benchmark.pedantic(lambda: asyncio.run(_worker_pool()), rounds=5, warmup_rounds=1)
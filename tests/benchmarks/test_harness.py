@@ -0,0 +1,187 @@
+"""Tests for the benchmark matrix harness.
+
+TestHarnessMechanics runs offline against an in-process workload.
+TestHarnessMatrix sweeps a small matrix against a live broker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from tests.benchmarks.harness import (
+    PATTERNS,
+    SCHEMA_VERSION,
+    HarnessSettings,
+    RoundResult,
+    Scenario,
+    Workload,
+    build_matrix,
+    compare,
+    main,
+    percentile,
+    regressions,
+    run_matrix,
+    run_round,
+    summarize,
+)
+
+
+class _SleepyWorkload(Workload):
+    """Slow setup and teardown, fast sends."""
+
+    setups = 0
+    sends = 0
+
+    async def setup(self) -> None:
+        type(self).setups += 1
+        await asyncio.sleep(0.2)
+
+    async def send(self) -> None:
+        type(self).sends += 1
+        await asyncio.sleep(0)
+
+    async def teardown(self) -> None:
+        await asyncio.sleep(0.2)
+        await super().teardown()
+
+
+class TestHarnessMechanics:
+    def test_setup_and_teardown_are_not_timed(self):
+        scenario = Scenario("sleepy", 64, 4, 1)
+        settings = HarnessSettings(address="unused", messages=100, warmup=10, rounds=1)
+        _SleepyWorkload.sends = 0
+
+        result = asyncio.run(run_round(scenario, settings, _SleepyWorkload, channel="c"))
+
+        assert result.sent == 100
+        assert result.errors == 0
+        assert len(result.latencies) == 100
+        assert _SleepyWorkload.sends == 110
+        assert result.elapsed_seconds < 0.1
+        assert result.received is None
+
+    def test_send_errors_are_counted_not_timed(self):
+        class Flaky(Workload):
+            calls = 0
+
+            async def send(self) -> None:
+                type(self).calls += 1
+                if type(self).calls % 2:
+                    raise RuntimeError("boom")
+
+        scenario = Scenario("flaky", 64, 2, 1)
+        settings = HarnessSettings(address="unused", messages=10, warmup=0)
+        result = asyncio.run(run_round(scenario, settings, Flaky, channel="c"))
+
+        assert result.sent == 5
+        assert result.errors == 5
+        assert len(result.latencies) == 5
+
+    def test_matrix_order_is_fixed(self):
+        scenarios = build_matrix(["queries", "events"], [1024, 64], [16, 1], [4, 1])
+
+        assert len(scenarios) == 16
+        assert scenarios[0] == Scenario("queries", 64, 1, 1)
+        assert scenarios[1] == Scenario("queries", 64, 1, 4)
+        assert scenarios[-1] == Scenario("events", 1024, 16, 4)
+
+    def test_unknown_pattern_rejected(self):
+        with pytest.raises(ValueError, match="unknown pattern"):
+            build_matrix(["nope"], [64], [1], [1])
+
+    def test_all_requested_patterns_registered(self):
+        assert set(PATTERNS) >= {
+            "events",
+            "events_store",
+            "queues_stream",
+            "queues_simple",
+            "commands",
+            "queries",
+        }
+
+    def test_percentile_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 99) == 0.0
+
+    def test_summarize_reports_median_round(self):
+        scenario = Scenario("events", 1024, 1, 1)
+        rounds = [
+            RoundResult(sent=100, errors=0, elapsed_seconds=1.0, latencies=[0.01] * 100),
+            RoundResult(sent=100, errors=0, elapsed_seconds=0.5, latencies=[0.005] * 100),
+            RoundResult(sent=100, errors=0, elapsed_seconds=2.0, latencies=[0.02] * 100),
+        ]
+
+        record = summarize(scenario, rounds)
+
+        assert record["key"] == "events/size=1024/concurrency=1/pool=1"
+        assert record["throughput_msgs_per_sec"] == 100.0
+        assert record["latency_ms"]["p99"] == 10.0
+        assert record["round_throughputs"] == [100.0, 200.0, 50.0]
+
+    def test_compare_matches_by_key(self):
+        def doc(throughput: float, p99: float) -> dict:
+            return {
+                "schema_version": SCHEMA_VERSION,
+                "results": [
+                    {
+                        "key": "events/size=64/concurrency=1/pool=1",
+                        "throughput_msgs_per_sec": throughput,
+                        "latency_ms": {"p99": p99},
+                    }
+                ],
+            }
+
+        rows = compare(doc(1000.0, 2.0), doc(800.0, 3.0))
+
+        assert rows[0]["throughput_change_pct"] == -20.0
+        assert rows[0]["p99_change_pct"] == 50.0
+        assert regressions(rows, 10.0) == rows
+        assert regressions(rows, 25.0) == []
+
+    def test_compare_rejects_other_schema(self):
+        with pytest.raises(ValueError, match="schema version"):
+            compare({"schema_version": 0, "results": []}, {"schema_version": 1, "results": []})
+
+    def test_results_document_is_json(self):
+        scenarios = [Scenario("sleepy", 64, 2, 1)]
+        settings = HarnessSettings(address="unused", messages=20, warmup=0, rounds=2)
+        PATTERNS["sleepy"] = _SleepyWorkload
+        try:
+            document = asyncio.run(run_matrix(scenarios, settings))
+        finally:
+            del PATTERNS["sleepy"]
+
+        decoded = json.loads(json.dumps(document))
+        assert decoded["schema_version"] == SCHEMA_VERSION
+        assert decoded["settings"]["messages"] == 20
+        assert "git_commit" in decoded["environment"]
+        assert decoded["results"][0]["sent"] == 20
+        assert len(decoded["results"][0]["round_throughputs"]) == 2
+
+    def test_cli_rejects_bad_arguments(self):
+        assert main(["--patterns", "nope"]) == 2
+        assert main(["--messages", "0"]) == 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.integration
+class TestHarnessMatrix:
+    """Small matrix over every pattern; the full sweep runs from the CLI."""
+
+    def test_matrix_smoke(self, kubemq_address: str, tmp_path):
+        scenarios = build_matrix(list(PATTERNS), [1024], [1, 8], [1, 2])
+        settings = HarnessSettings(address=kubemq_address, messages=200, warmup=20, rounds=1)
+
+        document = asyncio.run(run_matrix(scenarios, settings))
+
+        (tmp_path / "results.json").write_text(json.dumps(document))
+        assert len(document["results"]) == len(scenarios)
+        for record in document["results"]:
+            assert record["errors"] == 0, record["key"]
+            assert record["sent"] == 200, record["key"]
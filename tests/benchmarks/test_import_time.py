@@ -0,0 +1,79 @@
+"""Import-time regression budget for ``import kubemq``.
+
+Runs a fresh interpreter under ``python -X importtime`` and sums the
+cumulative time of the ``kubemq`` import, taking the best of several runs
+to damp scheduler noise. The public API is lazily resolved, so importing
+the package -- or only the message types -- must not pull in ``grpc``.
+
+The budgets can be overridden for slow CI hosts with
+``KUBEMQ_IMPORT_BUDGET_MS`` and ``KUBEMQ_IMPORT_MESSAGES_BUDGET_MS``.
+
+Usage:
+    uv run pytest tests/benchmarks/test_import_time.py -v
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = [pytest.mark.benchmark]
+
+RUNS = 5
+IMPORT_BUDGET_MS = float(os.environ.get("KUBEMQ_IMPORT_BUDGET_MS", "100"))
+MESSAGES_BUDGET_MS = float(os.environ.get("KUBEMQ_IMPORT_MESSAGES_BUDGET_MS", "150"))
+
+
+def _import_time_ms(statement: str, module: str = "kubemq") -> float:
+    """Best-of-N cumulative import time (ms) of ``module`` for ``statement``."""
+    best = float("inf")
+    for _ in range(RUNS):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cumulative_us = 0
+        for line in proc.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative_us += int(parts[1])
+        best = min(best, cumulative_us / 1000)
+    return best
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(proc.stdout.split())
+
+
+class TestImportTime:
+    """Import cost of the top-level package."""
+
+    def test_import_kubemq_within_budget(self):
+        elapsed = _import_time_ms("import kubemq")
+        print(f"\nimport kubemq: {elapsed:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+        assert elapsed <= IMPORT_BUDGET_MS
+
+    def test_import_messages_within_budget(self):
+        statement = "from kubemq import QueueMessage, EventMessage, CommandMessage"
+        elapsed = _import_time_ms(statement) + _import_time_ms(statement, "kubemq.grpc")
+        print(f"\nmessage types: {elapsed:.1f} ms (budget {MESSAGES_BUDGET_MS:.0f} ms)")
+        assert elapsed <= MESSAGES_BUDGET_MS
+
+    def test_message_types_do_not_import_grpc(self):
+        loaded = _loaded_modules(
+            "from kubemq import QueueMessage, EventMessage, CommandMessage, ClientConfig"
+        )
+        assert "grpc" not in loaded
+        assert "kubemq.queues.async_client" not in loaded
@@ -0,0 +1,119 @@
+"""Small-message encoding throughput: plain messages vs. message templates.
+
+Measures the client-side cost of turning a 64-byte payload into the
+protobuf that goes on the wire, for the three ways a producer can build it:
+
+- ``plain``: construct and validate a message dataclass, then encode it.
+- ``template_message``: ``MessageTemplate.message(body)`` then encode; the
+  result is a regular message object accepted by every send method.
+- ``template_encode``: ``MessageTemplate.encode(body, client_id)``, which
+  skips the message object entirely.
+
+No server is required.
+
+Usage:
+    uv run pytest tests/benchmarks/test_message_encoding.py --benchmark-only \\
+        --benchmark-group-by=param:kind
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from kubemq.core.message_template import MessageTemplate
+from kubemq.cq.command_message import CommandMessage
+from kubemq.pubsub.event_message import EventMessage
+from kubemq.queues.queues_message import QueueMessage
+
+from .conftest import BENCHMARK_PAYLOAD_64B
+
+pytestmark = [pytest.mark.benchmark]
+
+MESSAGES = 10_000
+CLIENT_ID = "bench-client"
+TAGS = {"source": "benchmark", "tenant": "t-1"}
+
+
+def _plain_event() -> Any:
+    return EventMessage(
+        channel="bench.events", metadata="m", tags=TAGS, body=BENCHMARK_PAYLOAD_64B
+    ).encode(CLIENT_ID)
+
+
+def _plain_queue() -> Any:
+    return QueueMessage(
+        channel="bench.queue",
+        metadata="m",
+        tags=TAGS,
+        expiration_in_seconds=3600,
+        body=BENCHMARK_PAYLOAD_64B,
+    ).encode_message(CLIENT_ID)
+
+
+def _plain_command() -> Any:
+    return CommandMessage(
+        channel="bench.commands",
+        metadata="m",
+        tags=TAGS,
+        timeout_in_seconds=10,
+        body=BENCHMARK_PAYLOAD_64B,
+    ).encode(CLIENT_ID)
+
+
+_EVENT_TEMPLATE = MessageTemplate(EventMessage(channel="bench.events", metadata="m", tags=TAGS))
+_QUEUE_TEMPLATE = MessageTemplate(
+    QueueMessage(channel="bench.queue", metadata="m", tags=TAGS, expiration_in_seconds=3600)
+)
+_COMMAND_TEMPLATE = MessageTemplate(
+    CommandMessage(channel="bench.commands", metadata="m", tags=TAGS, timeout_in_seconds=10)
+)
+
+PLAIN: dict[str, Callable[[], Any]] = {
+    "event": _plain_event,
+    "queue": _plain_queue,
+    "command": _plain_command,
+}
+TEMPLATE_MESSAGE: dict[str, Callable[[], Any]] = {
+    "event": lambda: _EVENT_TEMPLATE.message(BENCHMARK_PAYLOAD_64B).encode(CLIENT_ID),
+    "queue": lambda: _QUEUE_TEMPLATE.message(BENCHMARK_PAYLOAD_64B).encode_message(CLIENT_ID),
+    "command": lambda: _COMMAND_TEMPLATE.message(BENCHMARK_PAYLOAD_64B).encode(CLIENT_ID),
+}
+TEMPLATE_ENCODE: dict[str, Callable[[], Any]] = {
+    "event": lambda: _EVENT_TEMPLATE.encode(BENCHMARK_PAYLOAD_64B, CLIENT_ID),
+    "queue": lambda: _QUEUE_TEMPLATE.encode(BENCHMARK_PAYLOAD_64B, CLIENT_ID),
+    "command": lambda: _COMMAND_TEMPLATE.encode(BENCHMARK_PAYLOAD_64B, CLIENT_ID),
+}
+KINDS = list(PLAIN)
+ID_FIELDS = {"event": "EventID", "queue": "MessageID", "command": "RequestID"}
+
+
+def _encode_many(encode: Callable[[], Any]) -> None:
+    for _ in range(MESSAGES):
+        encode()
+
+
+class TestMessageEncoding:
+    """Encode 10k 64-byte messages to the same channel."""
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_plain(self, benchmark, kind):
+        benchmark.pedantic(_encode_many, args=(PLAIN[kind],), rounds=5, warmup_rounds=1)
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_template_message(self, benchmark, kind):
+        benchmark.pedantic(_encode_many, args=(TEMPLATE_MESSAGE[kind],), rounds=5, warmup_rounds=1)
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_template_encode(self, benchmark, kind):
+        benchmark.pedantic(_encode_many, args=(TEMPLATE_ENCODE[kind],), rounds=5, warmup_rounds=1)
+
+    @pytest.mark.parametrize("kind", KINDS)
+    def test_template_output_matches_plain(self, kind):
+        plain = PLAIN[kind]()
+        templated = TEMPLATE_ENCODE[kind]()
+        for pb in (plain, templated):
+            pb.ClearField(ID_FIELDS[kind])
+        assert templated == plain
@@ -26,12 +26,23 @@ class TestPublishThroughput:
         client.close()
 
     def test_async_publish_throughput_1kb(self, benchmark, kubemq_address: str, payload_1kb: bytes):
-        """Benchmark: async publish throughput with 1KB payload (sync wrapper)."""
+        """Benchmark: async publish throughput with 1KB payload.
+
+        The client is connected once on a long-lived loop; only the publish
+        is timed, not ``asyncio.run`` or the connection.
+        """
         from kubemq.pubsub import AsyncClient as AsyncPubSubClient, EventMessage
 
-        async def _run_one():
-            async with AsyncPubSubClient(address=kubemq_address) as client:
-                msg = EventMessage(channel="bench-throughput-async", body=payload_1kb)
-                await client.send_event(msg)
+        loop = asyncio.new_event_loop()
+        client = AsyncPubSubClient(address=kubemq_address)
+        loop.run_until_complete(client.connect())
+        msg = EventMessage(channel="bench-throughput-async", body=payload_1kb)
+
+        def publish():
+            loop.run_until_complete(client.publish_event(msg))
 
-        benchmark(lambda: asyncio.run(_run_one()))
+        try:
+            benchmark.pedantic(publish, iterations=100, rounds=5, warmup_rounds=1)
+        finally:
+            loop.run_until_complete(client.close())
+            loop.close()
@@ -273,3 +273,33 @@ class TestListChannelsRetryExhausted:
         assert result == []
         decode_fn.assert_not_called()
         transport.kubemq_client.assert_not_called()
+
+
+class TestChannelListCacheIntegration:
+    @patch("kubemq.common.requests.decode_queues_channel_list")
+    def test_list_uses_cache(self, mock_decode):
+        from kubemq._internal.channel_cache import ChannelListCache
+
+        channel = MagicMock()
+        channel.name = "q1"
+        mock_decode.return_value = [channel]
+        transport = _make_transport(response=_make_response(body=b"[]"))
+        cache = ChannelListCache(60)
+
+        list_queues_channels(transport, "client-1", "", cache=cache)
+        result = list_queues_channels(transport, "client-1", "", cache=cache)
+
+        assert result == [channel]
+        assert transport.kubemq_client().SendRequest.call_count == 1
+
+    def test_create_and_delete_invalidate_channel_type(self):
+        cache = MagicMock()
+        transport = _make_transport(response=_make_response(executed=True))
+
+        create_channel_request(transport, "client-1", "q1", "queues", cache=cache)
+        delete_channel_request(transport, "client-1", "q1", "queues", cache=cache)
+
+        assert cache.invalidate.call_args_list == [
+            unittest.mock.call("queues"),
+            unittest.mock.call("queues"),
+        ]
@@ -95,6 +95,21 @@ class TestBaseClientInit:
 
         assert client._config.auth_token == "test-token"
 
+    @patch("kubemq.transport.transport.SyncTransport")
+    def test_channel_cache_follows_config(self, mock_transport_class):
+        """Test that a positive channel_list_cache_ttl creates the cache."""
+        mock_transport = MagicMock()
+        mock_transport.initialize.return_value = mock_transport
+        mock_transport_class.return_value = mock_transport
+
+        assert ConcreteBaseClient(address="localhost:50000")._channel_cache is None
+        config = ClientConfig(address="localhost:50000", channel_list_cache_ttl=5.0)
+        client = ConcreteBaseClient(config=config)
+
+        assert client._channel_cache is not None
+        assert client._channel_cache.ttl_seconds == 5.0
+        client.invalidate_channel_cache()
+
 
 class TestBaseClientConnection:
     """Tests for BaseClient connection management."""
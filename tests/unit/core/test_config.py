@@ -9,6 +9,7 @@ from pathlib import Path
 import pytest
 
 from kubemq.core.config import (
+    AdaptiveRateConfig,
     ClientConfig,
     JitterType,
     KeepAliveConfig,
@@ -317,7 +318,12 @@ class TestConfigRepr:
 
 class TestJitterType:
     def test_members(self):
-        assert set(JitterType) == {JitterType.FULL, JitterType.EQUAL, JitterType.NONE}
+        assert set(JitterType) == {
+            JitterType.FULL,
+            JitterType.EQUAL,
+            JitterType.NONE,
+            JitterType.DECORRELATED,
+        }
 
 
 class TestRetryPolicy:
@@ -567,6 +573,48 @@ class TestClientConfigPostInitValidation:
             ClientConfig(address="localhost:50000", credential_timeout=0)
 
 
+class TestChannelListCacheTtl:
+    def test_disabled_by_default(self):
+        assert ClientConfig().channel_list_cache_ttl == 0.0
+
+    def test_negative_raises(self):
+        with pytest.raises(ValueError, match="channel_list_cache_ttl"):
+            ClientConfig(channel_list_cache_ttl=-1.0)
+
+
+class TestQueryCacheMaxBytes:
+    def test_disabled_by_default(self):
+        assert ClientConfig().query_cache_max_bytes == 0
+
+    def test_negative_raises(self):
+        with pytest.raises(ValueError, match="query_cache_max_bytes"):
+            ClientConfig(query_cache_max_bytes=-1)
+
+
+class TestAdaptiveRateConfig:
+    def test_defaults_are_valid(self):
+        config = AdaptiveRateConfig()
+        assert config.min_rate <= config.initial_rate <= config.max_rate
+        assert ClientConfig().adaptive_rate is None
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"min_rate": 0.0},
+            {"initial_rate": 5.0, "min_rate": 10.0},
+            {"initial_rate": 2e5},
+            {"additive_increase": 0.0},
+            {"decrease_factor": 1.0},
+            {"target_latency_seconds": 0.0},
+            {"high_queue_utilization": 1.5},
+            {"adjust_interval_seconds": 0.0},
+        ],
+    )
+    def test_invalid_values_raise(self, overrides):
+        with pytest.raises(ValueError):
+            AdaptiveRateConfig(**overrides)
+
+
 class TestClientConfigTokenPresent:
     def test_token_present_true(self):
         config = ClientConfig(address="localhost:50000", auth_token="secret")
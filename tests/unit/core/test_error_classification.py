@@ -26,7 +26,7 @@ from kubemq.core.exceptions import (
     from_grpc_error,
 )
 
-# Mapping table aligned with _GRPC_MAPPING in src/kubemq/core/exceptions.py.
+# Mapping table aligned with _STRING_GRPC_MAPPING in src/kubemq/core/exceptions.py.
 # CANCELLED without cancellation_token is treated as server-initiated
 # and returns KubeMQConnectionError (retryable=True, code=CANCELLED).
 GRPC_CODE_EXPECTATIONS = [
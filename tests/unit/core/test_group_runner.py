@@ -0,0 +1,145 @@
+"""Tests for the multi-process ConsumerGroupRunner."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from kubemq.common.async_cancellation_token import AsyncCancellationToken
+from kubemq.core.config import ClientConfig
+from kubemq.core.group_runner import (
+    ConsumerGroupRunner,
+    GroupRunReport,
+    WorkerContext,
+    WorkerMetrics,
+    WorkerSnapshot,
+)
+
+# Worker coroutines must be module-level so spawned processes can import them.
+
+
+async def _counting_worker(ctx: WorkerContext) -> None:
+    ctx.metrics.inc("processed", 10 + ctx.worker_index)
+    ctx.metrics.set("client_id_len", len(ctx.config.client_id or ""))
+
+
+async def _wait_for_cancel_worker(ctx: WorkerContext) -> None:
+    ctx.metrics.inc("started")
+    while not ctx.cancellation_token.is_cancelled:
+        await asyncio.sleep(0.01)
+    ctx.metrics.inc("drained")
+
+
+async def _failing_worker(ctx: WorkerContext) -> None:
+    if ctx.worker_index == 1:
+        raise RuntimeError("boom")
+
+
+class TestWorkerMetrics:
+    def test_inc_and_set(self):
+        m = WorkerMetrics()
+        m.inc("a")
+        m.inc("a", 2)
+        m.set("g", 5)
+        assert m.snapshot() == {"a": 3, "g": 5}
+
+
+class TestGroupRunReport:
+    def test_totals_and_exit_codes(self):
+        report = GroupRunReport(
+            workers={
+                0: WorkerSnapshot(0, 100, {"processed": 3}, exit_code=0),
+                1: WorkerSnapshot(1, 101, {"processed": 4, "errors": 1}, exit_code=1),
+            }
+        )
+        assert report.totals == {"processed": 7, "errors": 1}
+        assert report.exit_codes == {0: 0, 1: 1}
+        assert report.succeeded is False
+
+
+class TestWorkerContext:
+    async def test_clients_are_cached_and_closed(self, monkeypatch):
+        closed = []
+
+        class FakeClient:
+            def __init__(self, config):
+                self.config = config
+
+            async def connect(self):
+                pass
+
+            async def close(self):
+                closed.append(self)
+
+        monkeypatch.setattr("kubemq.pubsub.async_client.AsyncClient", FakeClient)
+        ctx = WorkerContext(0, 1, "g", ClientConfig(client_id="c-w0"), AsyncCancellationToken())
+
+        first = await ctx.pubsub_client()
+        second = await ctx.pubsub_client()
+        assert first is second
+        assert first.config.client_id == "c-w0"
+
+        await ctx.aclose()
+        assert closed == [first]
+
+
+class TestConsumerGroupRunnerValidation:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"group": ""},
+            {"group": "g", "processes": 0},
+            {"group": "g", "drain_timeout_seconds": -1},
+            {"group": "g", "metrics_interval_seconds": 0},
+        ],
+    )
+    def test_rejects_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            ConsumerGroupRunner(_counting_worker, **kwargs)
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(60)
+class TestConsumerGroupRunnerProcesses:
+    def test_runs_workers_and_aggregates_metrics(self):
+        runner = ConsumerGroupRunner(
+            _counting_worker,
+            group="g",
+            processes=2,
+            config=ClientConfig(client_id="svc"),
+        )
+        report = runner.run()
+
+        assert report.succeeded
+        assert set(report.workers) == {0, 1}
+        assert report.totals["processed"] == 10 + 11
+        # "svc-w0" / "svc-w1"
+        assert report.workers[0].counters["client_id_len"] == len("svc-w0")
+
+    def test_stop_drains_workers(self):
+        runner = ConsumerGroupRunner(
+            _wait_for_cancel_worker,
+            group="g",
+            processes=2,
+            metrics_interval_seconds=0.05,
+        )
+
+        def _stop_when_started():
+            while runner.metrics().totals.get("started", 0) < 2:
+                threading.Event().wait(0.05)
+            runner.stop()
+
+        stopper = threading.Thread(target=_stop_when_started, daemon=True)
+        stopper.start()
+        report = runner.run()
+
+        assert report.succeeded
+        assert report.totals["drained"] == 2
+
+    def test_failed_worker_reported(self):
+        report = ConsumerGroupRunner(_failing_worker, group="g", processes=2).run()
+
+        assert report.exit_codes == {0: 0, 1: 1}
+        assert "boom" in report.workers[1].error
@@ -0,0 +1,180 @@
+"""Tests for kubemq.core.message_template module."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubemq.core.message_template import MessageTemplate
+from kubemq.cq.command_message import CommandMessage
+from kubemq.cq.query_message import QueryMessage
+from kubemq.pubsub.event_message import EventMessage
+from kubemq.pubsub.event_store_message import EventStoreMessage
+from kubemq.queues.queues_message import QueueMessage
+
+SAMPLES = [
+    pytest.param(
+        EventMessage(channel="events.a", metadata="m", tags={"k": "v"}),
+        "encode",
+        "EventID",
+        id="event",
+    ),
+    pytest.param(
+        EventStoreMessage(channel="store.a", metadata="m", tags={"k": "v"}),
+        "encode",
+        "EventID",
+        id="event_store",
+    ),
+    pytest.param(
+        QueueMessage(
+            channel="queue.a",
+            metadata="m",
+            tags={"k": "v"},
+            delay_in_seconds=5,
+            expiration_in_seconds=60,
+            max_receive_count=3,
+            max_receive_queue="queue.dlq",
+        ),
+        "encode_message",
+        "MessageID",
+        id="queue",
+    ),
+    pytest.param(
+        CommandMessage(channel="cmd.a", metadata="m", tags={"k": "v"}, timeout_in_seconds=7),
+        "encode",
+        "RequestID",
+        id="command",
+    ),
+    pytest.param(
+        QueryMessage(
+            channel="query.a",
+            metadata="m",
+            tags={"k": "v"},
+            timeout_in_seconds=7,
+            cache_key="ck",
+            cache_ttl_in_seconds=30,
+        ),
+        "encode",
+        "RequestID",
+        id="query",
+    ),
+]
+
+
+class TestMessageTemplate:
+    @pytest.mark.parametrize(("sample", "encoder", "id_field"), SAMPLES)
+    def test_templated_encode_matches_plain_encode(self, sample, encoder, id_field):
+        template = MessageTemplate(sample)
+        message = template.message(b"payload", id="id-1")
+
+        plain = type(sample)(**{**vars(sample), "id": "id-1", "body": b"payload"})
+        assert getattr(message, encoder)("client") == getattr(plain, encoder)("client")
+
+    @pytest.mark.parametrize(("sample", "encoder", "id_field"), SAMPLES)
+    def test_direct_encode_matches_plain_encode(self, sample, encoder, id_field):
+        template = MessageTemplate(sample)
+        pb = template.encode(b"payload", "client", id="id-1")
+
+        plain = type(sample)(**{**vars(sample), "id": "id-1", "body": b"payload"})
+        assert pb == getattr(plain, encoder)("client")
+
+    @pytest.mark.parametrize(("sample", "encoder", "id_field"), SAMPLES)
+    def test_messages_are_instances_of_sample_class(self, sample, encoder, id_field):
+        message = MessageTemplate(sample).message(b"x")
+
+        assert isinstance(message, type(sample))
+        assert message.channel == sample.channel
+        assert message.tags == sample.tags
+        assert message.body == b"x"
+
+    @pytest.mark.parametrize(("sample", "encoder", "id_field"), SAMPLES)
+    def test_generated_ids_are_unique(self, sample, encoder, id_field):
+        template = MessageTemplate(sample)
+        ids = {getattr(template.encode(b"", "c"), id_field) for _ in range(100)}
+        ids |= {template.message().id for _ in range(100)}
+        assert len(ids) == 200
+        assert "" not in ids
+
+    def test_prototype_is_not_mutated(self):
+        template = MessageTemplate(EventMessage(channel="events.a", metadata="m"))
+        template.encode(b"first", "c1", id="a")
+
+        pb = template.encode(b"", "c2")
+        assert pb.Body == b""
+        assert pb.ClientID == "c2"
+        assert pb.EventID != "a"
+
+    def test_queue_upstream_request_uses_template(self):
+        template = MessageTemplate(QueueMessage(channel="queue.a", metadata="m"))
+        request = template.message(b"body", id="q-1").encode("client")
+
+        assert len(request.Messages) == 1
+        assert request.Messages[0].MessageID == "q-1"
+        assert request.Messages[0].Channel == "queue.a"
+        assert request.Messages[0].Body == b"body"
+
+    def test_command_span(self):
+        template = MessageTemplate(
+            CommandMessage(channel="cmd.a", metadata="m", timeout_in_seconds=5)
+        )
+
+        assert template.message(b"x").encode("c", span=b"trace").Span == b"trace"
+        assert template.encode(b"x", "c").Span == b""
+
+    def test_with_updates_returns_plain_message(self):
+        template = MessageTemplate(EventMessage(channel="events.a", metadata="m"))
+        message = template.message(b"x", id="e-1")
+
+        updated = message.with_updates(channel="events.b")
+
+        assert type(updated) is EventMessage
+        assert updated.channel == "events.b"
+        assert updated.id == "e-1"
+        assert updated.body == b"x"
+
+    def test_template_from_templated_message(self):
+        first = MessageTemplate(EventMessage(channel="events.a", metadata="m"))
+        second = MessageTemplate(first.message(b"x"))
+
+        assert second.channel == "events.a"
+        assert type(second.message()) is type(first.message())
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError, match="Unsupported message type"):
+            MessageTemplate("not a message")
+
+    def test_with_updates_without_changes_equals_plain_message(self):
+        template = MessageTemplate(EventMessage(channel="events.a", metadata="m"))
+        plain = EventMessage(channel="events.a", metadata="m", id="e-1", body=b"x")
+
+        assert template.message(b"x", id="e-1").with_updates() == plain
+
+
+class TestEncodeMany:
+    @pytest.mark.parametrize(("sample", "encoder", "id_field"), SAMPLES)
+    def test_rows_match_single_encode(self, sample, encoder, id_field):
+        template = MessageTemplate(sample)
+
+        rows = template.encode_many([b"a", b"b"], "client", ids=["i-0", "i-1"])
+
+        assert rows == [
+            template.encode(b"a", "client", id="i-0"),
+            template.encode(b"b", "client", id="i-1"),
+        ]
+
+    def test_fills_repeated_field_in_place(self):
+        from kubemq.grpc import QueueMessagesBatchRequest
+
+        template = MessageTemplate(QueueMessage(channel="queue.a", metadata="m"))
+        request = QueueMessagesBatchRequest()
+
+        returned = template.encode_many([b"a"] * 10, "client", into=request.Messages)
+
+        assert returned is request.Messages
+        assert len(request.Messages) == 10
+        assert len({m.MessageID for m in request.Messages}) == 10
+
+    def test_ids_length_mismatch_raises(self):
+        template = MessageTemplate(EventMessage(channel="events.a", metadata="m"))
+
+        with pytest.raises(ValueError, match="2 ids for 1 bodies"):
+            template.encode_many([b"a"], "client", ids=["x", "y"])
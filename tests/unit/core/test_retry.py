@@ -79,6 +79,30 @@ class TestBackoffCalculator:
         assert min(samples) >= 500.0
         assert max(samples) <= 1000.0
 
+    def test_decorrelated_jitter_range(self):
+        policy = RetryPolicy(
+            initial_backoff_ms=100,
+            max_backoff_ms=5000,
+            backoff_multiplier=2.0,
+            jitter=JitterType.DECORRELATED,
+        )
+        calc = BackoffCalculator(policy)
+        for _ in range(200):
+            previous = calc.delay_ms(0)
+            assert 100.0 <= previous <= 300.0
+            for attempt in range(1, 10):
+                delay = calc.delay_ms(attempt)
+                assert 100.0 <= delay <= min(5000.0, previous * 3)
+                previous = delay
+
+    def test_decorrelated_jitter_spreads_clients(self):
+        policy = RetryPolicy(initial_backoff_ms=100, jitter=JitterType.DECORRELATED)
+        clients = [BackoffCalculator(policy) for _ in range(50)]
+        for calc in clients:
+            calc.delay_ms(0)
+        third = [calc.delay_ms(2) for calc in clients]
+        assert len(set(third)) == len(third)
+
     def test_delay_seconds_conversion(self):
         policy = RetryPolicy(
             initial_backoff_ms=1000,
@@ -0,0 +1,100 @@
+"""Tests for kubemq.core.stage_timer."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubemq.core.stage_timer import StageTimer
+
+
+class TestStageTimer:
+    def test_rejects_sample_every_below_one(self):
+        with pytest.raises(ValueError, match="sample_every"):
+            StageTimer(sample_every=0)
+
+    def test_record_feeds_snapshot_callback_and_metrics(self):
+        samples = []
+        timer = StageTimer(callback=lambda *sample: samples.append(sample))
+        metrics = MagicMock()
+        timer._attach_metrics(metrics)
+        timer._attach_metrics(metrics)
+
+        timer.record("events", "write", 0.002)
+        timer.record("events", "write", 0.004)
+
+        snapshot = timer.snapshot()["events.write"]
+        assert snapshot.count == 2
+        assert snapshot.max_seconds == pytest.approx(0.004)
+        assert samples == [("events", "write", 0.002), ("events", "write", 0.004)]
+        assert metrics.record_stage_duration.call_count == 2
+        metrics.record_stage_duration.assert_called_with(0.004, "events", "write")
+
+    def test_reset_discards_samples(self):
+        timer = StageTimer()
+        timer.record("events", "encode", 0.001)
+
+        timer.reset()
+
+        assert timer.snapshot() == {}
+
+
+class TestStageProbe:
+    def test_samples_every_nth_message(self):
+        probe = StageTimer(sample_every=3).probe("events")
+
+        assert [probe.sample() for _ in range(7)] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_probes_have_independent_counters(self):
+        timer = StageTimer(sample_every=2)
+        first, second = timer.probe("events"), timer.probe("events")
+
+        assert first.sample() is True
+        assert second.sample() is True
+        assert first.sample() is False
+
+    def test_record_uses_component(self):
+        timer = StageTimer()
+        timer.probe("queues_upstream").record("encode", 0.001)
+
+        assert list(timer.snapshot()) == ["queues_upstream.encode"]
+
+
+class TestClientIntegration:
+    def test_client_config_attaches_metrics(self):
+        from kubemq.core.client import _create_instrumentor
+        from kubemq.core.config import ClientConfig
+
+        timer = StageTimer()
+        config = ClientConfig(address="localhost:50000", stage_timer=timer)
+        instrumentor = _create_instrumentor(config, logger=None)
+
+        assert timer._metrics == [instrumentor._metrics]
+
+    def test_async_clients_get_component_probes(self):
+        from kubemq.core.config import ClientConfig
+        from kubemq.pubsub.async_client import AsyncClient as AsyncPubSubClient
+        from kubemq.queues.async_client import AsyncClient as AsyncQueuesClient
+
+        timer = StageTimer()
+        config = ClientConfig(address="localhost:50000", stage_timer=timer)
+
+        assert AsyncPubSubClient(config=config)._stages.component == "events"
+        assert AsyncQueuesClient(config=config)._stages.component == "queues_upstream"
+
+    def test_no_timer_means_no_probe(self):
+        from kubemq.core.config import ClientConfig
+        from kubemq.pubsub.async_client import AsyncClient as AsyncPubSubClient
+
+        client = AsyncPubSubClient(config=ClientConfig(address="localhost:50000"))
+
+        assert client._stages is None
@@ -154,6 +154,95 @@ class TestAsyncClientSendQuery:
         mock_transport.send_request.assert_called_once()
 
 
+class TestAsyncClientQueryCache:
+    """Tests for the client-side query cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_query_skips_transport(self, mock_transport):
+        """Test a repeated query with a cache_key is served from memory."""
+        client = AsyncClient(config=ClientConfig(query_cache_max_bytes=1 << 20))
+        client._transport = mock_transport
+        mock_transport.send_request.return_value = pb.Response(Executed=True, Body=b"v")
+        message = QueryMessage(
+            channel="q", body=b"x", timeout_in_seconds=5, cache_key="k", cache_ttl_in_seconds=30
+        )
+
+        first = await client.send_query(message)
+        second = await client.send_query(message)
+
+        assert mock_transport.send_request.call_count == 1
+        assert (first.cache_hit, second.cache_hit) == (False, True)
+        assert second.body == b"v"
+        stats = client.query_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_queries_without_cache_key_bypass_cache(self, mock_transport):
+        """Test queries without a cache_key always reach the responder."""
+        client = AsyncClient(config=ClientConfig(query_cache_max_bytes=1 << 20))
+        client._transport = mock_transport
+        mock_transport.send_request.return_value = pb.Response(Executed=True)
+        message = QueryMessage(channel="q", body=b"x", timeout_in_seconds=5)
+
+        await client.send_query(message)
+        await client.send_query_fast(message)
+
+        assert mock_transport.send_request.call_count == 2
+        assert client.query_cache_stats().misses == 0
+
+    def test_disabled_by_default(self):
+        """Test the cache is off without query_cache_max_bytes."""
+        client = AsyncClient(address="localhost:50000")
+        assert client.query_cache_stats() is None
+        client.clear_query_cache()
+
+
+class TestAsyncClientHedging:
+    """Tests for hedged send_query."""
+
+    @pytest.mark.asyncio
+    async def test_slow_query_is_hedged_on_another_transport(self):
+        """Test a slow query is re-sent with a new RequestID on another connection."""
+        import asyncio
+
+        from kubemq.core.config import HedgingPolicy
+
+        policy = HedgingPolicy(initial_delay_seconds=0.01)
+        client = AsyncClient(config=ClientConfig(hedging=policy))
+        slow, fast = AsyncMock(), AsyncMock()
+
+        async def never(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        slow.send_request.side_effect = never
+        fast.send_request.return_value = pb.Response(Executed=True, Body=b"hedged")
+        client._transport = slow
+        client._pool = [slow, fast]
+        message = QueryMessage(channel="q", body=b"x", timeout_in_seconds=5)
+
+        response = await client.send_query(message)
+
+        assert response.body == b"hedged"
+        primary_request = slow.send_request.call_args.args[0]
+        hedge_request = fast.send_request.call_args.args[0]
+        assert hedge_request.RequestID != primary_request.RequestID
+        assert hedge_request.Body == primary_request.Body
+        assert client._hedger.wins == 1
+
+    @pytest.mark.asyncio
+    async def test_single_transport_is_not_hedged(self, mock_transport):
+        """Test hedging needs at least two pooled connections."""
+        from kubemq.core.config import HedgingPolicy
+
+        client = AsyncClient(config=ClientConfig(hedging=HedgingPolicy()))
+        client._transport = mock_transport
+        mock_transport.send_request.return_value = pb.Response(Executed=True)
+
+        await client.send_query_fast(QueryMessage(channel="q", body=b"x", timeout_in_seconds=5))
+
+        assert client._hedger.requests == 0
+
+
 class TestAsyncClientSendResponse:
     """Tests for send_response method."""
 
@@ -2670,3 +2759,26 @@ class TestAsyncCQClientSubscribeToQueriesAsyncCallback:
 
         assert len(received) == 1
         assert len(queries) == 1
+
+
+class TestAsyncClientReconnectBuffering:
+    """Commands go to the reconnect buffer while the transport reconnects."""
+
+    @pytest.mark.asyncio
+    async def test_send_command_is_buffered(self):
+        transport = AsyncMock()
+        transport.is_connected = False
+        transport.is_buffering = True
+        transport.buffer_publish = AsyncMock(
+            return_value=pb.Response(RequestID="r1", Executed=True)
+        )
+        client = AsyncClient(address="localhost:50000")
+        client._transport = transport
+
+        response = await client.send_command(
+            CommandMessage(channel="cmd", body=b"data", timeout_in_seconds=7)
+        )
+
+        assert response.is_executed is True
+        assert transport.buffer_publish.call_args[0][0] == "command"
+        assert transport.buffer_publish.call_args[1] == {"timeout_seconds": 7}
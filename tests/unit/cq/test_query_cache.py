@@ -0,0 +1,225 @@
+"""Tests for the client-side query result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubemq.cq.query_cache import QueryResultCache
+from kubemq.cq.query_message import QueryMessage
+from kubemq.cq.query_response_message import QueryResponse
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _query(cache_key: str = "k", channel: str = "q", ttl: int = 10) -> QueryMessage:
+    return QueryMessage(
+        channel=channel,
+        body=b"req",
+        timeout_in_seconds=5,
+        cache_key=cache_key,
+        cache_ttl_in_seconds=ttl,
+    )
+
+
+def _response(body: bytes = b"result", **kwargs) -> QueryResponse:
+    return QueryResponse(is_executed=True, body=body, **kwargs)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestSyncLookup:
+    def test_second_query_is_served_from_cache(self, clock):
+        cache = QueryResultCache(1 << 20, clock=clock)
+        fetch = MagicMock(return_value=_response(tags={"a": "b"}))
+
+        first = cache.get_or_fetch(_query(), fetch)
+        second = cache.get_or_fetch(_query(), fetch)
+
+        assert fetch.call_count == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.body == b"result"
+        second.tags["a"] = "changed"
+        assert cache.get_or_fetch(_query(), fetch).tags == {"a": "b"}
+
+    def test_entries_expire_after_query_ttl(self, clock):
+        cache = QueryResultCache(1 << 20, clock=clock)
+        fetch = MagicMock(return_value=_response())
+        cache.get_or_fetch(_query(ttl=10), fetch)
+
+        clock.now = 10.0
+        cache.get_or_fetch(_query(ttl=10), fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats().entries == 1
+
+    def test_key_includes_channel(self, clock):
+        cache = QueryResultCache(1 << 20, clock=clock)
+        fetch = MagicMock(return_value=_response())
+        cache.get_or_fetch(_query(channel="a"), fetch)
+        cache.get_or_fetch(_query(channel="b"), fetch)
+
+        assert fetch.call_count == 2
+
+    def test_failed_responses_are_not_cached(self, clock):
+        cache = QueryResultCache(1 << 20, clock=clock)
+        fetch = MagicMock(return_value=QueryResponse(is_executed=False, error="boom"))
+        cache.get_or_fetch(_query(), fetch)
+        cache.get_or_fetch(_query(), fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats().entries == 0
+
+    def test_lru_eviction_within_byte_budget(self, clock):
+        cache = QueryResultCache(1200, clock=clock)
+        body = b"x" * 300
+        for key in ("a", "b"):
+            cache.get_or_fetch(_query(key), lambda: _response(body))
+        # Touch "a" so "b" is the least recently used.
+        cache.get_or_fetch(_query("a"), MagicMock())
+        cache.get_or_fetch(_query("c"), lambda: _response(body))
+
+        stats = cache.stats()
+        assert stats.entries == 2
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 1200
+        refetch = MagicMock(return_value=_response())
+        cache.get_or_fetch(_query("b"), refetch)
+        assert refetch.call_count == 1
+
+    def test_oversized_response_is_not_cached(self, clock):
+        cache = QueryResultCache(100, clock=clock)
+        cache.get_or_fetch(_query(), lambda: _response(b"x" * 200))
+
+        assert cache.stats().entries == 0
+
+    def test_stats_and_metrics(self, clock):
+        metrics = MagicMock()
+        cache = QueryResultCache(1 << 20, metrics=metrics, clock=clock)
+        cache.get_or_fetch(_query(), lambda: _response())
+        cache.get_or_fetch(_query(), MagicMock())
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.coalesced) == (1, 1, 0)
+        assert [c.args for c in metrics.record_query_cache_lookup.call_args_list] == [
+            ("miss", "q"),
+            ("hit", "q"),
+        ]
+
+    def test_clear(self, clock):
+        cache = QueryResultCache(1 << 20, clock=clock)
+        cache.get_or_fetch(_query(), lambda: _response())
+        cache.clear()
+
+        assert cache.stats().entries == 0
+        assert cache.stats().size_bytes == 0
+
+    def test_max_bytes_must_be_positive(self):
+        with pytest.raises(ValueError):
+            QueryResultCache(0)
+
+
+class TestSyncSingleFlight:
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = QueryResultCache(1 << 20)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return _response()
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(cache.get_or_fetch(_query(), slow_fetch))
+        )
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(
+            target=lambda: results.append(cache.get_or_fetch(_query(), slow_fetch))
+        )
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(calls) == 1
+        assert [r.body for r in results] == [b"result", b"result"]
+        assert cache.stats().coalesced + cache.stats().hits == 1
+
+
+class TestAsyncSingleFlight:
+    async def test_concurrent_misses_share_one_fetch(self):
+        cache = QueryResultCache(1 << 20)
+        release = asyncio.Event()
+        calls = []
+
+        async def slow_fetch():
+            calls.append(1)
+            await release.wait()
+            return _response()
+
+        tasks = [
+            asyncio.create_task(cache.get_or_fetch_async(_query(), slow_fetch)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert all(r.body == b"result" for r in results)
+        assert cache.stats().coalesced == 4
+
+    async def test_error_propagates_to_followers(self):
+        cache = QueryResultCache(1 << 20)
+        release = asyncio.Event()
+
+        async def failing_fetch():
+            await release.wait()
+            raise RuntimeError("responder down")
+
+        tasks = [
+            asyncio.create_task(cache.get_or_fetch_async(_query(), failing_fetch)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.stats().entries == 0
+
+    async def test_follower_retries_when_leader_is_cancelled(self):
+        cache = QueryResultCache(1 << 20)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0 if len(calls) > 1 else 10)
+            return _response()
+
+        leader = asyncio.create_task(cache.get_or_fetch_async(_query(), fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_fetch_async(_query(), fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await follower
+
+        assert result.body == b"result"
+        assert len(calls) == 2
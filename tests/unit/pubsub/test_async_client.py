@@ -9,7 +9,12 @@ import pytest
 
 from kubemq.common.async_cancellation_token import AsyncCancellationToken
 from kubemq.core.config import ClientConfig
-from kubemq.core.exceptions import KubeMQConnectionError, KubeMQError, KubeMQStreamBrokenError
+from kubemq.core.exceptions import (
+    KubeMQConnectionError,
+    KubeMQError,
+    KubeMQStreamBrokenError,
+    KubeMQValidationError,
+)
 from kubemq.grpc import kubemq_pb2 as pb
 from kubemq.pubsub.async_client import AsyncClient, AsyncPubSubClient
 from kubemq.pubsub.event_message import EventMessage
@@ -364,6 +369,68 @@ class TestAsyncClientSendEventsStoreBatch:
         assert len(failed) == 2
 
 
+class TestAsyncClientSendEventsBulk:
+    """Tests for send_events_bulk and send_events_store_bulk."""
+
+    @staticmethod
+    def _client(mock_transport):
+        client = AsyncClient(address="localhost:50000", client_id="test-client")
+        client._transport = mock_transport
+        client._connected = True  # type: ignore[attr-defined]
+        return client
+
+    @pytest.mark.asyncio
+    async def test_send_events_bulk_writes_one_stream(self, mock_transport):
+        client = self._client(mock_transport)
+        mock_transport.send_events_bulk = AsyncMock(return_value={})
+
+        results = await client.send_events_bulk(
+            "events", [b"a", b"b"], ids=["e-0", "e-1"], tags={"k": "v"}
+        )
+
+        events = mock_transport.send_events_bulk.call_args[0][0]
+        expected = [
+            EventMessage(channel="events", id=f"e-{i}", body=body, tags={"k": "v"}).encode(
+                "test-client"
+            )
+            for i, body in enumerate([b"a", b"b"])
+        ]
+        assert list(events) == expected
+        assert [(r.id, r.sent) for r in results] == [("e-0", True), ("e-1", True)]
+
+    @pytest.mark.asyncio
+    async def test_send_events_store_bulk_maps_results_in_order(self, mock_transport):
+        client = self._client(mock_transport)
+        mock_transport.send_events_bulk = AsyncMock(
+            return_value={
+                "s-1": pb.Result(EventID="s-1", Sent=False, Error="rejected"),
+                "s-0": pb.Result(EventID="s-0", Sent=True),
+            }
+        )
+
+        results = await client.send_events_store_bulk(
+            "store", [b"a", b"b", b"c"], ids=["s-0", "s-1", "s-2"]
+        )
+
+        events = mock_transport.send_events_bulk.call_args[0][0]
+        assert all(event.Store for event in events)
+        assert [(r.id, r.sent, r.error) for r in results] == [
+            ("s-0", True, ""),
+            ("s-1", False, "rejected"),
+            ("s-2", False, "No result from server"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_validation_and_empty_input(self, mock_transport):
+        client = self._client(mock_transport)
+        mock_transport.send_events_bulk = AsyncMock(return_value={})
+
+        with pytest.raises(KubeMQValidationError):
+            await client.send_events_bulk("bad channel*", [b"a"])
+        assert await client.send_events_store_bulk("store", []) == []
+        mock_transport.send_events_bulk.assert_not_called()
+
+
 class TestAsyncClientSubscribeToEventsStore:
     """Tests for subscribe_to_events_store method."""
 
@@ -4557,3 +4624,277 @@ class TestSubscribeStoreWithCallbackLinkBranch:
             )
 
         assert len(received) == 1
+
+
+class TestSubscribeWithBatchCallback:
+    """Tests for subscribe_with_batch_callback / subscribe_store_with_batch_callback."""
+
+    @pytest.mark.asyncio
+    async def test_events_delivered_in_size_bounded_batches(self, mock_transport):
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        pb_events = [_make_pb_event(event_id=f"ev-{i}") for i in range(7)]
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(pb_events, token)
+        )
+
+        batches: list[list[str]] = []
+
+        async def on_batch(events):
+            batches.append([e.id for e in events])
+
+        await client.subscribe_with_batch_callback(
+            EventsSubscription(channel="ch", on_receive_event_callback=lambda e: None),
+            on_batch,
+            cancellation_token=token,
+            max_batch_size=3,
+            max_batch_delay_ms=10_000,
+        )
+
+        assert batches == [
+            ["ev-0", "ev-1", "ev-2"],
+            ["ev-3", "ev-4", "ev-5"],
+            ["ev-6"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_store_events_delivered_in_batches(self, mock_transport):
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        pb_events = [_make_pb_event(event_id=f"es-{i}") for i in range(4)]
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(pb_events, token)
+        )
+
+        batches: list[int] = []
+
+        async def on_batch(events):
+            batches.append(len(events))
+
+        await client.subscribe_store_with_batch_callback(
+            EventsStoreSubscription(
+                channel="ch",
+                on_receive_event_callback=lambda e: None,
+                events_store_type=EventStoreStartPosition.StartFromNew,
+            ),
+            on_batch,
+            cancellation_token=token,
+            max_batch_size=2,
+        )
+
+        assert batches == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_error_reported(self, mock_transport):
+        from kubemq.core.exceptions import KubeMQHandlerError
+
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock([_make_pb_event()], token)
+        )
+        errors: list[Exception] = []
+
+        async def on_batch(events):
+            raise RuntimeError("sink down")
+
+        async def on_error(err):
+            errors.append(err)
+
+        await client.subscribe_with_batch_callback(
+            EventsSubscription(channel="ch", on_receive_event_callback=lambda e: None),
+            on_batch,
+            on_error,
+            cancellation_token=token,
+        )
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], KubeMQHandlerError)
+        assert "sink down" in str(errors[0])
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_size_rejected(self, mock_transport):
+        client = _make_connected_client(mock_transport)
+
+        async def on_batch(events):
+            pass
+
+        with pytest.raises(ValueError, match="max_batch_size"):
+            await client.subscribe_with_batch_callback(
+                EventsSubscription(channel="ch", on_receive_event_callback=lambda e: None),
+                on_batch,
+                max_batch_size=0,
+            )
+
+
+class TestEventsStoreCheckpointing:
+    """Durable resume offsets for events-store subscriptions."""
+
+    @staticmethod
+    def _store_sub():
+        from kubemq.pubsub.events_store_subscription import (
+            EventsStoreSubscription,
+            EventStoreStartPosition,
+        )
+
+        return EventsStoreSubscription(
+            channel="ch",
+            on_receive_event_callback=lambda e: None,
+            events_store_type=EventStoreStartPosition.StartFromFirst,
+        )
+
+    @staticmethod
+    def _pb_events(*sequences):
+        events = []
+        for seq in sequences:
+            ev = _make_pb_event(event_id=f"ev-{seq}")
+            ev.Sequence = seq
+            events.append(ev)
+        return events
+
+    @pytest.mark.asyncio
+    async def test_fast_resumes_from_stored_sequence(self, mock_transport):
+        from kubemq.pubsub.checkpoint import MemoryCheckpointStore
+
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        store = MemoryCheckpointStore()
+        store.save("ch", 41)
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(self._pb_events(42, 43), token)
+        )
+
+        seen = [
+            ev.sequence
+            async for ev in client.subscribe_to_events_store_fast(
+                self._store_sub(), token, checkpoint_store=store
+            )
+        ]
+
+        request = mock_transport.subscribe_to_events.call_args[0][0]
+        assert request.EventsStoreTypeData == 4  # StartAtSequence
+        assert request.EventsStoreTypeValue == 42
+        assert seen == [42, 43]
+        assert store.load("ch") == 43
+
+    @pytest.mark.asyncio
+    async def test_fast_break_does_not_commit_unprocessed_event(self, mock_transport):
+        from kubemq.pubsub.checkpoint import MemoryCheckpointStore
+
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        store = MemoryCheckpointStore()
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(self._pb_events(1, 2, 3), token)
+        )
+
+        stream = client.subscribe_to_events_store_fast(
+            self._store_sub(), token, checkpoint_store=store, checkpoint_key="k"
+        )
+        async for ev in stream:
+            if ev.sequence == 2:
+                break
+        await stream.aclose()
+
+        request = mock_transport.subscribe_to_events.call_args[0][0]
+        assert request.EventsStoreTypeData == 2  # StartFromFirst, nothing stored
+        assert store.load("k") == 1
+
+    @pytest.mark.asyncio
+    async def test_callback_commits_processed_sequences(self, mock_transport):
+        from kubemq.pubsub.checkpoint import MemoryCheckpointStore
+
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        store = MemoryCheckpointStore()
+        store.save("ch#g", 9)
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(self._pb_events(10, 11, 12), token)
+        )
+        sub = self._store_sub()
+        sub.group = "g"
+        seen = []
+
+        async def cb(event):
+            seen.append(event.sequence)
+
+        await client.subscribe_store_with_callback(
+            sub, cb, cancellation_token=token, checkpoint_store=store
+        )
+
+        request = mock_transport.subscribe_to_events.call_args[0][0]
+        assert request.EventsStoreTypeValue == 10
+        assert seen == [10, 11, 12]
+        assert store.load("ch#g") == 12
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callbacks_commit_after_completion(self, mock_transport):
+        from kubemq.pubsub.checkpoint import MemoryCheckpointStore
+
+        client = _make_connected_client(mock_transport)
+        token = AsyncCancellationToken()
+        store = MemoryCheckpointStore()
+        mock_transport.subscribe_to_events = MagicMock(
+            return_value=CancellingAsyncIteratorMock(self._pb_events(1, 2, 3, 4), token)
+        )
+
+        async def cb(event):
+            await asyncio.sleep(0.01 * (5 - event.sequence))
+
+        await client.subscribe_store_with_callback(
+            self._store_sub(),
+            cb,
+            cancellation_token=token,
+            max_concurrent_callbacks=4,
+            checkpoint_store=store,
+        )
+
+        assert store.load("ch") == 4
+
+
+class TestAsyncClientReconnectBuffering:
+    """Publishes go to the reconnect buffer while the transport reconnects."""
+
+    @pytest.fixture
+    def reconnecting_transport(self):
+        transport = AsyncMock()
+        transport.is_connected = False
+        transport.is_buffering = True
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_publish_event_is_buffered(self, reconnecting_transport):
+        client = _make_connected_client(reconnecting_transport)
+        reconnecting_transport.buffer_publish = AsyncMock(return_value=None)
+
+        await client.publish_event(EventMessage(channel="ch", body=b"data"))
+
+        kind, pb_event = reconnecting_transport.buffer_publish.call_args[0]
+        assert kind == "event"
+        assert pb_event.Channel == "ch"
+        assert reconnecting_transport.buffer_publish.call_args[1] == {"wait": False}
+        reconnecting_transport.send_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_event_store_waits_for_flush(self, reconnecting_transport):
+        client = _make_connected_client(reconnecting_transport)
+        reconnecting_transport.buffer_publish = AsyncMock(
+            return_value=pb.Result(EventID="e1", Sent=True)
+        )
+
+        result = await client.send_event_store(EventStoreMessage(channel="ch", body=b"data"))
+
+        assert result.sent is True
+        assert reconnecting_transport.buffer_publish.call_args[0][0] == "event_store"
+        client._event_sender.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_not_buffered_when_transport_is_down_without_reconnect(self):
+        transport = AsyncMock()
+        transport.is_connected = False
+        transport.is_buffering = False
+        client = _make_connected_client(transport)
+
+        with pytest.raises(KubeMQConnectionError):
+            await client.send_event_unary(EventMessage(channel="ch", body=b"data"))
+        transport.buffer_publish.assert_not_called()
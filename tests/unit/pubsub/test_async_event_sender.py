@@ -124,6 +124,27 @@ class TestAsyncEventSenderSend:
         with pytest.raises(KubeMQBufferFullError):
             await sender.send(Event(EventID="overflow", Store=False))
 
+    @pytest.mark.asyncio
+    async def test_submit_returns_future_without_waiting(self):
+        sender, _ = _make_sender()
+        event = Event(EventID="e-sub", Store=True)
+
+        future = await sender.submit(event)
+
+        assert not future.done()
+        assert sender._send_queue.get_nowait() is event
+        assert sender._response_tracking["e-sub"] is future
+        future.set_result(Result(EventID="e-sub", Sent=True))
+        await asyncio.sleep(0)
+        assert "e-sub" not in sender._response_tracking
+
+    @pytest.mark.asyncio
+    async def test_submit_when_closed(self):
+        sender, _ = _make_sender()
+        sender._closed = True
+        with pytest.raises(ConnectionError, match="closed"):
+            await sender.submit(Event(EventID="e1", Store=True))
+
 
 class TestAsyncEventSenderStreamLoop:
     @pytest.mark.asyncio
@@ -793,3 +814,177 @@ class TestAsyncEventSenderHandleDisconnectionQueueRace:
                 sender._handle_disconnection()
 
         assert sender._allow_new_messages is False
+
+
+class TestAsyncEventSenderStageTimer:
+    async def _drive(self, sender, events):
+        for event in events:
+            sender._send_queue.put_nowait(event)
+        sender._send_queue.put_nowait(_SENTINEL)
+        async for _ in sender._request_generator():
+            pass
+
+    async def test_sampled_store_event_records_all_stages(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        samples = []
+        timer = StageTimer(callback=lambda *sample: samples.append(sample[:2]))
+        sender = AsyncEventSender(MagicMock(), stage_timer=timer)
+        event = Event(EventID="e1", Store=True)
+
+        future = await sender.submit(event)
+        sender._send_queue.get_nowait()
+        await self._drive(sender, [event])
+        await sender._receive_responses(AsyncIteratorMock([Result(EventID="e1", Sent=True)]))
+
+        assert future.result().Sent is True
+        assert samples == [
+            ("events", "queue_wait"),
+            ("events", "write"),
+            ("events", "response"),
+            ("events", "demux"),
+        ]
+        assert sender._enqueued_at == {}
+        assert sender._written_at == {}
+
+    async def test_timed_out_store_send_drops_stage_marks(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        sender = AsyncEventSender(MagicMock(), stage_timer=StageTimer())
+        unwritten, written = Event(EventID="e1", Store=True), Event(EventID="e2", Store=True)
+        sends = [
+            asyncio.create_task(asyncio.wait_for(sender.send(event), timeout=0.05))
+            for event in (unwritten, written)
+        ]
+        while sender._send_queue.qsize() < 2:
+            await asyncio.sleep(0)
+        sender._send_queue.get_nowait()
+        sender._send_queue.get_nowait()
+        await self._drive(sender, [written])
+        assert set(sender._enqueued_at) == {"e1"}
+        assert set(sender._written_at) == {"e2"}
+
+        for send in sends:
+            with pytest.raises(asyncio.TimeoutError):
+                await send
+        assert sender._response_tracking == {}
+        assert sender._enqueued_at == {}
+        assert sender._written_at == {}
+
+    async def test_cancelled_submit_drops_stage_marks(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        sender = AsyncEventSender(MagicMock(), stage_timer=StageTimer())
+        event = Event(EventID="e1", Store=True)
+
+        future = await sender.submit(event)
+        sender._send_queue.get_nowait()
+        await self._drive(sender, [event])
+        assert set(sender._written_at) == {"e1"}
+        future.cancel()
+        await asyncio.sleep(0)
+
+        assert sender._response_tracking == {}
+        assert sender._written_at == {}
+
+    async def test_fire_and_forget_records_queue_wait_and_write_only(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        timer = StageTimer()
+        sender = AsyncEventSender(MagicMock(), stage_timer=timer)
+        event = Event(EventID="e1")
+
+        await sender.send(event)
+        sender._send_queue.get_nowait()
+        await self._drive(sender, [event])
+
+        assert set(timer.snapshot()) == {"events.queue_wait", "events.write"}
+        assert sender._written_at == {}
+
+    async def test_sample_every_skips_unsampled_events(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        timer = StageTimer(sample_every=2)
+        sender = AsyncEventSender(MagicMock(), stage_timer=timer)
+        events = [Event(EventID=f"e{i}") for i in range(4)]
+
+        for event in events:
+            await sender.send(event)
+        while not sender._send_queue.empty():
+            sender._send_queue.get_nowait()
+        await self._drive(sender, events)
+
+        assert timer.snapshot()["events.write"].count == 2
+
+    async def test_no_timer_tracks_nothing(self):
+        sender, _ = _make_sender()
+        event = Event(EventID="e1", Store=True)
+
+        await sender.submit(event)
+
+        assert sender._stages is None
+        assert sender._enqueued_at == {}
+
+    def test_disconnection_clears_stage_marks(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        sender = AsyncEventSender(MagicMock(), stage_timer=StageTimer())
+        sender._enqueued_at["e1"] = 1.0
+        sender._written_at["e2"] = 2.0
+
+        sender._handle_disconnection()
+
+        assert sender._enqueued_at == {}
+        assert sender._written_at == {}
+
+
+class TestAsyncEventSenderAdaptiveRate:
+    async def test_store_confirmation_is_reported(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncEventSender(MagicMock(), adaptive_rate=AdaptiveRateConfig())
+        future = await sender.submit(Event(EventID="e1", Store=True))
+        await sender._receive_responses(AsyncIteratorMock([Result(EventID="e1", Sent=True)]))
+        await asyncio.sleep(0)
+
+        assert future.result().Sent is True
+        assert sender._rate.latency > 0
+        assert sender._rate._congested is False
+
+    async def test_rejected_store_event_counts_as_congestion(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncEventSender(MagicMock(), adaptive_rate=AdaptiveRateConfig())
+        await sender.submit(Event(EventID="e1", Store=True))
+        await sender._receive_responses(
+            AsyncIteratorMock([Result(EventID="e1", Sent=False, Error="x")])
+        )
+        await asyncio.sleep(0)
+
+        assert sender._rate._congested is True
+
+    async def test_send_is_paced(self, monkeypatch):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("kubemq._internal.rate_control.asyncio.sleep", fake_sleep)
+        config = AdaptiveRateConfig(initial_rate=10.0, min_rate=1.0)
+        sender = AsyncEventSender(MagicMock(), adaptive_rate=config)
+
+        await sender.send(Event(EventID="e1"))
+        await sender.send(Event(EventID="e2"))
+
+        assert len(sleeps) == 1
+        assert sender._send_queue.qsize() == 2
+
+    def test_disconnection_counts_as_congestion(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncEventSender(MagicMock(), adaptive_rate=AdaptiveRateConfig())
+        sender._handle_disconnection()
+
+        assert sender._rate._congested is True
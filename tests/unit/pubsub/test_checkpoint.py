@@ -0,0 +1,165 @@
+"""Tests for events-store checkpoint stores and AsyncCheckpointer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from kubemq.pubsub.checkpoint import (
+    AsyncCheckpointer,
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+    default_checkpoint_key,
+)
+
+
+class _CountingStore(MemoryCheckpointStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.saves: list[int] = []
+
+    def save(self, key: str, sequence: int) -> None:
+        self.saves.append(sequence)
+        super().save(key, sequence)
+
+
+class TestCheckpointStores:
+    """load/save round-trips for the bundled stores."""
+
+    @pytest.fixture(params=["memory", "file", "sqlite"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            yield MemoryCheckpointStore()
+        elif request.param == "file":
+            yield FileCheckpointStore(tmp_path / "sub" / "offsets.json")
+        else:
+            store = SQLiteCheckpointStore(tmp_path / "offsets.db")
+            yield store
+            store.close()
+
+    def test_round_trip(self, store):
+        assert isinstance(store, CheckpointStore)
+        assert store.load("a") is None
+        store.save("a", 10)
+        store.save("b", 3)
+        store.save("a", 12)
+        assert store.load("a") == 12
+        assert store.load("b") == 3
+
+    def test_file_store_persists_across_instances(self, tmp_path):
+        path = tmp_path / "offsets.json"
+        FileCheckpointStore(path, fsync=False).save("ch", 42)
+
+        assert FileCheckpointStore(path).load("ch") == 42
+        assert json.loads(path.read_text()) == {"ch": 42}
+        assert [p.name for p in tmp_path.iterdir()] == ["offsets.json"]
+
+    def test_sqlite_store_persists_across_instances(self, tmp_path):
+        path = tmp_path / "offsets.db"
+        first = SQLiteCheckpointStore(path)
+        first.save("ch", 7)
+        first.close()
+
+        second = SQLiteCheckpointStore(path)
+        assert second.load("ch") == 7
+        second.close()
+
+    def test_sqlite_rejects_bad_table_name(self, tmp_path):
+        with pytest.raises(ValueError, match="table"):
+            SQLiteCheckpointStore(tmp_path / "x.db", table="x; DROP TABLE y")
+
+    def test_default_key(self):
+        assert default_checkpoint_key("orders") == "orders"
+        assert default_checkpoint_key("orders", "g1") == "orders#g1"
+
+
+class TestAsyncCheckpointer:
+    """Batched commits and out-of-order completion handling."""
+
+    def test_rejects_invalid_tuning(self):
+        with pytest.raises(ValueError, match="commit_interval_seconds"):
+            AsyncCheckpointer(MemoryCheckpointStore(), "k", commit_interval_seconds=0)
+        with pytest.raises(ValueError, match="commit_every"):
+            AsyncCheckpointer(MemoryCheckpointStore(), "k", commit_every=0)
+
+    async def test_mark_does_not_write_until_commit(self):
+        store = _CountingStore()
+        cp = AsyncCheckpointer(store, "k", commit_interval_seconds=60)
+        cp.start()
+        for seq in range(1, 101):
+            cp.mark(seq)
+        assert store.saves == []
+
+        await cp.close()
+        assert store.saves == [100]
+        assert cp.committed == 100
+
+    async def test_commit_every_triggers_early_commit(self):
+        store = _CountingStore()
+        cp = AsyncCheckpointer(store, "k", commit_interval_seconds=60, commit_every=5)
+        cp.start()
+        for seq in range(1, 6):
+            cp.mark(seq)
+        for _ in range(50):
+            if store.saves:
+                break
+            await asyncio.sleep(0.01)
+        assert store.saves == [5]
+        await cp.close()
+        assert store.saves == [5]
+
+    async def test_interval_commit(self):
+        store = _CountingStore()
+        cp = AsyncCheckpointer(store, "k", commit_interval_seconds=0.02)
+        cp.start()
+        cp.mark(3)
+        await asyncio.sleep(0.1)
+        assert store.load("k") == 3
+        await cp.close()
+
+    async def test_load_seeds_position(self):
+        store = MemoryCheckpointStore()
+        store.save("k", 41)
+        cp = AsyncCheckpointer(store, "k")
+
+        assert await cp.load() == 41
+        assert cp.committed == 41
+        await cp.close()
+        assert store.load("k") == 41
+
+    async def test_tracked_sequences_commit_contiguously(self):
+        store = MemoryCheckpointStore()
+        cp = AsyncCheckpointer(store, "k")
+        for seq in (1, 2, 3):
+            cp.track(seq)
+
+        cp.mark(2)
+        cp.mark(3)
+        assert cp.pending == 0
+        cp.mark(1)
+        assert cp.pending == 3
+
+        await cp.close()
+        assert store.load("k") == 3
+
+    async def test_failed_commit_is_retried(self):
+        class FlakyStore(MemoryCheckpointStore):
+            fail = True
+
+            def save(self, key, sequence):
+                if self.fail:
+                    self.fail = False
+                    raise OSError("disk full")
+                super().save(key, sequence)
+
+        store = FlakyStore()
+        cp = AsyncCheckpointer(store, "k", commit_interval_seconds=0.01)
+        cp.start()
+        cp.mark(9)
+        await asyncio.sleep(0.1)
+        assert store.load("k") == 9
+        await cp.close()
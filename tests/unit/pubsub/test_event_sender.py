@@ -67,6 +67,27 @@ class TestEventSenderSend:
         assert got.EventID == "e1"
         assert got.Sent is True
 
+    def test_send_store_event_disconnected_in_flight(self):
+        sender, _, _ = _make_sender()
+        event = Event(EventID="e1", Store=True)
+
+        def _disconnect():
+            while True:
+                with sender.lock:
+                    if "e1" in sender.response_tracking:
+                        break
+            sender.handle_disconnection()
+
+        t = threading.Thread(target=_disconnect)
+        t.start()
+
+        got = sender.send(event)
+        t.join(timeout=2)
+
+        assert got is not None
+        assert got.Sent is False
+        assert sender.response_tracking == {}
+
     def test_send_when_disconnected(self):
         sender, _, _ = _make_sender()
         sender.allow_new_messages = False
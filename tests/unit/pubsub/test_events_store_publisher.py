@@ -0,0 +1,179 @@
+"""Tests for kubemq.pubsub.events_store_publisher (pipelined events-store publishing)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kubemq.core.exceptions import (
+    KubeMQClientClosedError,
+    KubeMQConnectionError,
+    KubeMQTimeoutError,
+)
+from kubemq.grpc import Result
+from kubemq.pubsub.async_client import AsyncClient
+from kubemq.pubsub.async_event_sender import AsyncEventSender
+from kubemq.pubsub.event_store_message import EventStoreMessage
+from kubemq.pubsub.events_store_publisher import EventsStorePublisher
+
+
+def _client() -> tuple[AsyncClient, AsyncEventSender]:
+    client = AsyncClient(address="localhost:50000", client_id="pub")
+    transport = AsyncMock()
+    transport.is_connected = True
+    client._transport = transport
+    client._connected = True  # type: ignore[attr-defined]
+    sender = AsyncEventSender(transport)
+    client._event_sender = sender
+    return client, sender
+
+
+def _message(i: int) -> EventStoreMessage:
+    return EventStoreMessage(channel="store", id=f"e-{i}", body=f"m-{i}".encode())
+
+
+def _confirm(sender: AsyncEventSender, event_id: str, *, sent: bool = True) -> None:
+    sender._response_tracking[event_id].set_result(
+        Result(EventID=event_id, Sent=sent, Error="" if sent else "rejected")
+    )
+
+
+class TestEventsStorePublisher:
+    async def test_publish_does_not_wait_for_confirmation(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher(window=4)
+
+        futures = [await publisher.publish(_message(i)) for i in range(3)]
+
+        assert sender._send_queue.qsize() == 3
+        assert publisher.in_flight == 3
+        assert not any(f.done() for f in futures)
+
+    async def test_confirmations_are_yielded_in_publish_order(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher(window=8)
+        for i in range(3):
+            await publisher.publish(_message(i))
+        for event_id in ("e-2", "e-0", "e-1"):
+            _confirm(sender, event_id)
+        await publisher.close()
+
+        results = [r async for r in publisher.confirmations()]
+
+        assert [r.id for r in results] == ["e-0", "e-1", "e-2"]
+        assert all(r.sent for r in results)
+
+    async def test_window_blocks_until_broker_confirms(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher(window=2)
+        await publisher.publish(_message(0))
+        await publisher.publish(_message(1))
+
+        third = asyncio.create_task(publisher.publish(_message(2)))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        _confirm(sender, "e-0")
+        await asyncio.wait_for(third, timeout=1)
+
+        confirmations = publisher.confirmations()
+        assert (await confirmations.__anext__()).id == "e-0"
+
+    async def test_context_manager_without_reader_does_not_deadlock(self):
+        client, sender = _client()
+
+        async def confirm_all() -> None:
+            while True:
+                for event_id, future in list(sender._response_tracking.items()):
+                    if not future.done():
+                        _confirm(sender, event_id)
+                await asyncio.sleep(0.001)
+
+        confirmer = asyncio.create_task(confirm_all())
+        try:
+            async with client.events_store_publisher(window=2) as publisher:
+                for i in range(10):
+                    await asyncio.wait_for(publisher.publish(_message(i)), timeout=1)
+        finally:
+            confirmer.cancel()
+
+        assert publisher.stats().confirmed == 10
+
+    async def test_flush_times_out_on_unconfirmed_events(self):
+        client, _ = _client()
+        publisher = client.events_store_publisher()
+        await publisher.publish(_message(0))
+
+        with pytest.raises(KubeMQTimeoutError, match="1 events still unconfirmed"):
+            await publisher.flush(timeout_seconds=0.01)
+
+    async def test_unordered_returns_credit_on_confirmation(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher(window=1, ordered_confirmations=False)
+        first = await publisher.publish(_message(0))
+
+        second = asyncio.create_task(publisher.publish(_message(1)))
+        await asyncio.sleep(0.01)
+        assert not second.done()
+        _confirm(sender, "e-0")
+
+        await asyncio.wait_for(second, timeout=1)
+        assert (await first).sent is True
+        with pytest.raises(RuntimeError):
+            await publisher.confirmations().__anext__()
+
+    async def test_failures_are_reported_not_raised(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher()
+        rejected = await publisher.publish(_message(0))
+        lost = await publisher.publish(_message(1))
+
+        _confirm(sender, "e-0", sent=False)
+        sender._response_tracking["e-1"].set_exception(KubeMQConnectionError("stream lost"))
+
+        assert (await rejected).error == "rejected"
+        lost_result = await lost
+        assert (lost_result.id, lost_result.sent) == ("e-1", False)
+        stats = publisher.stats()
+        assert (stats.published, stats.confirmed, stats.failed) == (2, 0, 2)
+
+    async def test_stats_record_confirmation_latency(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher()
+        for i in range(4):
+            await publisher.publish(_message(i))
+            _confirm(sender, f"e-{i}")
+        await publisher.flush()
+
+        stats = publisher.stats()
+        assert stats.in_flight == 0
+        assert stats.confirmed == 4
+        assert stats.confirm_latency.count == 4
+        assert stats.confirm_latency.percentile(99) <= stats.confirm_latency.max_seconds
+
+    async def test_close_rejects_publish_and_ends_iteration(self):
+        client, _ = _client()
+        publisher = client.events_store_publisher()
+        await publisher.close()
+
+        with pytest.raises(KubeMQClientClosedError):
+            await publisher.publish(_message(0))
+        assert [r async for r in publisher.confirmations()] == []
+
+    async def test_failed_submit_returns_credit(self):
+        client, sender = _client()
+        publisher = client.events_store_publisher(window=1)
+        sender._closed = True
+
+        with pytest.raises(ConnectionError):
+            await publisher.publish(_message(0))
+
+        sender._closed = False
+        await asyncio.wait_for(publisher.publish(_message(1)), timeout=1)
+
+    def test_window_must_be_positive(self):
+        client, _ = _client()
+        with pytest.raises(ValueError):
+            EventsStorePublisher(client, window=0)
@@ -6,6 +6,7 @@ Tests for Client (sync) class from kubemq.pubsub.client.
 from __future__ import annotations
 
 import threading
+import time
 import warnings
 from unittest.mock import MagicMock, patch
 
@@ -536,6 +537,42 @@ class TestSyncPubSubClientSubscriptions:
                 mock_thread.assert_called_once()
                 mock_thread_instance.start.assert_called_once()
 
+    def test_subscribe_to_events_batch_routes_events_through_collector(self):
+        """subscribe_to_events_batch wraps the per-event callback in a collector."""
+        with patch("kubemq.transport.transport.SyncTransport") as mock_transport_class:
+            mock_transport = MagicMock()
+            mock_transport.initialize.return_value = mock_transport
+            mock_transport_class.return_value = mock_transport
+
+            client = Client(address="localhost:50000")
+            cancel = CancellationToken()
+            batches = []
+            subscription = EventsSubscription(
+                channel="test-channel",
+                on_receive_event_callback=lambda msg: None,
+            )
+
+            with patch.object(client, "_subscribe") as mock_subscribe:
+                client.subscribe_to_events_batch(
+                    subscription,
+                    batches.append,
+                    cancel,
+                    max_batch_size=2,
+                    max_batch_delay_ms=60_000,
+                )
+
+            routed = mock_subscribe.call_args[0][0]
+            assert routed.channel == "test-channel"
+            for i in range(3):
+                routed.on_receive_event_callback(i)
+            assert batches == [[0, 1]]
+
+            cancel.cancel()
+            deadline = time.monotonic() + 2
+            while len(batches) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert batches == [[0, 1], [2]]
+
     def test_subscribe_calls_error_callback_on_grpc_error(self):
         """Test that subscription calls error callback on gRPC error."""
         with patch("kubemq.transport.transport.SyncTransport") as mock_transport_class:
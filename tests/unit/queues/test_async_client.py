@@ -9,7 +9,7 @@ import pytest
 
 from kubemq.common.async_cancellation_token import AsyncCancellationToken
 from kubemq.core.config import ClientConfig
-from kubemq.core.exceptions import KubeMQConnectionError
+from kubemq.core.exceptions import KubeMQConnectionError, KubeMQValidationError
 from kubemq.grpc import kubemq_pb2 as pb
 from kubemq.queues.async_client import (
     AsyncClient,
@@ -152,6 +152,100 @@ class TestAsyncClientSendBatch:
         assert req_arg.BatchID != ""
 
 
+class TestAsyncClientSendBulk:
+    """Tests for the columnar send_queue_messages_bulk method."""
+
+    @staticmethod
+    def _client(mock_transport, **config):
+        client = AsyncClient(address="localhost:50000", client_id="test-client", **config)
+        client._transport = mock_transport
+        client._connected = True  # type: ignore[attr-defined]
+        mock_transport.send_queue_messages_batch.return_value = pb.QueueMessagesBatchResponse(
+            BatchID="b-1", Results=[pb.SendQueueMessageResult(MessageID="m-0")]
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_encodes_like_per_message_batch(self, mock_transport):
+        client = self._client(mock_transport)
+        policy = {"expiration_in_seconds": 60, "max_receive_count": 2, "max_receive_queue": "dlq"}
+
+        await client.send_queue_messages_bulk(
+            "orders", [b"a", b"b"], ids=["m-0", "m-1"], metadata="md", tags={"k": "v"}, **policy
+        )
+        bulk = mock_transport.send_queue_messages_batch.call_args[0][0]
+        await client.send_queue_messages_batch(
+            [
+                QueueMessage(
+                    channel="orders",
+                    id=f"m-{i}",
+                    body=body,
+                    metadata="md",
+                    tags={"k": "v"},
+                    **policy,
+                )
+                for i, body in enumerate([b"a", b"b"])
+            ]
+        )
+        batch = mock_transport.send_queue_messages_batch.call_args[0][0]
+
+        assert list(bulk.Messages) == list(batch.Messages)
+        assert bulk.BatchID
+
+    @pytest.mark.asyncio
+    async def test_returns_batch_result(self, mock_transport):
+        client = self._client(mock_transport)
+
+        result = await client.send_queue_messages_bulk("orders", [b"a"])
+
+        assert result.batch_id == "b-1"
+        assert result.results[0].id == "m-0"
+
+    @pytest.mark.asyncio
+    async def test_generates_unique_ids(self, mock_transport):
+        client = self._client(mock_transport)
+
+        await client.send_queue_messages_bulk("orders", [b"x"] * 50)
+
+        request = mock_transport.send_queue_messages_batch.call_args[0][0]
+        assert len({m.MessageID for m in request.Messages}) == 50
+        assert all(m.ClientID == "test-client" for m in request.Messages)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("bodies", "kwargs"),
+        [
+            ([b"a", b"b"], {"ids": ["only-one"]}),
+            ([b"a", b""], {}),
+            ([b"a"], {"max_receive_count": 3}),
+            ([b"a"], {"delay_in_seconds": -1}),
+        ],
+        ids=["ids_mismatch", "empty_row", "dlq_missing", "negative_delay"],
+    )
+    async def test_validation_errors(self, mock_transport, bodies, kwargs):
+        client = self._client(mock_transport)
+
+        with pytest.raises(KubeMQValidationError):
+            await client.send_queue_messages_bulk("orders", bodies, **kwargs)
+        mock_transport.send_queue_messages_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_body_over_max_send_size(self, mock_transport):
+        client = self._client(mock_transport, max_send_size=4)
+
+        with pytest.raises(KubeMQValidationError, match="exceeds maximum"):
+            await client.send_queue_messages_bulk("orders", [b"ok", b"too long"])
+
+    @pytest.mark.asyncio
+    async def test_empty_body_allowed_with_shared_metadata(self, mock_transport):
+        client = self._client(mock_transport)
+
+        await client.send_queue_messages_bulk("orders", [b""], metadata="md")
+
+        request = mock_transport.send_queue_messages_batch.call_args[0][0]
+        assert request.Messages[0].Metadata == "md"
+
+
 class TestAsyncClientReceiveQueueMessages:
     """Tests for receive_queue_messages method."""
 
@@ -1229,8 +1323,6 @@ class TestAckAllCustomWaitTime:
 # Extended Coverage Tests — 95% target
 # ==============================================================================
 
-from kubemq.core.exceptions import KubeMQValidationError  # noqa: E402
-
 
 class TestAsyncClientSendQueueMessageSimple:
     """Tests for send_queue_message_simple() (lines 259-306)."""
@@ -2468,3 +2560,144 @@ class TestAsyncClientSendQueueMessageBidiWithSpan:
         assert result.is_error is False
         # Verify span.set_attribute was called (lines 383-389)
         assert mock_span.set_attribute.call_count == 2
+
+
+class TestProcessQueueMessagesBatch:
+    """Tests for process_queue_messages_batch and range settlement."""
+
+    @staticmethod
+    def _make_response(mock_transport, sent: list):
+        from kubemq.queues.queues_message_received import QueueMessageReceived
+
+        async def handler(req):
+            sent.append(req)
+
+        messages = [
+            QueueMessageReceived(
+                id=f"m-{i}",
+                channel="q",
+                sequence=i + 1,
+                transaction_id="tx-1",
+                receiver_client_id="c",
+                async_response_handler=handler,
+            )
+            for i in range(3)
+        ]
+        return AsyncQueuesPollResponse(
+            ref_request_id="r",
+            transaction_id="tx-1",
+            messages=messages,
+            error="",
+            is_error=False,
+            is_transaction_completed=False,
+            active_offsets=[1, 2, 3],
+            receiver_client_id="c",
+            is_auto_acked=False,
+            transport=mock_transport,
+        )
+
+    def _make_client(self, mock_transport):
+        client = AsyncClient(address="localhost:50000")
+        client._transport = mock_transport
+        client._connected = True
+        return client
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(5)
+    async def test_success_settles_batch_with_one_ack_range(self, mock_transport):
+        client = self._make_client(mock_transport)
+        sent: list = []
+        response = self._make_response(mock_transport, sent)
+        batches = []
+
+        async def fake_subscribe(**kwargs):
+            yield response
+
+        async def on_batch(messages):
+            batches.append([m.id for m in messages])
+
+        with patch.object(client, "subscribe_to_queue", fake_subscribe):
+            await client.process_queue_messages_batch(channel="q", callback=on_batch)
+
+        assert batches == [["m-0", "m-1", "m-2"]]
+        assert len(sent) == 1
+        assert sent[0].RequestTypeData == pb.QueuesDownstreamRequestType.AckRange
+        assert list(sent[0].SequenceRange) == [1, 2, 3]
+        assert sent[0].RefTransactionId == "tx-1"
+        assert response.is_transaction_completed
+        assert all(m.is_completed for m in response.messages)
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(5)
+    async def test_failure_rejects_batch_with_one_nack_range(self, mock_transport):
+        client = self._make_client(mock_transport)
+        sent: list = []
+        response = self._make_response(mock_transport, sent)
+        errors = []
+
+        async def fake_subscribe(**kwargs):
+            yield response
+
+        async def on_batch(messages):
+            raise RuntimeError("insert failed")
+
+        async def on_error(e):
+            errors.append(e)
+
+        with patch.object(client, "subscribe_to_queue", fake_subscribe):
+            await client.process_queue_messages_batch(
+                channel="q", callback=on_batch, error_callback=on_error
+            )
+
+        assert len(errors) == 1
+        assert "insert failed" in str(errors[0])
+        assert len(sent) == 1
+        assert sent[0].RequestTypeData == pb.QueuesDownstreamRequestType.NAckRange
+        assert list(sent[0].SequenceRange) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(5)
+    async def test_messages_settled_by_callback_are_skipped(self, mock_transport):
+        client = self._make_client(mock_transport)
+        sent: list = []
+        response = self._make_response(mock_transport, sent)
+
+        async def fake_subscribe(**kwargs):
+            yield response
+
+        async def on_batch(messages):
+            await messages[0].async_nack()
+
+        with patch.object(client, "subscribe_to_queue", fake_subscribe):
+            await client.process_queue_messages_batch(channel="q", callback=on_batch)
+
+        assert len(sent) == 2
+        assert list(sent[1].SequenceRange) == [2, 3]
+        assert sent[1].RequestTypeData == pb.QueuesDownstreamRequestType.AckRange
+
+    @pytest.mark.asyncio
+    async def test_ack_range_rejected_when_auto_acked(self, mock_transport):
+        sent: list = []
+        response = self._make_response(mock_transport, sent)
+        response.is_auto_acked = True
+        with pytest.raises(ValueError, match="auto-acknowledged"):
+            await response.ack_range()
+
+
+class TestAsyncClientReconnectBuffering:
+    """Queue sends go to the reconnect buffer while the transport reconnects."""
+
+    @pytest.mark.asyncio
+    async def test_send_queue_message_is_buffered(self):
+        transport = AsyncMock()
+        transport.is_connected = False
+        transport.is_buffering = True
+        transport.buffer_publish = AsyncMock(return_value=pb.SendQueueMessageResult(MessageID="m1"))
+        client = AsyncClient(address="localhost:50000")
+        client._transport = transport
+
+        result = await client.send_queue_message(QueueMessage(channel="q", body=b"data"))
+
+        assert result.id == "m1"
+        assert transport.buffer_publish.call_args[0][0] == "queue"
+        assert client._upstream_sender is None
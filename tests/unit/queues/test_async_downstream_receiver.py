@@ -936,3 +936,70 @@ class TestAsyncDownstreamReceiverIntegration:
         transport._get_stub = get_stub
         await receiver._stream_loop()
         assert call_count >= 1
+
+
+class TestAsyncDownstreamReceiverStageTimer:
+    async def _drive(self, receiver):
+        receiver._send_queue.put_nowait(_SENTINEL)
+        async for _ in receiver._request_generator(asyncio.Event()):
+            pass
+
+    async def test_get_request_records_all_stages(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        timer = StageTimer()
+        receiver, _ = _make_receiver()
+        receiver._stages = timer.probe("queues_downstream")
+        request = QueuesDownstreamRequest(RequestID="r1")
+        task = asyncio.create_task(receiver.send(request))
+        await asyncio.sleep(0)
+        await self._drive(receiver)
+
+        response = QueuesDownstreamResponse(RefRequestId="r1")
+
+        async def _mock_iter(self):
+            yield response
+
+        mock_call = MagicMock()
+        mock_call.__aiter__ = _mock_iter
+        await receiver._receive_responses(mock_call)
+
+        assert await task is response
+        assert set(timer.snapshot()) == {
+            "queues_downstream.queue_wait",
+            "queues_downstream.write",
+            "queues_downstream.response",
+            "queues_downstream.demux",
+        }
+
+    async def test_timed_out_get_drops_stage_marks(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        receiver, _ = _make_receiver(response_timeout=0.05)
+        receiver._stages = StageTimer().probe("queues_downstream")
+        unwritten = asyncio.create_task(receiver.send(QueuesDownstreamRequest(RequestID="r1")))
+        written = asyncio.create_task(receiver.send(QueuesDownstreamRequest(RequestID="r2")))
+        await asyncio.sleep(0)
+        receiver._send_queue.get_nowait()
+        await self._drive(receiver)
+        assert set(receiver._enqueued_at) == {"r1"}
+        assert set(receiver._written_at) == {"r2"}
+
+        assert await unwritten is None
+        assert await written is None
+        assert receiver._enqueued_at == {}
+        assert receiver._written_at == {}
+
+    async def test_ack_records_queue_wait_and_write_only(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        timer = StageTimer()
+        receiver = AsyncDownstreamReceiver(MagicMock(), stage_timer=timer)
+        await receiver.send_without_response(QueuesDownstreamRequest(RequestID="ack-1"))
+        await self._drive(receiver)
+
+        assert set(timer.snapshot()) == {
+            "queues_downstream.queue_wait",
+            "queues_downstream.write",
+        }
+        assert receiver._written_at == {}
@@ -767,3 +767,117 @@ class TestAsyncUpstreamSenderCloseQueueFull:
         assert future.done()
         # The disconnection error should be set
         assert future.result().Results[0].IsError is True
+
+
+class TestAsyncUpstreamSenderStageTimer:
+    async def test_sampled_send_records_all_stages(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        timer = StageTimer()
+        sender = AsyncUpstreamSender(MagicMock(), stage_timer=timer)
+        task = asyncio.create_task(sender.send(pbQueueMessage(MessageID="m1")))
+        await asyncio.sleep(0)
+        request = sender._send_queue.get_nowait()
+        sender._send_queue.put_nowait(request)
+        sender._send_queue.put_nowait(_SENTINEL)
+        async for _ in sender._request_generator(asyncio.Event()):
+            pass
+
+        response = QueuesUpstreamResponse(
+            RefRequestID=request.RequestID, Results=[SendQueueMessageResult(MessageID="m1")]
+        )
+
+        async def _mock_iter(self):
+            yield response
+
+        mock_call = MagicMock()
+        mock_call.__aiter__ = _mock_iter
+        await sender._receive_responses(mock_call)
+        result = await task
+
+        assert result.id == "m1"
+        assert set(timer.snapshot()) == {
+            "queues_upstream.queue_wait",
+            "queues_upstream.write",
+            "queues_upstream.response",
+            "queues_upstream.demux",
+        }
+        assert sender._written_at == {}
+
+    async def test_timed_out_sampled_send_drops_stage_marks(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        sender = AsyncUpstreamSender(MagicMock(), send_timeout=0.05, stage_timer=StageTimer())
+        unwritten = asyncio.create_task(sender.send(pbQueueMessage(MessageID="m1")))
+        written = asyncio.create_task(sender.send(pbQueueMessage(MessageID="m2")))
+        await asyncio.sleep(0)
+        first = sender._send_queue.get_nowait()
+        sender._send_queue.put_nowait(sender._send_queue.get_nowait())
+        sender._send_queue.put_nowait(_SENTINEL)
+        async for _ in sender._request_generator(asyncio.Event()):
+            pass
+        assert len(sender._enqueued_at) == 1
+        assert len(sender._written_at) == 1
+
+        assert (await unwritten).is_error is True
+        assert (await written).is_error is True
+        assert first.RequestID not in sender._response_tracking
+        assert sender._enqueued_at == {}
+        assert sender._written_at == {}
+
+    async def test_queue_full_drops_stage_mark(self):
+        from kubemq.core.stage_timer import StageTimer
+
+        sender = AsyncUpstreamSender(MagicMock(), max_queue_size=1, stage_timer=StageTimer())
+        sender._send_queue = asyncio.Queue(maxsize=1)
+        sender._send_queue.put_nowait(object())
+
+        with pytest.raises(KubeMQBufferFullError):
+            await sender.send(pbQueueMessage(MessageID="m1"))
+
+        assert sender._enqueued_at == {}
+
+
+class TestAsyncUpstreamSenderAdaptiveRate:
+    async def test_send_reports_confirmation(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncUpstreamSender(MagicMock(), adaptive_rate=AdaptiveRateConfig())
+        task = asyncio.create_task(sender.send(pbQueueMessage(MessageID="m1")))
+        await asyncio.sleep(0)
+        request = sender._send_queue.get_nowait()
+        sender._process_response(
+            QueuesUpstreamResponse(
+                RefRequestID=request.RequestID,
+                Results=[SendQueueMessageResult(MessageID="m1", IsError=True, Error="x")],
+            )
+        )
+        result = await task
+
+        assert result.is_error is True
+        assert sender._rate._congested is True
+
+    async def test_timeout_counts_as_congestion(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncUpstreamSender(
+            MagicMock(), send_timeout=0.01, adaptive_rate=AdaptiveRateConfig()
+        )
+
+        result = await sender.send(pbQueueMessage(MessageID="m1"))
+
+        assert result.is_error is True
+        assert sender._rate.latency == pytest.approx(0.01)
+        assert sender._rate._congested is True
+
+    def test_disconnection_counts_as_congestion(self):
+        from kubemq.core.config import AdaptiveRateConfig
+
+        sender = AsyncUpstreamSender(MagicMock(), adaptive_rate=AdaptiveRateConfig())
+        sender._handle_disconnection()
+
+        assert sender._rate._congested is True
+
+    def test_disabled_by_default(self):
+        sender, _ = _make_sender()
+        assert sender._rate is None
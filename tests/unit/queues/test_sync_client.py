@@ -250,6 +250,7 @@ class TestQueuesClientChannelManagement:
                     client._config.client_id,
                     "test-queue",
                     "queues",
+                    cache=None,
                 )
 
     def test_delete_queues_channel(self):
@@ -273,6 +274,7 @@ class TestQueuesClientChannelManagement:
                     client._config.client_id,
                     "test-queue",
                     "queues",
+                    cache=None,
                 )
 
     def test_list_queues_channels(self):
@@ -298,6 +300,7 @@ class TestQueuesClientChannelManagement:
                     client._transport,
                     client._config.client_id,
                     "",
+                    cache=None,
                 )
 
     def test_list_queues_channels_with_search(self):
@@ -319,6 +322,7 @@ class TestQueuesClientChannelManagement:
                     client._transport,
                     client._config.client_id,
                     "test",
+                    cache=None,
                 )
 
 
@@ -1476,6 +1480,39 @@ class TestSendQueueMessagesBatch:
             assert batch_result.results[1].is_error is True
 
 
+class TestSendQueueMessagesBulk:
+    """Tests for the columnar send_queue_messages_bulk()."""
+
+    def test_send_queue_messages_bulk_builds_one_batch(self):
+        from kubemq.grpc import QueueMessagesBatchResponse, SendQueueMessageResult
+
+        with patch("kubemq.transport.transport.SyncTransport") as mock_transport_class:
+            mock_transport = MagicMock()
+            mock_transport.initialize.return_value = mock_transport
+            mock_transport.is_connected.return_value = True
+
+            mock_grpc_client = MagicMock()
+            mock_grpc_client.SendQueueMessagesBatch.return_value = QueueMessagesBatchResponse(
+                BatchID="batch-1",
+                Results=[SendQueueMessageResult(MessageID=f"m-{i}") for i in range(3)],
+            )
+            mock_transport.kubemq_client.return_value = mock_grpc_client
+            mock_transport_class.return_value = mock_transport
+
+            client = Client(address="localhost:50000", client_id="sync-client")
+            result = client.send_queue_messages_bulk(
+                "q", [b"a", b"b", b"c"], tags={"k": "v"}, expiration_in_seconds=30
+            )
+
+            request = mock_grpc_client.SendQueueMessagesBatch.call_args[0][0]
+            assert [m.Body for m in request.Messages] == [b"a", b"b", b"c"]
+            assert all(m.Channel == "q" and m.Tags["k"] == "v" for m in request.Messages)
+            assert all(m.Policy.ExpirationSeconds == 30 for m in request.Messages)
+            assert all(m.ClientID == "sync-client" for m in request.Messages)
+            assert result.batch_id == "batch-1"
+            assert len(result.results) == 3
+
+
 class TestReceiveQueueMessagesMetadata:
     """Tests for receive_queue_messages with metadata (lines 527-529)."""
 
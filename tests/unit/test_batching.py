@@ -0,0 +1,143 @@
+"""Unit tests for the size/time batch collectors."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kubemq._internal.batching import AsyncBatchCollector, BatchCollector
+
+
+class TestAsyncBatchCollector:
+    async def test_flushes_when_full(self):
+        batches: list[list[int]] = []
+
+        async def handler(batch: list[int]) -> None:
+            batches.append(batch)
+
+        collector = AsyncBatchCollector(handler, max_batch_size=2, max_batch_delay_ms=10_000)
+        for i in range(5):
+            await collector.add(i)
+        assert batches == [[0, 1], [2, 3]]
+        assert collector.buffered == 1
+
+        await collector.close()
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    async def test_flushes_partial_batch_after_delay(self):
+        batches: list[list[int]] = []
+
+        async def handler(batch: list[int]) -> None:
+            batches.append(batch)
+
+        collector = AsyncBatchCollector(handler, max_batch_size=100, max_batch_delay_ms=20)
+        await collector.add(1)
+        await collector.add(2)
+        await asyncio.sleep(0.1)
+        assert batches == [[1, 2]]
+        await collector.close()
+
+    async def test_timer_survives_handler_error(self):
+        calls = 0
+
+        async def handler(batch: list[int]) -> None:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("boom")
+
+        collector = AsyncBatchCollector(handler, max_batch_size=100, max_batch_delay_ms=5)
+        await collector.add(1)
+        await asyncio.sleep(0.05)
+        await collector.add(2)
+        await asyncio.sleep(0.05)
+        assert calls == 2
+        await collector.close()
+
+    async def test_close_waits_for_timer_flush_in_progress(self):
+        delivered: list[list[int]] = []
+        cancelled: list[list[int]] = []
+        in_handler = asyncio.Event()
+
+        async def handler(batch: list[int]) -> None:
+            in_handler.set()
+            try:
+                await asyncio.sleep(0.05)
+            except asyncio.CancelledError:
+                cancelled.append(batch)
+                raise
+            delivered.append(batch)
+
+        collector = AsyncBatchCollector(handler, max_batch_size=100, max_batch_delay_ms=5)
+        for i in range(5):
+            await collector.add(i)
+        await asyncio.wait_for(in_handler.wait(), timeout=1.0)
+        await collector.add(5)
+
+        await collector.close()
+
+        assert cancelled == []
+        assert delivered == [[0, 1, 2, 3, 4], [5]]
+
+    @pytest.mark.parametrize(("size", "delay"), [(0, 10), (10_001, 10), (10, -1)])
+    def test_rejects_invalid_params(self, size, delay):
+        async def handler(batch: list[int]) -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            AsyncBatchCollector(handler, size, delay)
+
+
+class TestBatchCollector:
+    def test_flushes_inline_when_full(self):
+        batches: list[list[int]] = []
+        collector = BatchCollector(batches.append, max_batch_size=3, max_batch_delay_ms=10_000)
+        for i in range(6):
+            collector.add(i)
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+        collector.close(timeout=2)
+
+    def test_timer_flushes_partial_batch(self):
+        done = threading.Event()
+        batches: list[list[int]] = []
+
+        def handler(batch: list[int]) -> None:
+            batches.append(batch)
+            done.set()
+
+        collector = BatchCollector(handler, max_batch_size=100, max_batch_delay_ms=20)
+        collector.add(1)
+        assert done.wait(timeout=2)
+        assert batches == [[1]]
+        collector.close(timeout=2)
+
+    def test_stop_event_triggers_final_flush(self):
+        stop = threading.Event()
+        batches: list[list[int]] = []
+        collector = BatchCollector(
+            batches.append, max_batch_size=100, max_batch_delay_ms=60_000, stop_events=(stop,)
+        )
+        collector.add(1)
+        stop.set()
+        collector.thread.join(timeout=2)
+        assert not collector.thread.is_alive()
+        assert batches == [[1]]
+
+    def test_timer_errors_go_to_on_error(self):
+        errors: list[Exception] = []
+
+        def handler(batch: list[int]) -> None:
+            raise RuntimeError("sink down")
+
+        collector = BatchCollector(
+            handler, max_batch_size=100, max_batch_delay_ms=10, on_error=errors.append
+        )
+        collector.add(1)
+        deadline = time.monotonic() + 2
+        while not errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+        collector.close(timeout=2)
+        assert len(errors) == 1
+        assert str(errors[0]) == "sink down"
@@ -0,0 +1,118 @@
+"""Unit tests for the fixed-size subscription callback worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kubemq._internal.callback_pool import AsyncCallbackPool
+
+
+class TestAsyncCallbackPool:
+    async def test_processes_all_items(self):
+        seen: list[int] = []
+
+        async def handler(item: int) -> None:
+            seen.append(item)
+
+        pool = AsyncCallbackPool(handler, 4)
+        pool.start()
+        for i in range(50):
+            await pool.submit(i)
+        await pool.close()
+
+        assert sorted(seen) == list(range(50))
+        assert not pool.running
+
+    async def test_concurrency_capped_at_worker_count(self):
+        active = 0
+        peak = 0
+
+        async def handler(item: int) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+        pool = AsyncCallbackPool(handler, 3)
+        for i in range(30):
+            await pool.submit(i)
+        await pool.close()
+
+        assert peak == 3
+
+    async def test_submit_applies_backpressure(self):
+        release = asyncio.Event()
+
+        async def handler(item: int) -> None:
+            await release.wait()
+
+        pool = AsyncCallbackPool(handler, 1, queue_size=1)
+        pool.start()
+        await pool.submit(1)
+        await asyncio.sleep(0)  # worker picks up item 1
+        await pool.submit(2)  # fills the queue
+
+        blocked = asyncio.ensure_future(pool.submit(3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await pool.close()
+
+    async def test_handler_exception_does_not_kill_worker(self):
+        seen: list[int] = []
+
+        async def handler(item: int) -> None:
+            if item == 0:
+                raise RuntimeError("boom")
+            seen.append(item)
+
+        pool = AsyncCallbackPool(handler, 1)
+        for i in range(3):
+            await pool.submit(i)
+        await pool.close()
+
+        assert seen == [1, 2]
+
+    async def test_close_without_drain_cancels_in_flight(self):
+        started = asyncio.Event()
+        cancelled = False
+
+        async def handler(item: int) -> None:
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        pool = AsyncCallbackPool(handler, 1)
+        await pool.submit(1)
+        await started.wait()
+        await pool.close(drain=False)
+
+        assert cancelled
+        assert pool.pending == 0
+
+    async def test_start_is_idempotent(self):
+        async def handler(item: int) -> None:
+            pass
+
+        pool = AsyncCallbackPool(handler, 2)
+        pool.start()
+        workers = list(pool._workers)
+        pool.start()
+        assert pool._workers == workers
+        await pool.close()
+
+    def test_rejects_zero_workers(self):
+        async def handler(item: int) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="workers must be >= 1"):
+            AsyncCallbackPool(handler, 0)
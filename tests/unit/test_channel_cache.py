@@ -0,0 +1,203 @@
+"""Tests for the client-side channel listing cache."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from kubemq._internal.channel_cache import ChannelListCache, _literal_prefix
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Fetcher:
+    def __init__(self, names):
+        self.names = names
+        self.calls = []
+
+    def __call__(self, channel_search):
+        self.calls.append(channel_search)
+        return [SimpleNamespace(name=name) for name in self.names]
+
+
+def _names(channels):
+    return [channel.name for channel in channels]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ChannelListCache(5.0, clock=clock)
+
+
+class TestTtl:
+    def test_fresh_entry_is_served_from_cache(self, cache):
+        fetch = Fetcher(["a"])
+        cache.get("queues", "", fetch)
+        cache.get("queues", "", fetch)
+
+        assert fetch.calls == [""]
+
+    def test_expired_entry_is_refetched(self, cache, clock):
+        fetch = Fetcher(["a"])
+        cache.get("queues", "", fetch)
+        clock.now = 5.0
+        cache.get("queues", "", fetch)
+
+        assert fetch.calls == ["", ""]
+
+    def test_keys_include_type_and_search(self, cache):
+        fetch = Fetcher(["a"])
+        cache.get("queues", "x", fetch)
+        cache.get("events", "x", fetch)
+        cache.get("queues", "y", fetch)
+
+        assert fetch.calls == ["x", "x", "y"]
+
+    def test_ttl_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ChannelListCache(0)
+
+
+class TestPrefixIndex:
+    def test_trailing_wildcard_served_from_full_listing(self, cache):
+        fetch = Fetcher(["orders.b", "audit", "orders.a", "ordersx", "zeta"])
+        cache.get("queues", "", fetch)
+
+        assert _names(cache.get("queues", "orders.*", fetch)) == ["orders.a", "orders.b"]
+        assert _names(cache.get("queues", "orders*", fetch)) == [
+            "orders.a",
+            "orders.b",
+            "ordersx",
+        ]
+        assert fetch.calls == [""]
+
+    def test_full_listing_is_sorted_by_name(self, cache):
+        assert _names(cache.get("queues", "", Fetcher(["b", "c", "a"]))) == ["a", "b", "c"]
+
+    def test_other_searches_go_to_broker(self, cache):
+        fetch = Fetcher(["a"])
+        cache.get("queues", "", fetch)
+        cache.get("queues", "a?c*", fetch)
+        cache.get("queues", "abc", fetch)
+
+        assert fetch.calls == ["", "a?c*", "abc"]
+
+    def test_literal_prefix(self):
+        assert _literal_prefix("orders.*") == "orders."
+        assert _literal_prefix("orders") is None
+        assert _literal_prefix("*") is None
+        assert _literal_prefix("ord[ae]rs*") is None
+
+
+class TestInvalidation:
+    def test_invalidate_type_keeps_other_types(self, cache):
+        fetch = Fetcher(["a"])
+        cache.get("queues", "", fetch)
+        cache.get("events", "", fetch)
+        cache.invalidate("queues")
+        cache.get("queues", "", fetch)
+        cache.get("events", "", fetch)
+
+        assert fetch.calls == ["", "", ""]
+
+    def test_invalidate_during_fetch_discards_result(self, cache):
+        def fetch(channel_search):
+            cache.invalidate()
+            return []
+
+        cache.get("queues", "", fetch)
+        counting = Fetcher([])
+        cache.get("queues", "", counting)
+
+        assert counting.calls == [""]
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_share_one_fetch(self, cache):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch(channel_search):
+            calls.append(channel_search)
+            started.set()
+            release.wait(5)
+            return [SimpleNamespace(name="a")]
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(cache.get("q", "", slow_fetch)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.append(cache.get("q", "", slow_fetch)))
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert calls == [""]
+        assert len(results) == 2
+        assert results[0] is results[1]
+
+    def test_stale_entry_served_while_refreshing(self, cache, clock):
+        cache.get("q", "", Fetcher(["old"]))
+        clock.now = 10.0
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(channel_search):
+            started.set()
+            release.wait(5)
+            return [SimpleNamespace(name="new")]
+
+        refresher = threading.Thread(target=lambda: cache.get("q", "", slow_fetch))
+        refresher.start()
+        started.wait(5)
+
+        assert _names(cache.get("q", "", Fetcher(["unused"]))) == ["old"]
+        release.set()
+        refresher.join(5)
+        assert _names(cache.get("q", "", Fetcher(["unused"]))) == ["new"]
+
+    def test_error_propagates_to_waiters_and_is_not_cached(self, cache):
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing_fetch(channel_search):
+            started.set()
+            release.wait(5)
+            raise RuntimeError("broker down")
+
+        errors = []
+
+        def call():
+            try:
+                cache.get("q", "", failing_fetch)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(errors) == 2
+        fetch = Fetcher(["a"])
+        cache.get("q", "", fetch)
+        assert fetch.calls == [""]
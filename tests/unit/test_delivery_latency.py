@@ -0,0 +1,178 @@
+"""Tests for the opt-in publish-to-receive latency probe."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from kubemq._internal import delivery_latency
+from kubemq._internal.delivery_latency import PUBLISH_TIME_TAG, DeliveryLatencyProbe
+from kubemq._internal.telemetry import _NOOP_METER, KubeMQMetrics
+from kubemq.cq.command_message import CommandMessage
+from kubemq.cq.command_message_received import CommandReceived
+from kubemq.cq.query_message import QueryMessage
+from kubemq.cq.query_message_received import QueryReceived
+from kubemq.grpc import EventReceive, QueueMessage, QueueMessageAttributes, Request, Response
+from kubemq.pubsub.event_message_received import EventReceived
+from kubemq.pubsub.event_store_message_received import EventStoreReceived
+from kubemq.queues.queues_message_received import QueueMessageReceived
+
+DELAY_NS = 25_000_000
+
+
+@pytest.fixture
+def probe():
+    delivery_latency.disable()
+    yield delivery_latency.enable()
+    delivery_latency.disable()
+
+
+def _published() -> int:
+    return time.time_ns() - DELAY_NS
+
+
+class TestDeliveryLatencyProbe:
+    def test_record_measures_delay_since_publish(self):
+        probe = DeliveryLatencyProbe()
+        probe.record("events", _published())
+
+        snapshot = probe.snapshot()["events"]
+
+        assert snapshot.count == 1
+        assert DELAY_NS / 1e9 <= snapshot.max_seconds < 1.0
+
+    def test_zero_timestamp_is_skipped(self):
+        probe = DeliveryLatencyProbe()
+        probe.record("events", 0)
+
+        assert probe.snapshot() == {}
+
+    def test_record_tag_ignores_missing_and_malformed(self):
+        probe = DeliveryLatencyProbe()
+        probe.record_tag("commands", {})
+        probe.record_tag("commands", {PUBLISH_TIME_TAG: "not-a-number"})
+        probe.record_tag("commands", {PUBLISH_TIME_TAG: str(_published())})
+
+        assert probe.snapshot()["commands"].count == 1
+
+    def test_enable_is_idempotent(self, probe):
+        assert delivery_latency.enable() is probe
+        assert delivery_latency.active is probe
+
+
+class TestDecodeHooks:
+    def test_disabled_by_default(self):
+        delivery_latency.disable()
+        EventStoreReceived.decode(EventReceive(EventID="1", Timestamp=_published()))
+
+        assert delivery_latency.active is None
+
+    def test_events(self, probe):
+        EventReceived.decode(EventReceive(EventID="1", Timestamp=_published()))
+        EventReceived.decode(EventReceive(EventID="2"))
+
+        assert probe.snapshot()["events"].count == 1
+
+    def test_events_store(self, probe):
+        EventStoreReceived.decode(EventReceive(EventID="1", Timestamp=_published()))
+
+        assert probe.snapshot()["events_store"].count == 1
+
+    def test_queues(self, probe):
+        message = QueueMessage(
+            MessageID="1", Attributes=QueueMessageAttributes(Timestamp=_published())
+        )
+        QueueMessageReceived.decode(message, transaction_id="t")
+
+        assert probe.snapshot()["queues"].count == 1
+
+    def test_commands_and_queries_use_tag(self, probe):
+        tags = {PUBLISH_TIME_TAG: str(_published())}
+        CommandReceived.decode(Request(RequestID="1", Tags=tags))
+        QueryReceived.decode(Request(RequestID="2", Tags=tags))
+        QueryReceived.decode(Request(RequestID="3"))
+
+        snapshot = probe.snapshot()
+        assert snapshot["commands"].count == 1
+        assert snapshot["queries"].count == 1
+
+    def test_encode_stamps_publish_time_only_when_asked(self, probe):
+        command = CommandMessage(channel="c", body=b"x", timeout_in_seconds=5)
+        query = QueryMessage(channel="q", body=b"x", timeout_in_seconds=5)
+        assert PUBLISH_TIME_TAG not in command.encode("me").Tags
+
+        CommandReceived.decode(command.encode("me", stamp_publish_time=True))
+        QueryReceived.decode(query.encode("me", stamp_publish_time=True))
+
+        snapshot = probe.snapshot()
+        assert snapshot["commands"].count == 1
+        assert snapshot["queries"].count == 1
+
+
+class TestCQRoundTrip:
+    @pytest.mark.parametrize("probe_enabled", [True, False])
+    async def test_sent_command_and_query_are_recorded_on_decode(self, probe_enabled):
+        from kubemq.cq.async_client import AsyncClient
+
+        delivery_latency.disable()
+        try:
+            client = AsyncClient(address="localhost:50000", delivery_latency_probe=probe_enabled)
+            transport = AsyncMock(is_connected=True)
+            transport.send_request.return_value = Response(Executed=True)
+            client._transport = transport
+            client._connected = True
+            probe = delivery_latency.enable()
+
+            await client.send_command_fast(
+                CommandMessage(channel="c", body=b"x", timeout_in_seconds=5)
+            )
+            await client.send_query_fast(QueryMessage(channel="q", body=b"x", timeout_in_seconds=5))
+            command, query = (call.args[0] for call in transport.send_request.call_args_list)
+            CommandReceived.decode(Request.FromString(command.SerializeToString()))
+            QueryReceived.decode(Request.FromString(query.SerializeToString()))
+
+            snapshot = probe.snapshot()
+            if probe_enabled:
+                assert snapshot["commands"].count == 1
+                assert snapshot["queries"].count == 1
+            else:
+                assert snapshot == {}
+        finally:
+            delivery_latency.disable()
+
+
+class TestMetricsExposure:
+    def test_metrics_without_probe_report_nothing(self):
+        delivery_latency.disable()
+        metrics = KubeMQMetrics(meter=_NOOP_METER)
+
+        assert metrics.delivery_latency() == {}
+        assert delivery_latency.active is None
+
+    def test_metrics_enable_and_expose_probe(self):
+        delivery_latency.disable()
+        try:
+            metrics = KubeMQMetrics(meter=_NOOP_METER, delivery_latency=True)
+            EventStoreReceived.decode(EventReceive(EventID="1", Timestamp=_published()))
+
+            latency = metrics.delivery_latency()["events_store"]
+            assert latency.count == 1
+            assert latency.percentile(50) >= DELAY_NS / 1e9
+        finally:
+            delivery_latency.disable()
+
+    def test_client_config_enables_probe(self):
+        from kubemq.core.client import _create_instrumentor
+        from kubemq.core.config import ClientConfig
+
+        delivery_latency.disable()
+        try:
+            config = ClientConfig(address="localhost:50000", delivery_latency_probe=True)
+            instrumentor = _create_instrumentor(config, logger=None)
+
+            assert instrumentor._metrics._delivery_latency is delivery_latency.active
+            assert delivery_latency.active is not None
+        finally:
+            delivery_latency.disable()
@@ -0,0 +1,151 @@
+"""Tests for hedged query requests."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from kubemq._internal.hedging import Hedger
+from kubemq.core.config import HedgingPolicy
+
+
+def _policy(**overrides):
+    defaults = {"initial_delay_seconds": 0.01, "min_delay_seconds": 0.001}
+    defaults.update(overrides)
+    return HedgingPolicy(**defaults)
+
+
+class Attempts:
+    """Fake attempt callable with per-kind delays and failures."""
+
+    def __init__(self, primary_delay=0.0, hedge_delay=0.0, primary_error=None, hedge_error=None):
+        self.delays = {False: primary_delay, True: hedge_delay}
+        self.errors = {False: primary_error, True: hedge_error}
+        self.calls = []
+        self.cancelled = []
+
+    async def __call__(self, hedge, timeout):
+        self.calls.append((hedge, timeout))
+        try:
+            await asyncio.sleep(self.delays[hedge])
+        except asyncio.CancelledError:
+            self.cancelled.append(hedge)
+            raise
+        if self.errors[hedge] is not None:
+            raise self.errors[hedge]
+        return "hedge" if hedge else "primary"
+
+
+class TestHedgerRun:
+    async def test_fast_primary_is_not_hedged(self):
+        hedger = Hedger(_policy())
+        attempts = Attempts()
+
+        assert await hedger.run(attempts, 5, "q") == "primary"
+        assert attempts.calls == [(False, 5)]
+        assert hedger.hedged == 0
+
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        metrics = MagicMock()
+        hedger = Hedger(_policy(), metrics=metrics)
+        attempts = Attempts(primary_delay=5)
+
+        assert await hedger.run(attempts, 5, "q") == "hedge"
+        await asyncio.sleep(0)
+
+        assert [hedge for hedge, _ in attempts.calls] == [False, True]
+        assert attempts.calls[1][1] < 5
+        assert attempts.cancelled == [False]
+        assert (hedger.requests, hedger.hedged, hedger.wins) == (1, 1, 1)
+        assert [c.args for c in metrics.record_hedge.call_args_list] == [
+            ("hedged", "q"),
+            ("won", "q"),
+        ]
+
+    async def test_failed_hedge_falls_back_to_primary(self):
+        hedger = Hedger(_policy())
+        attempts = Attempts(primary_delay=0.05, hedge_error=RuntimeError("hedge"))
+
+        assert await hedger.run(attempts, 5, "q") == "primary"
+        assert hedger.wins == 0
+
+    async def test_both_failing_raises_primary_error(self):
+        hedger = Hedger(_policy())
+        attempts = Attempts(
+            primary_delay=0.05,
+            primary_error=RuntimeError("primary"),
+            hedge_error=RuntimeError("hedge"),
+        )
+
+        with pytest.raises(RuntimeError, match="primary"):
+            await hedger.run(attempts, 5, "q")
+
+    async def test_budget_limits_hedges(self):
+        hedger = Hedger(_policy(burst=1, max_hedge_ratio=0.01))
+
+        await hedger.run(Attempts(primary_delay=0.05), 5, "q")
+        second = Attempts(primary_delay=0.05)
+        assert await hedger.run(second, 5, "q") == "primary"
+
+        assert hedger.hedged == 1
+        assert [hedge for hedge, _ in second.calls] == [False]
+
+    async def test_no_hedge_near_deadline(self):
+        hedger = Hedger(_policy(min_remaining_seconds=1.0))
+        attempts = Attempts(primary_delay=0.05)
+
+        assert await hedger.run(attempts, 1, "q") == "primary"
+        assert hedger.hedged == 0
+
+    async def test_cancellation_cancels_both_attempts(self):
+        hedger = Hedger(_policy())
+        attempts = Attempts(primary_delay=5, hedge_delay=5)
+        task = asyncio.create_task(hedger.run(attempts, 10, "q"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        assert sorted(attempts.cancelled) == [False, True]
+
+
+class TestHedgeDelay:
+    def test_initial_delay_until_min_samples(self):
+        hedger = Hedger(_policy(initial_delay_seconds=0.2, min_samples=3))
+        hedger.record_latency(0.01)
+        hedger.record_latency(0.01)
+
+        assert hedger.delay == 0.2
+
+    def test_delay_follows_percentile_and_clamps(self):
+        hedger = Hedger(_policy(percentile=50, min_samples=4, max_delay_seconds=0.5))
+        for seconds in (0.010, 0.010, 0.010, 0.010):
+            hedger.record_latency(seconds)
+        assert hedger.delay == pytest.approx(0.010, rel=0.02)
+
+        slow = Hedger(_policy(percentile=50, min_samples=4, max_delay_seconds=0.5))
+        for _ in range(4):
+            slow.record_latency(2.0)
+        assert slow.delay == 0.5
+
+
+class TestHedgingPolicy:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"percentile": 100},
+            {"min_delay_seconds": 0},
+            {"min_delay_seconds": 2.0, "max_delay_seconds": 1.0},
+            {"initial_delay_seconds": 0},
+            {"min_samples": 0},
+            {"max_hedge_ratio": 0},
+            {"burst": 0},
+            {"min_remaining_seconds": -1},
+        ],
+    )
+    def test_invalid_values_raise(self, overrides):
+        with pytest.raises(ValueError):
+            HedgingPolicy(**overrides)
@@ -0,0 +1,114 @@
+"""Tests for kubemq._internal.histogram and the LatencyHistogram snapshot."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubemq._internal.histogram import BucketHistogram, LogHistogram
+from kubemq.core.types import LatencyHistogram
+
+
+class TestBucketHistogram:
+    def test_samples_land_in_upper_bound_bucket(self):
+        histogram = BucketHistogram(bounds=(0.001, 0.01, 0.1))
+        for seconds in (0.0005, 0.001, 0.005, 0.05, 2.0):
+            histogram.record(seconds)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.counts == (2, 1, 1, 1)
+        assert snapshot.count == 5
+        assert snapshot.max_seconds == 2.0
+        assert snapshot.sum_seconds == pytest.approx(2.0565)
+
+    def test_snapshot_is_independent(self):
+        histogram = BucketHistogram(bounds=(1.0,))
+        histogram.record(0.5)
+        snapshot = histogram.snapshot()
+        histogram.record(0.5)
+
+        assert snapshot.count == 1
+
+
+class TestLogHistogram:
+    def test_small_values_are_exact(self):
+        histogram = LogHistogram(significant_bits=7)
+        for ns in (0, 1, 5, 127):
+            histogram.record_ns(ns)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.bounds == (0.0, 1e-9, 5e-9, 127e-9)
+        assert snapshot.counts == (1, 1, 1, 1, 0)
+
+    @pytest.mark.parametrize("ns", [128, 1_000, 123_456, 5_000_000, 987_654_321, 3_000_000_000])
+    def test_bucket_bound_within_relative_precision(self, ns):
+        histogram = LogHistogram(significant_bits=7)
+        histogram.record_ns(ns)
+
+        (bound,) = histogram.snapshot().bounds
+
+        assert ns / 1e9 <= bound <= ns * (1 + 2**-6) / 1e9
+
+    def test_percentile_from_sparse_snapshot(self):
+        histogram = LogHistogram()
+        for _ in range(99):
+            histogram.record_ns(1_000_000)
+        histogram.record_ns(50_000_000)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.count == 100
+        assert snapshot.percentile(50) == pytest.approx(0.001, rel=0.02)
+        assert snapshot.percentile(100) == pytest.approx(0.05)
+        assert snapshot.mean_seconds == pytest.approx(0.00149)
+
+    def test_overflow_and_negative_samples(self):
+        histogram = LogHistogram(highest_ns=1_000)
+        histogram.record_ns(-5)
+        histogram.record_ns(10_000_000)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.counts[0] == 1
+        assert snapshot.counts[-1] == 1
+        assert snapshot.max_seconds == pytest.approx(0.01)
+        assert snapshot.percentile(100) == pytest.approx(0.01)
+
+    def test_rejects_too_few_bits(self):
+        with pytest.raises(ValueError):
+            LogHistogram(significant_bits=1)
+
+
+class TestLatencyHistogram:
+    def _histogram(self) -> LatencyHistogram:
+        # 90 samples <= 10 ms, 9 <= 100 ms, 1 overflow at 3 s.
+        return LatencyHistogram(
+            bounds=(0.01, 0.1, 1.0),
+            counts=(90, 9, 0, 1),
+            count=100,
+            sum_seconds=4.0,
+            max_seconds=3.0,
+        )
+
+    def test_percentiles(self):
+        histogram = self._histogram()
+
+        assert histogram.percentile(50) == 0.01
+        assert histogram.percentile(90) == 0.01
+        assert histogram.percentile(95) == 0.1
+        assert histogram.percentile(100) == 3.0
+
+    def test_percentile_capped_at_max(self):
+        histogram = LatencyHistogram(
+            bounds=(1.0,), counts=(1, 0), count=1, sum_seconds=0.2, max_seconds=0.2
+        )
+        assert histogram.percentile(50) == 0.2
+
+    def test_empty(self):
+        histogram = LatencyHistogram(bounds=(1.0,), counts=(0, 0))
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean_seconds == 0.0
+
+    def test_mean(self):
+        assert self._histogram().mean_seconds == pytest.approx(0.04)
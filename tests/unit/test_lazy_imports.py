@@ -0,0 +1,94 @@
+"""Tests for PEP 562 lazy re-exports in the package ``__init__`` modules."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+import kubemq
+from kubemq._internal.lazy import lazy_exports
+
+
+def _fresh_modules(statement: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(proc.stdout.split())
+
+
+class TestLazyExports:
+    @pytest.fixture
+    def package(self, monkeypatch):
+        for name, value in (("fake_first", 1), ("fake_second", 2)):
+            source = types.ModuleType(name)
+            source.shared = value
+            source.only_first = value
+            monkeypatch.setitem(sys.modules, name, source)
+        del sys.modules["fake_second"].only_first
+
+        module = types.ModuleType("fake_pkg")
+        monkeypatch.setitem(sys.modules, "fake_pkg", module)
+        module.__getattr__, module.__dir__ = lazy_exports(
+            "fake_pkg",
+            {"json": ("dumps", "loads as parse")},
+            fallback=("fake_first", "fake_second"),
+        )
+        return module
+
+    def test_resolves_and_caches(self, package):
+        import json
+
+        assert package.dumps is json.dumps
+        assert package.parse is json.loads
+        assert vars(package)["dumps"] is json.dumps
+
+    def test_fallback_later_module_wins(self, package):
+        assert package.shared == 2
+        assert package.only_first == 1
+
+    def test_unknown_and_private_names_raise(self, package):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            package.missing
+        with pytest.raises(AttributeError):
+            package._re
+
+    def test_dir_lists_lazy_names(self, package):
+        assert {"dumps", "parse"} <= set(dir(package))
+
+
+class TestKubemqLazyImport:
+    def test_all_names_resolve(self):
+        for name in kubemq.__all__:
+            assert getattr(kubemq, name) is not None or name == "__version__"
+        assert set(kubemq.__all__) <= set(dir(kubemq))
+
+    def test_aliases_match_subpackages(self):
+        from kubemq.pubsub.async_client import AsyncClient
+        from kubemq.queues import Client
+
+        assert kubemq.AsyncPubSubClient is AsyncClient
+        assert kubemq.QueuesClient is Client
+
+    def test_version_is_string(self):
+        assert isinstance(kubemq.__version__, str)
+
+    def test_import_kubemq_does_not_load_clients(self):
+        loaded = _fresh_modules("import kubemq")
+        assert "grpc" not in loaded
+        assert "kubemq.core.client" not in loaded
+        assert "kubemq.pubsub" not in loaded
+
+    def test_message_import_does_not_load_grpc(self):
+        loaded = _fresh_modules("from kubemq import QueueMessage, EventMessage, CommandMessage")
+        assert "grpc" not in loaded
+        assert "kubemq.grpc.kubemq_pb2" in loaded
+
+    def test_client_import_loads_grpc(self):
+        loaded = _fresh_modules("from kubemq import AsyncQueuesClient")
+        assert "grpc" in loaded
@@ -0,0 +1,146 @@
+"""Tests for the AIMD send-rate controller."""
+
+from __future__ import annotations
+
+import pytest
+
+from kubemq._internal.rate_control import AimdRateController
+from kubemq.core.config import AdaptiveRateConfig
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(**overrides):
+    clock = FakeClock()
+    config = AdaptiveRateConfig(**overrides)
+    return AimdRateController(config, clock=clock), clock
+
+
+class TestPacing:
+    def test_burst_is_admitted_without_delay(self):
+        controller, _ = _controller(initial_rate=100.0, adjust_interval_seconds=0.1)
+
+        delays = [controller.reserve(0, 100) for _ in range(10)]
+
+        assert delays == [0.0] * 10
+
+    def test_empty_bucket_returns_growing_delays(self):
+        controller, _ = _controller(initial_rate=100.0, adjust_interval_seconds=0.1)
+        for _ in range(10):
+            controller.reserve(0, 100)
+
+        first = controller.reserve(0, 100)
+        second = controller.reserve(0, 100)
+
+        assert first == pytest.approx(0.01)
+        assert second == pytest.approx(0.02)
+
+    def test_tokens_refill_over_time(self):
+        controller, clock = _controller(initial_rate=100.0, adjust_interval_seconds=1.0)
+        for _ in range(100):
+            controller.reserve(0, 100)
+
+        clock.now = 0.05
+
+        assert controller.reserve(0, 100) == 0.0
+
+    async def test_acquire_sleeps_for_delay(self, monkeypatch):
+        controller, _ = _controller(initial_rate=10.0, min_rate=1.0)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("kubemq._internal.rate_control.asyncio.sleep", fake_sleep)
+        await controller.acquire(0, 100)
+        await controller.acquire(0, 100)
+
+        assert sleeps == [pytest.approx(0.1)]
+
+
+class TestAdjustment:
+    def test_throttled_without_congestion_increases_additively(self):
+        controller, clock = _controller(initial_rate=100.0, additive_increase=50.0)
+        for _ in range(20):
+            controller.reserve(0, 100)
+
+        clock.now = 0.1
+        controller.reserve(0, 100)
+
+        assert controller.rate == 150.0
+
+    def test_idle_interval_keeps_rate(self):
+        controller, clock = _controller(initial_rate=100.0)
+        controller.reserve(0, 100)
+
+        clock.now = 0.1
+        controller.reserve(0, 100)
+
+        assert controller.rate == 100.0
+
+    def test_queue_utilization_decreases_multiplicatively(self):
+        controller, clock = _controller(initial_rate=1000.0, decrease_factor=0.5)
+        controller.reserve(60, 100)
+
+        clock.now = 0.1
+        controller.reserve(0, 100)
+
+        assert controller.rate == 500.0
+
+    def test_failed_result_decreases(self):
+        controller, clock = _controller(initial_rate=1000.0, decrease_factor=0.5)
+        controller.on_result(0.001, ok=False)
+
+        clock.now = 0.1
+        controller.reserve(0, 100)
+
+        assert controller.rate == 500.0
+
+    def test_high_latency_decreases(self):
+        controller, clock = _controller(initial_rate=1000.0, target_latency_seconds=0.01)
+        controller.on_result(0.02, ok=True)
+
+        clock.now = 0.1
+        controller.reserve(0, 100)
+
+        assert controller.rate == pytest.approx(700.0)
+        assert controller.latency == pytest.approx(0.02)
+
+    def test_latency_is_smoothed(self):
+        controller, _ = _controller()
+        controller.on_result(0.010, ok=True)
+        controller.on_result(0.020, ok=True)
+
+        assert controller.latency == pytest.approx(0.012)
+
+    def test_rate_is_bounded(self):
+        controller, clock = _controller(
+            initial_rate=20.0, min_rate=10.0, max_rate=20.0, decrease_factor=0.1
+        )
+        controller.on_error()
+        clock.now = 0.1
+        controller.reserve(0, 100)
+        assert controller.rate == 10.0
+
+        for step in range(2, 10):
+            for _ in range(10):
+                controller.reserve(0, 100)
+            clock.now = step * 0.1
+        controller.reserve(0, 100)
+        assert controller.rate == 20.0
+
+    def test_signals_reset_after_adjustment(self):
+        controller, clock = _controller(initial_rate=1000.0, decrease_factor=0.5)
+        controller.on_error()
+        clock.now = 0.1
+        controller.reserve(0, 100)
+        clock.now = 0.2
+        controller.reserve(0, 100)
+
+        assert controller.rate == 500.0
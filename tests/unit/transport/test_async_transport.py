@@ -3012,3 +3012,287 @@ class TestAsyncTransportConnectWithCredentialProvider:
         MockTM.assert_called_once()
         mock_tm_instance.get_token.assert_awaited_once()
         assert transport._token_manager is mock_tm_instance
+
+
+# ==============================================================================
+# Reconnect buffering
+# ==============================================================================
+
+
+def _buffered(kind, message, future=None, **extra):
+    return (message.SerializeToString(), {"kind": kind, "future": future, **extra})
+
+
+class _ResultStream:
+    """Stand-in for a SendEventsStream call yielding canned results."""
+
+    def __init__(self, results):
+        self._results = results
+        self.written = []
+        self.write = AsyncMock(side_effect=self.written.append)
+        self.done_writing = AsyncMock()
+        self.cancel = MagicMock()
+        self.drained = False
+
+    async def _iterate(self):
+        for result in self._results:
+            yield result
+        self.drained = True
+
+    def __aiter__(self):
+        return self._iterate()
+
+
+class TestAsyncTransportReconnectBuffering:
+    """Tests for buffering publishes while reconnecting."""
+
+    def _connected(self, mock_config, stub):
+        transport = AsyncTransport(mock_config)
+        transport._connected = True
+        transport._stub = stub
+        return transport
+
+    def test_not_buffering_when_idle(self, mock_config):
+        transport = AsyncTransport(mock_config)
+        assert transport.is_buffering is False
+
+    @pytest.mark.asyncio
+    async def test_buffer_publish_rejects_unknown_kind(self, mock_config):
+        transport = AsyncTransport(mock_config)
+        with pytest.raises(ValueError):
+            await transport.buffer_publish("query", pb.Request())
+
+    @pytest.mark.asyncio
+    async def test_buffer_publish_requires_auto_reconnect(self):
+        transport = AsyncTransport(ClientConfig(address="localhost:50000", auto_reconnect=False))
+        with pytest.raises(KubeMQConnectionError):
+            await transport.buffer_publish("event", pb.Event())
+
+    @pytest.mark.asyncio
+    async def test_flush_replays_runs_in_bulk(self, mock_config):
+        loop = asyncio.get_running_loop()
+        stub = MagicMock()
+        stream = _ResultStream([pb.Result(EventID="s1", Sent=True)])
+        stub.SendEventsStream = MagicMock(return_value=stream)
+        stub.SendQueueMessagesBatch = AsyncMock(
+            return_value=pb.QueueMessagesBatchResponse(
+                Results=[
+                    pb.SendQueueMessageResult(MessageID="q1"),
+                    pb.SendQueueMessageResult(MessageID="q2"),
+                ]
+            )
+        )
+        stub.SendRequest = AsyncMock(return_value=pb.Response(RequestID="c1", Executed=True))
+        transport = self._connected(mock_config, stub)
+
+        futures = [loop.create_future() for _ in range(5)]
+        await transport._flush_reconnect_buffer(
+            [
+                _buffered("event", pb.Event(EventID="e1", Channel="a"), futures[0]),
+                _buffered(
+                    "event_store", pb.Event(EventID="s1", Channel="a", Store=True), futures[1]
+                ),
+                _buffered("queue", pb.QueueMessage(MessageID="q1", Channel="q"), futures[2]),
+                _buffered("queue", pb.QueueMessage(MessageID="q2", Channel="q"), futures[3]),
+                _buffered(
+                    "command", pb.Request(RequestID="c1", Channel="c"), futures[4], timeout=5
+                ),
+            ]
+        )
+
+        assert [event.EventID for event in stream.written] == ["e1", "s1"]
+        stream.done_writing.assert_awaited_once()
+        stub.SendQueueMessagesBatch.assert_awaited_once()
+        assert len(stub.SendQueueMessagesBatch.call_args[0][0].Messages) == 2
+        assert futures[0].result() is None
+        assert futures[1].result().EventID == "s1"
+        assert [f.result().MessageID for f in futures[2:4]] == ["q1", "q2"]
+        assert futures[4].result().Executed is True
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_fails_only_that_run(self, mock_config):
+        loop = asyncio.get_running_loop()
+        stub = MagicMock()
+        stub.SendQueueMessagesBatch = AsyncMock(side_effect=TimeoutError())
+        stub.SendRequest = AsyncMock(return_value=pb.Response(RequestID="c1"))
+        transport = self._connected(mock_config, stub)
+
+        queued, command = loop.create_future(), loop.create_future()
+        await transport._flush_reconnect_buffer(
+            [
+                _buffered("queue", pb.QueueMessage(Channel="q"), queued),
+                _buffered("command", pb.Request(RequestID="c1", Channel="c"), command),
+            ]
+        )
+
+        with pytest.raises(KubeMQTimeoutError):
+            queued.result()
+        assert command.result().RequestID == "c1"
+
+    @pytest.mark.asyncio
+    async def test_flush_fails_queue_messages_missing_from_results(self, mock_config):
+        loop = asyncio.get_running_loop()
+        stub = MagicMock()
+        stub.SendQueueMessagesBatch = AsyncMock(
+            return_value=pb.QueueMessagesBatchResponse(
+                Results=[pb.SendQueueMessageResult(MessageID="q1")]
+            )
+        )
+        transport = self._connected(mock_config, stub)
+
+        first, second = loop.create_future(), loop.create_future()
+        await transport._flush_reconnect_buffer(
+            [
+                _buffered("queue", pb.QueueMessage(MessageID="q1", Channel="q"), first),
+                _buffered("queue", pb.QueueMessage(MessageID="q2", Channel="q"), second),
+            ]
+        )
+
+        assert first.result().MessageID == "q1"
+        with pytest.raises(KubeMQConnectionError, match="No result for buffered message"):
+            second.result()
+
+    @pytest.mark.asyncio
+    async def test_flush_fails_store_events_when_stream_ends_early(self, mock_config):
+        loop = asyncio.get_running_loop()
+        stub = MagicMock()
+        stream = _ResultStream([pb.Result(EventID="s1", Sent=True)])
+        stub.SendEventsStream = MagicMock(return_value=stream)
+        transport = self._connected(mock_config, stub)
+
+        plain, stored, lost = (loop.create_future() for _ in range(3))
+        await transport._flush_reconnect_buffer(
+            [
+                _buffered("event", pb.Event(EventID="e1", Channel="a"), plain),
+                _buffered("event_store", pb.Event(EventID="s1", Channel="a", Store=True), stored),
+                _buffered("event_store", pb.Event(EventID="s2", Channel="a", Store=True), lost),
+            ]
+        )
+
+        assert plain.result() is None
+        assert stored.result().EventID == "s1"
+        with pytest.raises(KubeMQConnectionError, match="No result for buffered message"):
+            lost.result()
+
+    @pytest.mark.asyncio
+    async def test_buffered_publish_resolves_after_reconnect(self):
+        from kubemq.core.config import JitterType, RetryPolicy
+
+        config = ClientConfig(
+            address="localhost:50000",
+            retry_policy=RetryPolicy(initial_backoff_ms=50, jitter=JitterType.NONE),
+        )
+        transport = AsyncTransport(config)
+        stub = MagicMock()
+        stub.SendQueueMessagesBatch = AsyncMock(
+            return_value=pb.QueueMessagesBatchResponse(
+                Results=[pb.SendQueueMessageResult(MessageID="q1")]
+            )
+        )
+
+        async def _reconnect():
+            transport._stub = stub
+            transport._connected = True
+
+        await transport._reconnection_manager.start_reconnection(
+            connect_fn=AsyncMock(side_effect=Exception("down"))
+        )
+        assert transport.is_buffering
+        publish = asyncio.create_task(
+            transport.buffer_publish("queue", pb.QueueMessage(MessageID="q1", Channel="q"))
+        )
+        await asyncio.sleep(0)
+        await transport._reconnection_manager.cancel()
+        with pytest.raises(KubeMQConnectionError):
+            await publish
+
+        await transport._reconnection_manager.start_reconnection(connect_fn=_reconnect)
+        result = await transport.buffer_publish(
+            "queue", pb.QueueMessage(MessageID="q1", Channel="q")
+        )
+        assert result.MessageID == "q1"
+
+    @pytest.mark.asyncio
+    async def test_buffered_publish_times_out_when_reconnect_never_completes(self, mock_config):
+        transport = AsyncTransport(mock_config)
+        never = asyncio.Event()
+        await transport._reconnection_manager.start_reconnection(connect_fn=never.wait)
+        assert transport.is_buffering
+
+        with pytest.raises(KubeMQTimeoutError):
+            await transport.buffer_publish(
+                "command", pb.Request(RequestID="c1", Channel="c"), timeout_seconds=1
+            )
+
+        assert transport._reconnection_manager.buffer.count == 0
+        assert transport._reconnection_manager.buffer.current_bytes == 0
+        await transport._reconnection_manager.cancel()
+
+
+class TestAsyncTransportSendEventsBulk:
+    """Tests for send_events_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_writes_all_and_collects_store_results(self, mock_config):
+        stream = _ResultStream(
+            [pb.Result(EventID="s2", Sent=True), pb.Result(EventID="s1", Sent=True)]
+        )
+        transport = AsyncTransport(mock_config)
+        transport._connected = True
+        transport._stub = MagicMock(SendEventsStream=MagicMock(return_value=stream))
+
+        results = await transport.send_events_bulk(
+            [
+                pb.Event(EventID="e1"),
+                pb.Event(EventID="s1", Store=True),
+                pb.Event(EventID="s2", Store=True),
+            ]
+        )
+
+        assert [event.EventID for event in stream.written] == ["e1", "s1", "s2"]
+        stream.done_writing.assert_awaited_once()
+        assert stream.drained is True
+        stream.cancel.assert_not_called()
+        assert set(results) == {"s1", "s2"}
+
+    @pytest.mark.asyncio
+    async def test_non_persistent_batch_drains_stream_before_release(self, mock_config):
+        stream = _ResultStream([])
+        transport = AsyncTransport(mock_config)
+        transport._connected = True
+        transport._stub = MagicMock(SendEventsStream=MagicMock(return_value=stream))
+
+        results = await transport.send_events_bulk([pb.Event(EventID="e1")])
+
+        assert results == {}
+        assert stream.drained is True
+        stream.cancel.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_cancels_call(self):
+        class _OpenStream(_ResultStream):
+            async def _iterate(self):
+                await asyncio.Event().wait()
+                yield  # pragma: no cover
+
+        stream = _OpenStream([])
+        transport = AsyncTransport(
+            ClientConfig(address="localhost:50000", default_timeout_seconds=1)
+        )
+        transport._connected = True
+        transport._stub = MagicMock(SendEventsStream=MagicMock(return_value=stream))
+
+        with pytest.raises(KubeMQTimeoutError):
+            await transport.send_events_bulk([pb.Event(EventID="e1")])
+
+        stream.cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_before_results(self, mock_config):
+        transport = AsyncTransport(mock_config)
+        transport._connected = True
+        transport._stub = MagicMock(SendEventsStream=MagicMock(return_value=_ResultStream([])))
+
+        results = await transport.send_events_bulk([pb.Event(EventID="s1", Store=True)])
+
+        assert results == {}
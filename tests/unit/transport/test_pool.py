@@ -0,0 +1,184 @@
+"""Tests for kubemq._internal.transport.pool (coordinated pool reconnection)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from kubemq._internal.transport.pool import PoolReconnectCoordinator
+from kubemq.core.config import ClientConfig, JitterType
+from kubemq.core.exceptions import KubeMQConnectionError
+from kubemq.transport.async_transport import AsyncTransport
+
+
+class _Member:
+    """Stand-in for a pooled AsyncTransport."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.is_connected = True
+        self.is_reconnecting = False
+
+    def lose(self, coordinator: PoolReconnectCoordinator) -> None:
+        self.is_connected = False
+        self.is_reconnecting = True
+        coordinator.connection_lost(self)  # type: ignore[arg-type]
+
+
+def _pool(size: int, **kwargs) -> tuple[PoolReconnectCoordinator, list[_Member]]:
+    coordinator = PoolReconnectCoordinator(**kwargs)
+    members = [_Member(f"t{i}") for i in range(size)]
+    for member in members:
+        coordinator.register(member)  # type: ignore[arg-type]
+    return coordinator, members
+
+
+def _dialer(member: _Member, log: list[str], fail: int = 0):
+    failures = [fail]
+
+    async def dial() -> None:
+        log.append(member.name)
+        if failures[0]:
+            failures[0] -= 1
+            raise ConnectionError("broker down")
+        member.is_connected = True
+        member.is_reconnecting = False
+
+    return dial
+
+
+class TestPoolReconnectCoordinator:
+    async def test_probe_dials_alone_then_pool_is_staged(self):
+        coordinator, members = _pool(3, stagger_ms=20)
+        for member in members:
+            member.lose(coordinator)
+        log: list[str] = []
+
+        probe = members[0]
+        with pytest.raises(ConnectionError):
+            await coordinator.redial(probe, _dialer(probe, log, fail=1))  # type: ignore[arg-type]
+        waiters = [
+            asyncio.create_task(coordinator.redial(m, _dialer(m, log)))  # type: ignore[arg-type]
+            for m in members[1:]
+        ]
+        await asyncio.sleep(0.05)
+        assert log == ["t0"]
+        assert not any(w.done() for w in waiters)
+
+        await coordinator.redial(probe, _dialer(probe, log))  # type: ignore[arg-type]
+        await asyncio.gather(*waiters)
+
+        assert log[:2] == ["t0", "t0"]
+        assert sorted(log[2:]) == ["t1", "t2"]
+        health = coordinator.health()
+        assert health.ready == 3
+        assert health.probe_attempts == 2
+        assert health.reconnects == 3
+        assert health.recoveries == 1
+        assert health.last_recovery_seconds is not None
+
+    async def test_stagger_spreads_admissions(self):
+        coordinator, members = _pool(4, stagger_ms=30)
+        for member in members:
+            member.lose(coordinator)
+        await coordinator.redial(members[0], _dialer(members[0], []))  # type: ignore[arg-type]
+
+        loop = asyncio.get_running_loop()
+        admitted: list[float] = []
+
+        def _timed(member):
+            async def dial() -> None:
+                admitted.append(loop.time())
+                member.is_connected = True
+
+            return dial
+
+        start = loop.time()
+        await asyncio.gather(
+            *(coordinator.redial(m, _timed(m)) for m in members[1:])  # type: ignore[arg-type]
+        )
+        # The last of three staged redials waits at least two full steps.
+        assert max(admitted) - start >= 0.06
+
+    async def test_abandoned_probe_is_taken_over(self):
+        coordinator, members = _pool(2, stagger_ms=0)
+        for member in members:
+            member.lose(coordinator)
+        log: list[str] = []
+
+        with pytest.raises(ConnectionError):
+            await coordinator.redial(members[0], _dialer(members[0], log, fail=1))  # type: ignore[arg-type]
+        members[0].is_reconnecting = False  # its ReconnectionManager gave up
+
+        await coordinator.redial(members[1], _dialer(members[1], log))  # type: ignore[arg-type]
+
+        assert log == ["t0", "t1"]
+        assert coordinator.health().probe_attempts == 2
+
+    async def test_waiter_times_out_while_probe_is_down(self):
+        coordinator, members = _pool(2, probe_wait_seconds=0.05)
+        for member in members:
+            member.lose(coordinator)
+        with pytest.raises(ConnectionError):
+            await coordinator.redial(members[0], _dialer(members[0], [], fail=1))  # type: ignore[arg-type]
+
+        with pytest.raises(KubeMQConnectionError):
+            await coordinator.redial(members[1], _dialer(members[1], []))  # type: ignore[arg-type]
+
+    async def test_healthy_pool_redials_without_probe(self):
+        coordinator, members = _pool(2, stagger_ms=0)
+        log: list[str] = []
+
+        await coordinator.redial(members[1], _dialer(members[1], log))  # type: ignore[arg-type]
+
+        assert log == ["t1"]
+        assert coordinator.health().probe_attempts == 0
+
+
+class TestPooledTransports:
+    def test_pooled_transport_uses_decorrelated_backoff(self):
+        config = ClientConfig(address="localhost:50000")
+        pooled = AsyncTransport(config, pool_coordinator=PoolReconnectCoordinator())
+        single = AsyncTransport(config)
+
+        assert pooled._reconnection_manager._backoff._jitter == JitterType.DECORRELATED
+        assert single._reconnection_manager._backoff._jitter == config.retry_policy.jitter
+
+    async def test_connection_lost_reports_to_coordinator(self):
+        coordinator = PoolReconnectCoordinator()
+        transport = AsyncTransport(
+            ClientConfig(address="localhost:50000"), pool_coordinator=coordinator
+        )
+        coordinator.register(transport)
+        transport._connected = True
+
+        with patch.object(transport._reconnection_manager, "start_reconnection") as start:
+            await transport._on_connection_lost()
+
+        assert not coordinator._healthy.is_set()
+        assert start.call_args.kwargs["connect_fn"] == transport._pool_redial
+
+    async def test_client_connect_builds_coordinated_pool(self):
+        from kubemq.pubsub.async_client import AsyncClient
+
+        client = AsyncClient(address="localhost:50000", connection_pool_size=3)
+        with patch.object(AsyncTransport, "connect", AsyncMock()):
+            await client.connect()
+
+        assert client._pool_coordinator is not None
+        assert all(t._pool_coordinator is client._pool_coordinator for t in client._pool)
+        health = client.pool_health()
+        assert health.size == 4
+        assert health.reconnecting == 0
+
+    async def test_single_connection_client_reports_health(self):
+        from kubemq.pubsub.async_client import AsyncClient
+
+        client = AsyncClient(address="localhost:50000", connection_pool_size=1)
+        with patch.object(AsyncTransport, "connect", AsyncMock()):
+            await client.connect()
+
+        assert client._pool_coordinator is None
+        assert client.pool_health().size == 1
@@ -18,7 +18,7 @@ from kubemq._internal.transport.reconnect import (
     _BoundedByteBuffer,
 )
 from kubemq.core.config import JitterType, RetryPolicy
-from kubemq.core.exceptions import KubeMQBufferFullError
+from kubemq.core.exceptions import KubeMQBufferFullError, KubeMQConnectionError
 
 # -----------------------------------------------------------------------
 # _BoundedByteBuffer (sync, thread-safe)
@@ -116,6 +116,18 @@ class TestAsyncBoundedByteBuffer:
         assert count == 2
         assert buf.count == 0
 
+    async def test_remove_by_metadata(self):
+        buf = _AsyncBoundedByteBuffer(max_bytes=1024)
+        first, second = {"id": "1"}, {"id": "2"}
+        await buf.put(b"hello", first)
+        await buf.put(b"wor", second)
+
+        assert await buf.remove(first) is True
+        assert await buf.remove(first) is False
+        assert buf.count == 1
+        assert buf.current_bytes == 3
+        assert await buf.drain_all() == [(b"wor", second)]
+
     async def test_fifo_order(self):
         buf = _AsyncBoundedByteBuffer(max_bytes=1024)
         for i in range(5):
@@ -543,3 +555,83 @@ class TestConnectionReuseDocstrings:
 
         assert "Thread Safety" in NativeAsyncBaseClient.__doc__
         assert "safe to share" in NativeAsyncBaseClient.__doc__
+
+
+# -----------------------------------------------------------------------
+# Reconnect buffering: overflow mode, flush and discard
+# -----------------------------------------------------------------------
+
+
+class TestReconnectionManagerFlush:
+    def test_overflow_mode_passed_to_buffer(self):
+        config = ReconnectConfig(buffer_overflow_mode="block")
+        mgr = ReconnectionManager(config, _make_backoff())
+        assert mgr.buffer._overflow_mode == "block"
+
+    async def test_flush_fn_receives_buffered_items_in_order(self):
+        flushed = []
+        drain_cb = MagicMock()
+
+        async def flush_fn(items):
+            flushed.extend(items)
+
+        config = ReconnectConfig(reconnect_buffer_size=1024, initial_reconnect_delay_ms=50)
+        mgr = ReconnectionManager(
+            config, _make_backoff(), on_buffer_drain=drain_cb, flush_fn=flush_fn
+        )
+
+        await mgr.buffer_message(b"one", {"kind": "event"})
+        await mgr.buffer_message(b"two", {"kind": "queue"})
+        await mgr.start_reconnection(AsyncMock())
+        await asyncio.sleep(0.2)
+
+        assert flushed == [(b"one", {"kind": "event"}), (b"two", {"kind": "queue"})]
+        drain_cb.assert_called_once_with(2)
+
+    async def test_flush_failure_fails_pending_futures(self):
+        future = asyncio.get_running_loop().create_future()
+        config = ReconnectConfig(reconnect_buffer_size=1024, initial_reconnect_delay_ms=50)
+        mgr = ReconnectionManager(
+            config, _make_backoff(), flush_fn=AsyncMock(side_effect=RuntimeError("boom"))
+        )
+
+        await mgr.buffer_message(b"msg", {"future": future})
+        await mgr.start_reconnection(AsyncMock())
+        await asyncio.sleep(0.2)
+
+        with pytest.raises(KubeMQConnectionError):
+            future.result()
+
+    async def test_discard_fails_pending_futures(self):
+        future = asyncio.get_running_loop().create_future()
+        mgr = ReconnectionManager(ReconnectConfig(reconnect_buffer_size=1024), _make_backoff())
+
+        await mgr.buffer_message(b"msg", {"future": future})
+        await mgr.cancel()
+
+        with pytest.raises(KubeMQConnectionError):
+            future.result()
+
+    async def test_blocked_put_flushed_after_reconnect_completes(self):
+        flushed = []
+
+        async def flush_fn(items):
+            flushed.extend(data for data, _ in items)
+
+        config = ReconnectConfig(
+            reconnect_buffer_size=5,
+            buffer_overflow_mode="block",
+            initial_reconnect_delay_ms=50,
+        )
+        mgr = ReconnectionManager(config, _make_backoff(), flush_fn=flush_fn)
+
+        await mgr.buffer_message(b"12345")
+        blocked = asyncio.create_task(mgr.buffer_message(b"678"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+
+        await mgr.start_reconnection(AsyncMock())
+        await asyncio.wait_for(blocked, timeout=1.0)
+
+        assert flushed == [b"12345", b"678"]
+        assert mgr.buffer.count == 0